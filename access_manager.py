@@ -1,10 +1,16 @@
-import json
+import atexit
 import hashlib
+import itertools
 import secrets
+import threading
+import time
 from typing import Dict, List, Optional, Set
 from datetime import datetime, timedelta
 import logging
 
+from session_store import SessionStore
+import json_codec
+
 logger = logging.getLogger(__name__)
 
 class AccessManager:
@@ -12,15 +18,31 @@ class AccessManager:
     
     def __init__(self, data_file: str = "access_data.json"):
         self.data_file = data_file
+        # Відкладене збереження: зміни позначаються dirty і записуються не частіше ніж раз на _save_interval
+        self._save_lock = threading.RLock()
+        self._dirty = False
+        self._last_save = 0.0
+        self._save_interval = 10  # секунд
         self.data = self._load_data()
         self.authorized_users: Set[int] = set()  # Telegram ID авторизованих користувачів
-        self.user_sessions: Dict[int, datetime] = {}  # Сесії користувачів з часом авторизації
+        self.user_sessions = SessionStore(30 * 60)  # Сесії користувачів з чергою закінчення
+        
+        # Вторинні індекси (оновлюються при кожній зміні користувачів)
+        self._telegram_index: Dict[int, str] = {}  # telegram_id -> user_id
+        self._username_index: Dict[str, str] = {}  # username (lower) -> user_id
+        self._role_index: Dict[str, Set[str]] = {}  # role -> set of user_id
+        self._search_index: Dict[str, Set[str]] = {}  # n-грама username (1-3 символи) -> set of user_id
+        self._user_order: Dict[str, int] = {}  # user_id -> порядковий номер (порядок як у файлі)
+        self._user_ordinals = itertools.count()  # Номери не повторюються і після видалення користувачів
+        self._rebuild_indexes()
+        
+        # Записуємо незбережені зміни при завершенні процесу
+        atexit.register(self.flush)
         
     def _load_data(self) -> Dict:
         """Завантажити дані з файлу"""
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return json_codec.load_file(self.data_file)
         except FileNotFoundError:
             # Створюємо новий файл з базовою структурою
             default_data = {
@@ -37,16 +59,114 @@ class AccessManager:
             logger.error(f"Помилка завантаження даних доступу: {e}")
             return {"users": {}, "settings": {"default_password": "admin123", "session_timeout_minutes": 30, "max_login_attempts": 3}}
     
+    def _write_atomic(self, data: Dict) -> None:
+        """Атомарно записати дані: тимчасовий файл у тій самій теці + rename"""
+        json_codec.dump_file(self.data_file, data, pretty=True)  # Файл переглядають вручну - з відступами
+    
+    def _mark_dirty(self) -> None:
+        """Позначити дані як змінені без запису на диск"""
+        self._dirty = True
+    
     def _save_data(self, data: Dict = None) -> None:
-        """Зберегти дані в файл"""
+        """Зберегти дані в файл (зміни об'єднуються, запис не частіше ніж раз на _save_interval)"""
         try:
-            if data is None:
-                data = self.data
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if data is not None:
+                with self._save_lock:
+                    self._write_atomic(data)
+                return
+            
+            self._mark_dirty()
+            if time.monotonic() - self._last_save >= self._save_interval:
+                self.flush()
         except Exception as e:
             logger.error(f"Помилка збереження даних доступу: {e}")
     
+    def flush(self) -> bool:
+        """Записати незбережені зміни на диск"""
+        with self._save_lock:
+            if not self._dirty:
+                return True
+            try:
+                self._dirty = False
+                self._write_atomic(self.data)
+                self._last_save = time.monotonic()
+                return True
+            except Exception as e:
+                self._dirty = True
+                logger.error(f"Помилка збереження даних доступу: {e}")
+                return False
+    
+    @staticmethod
+    def _username_grams(username: str) -> Set[str]:
+        """Всі підрядки username довжиною 1-3 символи (для пошуку за підрядком)"""
+        grams = set()
+        for size in (1, 2, 3):
+            for i in range(len(username) - size + 1):
+                grams.add(username[i:i + size])
+        return grams
+    
+    def _index_user(self, user_id: str, user_data: Dict) -> None:
+        """Додати користувача до індексів"""
+        if user_id not in self._user_order:
+            self._user_order[user_id] = next(self._user_ordinals)
+        
+        telegram_id = user_data.get("telegram_id")
+        if telegram_id is not None:
+            self._telegram_index.setdefault(telegram_id, user_id)
+        
+        username = (user_data.get("username") or "").lower()
+        if username:
+            self._username_index.setdefault(username, user_id)
+            for gram in self._username_grams(username):
+                self._search_index.setdefault(gram, set()).add(user_id)
+        
+        self._role_index.setdefault(user_data.get("role"), set()).add(user_id)
+    
+    def _unindex_user(self, user_id: str, user_data: Dict) -> None:
+        """Видалити користувача з індексів"""
+        self._user_order.pop(user_id, None)
+        
+        telegram_id = user_data.get("telegram_id")
+        if self._telegram_index.get(telegram_id) == user_id:
+            del self._telegram_index[telegram_id]
+        
+        username = (user_data.get("username") or "").lower()
+        if username:
+            if self._username_index.get(username) == user_id:
+                del self._username_index[username]
+            for gram in self._username_grams(username):
+                postings = self._search_index.get(gram)
+                if postings:
+                    postings.discard(user_id)
+                    if not postings:
+                        del self._search_index[gram]
+        
+        role_users = self._role_index.get(user_data.get("role"))
+        if role_users:
+            role_users.discard(user_id)
+    
+    def _reindex_role(self, user_id: str, old_role: Optional[str], new_role: str) -> None:
+        """Оновити індекс ролей після зміни ролі"""
+        role_users = self._role_index.get(old_role)
+        if role_users:
+            role_users.discard(user_id)
+        self._role_index.setdefault(new_role, set()).add(user_id)
+    
+    def _rebuild_indexes(self) -> None:
+        """Повністю перебудувати індекси з self.data"""
+        self._telegram_index = {}
+        self._username_index = {}
+        self._role_index = {}
+        self._search_index = {}
+        self._user_order = {}
+        self._user_ordinals = itertools.count()
+        for user_id, user_data in self.data["users"].items():
+            self._index_user(user_id, user_data)
+    
+    def _ordered(self, user_ids) -> List[str]:
+        """Відсортувати user_id у порядку зберігання"""
+        return sorted(user_ids, key=lambda uid: self._user_order.get(uid, 0))
+    
     def _hash_password(self, password: str) -> str:
         """Хешувати пароль"""
         return hashlib.sha256(password.encode()).hexdigest()
@@ -59,10 +179,10 @@ class AccessManager:
         """Додати нового користувача"""
         try:
             # Перевіряємо чи користувач вже існує
-            for user_id, user_data in self.data["users"].items():
-                if user_data.get("telegram_id") == telegram_id:
-                    logger.warning(f"Користувач з Telegram ID {telegram_id} вже існує")
-                    return user_id
+            existing_user_id = self._telegram_index.get(telegram_id)
+            if existing_user_id:
+                logger.warning(f"Користувач з Telegram ID {telegram_id} вже існує")
+                return existing_user_id
             
             # Генеруємо новий ID користувача
             user_id = self._generate_user_id()
@@ -92,6 +212,7 @@ class AccessManager:
             }
             
             self.data["users"][user_id] = user_data
+            self._index_user(user_id, user_data)
             self._save_data()
             
             logger.info(f"Додано нового користувача: {username} (Telegram ID: {telegram_id})")
@@ -128,17 +249,17 @@ class AccessManager:
                 user_data["last_login"] = datetime.now().isoformat()
                 user_data["login_attempts"] = 0
                 self.authorized_users.add(telegram_id)
-                self.user_sessions[telegram_id] = datetime.now()
+                self.user_sessions.touch(telegram_id)
                 
-                # Оновлюємо дані
-                self._save_data()
+                # Оновлюємо дані (запис на диск виконає періодичний flush)
+                self._mark_dirty()
                 
                 logger.info(f"Користувач {telegram_id} успішно авторизований")
                 return True
             else:
                 # Невдала спроба
                 user_data["login_attempts"] = user_data.get("login_attempts", 0) + 1
-                self._save_data()
+                self._mark_dirty()
                 
                 logger.warning(f"Невдала спроба авторизації користувача: {telegram_id}")
                 return False
@@ -154,8 +275,7 @@ class AccessManager:
         
         # Перевіряємо чи не закінчилася сесія
         if telegram_id in self.user_sessions:
-            session_timeout = timedelta(minutes=self.data["settings"]["session_timeout_minutes"])
-            if datetime.now() - self.user_sessions[telegram_id] > session_timeout:
+            if self.user_sessions.is_expired(telegram_id, self._session_timeout_seconds()):
                 self.logout_user(telegram_id)
                 return False
         
@@ -164,21 +284,32 @@ class AccessManager:
     def update_session_activity(self, telegram_id: int) -> None:
         """Оновити час активності сесії користувача"""
         if telegram_id in self.authorized_users:
-            self.user_sessions[telegram_id] = datetime.now()
+            self.user_sessions.touch(telegram_id)
             logger.debug(f"Оновлено активність сесії користувача {telegram_id}")
     
     def logout_user(self, telegram_id: int) -> None:
         """Вийти з системи"""
         self.authorized_users.discard(telegram_id)
-        self.user_sessions.pop(telegram_id, None)
+        self.user_sessions.remove(telegram_id)
         logger.info(f"Користувач {telegram_id} вийшов з системи")
     
+    def _session_timeout_seconds(self) -> float:
+        """Тайм-аут сесії з налаштувань (може змінюватися під час роботи)"""
+        return self.data["settings"].get("session_timeout_minutes", 30) * 60
+    
     def get_user_by_telegram_id(self, telegram_id: int) -> Optional[Dict]:
         """Отримати дані користувача за Telegram ID"""
-        for user_id, user_data in self.data["users"].items():
-            if user_data.get("telegram_id") == telegram_id:
-                return user_data
-        return None
+        user_id = self._telegram_index.get(telegram_id)
+        if user_id is None:
+            return None
+        return self.data["users"].get(user_id)
+    
+    def get_user_by_username(self, username: str) -> Optional[Dict]:
+        """Отримати дані користувача за username (без урахування регістру)"""
+        user_id = self._username_index.get((username or "").replace('@', '').strip().lower())
+        if user_id is None:
+            return None
+        return self.data["users"].get(user_id)
     
     def get_user_by_id(self, user_id: str) -> Optional[Dict]:
         """Отримати дані користувача за ID"""
@@ -285,16 +416,11 @@ class AccessManager:
     
     def cleanup_expired_sessions(self) -> None:
         """Очистити закінчені сесії"""
-        current_time = datetime.now()
-        session_timeout = timedelta(minutes=self.data["settings"]["session_timeout_minutes"])
-        
-        expired_users = []
-        for telegram_id, login_time in self.user_sessions.items():
-            if current_time - login_time > session_timeout:
-                expired_users.append(telegram_id)
+        # Черга закінчення віддає лише прострочені сесії, без перебору всіх
+        expired_users = self.user_sessions.pop_expired(self._session_timeout_seconds())
         
         for telegram_id in expired_users:
-            self.logout_user(telegram_id)
+            self.authorized_users.discard(telegram_id)
         
         if expired_users:
             logger.info(f"Очищено {len(expired_users)} закінчених сесій")
@@ -321,6 +447,7 @@ class AccessManager:
                 logger.error(f"Невірна роль: {role}")
                 return False
             
+            self._reindex_role(self._telegram_index[telegram_id], user_data.get("role"), role)
             user_data["role"] = role
             
             # Оновлюємо дозволи залежно від ролі
@@ -371,47 +498,41 @@ class AccessManager:
     def get_all_admins(self) -> List[Dict]:
         """Отримати список всіх адміністраторів"""
         admins = []
-        for user_id, user_data in self.data["users"].items():
-            if user_data.get("role") == "admin":
-                admin_info = {
-                    "user_id": user_id,
-                    "telegram_id": user_data.get("telegram_id"),
-                    "username": user_data.get("username", ""),
-                    "is_active": user_data.get("is_active", True),
-                    "last_login": user_data.get("last_login"),
-                    "created_at": user_data.get("created_at")
-                }
-                admins.append(admin_info)
+        for user_id in self._ordered(self._role_index.get("admin", ())):
+            user_data = self.data["users"][user_id]
+            admin_info = {
+                "user_id": user_id,
+                "telegram_id": user_data.get("telegram_id"),
+                "username": user_data.get("username", ""),
+                "is_active": user_data.get("is_active", True),
+                "last_login": user_data.get("last_login"),
+                "created_at": user_data.get("created_at")
+            }
+            admins.append(admin_info)
         return admins
     
     def get_all_users_by_role(self, role: str) -> List[Dict]:
         """Отримати користувачів за роллю"""
         users = []
-        for user_id, user_data in self.data["users"].items():
-            if user_data.get("role") == role:
-                user_info = {
-                    "user_id": user_id,
-                    "telegram_id": user_data.get("telegram_id"),
-                    "username": user_data.get("username", ""),
-                    "is_active": user_data.get("is_active", True),
-                    "last_login": user_data.get("last_login"),
-                    "created_at": user_data.get("created_at")
-                }
-                users.append(user_info)
+        for user_id in self._ordered(self._role_index.get(role, ())):
+            user_data = self.data["users"][user_id]
+            user_info = {
+                "user_id": user_id,
+                "telegram_id": user_data.get("telegram_id"),
+                "username": user_data.get("username", ""),
+                "is_active": user_data.get("is_active", True),
+                "last_login": user_data.get("last_login"),
+                "created_at": user_data.get("created_at")
+            }
+            users.append(user_info)
         return users
     
     def delete_user(self, telegram_id: int) -> bool:
         """Видалити користувача повністю"""
         try:
             # Знаходимо користувача
-            user_to_delete = None
-            user_id_to_delete = None
-            
-            for user_id, user_data in self.data["users"].items():
-                if user_data.get("telegram_id") == telegram_id:
-                    user_to_delete = user_data
-                    user_id_to_delete = user_id
-                    break
+            user_id_to_delete = self._telegram_index.get(telegram_id)
+            user_to_delete = self.data["users"].get(user_id_to_delete) if user_id_to_delete else None
             
             if not user_to_delete:
                 logger.warning(f"Спроба видалення неіснуючого користувача: {telegram_id}")
@@ -419,10 +540,11 @@ class AccessManager:
             
             # Видаляємо користувача
             del self.data["users"][user_id_to_delete]
+            self._unindex_user(user_id_to_delete, user_to_delete)
             
             # Видаляємо з активних сесій
             self.authorized_users.discard(telegram_id)
-            self.user_sessions.pop(telegram_id, None)
+            self.user_sessions.remove(telegram_id)
             
             self._save_data()
             logger.info(f"Користувач {telegram_id} повністю видалений")
@@ -432,40 +554,52 @@ class AccessManager:
             logger.error(f"Помилка видалення користувача: {e}")
             return False
     
+    def _search_username_candidates(self, query: str) -> Set[str]:
+        """Знайти user_id, username яких містить query, через n-грамний індекс"""
+        if not query:
+            return set(self.data["users"].keys())
+        if len(query) <= 3:
+            return set(self._search_index.get(query, ()))
+        
+        # Перетинаємо множини триграм, потім перевіряємо повний підрядок
+        candidates = None
+        for i in range(len(query) - 2):
+            postings = self._search_index.get(query[i:i + 3])
+            if not postings:
+                return set()
+            candidates = set(postings) if candidates is None else candidates & postings
+            if not candidates:
+                return set()
+        return {
+            user_id for user_id in candidates
+            if query in (self.data["users"][user_id].get("username") or "").lower()
+        }
+    
     def search_users(self, query: str) -> List[Dict]:
         """Пошук користувачів за username або Telegram ID"""
         try:
             query = query.lower().strip()
-            results = []
+            matches = {user_id: "username" for user_id in self._search_username_candidates(query)}
             
-            for user_id, user_data in self.data["users"].items():
-                telegram_id = user_data.get("telegram_id")
-                username = user_data.get("username", "").lower()
-                
-                # Пошук за username
-                if query in username:
-                    results.append({
-                        "user_id": user_id,
-                        "telegram_id": telegram_id,
-                        "username": user_data.get("username", ""),
-                        "role": user_data.get("role", "user"),
-                        "is_active": user_data.get("is_active", True),
-                        "last_login": user_data.get("last_login"),
-                        "created_at": user_data.get("created_at"),
-                        "match_type": "username"
-                    })
-                # Пошук за Telegram ID
-                elif query.isdigit() and str(telegram_id) == query:
-                    results.append({
-                        "user_id": user_id,
-                        "telegram_id": telegram_id,
-                        "username": user_data.get("username", ""),
-                        "role": user_data.get("role", "user"),
-                        "is_active": user_data.get("is_active", True),
-                        "last_login": user_data.get("last_login"),
-                        "created_at": user_data.get("created_at"),
-                        "match_type": "telegram_id"
-                    })
+            # Пошук за Telegram ID
+            if query.isdigit():
+                user_id = self._telegram_index.get(int(query)) or self._telegram_index.get(query)
+                if user_id and user_id not in matches:
+                    matches[user_id] = "telegram_id"
+            
+            results = []
+            for user_id in self._ordered(matches):
+                user_data = self.data["users"][user_id]
+                results.append({
+                    "user_id": user_id,
+                    "telegram_id": user_data.get("telegram_id"),
+                    "username": user_data.get("username", ""),
+                    "role": user_data.get("role", "user"),
+                    "is_active": user_data.get("is_active", True),
+                    "last_login": user_data.get("last_login"),
+                    "created_at": user_data.get("created_at"),
+                    "match_type": matches[user_id]
+                })
             
             return results
             
@@ -486,6 +620,7 @@ class AccessManager:
                 return False
             
             old_role = user_data.get("role", "user")
+            self._reindex_role(self._telegram_index[telegram_id], user_data.get("role"), new_role)
             user_data["role"] = new_role
             
             # Оновлюємо дозволи залежно від ролі
@@ -532,7 +667,7 @@ class AccessManager:
             
             # Видаляємо з активних сесій
             self.authorized_users.discard(telegram_id)
-            self.user_sessions.pop(telegram_id, None)
+            self.user_sessions.remove(telegram_id)
             
             self._save_data()
             logger.info(f"Пароль користувача {telegram_id} скинуто")
@@ -636,19 +771,14 @@ class AccessManager:
     def cleanup_inactive_sessions(self) -> int:
         """Очистити неактивні сесії"""
         try:
-            current_time = datetime.now()
             cleaned_count = 0
             
-            inactive_users = []
-            for telegram_id, last_activity_time in self.user_sessions.items():
-                # user_sessions містить datetime об'єкти, не словники
-                if current_time - last_activity_time > timedelta(hours=24):  # 24 години неактивності
-                    inactive_users.append(telegram_id)
+            # 24 години неактивності
+            inactive_users = self.user_sessions.pop_expired(24 * 60 * 60)
             
             # Видаляємо неактивні сесії
             for telegram_id in inactive_users:
                 self.authorized_users.discard(telegram_id)
-                self.user_sessions.pop(telegram_id, None)
                 cleaned_count += 1
             
             if cleaned_count > 0:
@@ -675,6 +805,8 @@ class AccessManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = os.path.join(backup_dir, f"access_data_backup_{timestamp}.json")
             
+            # Спочатку записуємо відкладені зміни, щоб копія була актуальною
+            self.flush()
             shutil.copy2(self.data_file, backup_file)
             logger.info(f"Резервна копія створена: {backup_file}")
             return True
@@ -720,6 +852,7 @@ class AccessManager:
             
             # Очищаємо всіх користувачів
             self.data["users"] = admin_users
+            self._rebuild_indexes()
             self.authorized_users.clear()
             self.user_sessions.clear()
             
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Мікробенчмарки гарячого шляху обробки подій
+
+Функції, які виконуються на кожну подію, проганяються на синтетичних data.json
+різного розміру (за замовчуванням 10, 1 000 та 100 000 проектів). Мережа
+Telegram підмінена (bot.telegram_post повертає успішну відповідь), time.sleep
+вимкнено - вимірюється лише власний код.
+
+Результати порівнюються з базовою лінією; якщо медіана випадку гірша за базову
+більше ніж на --threshold, скрипт завершується з кодом 1.
+
+Приклади:
+    python benchmark_hot_path.py --save-baseline            # записати базову лінію
+    python benchmark_hot_path.py                            # порівняти з базовою (поріг 25%)
+    python benchmark_hot_path.py --sizes 10,1000 --threshold 0.1 --only escape_html
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+
+from benchmark_support import scaled_data  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(REPO_DIR, 'benchmark_baseline.json')
+
+
+class FakeResponse:
+    """Успішна відповідь Telegram без мережі"""
+
+    status_code = 200
+    text = '{"ok": true}'
+    content = b'{"ok":true,"result":{"message_id":1,"message_thread_id":1001}}'
+
+    def __init__(self):
+        self._payload = {'ok': True, 'result': {'message_id': 1, 'message_thread_id': 1001}}
+
+    def json(self):
+        return self._payload
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Мікробенчмарки гарячого шляху")
+    parser.add_argument('--sizes', default='10,1000,100000', help="Розміри data.json (кількість проектів)")
+    parser.add_argument('--repeat', type=int, default=5, help="Кількість замірів кожного випадку")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="Мінімальна тривалість одного заміру, с (кількість викликів підбирається)")
+    parser.add_argument('--threshold', type=float, default=0.25, help="Допустиме погіршення медіани (0.25 = 25%%)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Файл базової лінії")
+    parser.add_argument('--save-baseline', action='store_true', help="Записати поточні результати як базову лінію")
+    parser.add_argument('--only', help="Запускати лише випадки, що містять цей підрядок")
+    parser.add_argument('--with-logging', action='store_true', help="Не вимикати logging під час замірів")
+    return parser.parse_args()
+
+
+def measure(func, repeat: int, min_time: float) -> dict:
+    """Підібрати кількість викликів під min_time та зробити repeat замірів (с/виклик)"""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - started) / number)
+    return {'min': min(samples), 'median': statistics.median(samples), 'calls': number}
+
+
+class HotPathCases:
+    """Випадки бенчмарку для одного розміру data.json"""
+
+    def __init__(self, bot, size: int, workdir: str):
+        from project_manager import ProjectManager
+
+        data_file = os.path.join(workdir, f'data_{size}.json')
+        with open(data_file, 'w', encoding='utf-8') as f:
+            json.dump(scaled_data(size), f)
+
+        self.bot = bot
+        self.size = size
+        self.project_manager = ProjectManager(data_file)
+        bot.project_manager = self.project_manager
+        bot.global_sent_tweets.clear()
+
+        projects = self.project_manager.data['projects']
+        first_user, user_projects = next(iter(projects.items()))
+        self.user_id = int(first_user)
+        self.forward_channel = self.project_manager.get_forward_channel(self.user_id)
+        self.twitter_url = next(p['url'] for items in projects.values() for p in items if p['platform'] == 'twitter')
+        self.twitter_account = self.twitter_url.rsplit('/', 1)[1]
+        self.discord_project = next((p for items in projects.values() for p in items if p['platform'] == 'discord'), None)
+        self.counter = 0
+
+    def _next_id(self) -> str:
+        self.counter += 1
+        return str(1_900_000_000_000_000_000 + self.counter)
+
+    def cases(self):
+        yield 'escape_html', lambda: self.bot.escape_html('<b>Tweet</b> & "quotes" ' * 8)
+        yield 'extract_twitter_username', lambda: self.bot.extract_twitter_username(self.twitter_url)
+        yield 'get_users_tracking_twitter', lambda: self.bot.get_users_tracking_twitter(self.twitter_account)
+        yield 'is_message_sent', lambda: self.project_manager.is_message_sent(
+            'missing_message', self.forward_channel, self.user_id)
+        yield 'handle_twitter_notifications_sync', self.handle_twitter
+        if self.discord_project:
+            yield 'handle_discord_notifications_sync', self.handle_discord
+
+    def handle_twitter(self):
+        tweet_id = self._next_id()
+        self.bot.handle_twitter_notifications_sync([{
+            'account': self.twitter_account,
+            'tweet_id': tweet_id,
+            'text': f'benchmark tweet {tweet_id}',
+            'author': self.twitter_account,
+            'username': self.twitter_account,
+            'timestamp': '2025-01-01T12:00:00+00:00',
+            'url': f'{self.twitter_url}/status/{tweet_id}'
+        }])
+
+    def handle_discord(self):
+        message_id = self._next_id()
+        url = self.discord_project['url']
+        channel_id = url.rstrip('/').rsplit('/', 1)[1]
+        self.bot.handle_discord_notifications_sync([{
+            'message_id': message_id,
+            'channel_id': channel_id,
+            'author': 'bench',
+            'content': f'benchmark message {message_id}',
+            'timestamp': '2025-01-01T12:00:00+00:00',
+            'url': f'{url}/{message_id}',
+            'images': []
+        }])
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Список випадків, де медіана гірша за базову більше ніж на threshold"""
+    regressions = []
+    for name, stats in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        ratio = stats['median'] / previous['median'] if previous['median'] else 1.0
+        stats['ratio'] = ratio
+        if ratio > 1.0 + threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def format_time(seconds: float) -> str:
+    if seconds < 1e-6:
+        return f'{seconds * 1e9:.0f}ns'
+    if seconds < 1e-3:
+        return f'{seconds * 1e6:.1f}µs'
+    if seconds < 1:
+        return f'{seconds * 1e3:.2f}ms'
+    return f'{seconds:.2f}s'
+
+
+def main():
+    args = parse_args()
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+
+    workdir = tempfile.mkdtemp(prefix='monitor_hot_path_')
+    os.environ.setdefault('BOT_TOKEN', '123456:BENCHMARK')
+    os.environ['METRICS_PORT'] = '0'
+    os.chdir(workdir)
+
+    import bot
+    bot.bot_instance = object()
+    bot.telegram_post = lambda url, **kwargs: FakeResponse()
+    time.sleep = lambda seconds: None  # Затримки rate limit у коді доставки не вимірюємо
+    if not args.with_logging:
+        logging.disable(logging.CRITICAL)
+
+    results = {}
+    print("🚀 Бенчмарк гарячого шляху")
+    print("=" * 60)
+    for size in sizes:
+        cases = HotPathCases(bot, size, workdir)
+        print(f"\n📦 {size} проектів:")
+        for name, func in cases.cases():
+            case_name = f'{name}[{size}]'
+            if args.only and args.only not in case_name:
+                continue
+            stats = measure(func, args.repeat, args.min_time)
+            results[case_name] = stats
+            print(f"   {name:<36} median {format_time(stats['median']):>10}  min {format_time(stats['min']):>10}"
+                  f"  ({stats['calls']} викликів)")
+
+    logging.disable(logging.NOTSET)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Базову лінію збережено: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nℹ️ Базової лінії немає ({args.baseline}) - запустіть з --save-baseline")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+
+    print(f"\n📊 Порівняння з базовою лінією (поріг +{args.threshold:.0%}):")
+    for name, stats in results.items():
+        if 'ratio' in stats:
+            print(f"   {name:<48} x{stats['ratio']:.2f}")
+    if regressions:
+        print("\n❌ Регресії:")
+        for name, ratio in regressions:
+            print(f"   {name}: повільніше в {ratio:.2f} раза")
+        return 1
+    print("\n✅ Регресій не виявлено")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
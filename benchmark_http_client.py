@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк повторного використання з'єднань вихідних HTTP клієнтів
+
+Локальний HTTP/1.1 сервер з keep-alive рахує прийняті з'єднання та запити.
+Порівнюються:
+    requests.post на кожен запит (як раніше telegram_post та завантаження
+    зображень) і http_client.post (спільний клієнт);
+    aiohttp.ClientSession на кожен запит (як раніше запити до Discord з
+    обробників) і сесія з http_client.create_connector.
+
+Для кожного варіанту - час на запит і частка запитів без нового з'єднання
+(за лічильниками сервера та за http_client.connection_stats). Сервер без TLS,
+тож виграш тут - лише TCP handshake; до api.telegram.org кожне нове
+з'єднання ще й TLS handshake.
+
+Приклади:
+    python benchmark_http_client.py
+    python benchmark_http_client.py --requests 500 --threads 4
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+
+import http_client  # noqa: E402
+from benchmark_hot_path import format_time  # noqa: E402
+
+BODY = b'{"ok":true,"result":{"message_id":1}}'
+
+
+class CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), CountingHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+
+    def reset(self):
+        with self.lock:
+            self.connections = self.requests = 0
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True  # Заголовки й тіло пишуться окремо - без TCP_NODELAY +40мс на повторному з'єднанні
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        with self.server.lock:
+            self.server.requests += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_sync(send, count: int, threads: int) -> float:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for response in pool.map(lambda _: send(), range(count)):
+            response.content
+    return (time.perf_counter() - started) / count
+
+
+async def run_async(send, count: int, threads: int) -> float:
+    started = time.perf_counter()
+    semaphore = asyncio.Semaphore(threads)
+
+    async def one():
+        async with semaphore:
+            await send()
+
+    await asyncio.gather(*(one() for _ in range(count)))
+    return (time.perf_counter() - started) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк повторного використання HTTP з'єднань")
+    parser.add_argument('--requests', type=int, default=200, help="Запитів на варіант")
+    parser.add_argument('--threads', type=int, default=1, help="Паралельних запитів")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    server = CountingServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/botTOKEN/sendMessage'
+    data = {'chat_id': '1', 'text': 'benchmark', 'message_thread_id': None}
+
+    import aiohttp
+    import requests
+
+    async def aiohttp_fresh():
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                await response.read()
+
+    async def aiohttp_shared():
+        async with aiohttp.ClientSession(connector=http_client.create_connector(),
+                                         trace_configs=[http_client.trace_config()]) as session:
+            async def send():
+                async with session.get(url) as response:
+                    await response.read()
+            return await run_async(send, args.requests, args.threads)
+
+    cases = (
+        ('requests.post на запит', lambda: run_sync(lambda: requests.post(url, data=data, timeout=10),
+                                                    args.requests, args.threads)),
+        (f'http_client.post ({http_client.BACKEND})', lambda: run_sync(lambda: http_client.post(url, data=data, timeout=10),
+                                                                       args.requests, args.threads)),
+        ('aiohttp: сесія на запит', lambda: asyncio.run(run_async(aiohttp_fresh, args.requests, args.threads))),
+        ('aiohttp: create_connector', lambda: asyncio.run(aiohttp_shared()))
+    )
+
+    print("🚀 Бенчмарк повторного використання HTTP з'єднань")
+    print(f"   {args.requests} запитів на варіант, паралельно {args.threads}")
+    print("=" * 70)
+    for label, func in cases:
+        server.reset()
+        per_request = func()
+        reuse = 1 - server.connections / server.requests if server.requests else 0.0
+        print(f"   {label:<32} {format_time(per_request):>10}/запит   з'єднань {server.connections:>4}"
+              f"   reuse {reuse:6.1%}")
+
+    print("\n📊 http_client.connection_stats():")
+    for (client, host), stats in sorted(http_client.connection_stats().items()):
+        print(f"   {client:<8} {host:<12} запитів {stats['requests']:>5.0f}   з'єднань {stats['connections']:>3.0f}"
+              f"   reuse {stats['reuse_rate']:6.1%}")
+
+    http_client.close()
+    server.shutdown()
+    logging.disable(logging.NOTSET)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
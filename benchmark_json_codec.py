@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк серіалізації JSON: стандартний json проти orjson / msgspec
+
+Вимірюється розбір і запис файлів стану репозиторію (data.json, access_data.json,
+seen_tweets файли, threads_mapping.json), синтетичних data.json більшого розміру
+та відповіді UserTweets. Для кожного доступного бекенда - loads, dumps з
+відступами (як раніше) та компактний dumps (як тепер для службових файлів).
+
+Приклади:
+    python benchmark_json_codec.py
+    python benchmark_json_codec.py --sizes 1000,100000 --repeat 3
+"""
+
+import argparse
+import json
+import os
+import sys
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+
+import json_codec  # noqa: E402
+from benchmark_hot_path import format_time, measure  # noqa: E402
+from benchmark_support import scaled_data, format_twitter_date  # noqa: E402
+
+STATE_FILES = ('data.json', 'access_data.json', 'twitter_api_seen_tweets.json', 'twitter_monitor_seen_tweets.json',
+               'seen_tweets.json', 'threads_mapping.json')
+
+
+def user_tweets_response(count: int = 20) -> dict:
+    """Відповідь UserTweets з count твітами (поля, близькі до реальних)"""
+    entries = []
+    for index in range(count):
+        tweet_id = str(1_900_000_000_000_000_000 + index)
+        entries.append({
+            'entryId': f'tweet-{tweet_id}',
+            'sortIndex': tweet_id,
+            'content': {'entryType': 'TimelineTimelineItem', '__typename': 'TimelineTimelineItem', 'itemContent': {
+                'itemType': 'TimelineTweet',
+                'tweet_results': {'result': {
+                    '__typename': 'Tweet',
+                    'rest_id': tweet_id,
+                    'core': {'user_results': {'result': {'legacy': {
+                        'name': 'Bench', 'screen_name': 'bench_user', 'description': 'benchmark profile ' * 5,
+                        'followers_count': 12345, 'profile_image_url_https': 'https://pbs.twimg.com/profile_images/1/x.jpg'
+                    }}}},
+                    'legacy': {
+                        'full_text': f'Benchmark tweet {index} ' * 8,
+                        'created_at': format_twitter_date(1_735_000_000 + index * 60),
+                        'entities': {'hashtags': [{'text': 'bench', 'indices': [0, 6]}], 'urls': [], 'user_mentions': []},
+                        'extended_entities': {'media': [{
+                            'media_url_https': f'https://pbs.twimg.com/media/{tweet_id}.jpg', 'type': 'photo',
+                            'sizes': {size: {'w': 1200, 'h': 675, 'resize': 'fit'} for size in ('large', 'medium', 'small')}
+                        }]},
+                        'favorite_count': index * 3, 'retweet_count': index, 'lang': 'en'
+                    },
+                    'views': {'count': str(index * 100), 'state': 'EnabledWithCount'}
+                }}
+            }}
+        })
+    return {'data': {'user': {'result': {'timeline_v2': {'timeline': {
+        'instructions': [{'type': 'TimelineAddEntries', 'entries': entries}]
+    }}}}}}
+
+
+def backends() -> dict:
+    """Доступні бекенди: назва -> (loads, dumps з відступами, компактний dumps)"""
+    available = {'json': (
+        json.loads,
+        lambda obj: json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8'),
+        lambda obj: json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    )}
+    try:
+        import orjson
+        available['orjson'] = (
+            orjson.loads,
+            lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2),
+            lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        )
+    except ImportError:
+        pass
+    try:
+        import msgspec
+        encoder, decoder = msgspec.json.Encoder(), msgspec.json.Decoder()
+        available['msgspec'] = (
+            decoder.decode,
+            lambda obj: msgspec.json.format(encoder.encode(obj), indent=2),
+            encoder.encode
+        )
+    except ImportError:
+        pass
+    return available
+
+
+def documents(sizes) -> list:
+    """[(назва, об'єкт)]"""
+    docs = []
+    for name in STATE_FILES:
+        path = os.path.join(REPO_DIR, name)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                docs.append((name, json.load(f)))
+    for size in sizes:
+        docs.append((f'data.json[{size} проектів]', scaled_data(size)))
+    docs.append(('UserTweets[20]', user_tweets_response(20)))
+    return docs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк серіалізації JSON")
+    parser.add_argument('--sizes', default='1000,100000', help="Розміри синтетичних data.json")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+
+    available = backends()
+    print(f"🚀 Бенчмарк JSON (активний бекенд json_codec: {json_codec.BACKEND}; доступні: {', '.join(available)})")
+    print("=" * 78)
+    for name, obj in documents(sizes):
+        pretty_size = len(available['json'][1](obj))
+        compact_size = len(available['json'][2](obj))
+        print(f"\n📄 {name}: {pretty_size / 1024:.1f}KB з відступами, {compact_size / 1024:.1f}KB компактно")
+        encoded = available['json'][2](obj)
+        for backend, (loads, dumps_pretty, dumps_compact) in available.items():
+            load_stats = measure(lambda: loads(encoded), args.repeat, args.min_time)
+            pretty_stats = measure(lambda: dumps_pretty(obj), args.repeat, args.min_time)
+            compact_stats = measure(lambda: dumps_compact(obj), args.repeat, args.min_time)
+            print(f"   {backend:<8} loads {format_time(load_stats['median']):>10}   "
+                  f"dumps(indent=2) {format_time(pretty_stats['median']):>10}   "
+                  f"dumps(compact) {format_time(compact_stats['median']):>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
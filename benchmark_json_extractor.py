@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк витягування твітів з вбудованого JSON сторінки профілю
+
+Порівнює обхід TwitterMonitor._extract_tweets_from_json (явний стек, відсікання
+гілок, limit) з попередньою рекурсивною реалізацією, що будувала рядок шляху для
+кожного вузла, а також повний _parse_tweets_from_html з limit і без. Для кожної
+сторінки перевіряється, що обидві реалізації знаходять ті самі твіти, і
+виводиться час та пікова пам'ять.
+
+Сторінки: синтетичні знімки (benchmark_support.profile_html) та, якщо вказано
+--fixtures, збережені HTML сторінки профілів (ім'я файлу = username.html).
+
+Приклади:
+    python benchmark_json_extractor.py
+    python benchmark_json_extractor.py --fixtures captured_pages --limit 5
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import tracemalloc
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+
+from benchmark_hot_path import format_time, measure  # noqa: E402
+from benchmark_support import profile_html  # noqa: E402
+
+INITIAL_STATE = re.compile(r'<script[^>]*>.*?window\.__INITIAL_STATE__\s*=\s*({.*?});', re.DOTALL)
+
+
+def recursive_extract(json_data, username: str) -> list:
+    """Попередня реалізація (рекурсія з рядком шляху) - еталон для порівняння"""
+    tweets = []
+
+    def find_tweets_recursive(obj, path=""):
+        if isinstance(obj, dict):
+            if 'id_str' in obj and 'text' in obj:
+                tweet_author = obj.get('user', {}).get('screen_name', '').lower()
+                if tweet_author and tweet_author != username.lower():
+                    return
+                tweets.append(obj.get('id_str', ''))
+            for key, value in obj.items():
+                find_tweets_recursive(value, f"{path}.{key}")
+        elif isinstance(obj, list):
+            for i, item in enumerate(obj):
+                find_tweets_recursive(item, f"{path}[{i}]")
+
+    find_tweets_recursive(json_data)
+    return tweets
+
+
+def recursive_parse(html: str, username: str, limit: int) -> list:
+    tweets = []
+    for match in INITIAL_STATE.findall(html):
+        tweets.extend(recursive_extract(json.loads(match), username))
+    return tweets[:limit] if limit else tweets
+
+
+def load_pages(args) -> list:
+    """[(назва, username, html, очікувані ID або None)]"""
+    pages = []
+    for tweets, padding in ((20, 200), (100, 2000), (400, 20000)):
+        html, expected = profile_html('bench_user', tweets=tweets, foreign=tweets // 2, padding=padding)
+        pages.append((f'synthetic_{tweets}t_{len(html) // 1024}KB', 'bench_user', html, expected))
+    if args.fixtures:
+        for path in sorted(glob.glob(os.path.join(args.fixtures, '*.html'))):
+            with open(path, 'r', encoding='utf-8') as f:
+                html = f.read()
+            username = os.path.splitext(os.path.basename(path))[0]
+            pages.append((os.path.basename(path), username, html, None))
+    return pages
+
+
+def peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк витягування твітів з JSON сторінки")
+    parser.add_argument('--fixtures', help="Каталог зі збереженими сторінками профілів (*.html)")
+    parser.add_argument('--limit', type=int, default=5, help="limit для _parse_tweets_from_html")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2)
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp(prefix='monitor_json_'))  # Файли стану монітора - у тимчасовому каталозі
+    logging.disable(logging.CRITICAL)
+    from twitter_monitor import TwitterMonitor
+    monitor = TwitterMonitor()
+
+    print("🚀 Бенчмарк витягування твітів з JSON")
+    print("=" * 70)
+    failed = False
+    for name, username, html, expected in load_pages(args):
+        reference = recursive_parse(html, username, 0)
+        found = [tweet['id'] for tweet in monitor._parse_tweets_from_html(html, username)]
+        limited = [tweet['id'] for tweet in monitor._parse_tweets_from_html(html, username, args.limit)]
+        correct = found == reference and limited == reference[:args.limit]
+        if expected is not None:
+            correct = correct and found == expected
+        failed = failed or not correct
+
+        print(f"\n📄 {name}: {len(reference)} твітів {'✅' if correct else '❌ результати розходяться'}")
+        # Обхід вже розібраного JSON (без regex та json.loads) та повний розбір сторінки
+        blobs = [json.loads(match) for match in INITIAL_STATE.findall(html)]
+        cases = (
+            ('обхід: рекурсивний (старий)', lambda: [recursive_extract(blob, username) for blob in blobs]),
+            ('обхід: ітеративний', lambda: [monitor._extract_tweets_from_json(blob, username) for blob in blobs]),
+            (f'обхід: ітеративний limit={args.limit}',
+             lambda: [monitor._extract_tweets_from_json(blob, username, args.limit) for blob in blobs]),
+            ('сторінка: без limit', lambda: monitor._parse_tweets_from_html(html, username)),
+            (f'сторінка: limit={args.limit}', lambda: monitor._parse_tweets_from_html(html, username, args.limit))
+        )
+        for label, func in cases:
+            stats = measure(func, args.repeat, args.min_time)
+            peak = peak_memory(func)
+            print(f"   {label:<34} median {format_time(stats['median']):>10}  пік пам'яті {peak / 1024:8.1f}KB")
+
+    logging.disable(logging.NOTSET)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
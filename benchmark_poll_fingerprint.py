@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк опитування незмінної стрічки UserTweets
+
+Більшість опитувань повертає ті самі твіти (змінюються лише лічильники
+переглядів). Порівнюється вартість одного опитування акаунта в
+TwitterMonitor.check_new_tweets з розбором відповіді (як раніше) та з
+коротким замиканням за відбитком відповіді, а також окремо: json_codec.loads
++ _parse_api_response проти _timeline_fingerprint на тих самих байтах.
+Мережа підмінена сесією в процесі - вимірюється лише власний код.
+
+Приклади:
+    python benchmark_poll_fingerprint.py
+    python benchmark_poll_fingerprint.py --tweets 5,20,100
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+
+import json_codec  # noqa: E402
+from benchmark_hot_path import format_time, measure  # noqa: E402
+from benchmark_json_codec import user_tweets_response  # noqa: E402
+
+USERNAME = 'bench_user'
+
+
+class FakeTimelineResponse:
+    def __init__(self, body: bytes):
+        self.status = 200
+        self.headers = {}
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+class FakeTimelineSession:
+    """Повертає ту саму стрічку, по черзі з різними лічильниками переглядів (тіла готуються заздалегідь)"""
+
+    def __init__(self, tweets: int):
+        self.response = user_tweets_response(tweets)
+        entries = self.response['data']['user']['result']['timeline_v2']['timeline']['instructions'][0]['entries']
+        entries.reverse()  # Від нових до старих, як у справжній стрічці
+        self.results = [entry['content']['itemContent']['tweet_results']['result'] for entry in entries]
+        for result in self.results:
+            result['core']['user_results']['result']['legacy']['screen_name'] = USERNAME
+        self.bodies = []
+        for views in ('100', '101'):
+            for result in self.results:
+                result['views']['count'] = views
+            self.bodies.append(json_codec.dumps(self.response))
+        self.polls = 0
+
+    def post(self, url, json=None, headers=None):
+        self.polls += 1
+        return FakeTimelineResponse(self.bodies[self.polls % 2])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк опитування незмінної стрічки")
+    parser.add_argument('--tweets', default='5,20,100', help="Кількість твітів у відповіді")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2)
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp(prefix='monitor_poll_'))  # Файли стану монітора - у тимчасовому каталозі
+    logging.disable(logging.CRITICAL)
+    from twitter_monitor import TwitterMonitor, _timeline_fingerprint
+
+    loop = asyncio.new_event_loop()
+    print("🚀 Бенчмарк опитування незмінної стрічки UserTweets")
+    print("=" * 70)
+    for count in (int(value) for value in args.tweets.split(',') if value.strip()):
+        session = FakeTimelineSession(count)
+        monitor = TwitterMonitor()
+        monitor.session = session
+        monitor.user_ids[USERNAME] = '1'
+        monitor.add_account(USERNAME)
+        loop.run_until_complete(monitor.check_new_tweets())  # Базове опитування
+
+        def poll_with_parse():
+            monitor.timeline_fingerprints.clear()  # Без збереженого відбитка - повний розбір, як раніше
+            return loop.run_until_complete(monitor.check_new_tweets())
+
+        def poll_with_fingerprint():
+            return loop.run_until_complete(monitor.check_new_tweets())
+
+        body = session.bodies[0]
+        cases = (
+            ('опитування: розбір відповіді', poll_with_parse),
+            ('опитування: відбиток', poll_with_fingerprint),
+            ('loads + _parse_api_response', lambda: monitor._parse_api_response(json_codec.loads(body), USERNAME)),
+            ('_timeline_fingerprint', lambda: _timeline_fingerprint(body))
+        )
+        new_events = len(poll_with_parse()) + len(poll_with_fingerprint())
+        print(f"\n📄 {count} твітів, {len(body) / 1024:.1f}KB {'✅' if not new_events else '❌ знайдено нові події'}")
+        for label, func in cases:
+            stats = measure(func, args.repeat, args.min_time)
+            print(f"   {label:<32} median {format_time(stats['median']):>10}")
+
+    loop.close()
+    logging.disable(logging.NOTSET)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
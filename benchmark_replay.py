@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Офлайн бенчмарк: відтворення трасування подій через реальні монітори та доставку
+
+Twitter події проходять через TwitterMonitor (GraphQL UserTweets на локальній
+заглушці) та bot.handle_twitter_notifications_sync, Discord - через
+bot.handle_discord_notifications_sync. Усі виклики Telegram Bot API йдуть на
+заглушку, яка фіксує час підтвердження кожного повідомлення.
+
+Приклади:
+    python benchmark_replay.py --twitter-accounts 3 --discord-channels 3 --events 5
+    python benchmark_replay.py --trace trace.jsonl --latency-ms 150 --rate-limit 0.05
+    python benchmark_replay.py --no-throttle   # без time.sleep у коді доставки
+
+Формат трасування (JSON Lines):
+    {"t": 1.5, "platform": "twitter", "account": "username", "id": "1800...", "text": "..."}
+    {"t": 2.0, "platform": "discord", "account": "<channel_id>", "id": "1200...", "text": "..."}
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+
+import aiohttp
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+
+from benchmark_support import (StubBehaviour, StubCluster, load_trace, percentile,  # noqa: E402
+                               synthetic_data, synthetic_trace)
+
+STATUS_ID_RE = re.compile(r'/status/(\d+)')
+DISCORD_ID_RE = re.compile(r'/channels/\d+/\d+/(\d+)')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Офлайн бенчмарк доставки подій")
+    parser.add_argument('--trace', help="Файл трасування (JSON Lines); без нього генерується синтетичне")
+    parser.add_argument('--twitter-accounts', type=int, default=2)
+    parser.add_argument('--discord-channels', type=int, default=2)
+    parser.add_argument('--events', type=int, default=3, help="Подій на кожне джерело (синтетичне трасування)")
+    parser.add_argument('--interval', type=float, default=5.0, help="Інтервал між подіями джерела, с")
+    parser.add_argument('--users', type=int, default=1, help="Користувачів, що відстежують кожне джерело")
+    parser.add_argument('--latency-ms', type=float, default=50.0, help="Затримка відповідей заглушок")
+    parser.add_argument('--jitter-ms', type=float, default=10.0)
+    parser.add_argument('--rate-limit', type=float, default=0.0, help="Частка відповідей 429 (0..1)")
+    parser.add_argument('--poll-interval', type=float, default=1.0, help="Пауза між опитуваннями джерел, с")
+    parser.add_argument('--drain-timeout', type=float, default=120.0,
+                        help="Скільки чекати доставки після останньої події, с")
+    parser.add_argument('--no-threads', action='store_true', help="Відправка з тегами замість гілок")
+    parser.add_argument('--no-throttle', action='store_true',
+                        help="Вимкнути time.sleep у коді доставки (вимірює накладні витрати, а не реальну швидкість)")
+    parser.add_argument('--json', action='store_true', help="Вивести результат у JSON")
+    return parser.parse_args()
+
+
+class Replay:
+    """Стан прогону: монітори, заглушки та зіставлення доставок з подіями"""
+
+    def __init__(self, args, events, cluster: StubCluster):
+        self.args = args
+        self.events = events
+        self.cluster = cluster
+        self.bot = None
+        self.twitter_monitor = None
+        self.discord_last_ids = {}
+
+    def setup_bot(self, workdir: str) -> None:
+        """Імпорт bot з оточенням, що вказує на заглушки"""
+        twitter_accounts = sorted({e['account'] for e in self.events if e['platform'] == 'twitter'})
+        discord_channels = sorted({e['account'] for e in self.events if e['platform'] == 'discord'})
+        data = synthetic_data(twitter_accounts, discord_channels, users=self.args.users,
+                              guild_id=self.cluster.discord.guild_id, use_threads=not self.args.no_threads)
+        with open(os.path.join(workdir, 'data.json'), 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+        os.environ['BOT_TOKEN'] = '123456:BENCHMARK'
+        os.environ['TELEGRAM_API_BASE'] = self.cluster.base_url
+        os.environ['METRICS_PORT'] = '0'
+        for name in ('TWITTER_AUTH_TOKEN', 'TWITTER_CSRF_TOKEN', 'DISCORD_AUTHORIZATION'):
+            os.environ.pop(name, None)
+        os.chdir(workdir)
+
+        import bot
+        bot.bot_instance = object()  # Обробники перевіряють лише наявність екземпляра
+        self.bot = bot
+
+        from twitter_monitor import TwitterMonitor
+        self.twitter_monitor = TwitterMonitor('benchmark_auth_token', 'benchmark_csrf')
+        self.twitter_monitor.api_base = self.cluster.base_url
+        for username in twitter_accounts:
+            self.twitter_monitor.add_account(username)
+
+    async def poll_discord(self, session: aiohttp.ClientSession, baseline: bool = False):
+        """Опитування Discord заглушки (discord_monitor в дереві відсутній - опитуємо тут)"""
+        new_messages = []
+        for channel_id in sorted({e['account'] for e in self.events if e['platform'] == 'discord'}):
+            params = {'limit': 50}
+            if self.discord_last_ids.get(channel_id):
+                params['after'] = self.discord_last_ids[channel_id]
+            url = f"{self.cluster.base_url}/api/v9/channels/{channel_id}/messages"
+            async with session.get(url, params=params) as response:
+                if response.status != 200:
+                    continue
+                messages = await response.json()
+            if not messages:
+                continue
+            self.discord_last_ids[channel_id] = messages[0]['id']
+            if baseline:
+                continue
+            for message in reversed(messages):
+                new_messages.append({
+                    'message_id': message['id'],
+                    'channel_id': channel_id,
+                    'author': message['author']['username'],
+                    'content': message['content'],
+                    'timestamp': message['timestamp'],
+                    'url': f"https://discord.com/channels/{message['guild_id']}/{channel_id}/{message['id']}",
+                    'images': [],
+                    'detected_at': time.time()
+                })
+        return new_messages
+
+    async def run(self) -> float:
+        """Відтворити трасування; повертає тривалість прогону"""
+        expected = {e['id'] for e in self.events if e['t'] >= 0}
+        last_offset = max((e['t'] for e in self.events), default=0.0)
+
+        async with self.twitter_monitor, aiohttp.ClientSession() as session:
+            # Базове опитування: до reset() заглушки віддають лише події з t < 0 (опубліковані
+            # до старту), тож жодна подія трасування не потрапляє в базу незалежно від того,
+            # скільки триває імпорт bot і саме опитування (TwitterMonitor чекає 2с між акаунтами)
+            await self.twitter_monitor.check_new_tweets()
+            await self.poll_discord(session, baseline=True)
+            self.cluster.clock.reset()
+            started = self.cluster.clock.started
+            deadline = started + last_offset + self.args.drain_timeout
+
+            while time.time() < deadline:
+                new_tweets = await self.twitter_monitor.check_new_tweets()
+                if new_tweets:
+                    self.bot.handle_twitter_notifications_sync(new_tweets)
+                new_messages = await self.poll_discord(session)
+                if new_messages:
+                    self.bot.handle_discord_notifications_sync(new_messages)
+                if time.time() >= started + last_offset and expected <= self.delivered_ids():
+                    break
+                await asyncio.sleep(self.args.poll_interval)
+            return time.time() - started
+
+    def delivered_ids(self):
+        return set(self.first_acks())
+
+    def first_acks(self):
+        """id події -> час першого підтвердження Telegram"""
+        acks = {}
+        for delivery in list(self.cluster.telegram.deliveries):
+            match = STATUS_ID_RE.search(delivery['text']) or DISCORD_ID_RE.search(delivery['text'])
+            if match and match.group(1) not in acks:
+                acks[match.group(1)] = delivery['acked_at']
+        return acks
+
+    def report(self, duration: float) -> dict:
+        acks = self.first_acks()
+        result = {'duration_seconds': round(duration, 2), 'platforms': {}}
+        for platform in ('twitter', 'discord'):
+            events = [e for e in self.events if e['platform'] == platform and e['t'] >= 0]
+            if not events:
+                continue
+            latencies = [acks[e['id']] - self.cluster.clock.published_at(e['t']) for e in events if e['id'] in acks]
+            delivered = len(latencies)
+            result['platforms'][platform] = {
+                'events': len(events),
+                'delivered': delivered,
+                'undelivered': len(events) - delivered,
+                'events_per_second': round(delivered / duration, 3) if duration else 0.0,
+                'p50': percentile(latencies, 50),
+                'p95': percentile(latencies, 95),
+                'p99': percentile(latencies, 99),
+                'max': max(latencies) if latencies else None
+            }
+        result['telegram_calls'] = dict(self.cluster.telegram.calls)
+        result['rate_limited'] = {
+            'twitter': self.cluster.twitter.behaviour.rate_limited,
+            'discord': self.cluster.discord.behaviour.rate_limited,
+            'telegram': self.cluster.telegram.behaviour.rate_limited
+        }
+        return result
+
+
+def print_report(result: dict) -> None:
+    def fmt(value):
+        return '-' if value is None else f'{value:.2f}с'
+
+    print("\n📊 Результати бенчмарку")
+    print("=" * 45)
+    print(f"Тривалість: {result['duration_seconds']}с")
+    for platform, stats in result['platforms'].items():
+        print(f"\n{'🐦 Twitter' if platform == 'twitter' else '💬 Discord'}:")
+        print(f"   Доставлено: {stats['delivered']}/{stats['events']} (не доставлено: {stats['undelivered']})")
+        print(f"   Подій/с: {stats['events_per_second']}")
+        print(f"   Публікація → підтвердження: p50 {fmt(stats['p50'])}, p95 {fmt(stats['p95'])}, "
+              f"p99 {fmt(stats['p99'])}, max {fmt(stats['max'])}")
+    print(f"\nВиклики Telegram: {result['telegram_calls']}")
+    print(f"Відповіді 429: {result['rate_limited']}")
+
+
+def main():
+    args = parse_args()
+    if args.trace:
+        events = load_trace(args.trace)
+    else:
+        events = synthetic_trace(args.twitter_accounts, args.discord_channels, args.events,
+                                 args.interval, warmup=1.0)
+
+    if args.no_throttle:
+        print("⚠️ time.sleep вимкнено: результати показують накладні витрати коду, а не реальну швидкість доставки")
+        time.sleep = lambda seconds: None
+
+    twitter = StubBehaviour(args.latency_ms, args.jitter_ms, args.rate_limit, seed=1)
+    discord = StubBehaviour(args.latency_ms, args.jitter_ms, args.rate_limit, seed=2)
+    telegram = StubBehaviour(args.latency_ms, args.jitter_ms, args.rate_limit, seed=3)
+    cluster = StubCluster(twitter, discord, telegram)
+    cluster.load_trace(events)
+    cluster.start()
+
+    print(f"🚀 Відтворення {sum(1 for e in events if e['t'] >= 0)} подій через {cluster.base_url}")
+    workdir = tempfile.mkdtemp(prefix='monitor_bench_')
+    replay = Replay(args, events, cluster)
+    try:
+        replay.setup_bot(workdir)
+        duration = asyncio.run(replay.run())
+        result = replay.report(duration)
+    finally:
+        cluster.stop()
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print_report(result)
+    undelivered = sum(stats['undelivered'] for stats in result['platforms'].values())
+    return 0 if not undelivered else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
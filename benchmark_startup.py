@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк запуску: час імпорту bot.py у чистому процесі
+
+Кожен замір - окремий інтерпретатор у тимчасовому каталозі (порожній data.json),
+тому кеш модулів не впливає на результат. Додатково перевіряється, що
+платформні бекенди (twscrape, selenium, монітори) не імпортуються під час
+старту - вони мають завантажуватись лише у фоновому етапі.
+
+Приклади:
+    python benchmark_startup.py
+    python benchmark_startup.py --runs 10 --max-seconds 1.5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+LAZY_MODULES = ('twscrape', 'selenium', 'twitter_monitor_adapter', 'twitter_monitor', 'discord_monitor',
+                'selenium_twitter_monitor')
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {repo!r})
+import bot
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    'import_seconds': elapsed,
+    'loaded': [name for name in {lazy!r} if name in sys.modules]
+}}))
+"""
+
+
+def run_probe(workdir: str) -> dict:
+    env = dict(os.environ, BOT_TOKEN='123456:BENCHMARK', METRICS_PORT='0')
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(repo=REPO_DIR, lazy=LAZY_MODULES)],
+        cwd=workdir, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк запуску bot.py")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-seconds', type=float, default=0.0,
+                        help="Завершитись з кодом 1, якщо медіана імпорту більша (0 - без перевірки)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='monitor_startup_')
+    with open(os.path.join(workdir, 'data.json'), 'w', encoding='utf-8') as f:
+        json.dump({'projects': {}, 'users': {}, 'settings': {}, 'selenium_accounts': {}}, f)
+
+    print("🚀 Бенчмарк запуску bot.py")
+    print("=" * 45)
+    timings = []
+    loaded = set()
+    for run in range(1, args.runs + 1):
+        result = run_probe(workdir)
+        timings.append(result['import_seconds'])
+        loaded.update(result['loaded'])
+        print(f"   {run}. import bot: {result['import_seconds']:.3f}с")
+
+    median = statistics.median(timings)
+    print(f"\n📊 Медіана: {median:.3f}с, мін: {min(timings):.3f}с, макс: {max(timings):.3f}с")
+
+    failed = False
+    if loaded:
+        print(f"❌ Під час імпорту завантажено бекенди: {', '.join(sorted(loaded))}")
+        failed = True
+    else:
+        print("✅ Платформні бекенди не імпортуються при старті")
+    if args.max_seconds and median > args.max_seconds:
+        print(f"❌ Медіана перевищує ліміт {args.max_seconds:.2f}с")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""
+Допоміжні засоби для бенчмарків: локальні заглушки API та синтетичні дані
+
+Заглушки (aiohttp.web) імітують:
+    - Twitter GraphQL: UserByScreenName та UserTweets
+    - Discord: GET /api/v9/channels/{channel_id}/messages
+    - Telegram Bot API: sendMessage, sendPhoto, sendMediaGroup, createForumTopic
+
+Кожна заглушка має налаштовувану затримку відповіді та частку відповідей 429.
+Події стають видимими в джерелах за розкладом трасування (поле "t" у секундах
+від старту), тому монітори бачать їх так само, як нові твіти/повідомлення.
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from aiohttp import web
+
+TWITTER_USER_BY_SCREEN_NAME = '7mjxD3-C6BxitZR0F6X0aQ'
+TWITTER_USER_TWEETS = '9jV-614Qopr4Eg6_JNNoqQ'
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Точний перцентиль (0..100) з лінійною інтерполяцією"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def format_twitter_date(timestamp: float) -> str:
+    """Дата у форматі legacy.created_at Twitter"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime('%a %b %d %H:%M:%S %z %Y')
+
+
+class StubBehaviour:
+    """Затримка та ін'єкція 429 для заглушки"""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, rate_limit_ratio: float = 0.0,
+                 retry_after: int = 1, seed: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.rate_limited = 0
+
+    async def delay(self) -> None:
+        latency = self.latency_ms + (self.random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0)
+        if latency > 0:
+            await asyncio.sleep(latency / 1000.0)
+
+    def should_rate_limit(self) -> bool:
+        self.requests += 1
+        if self.rate_limit_ratio and self.random.random() < self.rate_limit_ratio:
+            self.rate_limited += 1
+            return True
+        return False
+
+
+class ReplayClock:
+    """Спільний відлік часу трасування для всіх заглушок
+
+    До reset() видно лише події з t < 0 (опубліковані до старту): імпорт bot і
+    підготовка прогону не повинні "випускати" події трасування.
+    """
+
+    def __init__(self):
+        self.started: Optional[float] = None
+
+    def reset(self) -> None:
+        self.started = time.time()
+
+    def visible(self, offset: float) -> bool:
+        if self.started is None:
+            return offset < 0
+        return time.time() >= self.started + offset
+
+    def published_at(self, offset: float) -> float:
+        return (time.time() if self.started is None else self.started) + offset
+
+
+class TwitterStub:
+    """GraphQL UserByScreenName / UserTweets поверх трасування"""
+
+    def __init__(self, clock: ReplayClock, behaviour: StubBehaviour):
+        self.clock = clock
+        self.behaviour = behaviour
+        self.timelines: Dict[str, List[Dict]] = {}  # username -> події (за зростанням t)
+        self.user_ids: Dict[str, str] = {}
+
+    def load(self, events: Iterable[Dict]) -> None:
+        for event in events:
+            username = event['account']
+            self.user_ids.setdefault(username, str(1000 + len(self.user_ids)))
+            self.timelines.setdefault(username, []).append(event)
+        for timeline in self.timelines.values():
+            timeline.sort(key=lambda event: event['t'])
+
+    def routes(self) -> List[web.RouteDef]:
+        return [web.post('/i/api/graphql/{query_id}', self.handle_graphql)]
+
+    async def handle_graphql(self, request: web.Request) -> web.Response:
+        await self.behaviour.delay()
+        if self.behaviour.should_rate_limit():
+            return web.json_response({'errors': [{'message': 'Rate limit exceeded', 'code': 88}]}, status=429)
+
+        body = await request.json()
+        variables = json.loads(body.get('variables', '{}'))
+        query_id = request.match_info['query_id']
+
+        if query_id == TWITTER_USER_BY_SCREEN_NAME:
+            username = variables.get('screen_name', '')
+            user_id = self.user_ids.get(username)
+            if not user_id:
+                return web.json_response({'data': {}}, status=404)
+            return web.json_response({'data': {'user': {'result': {'rest_id': user_id}}}})
+
+        if query_id == TWITTER_USER_TWEETS:
+            user_id = variables.get('userId')
+            username = next((name for name, uid in self.user_ids.items() if uid == user_id), None)
+            if username is None:
+                return web.json_response({'data': {}}, status=404)
+            count = int(variables.get('count', 20))
+            # Курсор - кількість уже відданих найновіших подій (сторінки йдуть у минуле)
+            offset = int(variables.get('cursor') or 0)
+            visible = [event for event in self.timelines.get(username, []) if self.clock.visible(event['t'])]
+            newest_first = list(reversed(visible))
+            page = newest_first[offset:offset + count]
+            entries = [self._entry(username, event) for event in page]
+            if offset + count < len(newest_first):
+                entries.append({'entryId': f'cursor-bottom-{offset + count}',
+                                'content': {'entryType': 'TimelineTimelineCursor', 'cursorType': 'Bottom',
+                                            'value': str(offset + count)}})
+            return web.json_response({'data': {'user': {'result': {'timeline_v2': {'timeline': {
+                'instructions': [{'type': 'TimelineAddEntries', 'entries': entries}]
+            }}}}}})
+
+        return web.json_response({'errors': [{'message': 'Unknown query'}]}, status=400)
+
+    def _entry(self, username: str, event: Dict) -> Dict:
+        return {
+            'entryId': f"tweet-{event['id']}",
+            'type': 'TimelineTimelineItem',
+            'content': {
+                'entryType': 'TimelineTimelineItem',
+                'itemContent': {'tweet_results': {'result': {
+                    '__typename': 'Tweet',
+                    'rest_id': event['id'],
+                    'core': {'user_results': {'result': {'legacy': {'name': username, 'screen_name': username}}}},
+                    'legacy': {
+                        'full_text': event['text'],
+                        'created_at': format_twitter_date(self.clock.published_at(event['t']))
+                    }
+                }}}
+            }
+        }
+
+
+class DiscordStub:
+    """GET /api/v9/channels/{channel_id}/messages поверх трасування"""
+
+    def __init__(self, clock: ReplayClock, behaviour: StubBehaviour, guild_id: str = '900000000000000000'):
+        self.clock = clock
+        self.behaviour = behaviour
+        self.guild_id = guild_id
+        self.channels: Dict[str, List[Dict]] = {}
+
+    def load(self, events: Iterable[Dict]) -> None:
+        for event in events:
+            self.channels.setdefault(event['account'], []).append(event)
+        for messages in self.channels.values():
+            messages.sort(key=lambda event: event['t'])
+
+    def routes(self) -> List[web.RouteDef]:
+        return [web.get('/api/v9/channels/{channel_id}/messages', self.handle_messages)]
+
+    async def handle_messages(self, request: web.Request) -> web.Response:
+        await self.behaviour.delay()
+        if self.behaviour.should_rate_limit():
+            return web.json_response({'message': 'You are being rate limited.', 'retry_after': self.behaviour.retry_after,
+                                      'global': False}, status=429)
+
+        channel_id = request.match_info['channel_id']
+        limit = int(request.query.get('limit', 50))
+        after = int(request.query.get('after', 0) or 0)
+        visible = [event for event in self.channels.get(channel_id, [])
+                   if self.clock.visible(event['t']) and int(event['id']) > after]
+        # Discord віддає найновіші першими
+        messages = [{
+            'id': event['id'],
+            'channel_id': channel_id,
+            'guild_id': self.guild_id,
+            'content': event['text'],
+            'author': {'id': '1', 'username': event.get('author', 'replay')},
+            'timestamp': datetime.fromtimestamp(self.clock.published_at(event['t']), tz=timezone.utc).isoformat(),
+            'attachments': []
+        } for event in reversed(visible[-limit:])]
+        return web.json_response(messages)
+
+
+class TelegramStub:
+    """Telegram Bot API: фіксує час підтвердження кожного надісланого повідомлення"""
+
+    def __init__(self, behaviour: StubBehaviour):
+        self.behaviour = behaviour
+        self.deliveries: List[Dict] = []  # {'method', 'text', 'acked_at'}
+        self.calls: Dict[str, int] = {}
+        self._next_message_id = 1
+        self._next_thread_id = 100
+
+    def routes(self) -> List[web.RouteDef]:
+        return [
+            web.post('/bot{token}/{method}', self.handle_method),
+            web.get('/media/{name}', self.handle_media)
+        ]
+
+    async def handle_method(self, request: web.Request) -> web.Response:
+        method = request.match_info['method']
+        self.calls[method] = self.calls.get(method, 0) + 1
+        await self.behaviour.delay()
+        if self.behaviour.should_rate_limit():
+            return web.json_response({'ok': False, 'error_code': 429,
+                                      'description': f'Too Many Requests: retry after {self.behaviour.retry_after}',
+                                      'parameters': {'retry_after': self.behaviour.retry_after}}, status=429)
+
+        form = await request.post()
+        if method == 'createForumTopic':
+            self._next_thread_id += 1
+            return web.json_response({'ok': True, 'result': {'message_thread_id': self._next_thread_id,
+                                                             'name': form.get('name', '')}})
+
+        text = form.get('text') or form.get('caption') or ''
+        if method == 'sendMediaGroup':
+            try:
+                media = json.loads(form.get('media', '[]'))
+                text = next((item.get('caption', '') for item in media if item.get('caption')), '')
+            except ValueError:
+                pass
+        self.deliveries.append({'method': method, 'text': str(text), 'acked_at': time.time()})
+        self._next_message_id += 1
+        return web.json_response({'ok': True, 'result': {'message_id': self._next_message_id}})
+
+    async def handle_media(self, request: web.Request) -> web.Response:
+        # Мінімальний валідний GIF 1x1 для download_and_send_image
+        body = (b'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00'
+                b',\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;')
+        return web.Response(body=body, content_type='image/gif')
+
+
+class StubCluster:
+    """Усі заглушки на одному локальному порту в окремому потоці з власним event loop"""
+
+    def __init__(self, twitter: StubBehaviour, discord: StubBehaviour, telegram: StubBehaviour):
+        self.clock = ReplayClock()
+        self.twitter = TwitterStub(self.clock, twitter)
+        self.discord = DiscordStub(self.clock, discord)
+        self.telegram = TelegramStub(telegram)
+        self.base_url = ''
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._ready = threading.Event()
+
+    def load_trace(self, events: List[Dict]) -> None:
+        self.twitter.load(event for event in events if event['platform'] == 'twitter')
+        self.discord.load(event for event in events if event['platform'] == 'discord')
+
+    def start(self) -> str:
+        """Запустити сервер у фоновому потоці; повертає базовий URL"""
+        thread = threading.Thread(target=self._serve, name='benchmark-stubs', daemon=True)
+        thread.start()
+        if not self._ready.wait(10):
+            raise RuntimeError("Заглушки не запустилися за 10 секунд")
+        return self.base_url
+
+    def _serve(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._start_site())
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _start_site(self) -> None:
+        app = web.Application()
+        app.add_routes(self.twitter.routes() + self.discord.routes() + self.telegram.routes())
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f'http://127.0.0.1:{port}'
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        future = asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop)
+        try:
+            future.result(5)
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+def synthetic_trace(twitter_accounts: int, discord_channels: int, events_per_source: int,
+                    interval: float, warmup: float = 3.0, seed: int = 42) -> List[Dict]:
+    """Згенерувати трасування: рівномірний потік подій з невеликим розкидом"""
+    rng = random.Random(seed)
+    events = []
+    next_id = 1_800_000_000_000_000_000
+    sources = [('twitter', f'bench_user{i}') for i in range(twitter_accounts)]
+    sources += [('discord', str(1_100_000_000_000_000_000 + i)) for i in range(discord_channels)]
+    for platform, account in sources:
+        # Одна стара подія - база для першого опитування монітора
+        next_id += 1
+        events.append({'t': -60.0, 'platform': platform, 'account': account, 'id': str(next_id),
+                       'text': f'baseline {account}'})
+        for n in range(events_per_source):
+            next_id += 1
+            events.append({
+                't': warmup + n * interval + rng.uniform(0, interval / 2),
+                'platform': platform,
+                'account': account,
+                'id': str(next_id),
+                'text': f'replay event {n} from {account}'
+            })
+    events.sort(key=lambda event: event['t'])
+    return events
+
+
+def profile_html(username: str, tweets: int = 40, foreign: int = 20, padding: int = 2000,
+                 seed: int = 7) -> Tuple[str, List[str]]:
+    """Сторінка профілю з вбудованим window.__INITIAL_STATE__ у форматі знімків x.com
+
+    padding - кількість записів конфігурації (featureSwitch), яка на реальних
+    сторінках займає більшу частину JSON. Між твітами акаунта вставлено foreign
+    ретвітів/цитат інших авторів. Повертає (html, ID твітів акаунта в порядку документа).
+    """
+    rng = random.Random(seed)
+    next_id = 1_850_000_000_000_000_000
+
+    def author(screen_name: str) -> Dict:
+        return {
+            'id_str': str(rng.randrange(10 ** 9, 10 ** 10)),
+            'screen_name': screen_name,
+            'name': screen_name.title(),
+            'description': 'benchmark profile ' * 4,
+            'profile_image_extensions': {'mediaColor': {'r': {'ok': {'palette': [
+                {'percentage': rng.random() * 100, 'rgb': {'red': 1, 'green': 2, 'blue': 3}} for _ in range(5)]}}}},
+            'entities': {'url': {'urls': [{'url': 'https://t.co/x', 'expanded_url': 'https://example.com'}]}}
+        }
+
+    def tweet(tweet_id: int, screen_name: str, text: str) -> Dict:
+        return {
+            'id_str': str(tweet_id),
+            'text': text,
+            'created_at': format_twitter_date(1_735_000_000 + tweet_id % 100_000),
+            'user': author(screen_name),
+            'entities': {
+                'hashtags': [{'text': 'bench', 'indices': [0, 6]}],
+                'urls': [{'url': 'https://t.co/y', 'expanded_url': 'https://example.com/post', 'indices': [7, 30]}],
+                'user_mentions': [{'screen_name': 'someone', 'id_str': '12345', 'indices': [31, 39]}]
+            },
+            'extended_entities': {'media': [{
+                'id_str': str(tweet_id + 1), 'type': 'photo',
+                'media_url_https': f'https://pbs.twimg.com/media/{tweet_id}.jpg',
+                'sizes': {size: {'w': 1200, 'h': 675, 'resize': 'fit'} for size in ('large', 'medium', 'small', 'thumb')}
+            }]},
+            'retweet_count': rng.randrange(1000),
+            'favorite_count': rng.randrange(10000)
+        }
+
+    own_ids = []
+    entries = []
+    total = tweets + foreign
+    foreign_positions = set(rng.sample(range(1, total), foreign)) if total > 1 else set()
+    for index in range(total):
+        next_id += 1000
+        if index in foreign_positions:
+            item = tweet(next_id, f'other_{index}', f'retweeted post {index}')
+        else:
+            item = tweet(next_id, username, f'post {index} from {username}')
+            if index % 5 == 0:
+                item['quoted_status'] = tweet(next_id + 500, f'quoted_{index}', f'quoted post {index}')
+            own_ids.append(item['id_str'])
+        entries.append({'entryId': f'tweet-{next_id}', 'sortIndex': str(next_id), 'content': {'tweet': item}})
+
+    state = {
+        'featureSwitch': {'config': {f'flag_{i}': {'value': bool(i % 2), 'variant': f'v{i % 7}'} for i in range(padding)}},
+        'settings': {'remote': {'language': 'en', 'country': 'UA', 'nsfw_view': False}},
+        'timeline': {'instructions': [{'type': 'TimelineAddEntries', 'entries': entries}]}
+    }
+    page = (
+        '<!DOCTYPE html><html dir="ltr" lang="en"><head><meta charset="utf-8">'
+        f'<title>{username} / X</title></head><body>'
+        f'<script type="text/javascript">window.__INITIAL_STATE__={json.dumps(state, separators=(",", ":"))};'
+        'window.__META_DATA__={"env":"prod"};</script>'
+        '<div id="react-root"></div></body></html>'
+    )
+    return page, own_ids
+
+
+def load_trace(path: str) -> List[Dict]:
+    """Завантажити записане трасування (JSON Lines: t, platform, account, id, text)"""
+    events = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                events.append(json.loads(line))
+    events.sort(key=lambda event: event['t'])
+    return events
+
+
+def synthetic_data(twitter_accounts: List[str], discord_channels: List[str], users: int = 1,
+                   forward_channel: str = '-1001234567890', guild_id: str = '900000000000000000',
+                   use_threads: bool = True) -> Dict:
+    """data.json для ProjectManager: кожен користувач відстежує всі джерела"""
+    projects = {}
+    forward_settings = {}
+    for user_index in range(users):
+        user_id = str(700000000 + user_index)
+        user_projects = []
+        for username in twitter_accounts:
+            project_id = len(user_projects) + 1
+            user_projects.append({
+                'id': project_id, 'name': f'Twitter {username}', 'platform': 'twitter',
+                'url': f'https://twitter.com/{username}', 'tag': f'#tw_{username}'[:20],
+                'admins': [int(user_id)], 'ping_users': [], 'created_by': int(user_id)
+            })
+        for channel_id in discord_channels:
+            project_id = len(user_projects) + 1
+            user_projects.append({
+                'id': project_id, 'name': f'Discord {channel_id}', 'platform': 'discord',
+                'url': f'https://discord.com/channels/{guild_id}/{channel_id}', 'tag': f'#ds_{channel_id[-6:]}',
+                'admins': [int(user_id)], 'ping_users': [], 'created_by': int(user_id)
+            })
+        projects[user_id] = user_projects
+        forward_settings[user_id] = {
+            'channel_id': forward_channel, 'enabled': True, 'created_at': datetime.now().isoformat(),
+            'use_threads': use_threads, 'project_threads': {}
+        }
+    return {
+        'projects': projects,
+        'users': {},
+        'settings': {'forward_settings': forward_settings, 'sent_messages': {}},
+        'selenium_accounts': {},
+        'metadata': {'version': '1.0', 'created_at': datetime.now().isoformat(),
+                     'last_updated': datetime.now().isoformat()}
+    }
+
+
+def scaled_data(total_projects: int, projects_per_user: int = 20, projects_per_source: int = 5,
+                sent_history: int = 100, twitter_share: float = 0.7) -> Dict:
+    """data.json заданого розміру для мікробенчмарків
+
+    Кожне джерело відстежують ~projects_per_source проектів різних користувачів,
+    у кожного користувача налаштовано пересилання з готовими гілками та історія
+    sent_messages довжиною sent_history.
+    """
+    users = max(1, total_projects // projects_per_user)
+    sources = max(1, total_projects // projects_per_source)
+    twitter_sources = max(1, int(sources * twitter_share))
+    guild_id = '900000000000000000'
+    created_at = datetime.now().isoformat()
+
+    projects: Dict[str, List[Dict]] = {}
+    forward_settings: Dict[str, Dict] = {}
+    sent_messages: Dict[str, Dict] = {}
+    for index in range(total_projects):
+        user_id = str(700000000 + index % users)
+        user_projects = projects.setdefault(user_id, [])
+        project_id = len(user_projects) + 1
+        source = (index * 7919) % sources  # Розкидаємо джерела між користувачами
+        if source < twitter_sources:
+            project = {'platform': 'twitter', 'name': f'Twitter bench_user{source}',
+                       'url': f'https://twitter.com/bench_user{source}', 'tag': f'#tw_{source}'}
+        else:
+            channel_id = str(1_100_000_000_000_000_000 + source)
+            project = {'platform': 'discord', 'name': f'Discord {channel_id}',
+                       'url': f'https://discord.com/channels/{guild_id}/{channel_id}', 'tag': f'#ds_{source}'}
+        project.update({'id': project_id, 'admins': [int(user_id)], 'ping_users': [], 'created_by': int(user_id)})
+        user_projects.append(project)
+
+    for user_index, user_id in enumerate(projects):
+        forward_channel = str(-1001000000000 - user_index)
+        forward_settings[user_id] = {
+            'channel_id': forward_channel, 'enabled': True, 'created_at': created_at, 'use_threads': True,
+            'project_threads': {str(p['id']): 1000 + p['id'] for p in projects[user_id]}
+        }
+        sent_messages[user_id] = {forward_channel: [
+            {'message_id': f'history_{user_index}_{n}', 'timestamp': created_at} for n in range(sent_history)
+        ]}
+
+    return {
+        'projects': projects,
+        'users': {},
+        'settings': {'forward_settings': forward_settings, 'sent_messages': sent_messages},
+        'selenium_accounts': {},
+        'metadata': {'version': '1.0', 'created_at': created_at, 'last_updated': created_at}
+    }
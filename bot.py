@@ -1,44 +1,67 @@
+import time
+_startup_started = time.perf_counter()  # Відлік часу запуску (звіт startup_seconds)
 import logging
 import asyncio
+import importlib
 import threading
-import requests
 import tempfile
 import os
 import json
 from datetime import datetime
-from typing import List, Dict, Optional, Any, Set
-import time
+from typing import List, Dict, Optional, Any, Set, Iterable, Iterator, Union
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, CallbackQuery
 from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQueryHandler, filters, ContextTypes, JobQueue
 from security_manager import SecurityManager
 from project_manager import ProjectManager
-from discord_monitor import DiscordMonitor
-from twitter_monitor import TwitterMonitor
-from twitter_monitor_adapter import TwitterMonitorAdapter
 from access_manager import access_manager
-from config import BOT_TOKEN, ADMIN_PASSWORD, SECURITY_TIMEOUT, MESSAGES, DISCORD_AUTHORIZATION, MONITORING_INTERVAL, TWITTER_AUTH_TOKEN, TWITTER_CSRF_TOKEN, TWITTER_MONITORING_INTERVAL
-
-# Налаштування логування - тільки критичні помилки для швидкості
-import logging
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.ERROR
-)
-
-# Відключаємо детальне логування для Twitter моніторингу
-logging.getLogger('twitter_monitor').setLevel(logging.WARNING)
-logging.getLogger('twitter_monitor_adapter').setLevel(logging.WARNING)
-logging.getLogger('httpx').setLevel(logging.WARNING)
+from callback_router import CallbackRouter
+from monitor_subscriptions import SubscriptionIndex, FORBIDDEN_TWITTER_ACCOUNTS, is_forbidden_twitter_account
+from metrics import REGISTRY as metrics_registry, start_http_server as start_metrics_server
+from freshness import freshness_tracker
+from log_utils import configure_logging, SampledLogger, event
+from sampling_profiler import profiler as sampling_profiler
+import json_codec
+import http_client
+from events import TweetEvent, DiscordEvent, as_tweet_event, as_discord_event
+from twitter_credentials import parse_credentials
+from config import BOT_TOKEN, ADMIN_PASSWORD, SECURITY_TIMEOUT, MESSAGES, DISCORD_AUTHORIZATION, MONITORING_INTERVAL, TWITTER_AUTH_TOKEN, TWITTER_CSRF_TOKEN, TWITTER_CREDENTIALS, TWITTER_CREDENTIAL_STRATEGY, TWITTER_MONITORING_INTERVAL, TWITTER_BATCH_POLLING, METRICS_PORT, PROFILE_SECONDS, TELEGRAM_API_BASE, LOG_LEVEL, LOG_LEVELS, LOG_FORMAT
+
+# Налаштування логування: рівні підсистем задаються через LOG_LEVEL / LOG_LEVELS
+configure_logging(LOG_LEVEL, LOG_LEVELS, LOG_FORMAT)
 
 logger = logging.getLogger(__name__)
+# Рядки на кожну подію доставки: окрема підсистема 'bot.delivery' з обмеженням частоти
+delivery_logger = logging.getLogger('bot.delivery')
+delivery_log = SampledLogger(delivery_logger, interval=10.0, burst=5)
 
 # Ініціалізація менеджерів
 security_manager = SecurityManager(SECURITY_TIMEOUT)
 project_manager = ProjectManager()
-discord_monitor = DiscordMonitor(DISCORD_AUTHORIZATION) if DISCORD_AUTHORIZATION else None
-twitter_monitor = TwitterMonitor(TWITTER_AUTH_TOKEN, TWITTER_CSRF_TOKEN) if TWITTER_AUTH_TOKEN and TWITTER_CSRF_TOKEN else None
+# Монітори створюються у фоновому етапі запуску (init_platform_backends)
+discord_monitor = None
+twitter_monitor = None
 twitter_monitor_adapter = None  # Twitter Monitor Adapter (заміна Selenium)
 
+# Таблиця маршрутів для inline-кнопок (заповнюється декораторами нижче)
+callback_router = CallbackRouter()
+
+# Індекс підписок моніторів (оновлюється подіями ProjectManager)
+subscription_index = SubscriptionIndex()
+
+# Метрики відправки в Telegram та обробки сповіщень
+TELEGRAM_REQUEST_SECONDS = metrics_registry.histogram(
+    'telegram_request_seconds', 'Затримка запитів до Telegram Bot API', ('method',))
+TELEGRAM_RESPONSES = metrics_registry.counter(
+    'telegram_responses_total', 'Відповіді Telegram Bot API за статусом', ('method', 'status'))
+TELEGRAM_RATE_LIMITED = metrics_registry.counter(
+    'telegram_rate_limited_total', 'Відповіді 429 від Telegram Bot API', ('method',))
+STARTUP_SECONDS = metrics_registry.gauge(
+    'startup_seconds', 'Час запуску від старту процесу за етапами', ('stage',))
+NOTIFICATION_HANDLER_SECONDS = metrics_registry.histogram(
+    'notification_handler_seconds', 'Тривалість обробки пачки сповіщень', ('platform',))
+NOTIFICATIONS_RECEIVED = metrics_registry.counter(
+    'notifications_received_total', 'Події, отримані обробниками сповіщень', ('platform',))
+
 # Словник для зберігання стану користувачів (очікують пароль)
 waiting_for_password = {}
 
@@ -79,10 +102,56 @@ def require_auth(func):
     
     return wrapper
 
+# ===================== Лінивий імпорт платформних бекендів =====================
+def _backend_class(module_name: str, class_name: str):
+    """Імпортувати клас монітора при першому використанні (twscrape, selenium тощо не вантажаться при старті)"""
+    return getattr(importlib.import_module(module_name), class_name)
+
+def create_twitter_monitor_adapter():
+    """Створити Twitter Monitor Adapter (імпорт twscrape відбувається тут)"""
+    return _backend_class('twitter_monitor_adapter', 'TwitterMonitorAdapter')(batch_polling=TWITTER_BATCH_POLLING)
+
+def init_platform_backends() -> None:
+    """Імпортувати та створити монітори. Виконується у фоні, поки бот вже приймає команди"""
+    global discord_monitor, twitter_monitor, twitter_monitor_adapter
+    
+    if DISCORD_AUTHORIZATION and discord_monitor is None:
+        try:
+            discord_monitor = _backend_class('discord_monitor', 'DiscordMonitor')(DISCORD_AUTHORIZATION)
+        except Exception as e:
+            logger.error(f"Помилка ініціалізації Discord монітора: {e}")
+    
+    twitter_credentials = parse_credentials(TWITTER_CREDENTIALS)
+    if ((TWITTER_AUTH_TOKEN and TWITTER_CSRF_TOKEN) or twitter_credentials) and twitter_monitor is None:
+        try:
+            twitter_monitor = _backend_class('twitter_monitor', 'TwitterMonitor')(
+                TWITTER_AUTH_TOKEN if TWITTER_CSRF_TOKEN else None, TWITTER_CSRF_TOKEN,
+                batch_polling=TWITTER_BATCH_POLLING, credentials=twitter_credentials,
+                strategy=TWITTER_CREDENTIAL_STRATEGY)
+        except Exception as e:
+            logger.error(f"Помилка ініціалізації Twitter монітора: {e}")
+    
+    # Ініціалізуємо Twitter Monitor Adapter (основний підхід)
+    if twitter_monitor_adapter is None:
+        try:
+            adapter = create_twitter_monitor_adapter()
+            # Завантажуємо збережені акаунти в адаптер
+            saved_accounts = project_manager.get_selenium_accounts()
+            if saved_accounts:
+                logger.info(f"Завантажено {len(saved_accounts)} збережених акаунтів в Twitter Monitor Adapter: {saved_accounts}")
+                for username in saved_accounts:
+                    adapter.add_account(username)
+            # Команда користувача могла вже створити адаптер, поки йшов імпорт
+            if twitter_monitor_adapter is None:
+                twitter_monitor_adapter = adapter
+            logger.info("✅ Twitter Monitor Adapter ініціалізовано")
+        except Exception as e:
+            logger.error(f"Помилка ініціалізації Twitter Monitor Adapter: {e}")
+
 # ===================== Синхронізація моніторів з проектами =====================
 def clean_forbidden_accounts():
     """Очистити заборонені акаунти з моніторів"""
-    forbidden_accounts = ['twitter', 'x']
+    forbidden_accounts = FORBIDDEN_TWITTER_ACCOUNTS
     
     # Очищаємо Twitter монітор
     if twitter_monitor:
@@ -108,114 +177,201 @@ def clean_forbidden_accounts():
                 logger.info(f"🧹 Видалено заборонений Twitter Monitor Adapter акаунт: {account}")
         twitter_monitor_adapter.save_seen_tweets()
 
+def _project_subscription(project: Dict) -> Optional[tuple]:
+    """Визначити підписку проекту: (platform, key, target) або None"""
+    platform = project.get('platform')
+    url = project.get('url', '')
+    if platform == 'twitter':
+        username = extract_twitter_username(url)
+        if username and not is_forbidden_twitter_account(username):
+            return 'twitter', username, username
+        if username:
+            logger.warning(f"   ⚠️ Пропущено заборонений Twitter акаунт: {username}")
+    elif platform == 'discord':
+        channel_id = extract_discord_channel_id(url)
+        if channel_id:
+            return 'discord', channel_id, url  # Зберігаємо оригінальний URL
+    return None
+
+def _account_subscription(username: str) -> Optional[tuple]:
+    """Підписка для збереженого Twitter Monitor Adapter акаунта"""
+    if username and not is_forbidden_twitter_account(username):
+        return 'twitter', username, username
+    return None
+
+def _subscribe_monitors(platform: str, key: str, target: str) -> None:
+    """Додати нову підписку до моніторів"""
+    if platform == 'twitter':
+        if twitter_monitor is not None:
+            try:
+                twitter_monitor.add_account(key)
+                logger.info(f"➕ Додано Twitter акаунт до моніторингу: {key}")
+            except Exception:
+                pass
+        if twitter_monitor_adapter is not None:
+            twitter_monitor_adapter.add_account(key)
+            logger.info(f"➕ Додано Twitter Monitor Adapter акаунт до моніторингу: {key}")
+    elif platform == 'discord' and discord_monitor is not None:
+        try:
+            discord_monitor.add_channel(target)  # Передаємо оригінальний URL
+            logger.info(f"➕ Додано Discord канал до моніторингу: {key} ({target})")
+        except Exception as e:
+            logger.error(f"❌ Помилка додавання Discord каналу {key}: {e}")
+
+def _unsubscribe_monitors(platform: str, key: str) -> None:
+    """Прибрати підписку, на яку більше не посилається жоден проект"""
+    if platform == 'twitter':
+        if twitter_monitor is not None:
+            try:
+                twitter_monitor.remove_account(key)
+                logger.info(f"🗑️ Видалено Twitter акаунт з моніторингу: {key}")
+            except Exception:
+                pass
+        if twitter_monitor_adapter is not None:
+            twitter_monitor_adapter.monitoring_accounts.discard(key)
+            logger.info(f"🗑️ Видалено Twitter Monitor Adapter акаунт з моніторингу: {key}")
+    elif platform == 'discord' and discord_monitor is not None:
+        try:
+            discord_monitor.remove_channel(key)
+            logger.info(f"🗑️ Видалено Discord канал з моніторингу: {key}")
+        except Exception as e:
+            logger.error(f"❌ Помилка видалення Discord каналу {key}: {e}")
+
+def on_project_event(event: str, payload: Dict) -> None:
+    """Інкрементально оновити монітори за подією ProjectManager (O(1) на зміну)"""
+    try:
+        if event == 'reset':
+            sync_monitors_with_projects()
+            return
+        
+        if event in ('project_added', 'project_removed'):
+            subscription = _project_subscription(payload)
+        else:
+            subscription = _account_subscription(payload.get('username', ''))
+        if subscription is None:
+            return
+        
+        platform, key, target = subscription
+        if event in ('project_added', 'account_added'):
+            if subscription_index.add(platform, key, target):
+                _subscribe_monitors(platform, key, target)
+                # Перша підписка платформи - монітор може бути ще не запущено
+                auto_start_monitoring()
+        elif subscription_index.remove(platform, key):
+            _unsubscribe_monitors(platform, key)
+    except Exception as e:
+        logger.error(f"Помилка обробки події проекту {event}: {e}")
+
+def _rebuild_subscription_index() -> None:
+    """Перебудувати індекс підписок з усіх проектів і збережених акаунтів"""
+    subscription_index.clear()
+    for user_id, projects in project_manager.data.get('projects', {}).items():
+        for p in projects:
+            subscription = _project_subscription(p)
+            if subscription:
+                subscription_index.add(*subscription)
+    for username in project_manager.get_selenium_accounts() or []:  # Використовуємо ту ж функцію
+        subscription = _account_subscription(username)
+        if subscription:
+            subscription_index.add(*subscription)
+
+def _current_monitor_keys() -> Dict[str, Set[str]]:
+    """Фактичні набори підписок кожного монітора"""
+    current = {}
+    if twitter_monitor is not None:
+        current['twitter_monitor'] = set(getattr(twitter_monitor, 'monitoring_accounts', set()))
+    if twitter_monitor_adapter is not None:
+        current['twitter_monitor_adapter'] = set(getattr(twitter_monitor_adapter, 'monitoring_accounts', set()))
+    if discord_monitor is not None:
+        current['discord_monitor'] = set(str(ch) for ch in getattr(discord_monitor, 'monitoring_channels', []))
+    return current
+
+def _reconcile_monitors() -> None:
+    """Звести набори підписок моніторів до індексу (лише різниця множин)"""
+    target_usernames = subscription_index.keys('twitter')
+    discord_channels = subscription_index.targets('discord')  # channel_id -> original_url
+    current = _current_monitor_keys()
+    
+    if twitter_monitor is not None:
+        for username in current['twitter_monitor'] - target_usernames:
+            try:
+                if username:
+                    twitter_monitor.remove_account(username)
+                    logger.info(f"🗑️ Видалено Twitter акаунт з моніторингу: {username}")
+            except Exception:
+                pass
+        for username in target_usernames - current['twitter_monitor']:
+            try:
+                twitter_monitor.add_account(username)
+                logger.info(f"➕ Додано Twitter акаунт до моніторингу: {username}")
+            except Exception:
+                pass
+
+    if twitter_monitor_adapter is not None:
+        for username in current['twitter_monitor_adapter'] - target_usernames:
+            twitter_monitor_adapter.monitoring_accounts.discard(username)
+            logger.info(f"🗑️ Видалено Twitter Monitor Adapter акаунт з моніторингу: {username}")
+        for username in target_usernames - current['twitter_monitor_adapter']:
+            twitter_monitor_adapter.add_account(username)
+            logger.info(f"➕ Додано Twitter Monitor Adapter акаунт до моніторингу: {username}")
+
+    if discord_monitor is not None:
+        for channel_id, original_url in discord_channels.items():
+            if channel_id not in current['discord_monitor']:
+                _subscribe_monitors('discord', channel_id, original_url)
+        for channel_id in current['discord_monitor'] - set(discord_channels):
+            _unsubscribe_monitors('discord', channel_id)
+    else:
+        logger.warning("⚠️ Discord монітор не ініціалізовано (DISCORD_AUTHORIZATION відсутній?)")
+
+def check_monitor_consistency() -> bool:
+    """Дешева перевірка: контрольні суми моніторів проти індексу підписок.
+    
+    Повний перебір проектів виконується лише при розбіжності.
+    Повертає True якщо стан узгоджений.
+    """
+    try:
+        platforms = {
+            'twitter_monitor': 'twitter',
+            'twitter_monitor_adapter': 'twitter',
+            'discord_monitor': 'discord'
+        }
+        for monitor_name, keys in _current_monitor_keys().items():
+            if not subscription_index.matches(platforms[monitor_name], keys):
+                logger.warning(f"⚠️ {monitor_name} розійшовся з індексом підписок - повна синхронізація")
+                sync_monitors_with_projects()
+                return False
+        return True
+    except Exception as e:
+        logger.error(f"Помилка перевірки узгодженості моніторів: {e}")
+        return False
+
 def sync_monitors_with_projects() -> None:
-    """Звести активні монітори до фактичних проектів і збережених Twitter Monitor Adapter акаунтів"""
+    """Повна синхронізація: перебудувати індекс підписок і звести до нього монітори.
+    
+    Потрібна при старті, після перезавантаження даних та при розбіжності
+    контрольних сум - поточні зміни проектів приходять подіями (on_project_event).
+    """
     try:
         # Спочатку очищаємо заборонені акаунти
         clean_forbidden_accounts()
         
-        # Збираємо цільові Twitter usernames із проектів
-        project_usernames = set()
-        discord_channels = {}  # channel_id -> original_url
+        _rebuild_subscription_index()
+        _reconcile_monitors()
         
-        logger.info("🔍 Аналізуємо всі проекти...")
-        for user_id, projects in project_manager.data.get('projects', {}).items():
-            logger.info(f"👤 Користувач {user_id}: {len(projects)} проектів")
-            for p in projects:
-                if p.get('platform') == 'twitter':
-                    url = p.get('url', '')
-                    sync_username = extract_twitter_username(url)
-                    logger.info(f"   🐦 Twitter проект: URL='{url}' -> username='{sync_username}'")
-                    if sync_username and sync_username.lower() not in ['twitter', 'x', 'elonmusk']:
-                        project_usernames.add(sync_username)
-                    elif sync_username and sync_username.lower() in ['twitter', 'x', 'elonmusk']:
-                        logger.warning(f"   ⚠️ Пропущено заборонений Twitter акаунт: {sync_username}")
-                elif p.get('platform') == 'discord':
-                    url = p.get('url', '')
-                    channel_id = extract_discord_channel_id(url)
-                    logger.info(f"   💬 Discord проект: URL='{url}' -> channel_id='{channel_id}'")
-                    if channel_id:
-                        discord_channels[channel_id] = url  # Зберігаємо оригінальний URL
-        
-        logger.info(f"📊 Результат аналізу:")
-        logger.info(f"   🐦 Знайдено Twitter usernames: {list(project_usernames)}")
-        logger.info(f"   💬 Знайдено Discord channels: {list(discord_channels.keys())}")
-
-        # Додаємо явно збережені Twitter Monitor Adapter акаунти (якщо ще є)
-        twitter_adapter_saved = set(project_manager.get_selenium_accounts() or [])  # Використовуємо ту ж функцію
-        # Фільтруємо заборонені акаунти
-        twitter_adapter_saved = {acc for acc in twitter_adapter_saved if acc.lower() not in ['twitter', 'x']}
-        target_usernames = project_usernames.union(twitter_adapter_saved)
-
-        # Синхронізація Twitter API монітора
-        global twitter_monitor
-        if twitter_monitor is not None:
-            current = set(getattr(twitter_monitor, 'monitoring_accounts', set()))
-            # Видаляємо зайві
-            for username in list(current - target_usernames):
-                try:
-                    if username:
-                        twitter_monitor.remove_account(username)
-                        logger.info(f"🗑️ Видалено Twitter акаунт з моніторингу: {username}")
-                except Exception:
-                    pass
-            # Додаємо відсутні (із проектів/selenium_saved)
-            for username in list(target_usernames - current):
-                try:
-                    twitter_monitor.add_account(username)
-                    logger.info(f"➕ Додано Twitter акаунт до моніторингу: {username}")
-                except Exception:
-                    pass
-
-        # Синхронізація Twitter Monitor Adapter (основний підхід)
-        global twitter_monitor_adapter
-        if twitter_monitor_adapter is not None:
-            current = set(getattr(twitter_monitor_adapter, 'monitoring_accounts', set()))
-            # Видаляємо зайві
-            for username in list(current - target_usernames):
-                twitter_monitor_adapter.monitoring_accounts.discard(username)
-                logger.info(f"🗑️ Видалено Twitter Monitor Adapter акаунт з моніторингу: {username}")
-            # Додаємо відсутні
-            for username in list(target_usernames - current):
-                twitter_monitor_adapter.add_account(username)
-                logger.info(f"➕ Додано Twitter Monitor Adapter акаунт до моніторингу: {username}")
-
-        # Синхронізація Discord монітора
-        global discord_monitor
-        if discord_monitor is not None:
-            current_channels = set(str(ch) for ch in getattr(discord_monitor, 'monitoring_channels', []))
-            logger.info(f"🔄 Discord монітор: поточні канали = {list(current_channels)}")
-            logger.info(f"🔄 Discord монітор: цільові канали = {list(discord_channels.keys())}")
-            
-            # Додаємо нові канали
-            for channel_id, original_url in discord_channels.items():
-                if channel_id not in current_channels:
-                    try:
-                        discord_monitor.add_channel(original_url)  # Передаємо оригінальний URL
-                        logger.info(f"➕ Додано Discord канал до моніторингу: {channel_id} ({original_url})")
-                    except Exception as e:
-                        logger.error(f"❌ Помилка додавання Discord каналу {channel_id}: {e}")
-            # Видаляємо зайві канали
-            for channel_id in current_channels - set(discord_channels.keys()):
-                try:
-                    discord_monitor.remove_channel(channel_id)
-                    logger.info(f"🗑️ Видалено Discord канал з моніторингу: {channel_id}")
-                except Exception as e:
-                    logger.error(f"❌ Помилка видалення Discord каналу {channel_id}: {e}")
-        else:
-            logger.warning("⚠️ Discord монітор не ініціалізовано (DISCORD_AUTHORIZATION відсутній?)")
-
-        if target_usernames:
-            logger.info(f"🔄 Синхронізовано Twitter моніторинг: {len(target_usernames)} акаунтів")
-        if discord_channels:
-            logger.info(f"🔄 Синхронізовано Discord моніторинг: {len(discord_channels)} каналів")
+        twitter_count = len(subscription_index.keys('twitter'))
+        discord_count = len(subscription_index.keys('discord'))
+        if twitter_count:
+            logger.info(f"🔄 Синхронізовано Twitter моніторинг: {twitter_count} акаунтів")
+        if discord_count:
+            logger.info(f"🔄 Синхронізовано Discord моніторинг: {discord_count} каналів")
             
         # Завжди намагаємося запустити моніторинг
         logger.info("🚀 Автоматично запускаємо моніторинг...")
         auto_start_monitoring()
         
-        if target_usernames or discord_channels:
-            logger.info(f"✅ Знайдено проекти для моніторингу: {len(target_usernames)} Twitter + {len(discord_channels)} Discord")
+        if twitter_count or discord_count:
+            logger.info(f"✅ Знайдено проекти для моніторингу: {twitter_count} Twitter + {discord_count} Discord")
         else:
             logger.info("ℹ️ Поки що немає проектів для моніторингу, але монітори готові до роботи")
 
@@ -231,7 +387,7 @@ def auto_start_monitoring() -> None:
         # Запускаємо Twitter API моніторинг
         if twitter_monitor and hasattr(twitter_monitor, 'monitoring_accounts'):
             accounts = getattr(twitter_monitor, 'monitoring_accounts', set())
-            if accounts and TWITTER_AUTH_TOKEN:
+            if accounts and twitter_monitor.auth_token:
                 logger.info(f"🐦 Автоматично запускаємо Twitter API моніторинг для {len(accounts)} акаунтів")
                 try:
                     # Запускаємо в окремому потоці якщо ще не запущено
@@ -296,6 +452,23 @@ def auto_start_monitoring() -> None:
         logger.error(f"Помилка автоматичного запуску моніторингу: {e}")
 
 # ===================== Утиліти для Telegram chat_id =====================
+def telegram_post(url: str, **kwargs):
+    """POST до Telegram Bot API через спільний HTTP клієнт (keep-alive) із записом затримки та статусу відповіді"""
+    method = url.rsplit('/', 1)[-1]
+    started = time.perf_counter()
+    try:
+        response = http_client.post(url, **kwargs)
+    except Exception:
+        TELEGRAM_RESPONSES.inc(method=method, status='error')
+        raise
+    finally:
+        TELEGRAM_REQUEST_SECONDS.observe(time.perf_counter() - started, method=method)
+    TELEGRAM_RESPONSES.inc(method=method, status=response.status_code)
+    if response.status_code == 429:
+        TELEGRAM_RATE_LIMITED.inc(method=method)
+        event(delivery_logger, logging.WARNING, 'telegram_rate_limited', method=method)
+    return response
+
 def normalize_chat_id(chat_id_value: str) -> str:
     """Нормалізувати chat_id: додає -100 для каналів/супергруп, якщо відсутній.
     Приймає рядок з цифрами або вже валідний від'ємний chat_id."""
@@ -329,33 +502,33 @@ def create_project_thread_sync(bot_token: str, chat_id: str, project_name: str,
         if user_id:
             existing_thread_id = get_project_thread_id(user_id, project_name, chat_id)
             if existing_thread_id:
-                logger.info(f"🔍 Знайдено існуючий thread {existing_thread_id} для проекту '{project_name}'")
+                delivery_log.info("🔍 Знайдено існуючий thread %s для проекту '%s'", existing_thread_id, project_name)
                 return existing_thread_id
         
         # Створюємо тему в групі для цього проекту
-        url = f"https://api.telegram.org/bot{bot_token}/createForumTopic"
+        url = f"{TELEGRAM_API_BASE}/bot{bot_token}/createForumTopic"
         data = {
             'chat_id': normalize_chat_id(chat_id),
             'name': f"{project_tag} {project_name}",
             'icon_color': 0x6FB9F0,  # Синій колір
         }
         
-        response = requests.post(url, data=data, timeout=10)
+        response = telegram_post(url, data=data, timeout=10)
         
         # Додаємо затримку після запиту для уникнення rate limit
         import time
         time.sleep(1)  # Зменшено для швидшої роботи
         
-        logger.info(f"🔧 API запит створення thread: {url}")
-        logger.info(f"🔧 API дані: {data}")
-        logger.info(f"🔧 API відповідь status: {response.status_code}")
+        delivery_log.info("🔧 API запит створення thread: %s", url)
+        delivery_log.info("🔧 API дані: %s", data)
+        delivery_log.info("🔧 API відповідь status: %s", response.status_code)
         
         if response.status_code == 200:
-            result = response.json()
-            logger.info(f"🔧 API відповідь: {result}")
+            result = json_codec.loads(response.content)
+            delivery_log.info("🔧 API відповідь: %s", result)
             if result.get('ok'):
                 thread_id = result['result']['message_thread_id']
-                logger.info(f"✅ Створено thread {thread_id} для проекту '{project_name}' з тегом {project_tag}")
+                delivery_log.info("✅ Створено thread %s для проекту '%s' з тегом %s", thread_id, project_name, project_tag)
                 
                 # Зберігаємо mapping thread_id для проекту
                 if user_id:
@@ -368,22 +541,22 @@ def create_project_thread_sync(bot_token: str, chat_id: str, project_name: str,
                 return None
         else:
             try:
-                result = response.json()
+                result = json_codec.loads(response.content)
                 logger.error(f"❌ HTTP {response.status_code} при створенні thread: {result}")
             except:
                 logger.error(f"❌ HTTP {response.status_code} при створенні thread (не JSON відповідь)")
             return None
             
         if response.status_code == 429:
-            logger.warning(f"⚠️ Rate limit при створенні thread, чекаємо 10 секунд...")
+            delivery_log.warning("⚠️ Rate limit при створенні thread, чекаємо 10 секунд...")
             time.sleep(10)
             # Повторна спроба після rate limit
-            response2 = requests.post(url, data=data, timeout=10)
+            response2 = telegram_post(url, data=data, timeout=10)
             if response2.status_code == 200:
-                result2 = response2.json()
+                result2 = json_codec.loads(response2.content)
                 if result2.get('ok'):
                     thread_id = result2['result']['message_thread_id']
-                    logger.info(f"✅ Створено thread {thread_id} для проекту '{project_name}' після повторної спроби")
+                    delivery_log.info("✅ Створено thread %s для проекту '%s' після повторної спроби", thread_id, project_name)
                     
                     # Зберігаємо mapping thread_id для проекту
                     if user_id:
@@ -413,7 +586,7 @@ def send_message_to_thread_sync(bot_token: str, chat_id: str, thread_id: int, te
         else:
             tagged_text = text
             
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+        url = f"{TELEGRAM_API_BASE}/bot{bot_token}/sendMessage"
         data = {
             'chat_id': normalize_chat_id(chat_id),
             'message_thread_id': thread_id,
@@ -421,15 +594,15 @@ def send_message_to_thread_sync(bot_token: str, chat_id: str, thread_id: int, te
             'parse_mode': 'HTML'
         }
         
-        logger.info(f"🔍 Відправляємо в thread: chat_id={data['chat_id']}, thread_id={thread_id}, текст довжиною {len(tagged_text)} символів")
-        logger.debug(f"🔍 Текст повідомлення: {repr(tagged_text)}")
+        delivery_log.info("🔍 Відправляємо в thread: chat_id=%s, thread_id=%s, текст довжиною %s символів", data['chat_id'], thread_id, len(tagged_text))
+        delivery_logger.debug("🔍 Текст повідомлення: %r", tagged_text)
         
-        response = requests.post(url, data=data, timeout=10)
+        response = telegram_post(url, data=data, timeout=10)
         
         if response.status_code == 200:
-            result = response.json()
+            result = json_codec.loads(response.content)
             if result.get('ok'):
-                logger.info(f"✅ Повідомлення відправлено в thread {thread_id} з тегом {project_tag}")
+                delivery_log.info("✅ Повідомлення відправлено в thread %s з тегом %s", thread_id, project_tag)
                 # Додаємо затримку після успішної відправки для уникнення rate limit
                 import time
                 time.sleep(0.7)  # Зменшено для швидшої роботи
@@ -439,17 +612,17 @@ def send_message_to_thread_sync(bot_token: str, chat_id: str, thread_id: int, te
         elif response.status_code == 429:
             # Обробка rate limit
             try:
-                error_response = response.json()
+                error_response = json_codec.loads(response.content)
                 retry_after = error_response.get('parameters', {}).get('retry_after', 15)
-                logger.warning(f"⚠️ Rate limit при відправці в thread, чекаємо {retry_after} секунд...")
+                delivery_log.warning("⚠️ Rate limit при відправці в thread, чекаємо %s секунд...", retry_after)
                 import time
                 time.sleep(retry_after + 1)
                 # Повторна спроба
-                response2 = requests.post(url, data=data, timeout=10)
+                response2 = telegram_post(url, data=data, timeout=10)
                 if response2.status_code == 200:
-                    result2 = response2.json()
+                    result2 = json_codec.loads(response2.content)
                     if result2.get('ok'):
-                        logger.info(f"✅ Повідомлення відправлено в thread {thread_id} після повторної спроби")
+                        delivery_log.info("✅ Повідомлення відправлено в thread %s після повторної спроби", thread_id)
                         time.sleep(1)
                         return True
                 logger.error(f"❌ Не вдалося відправити повідомлення після повторної спроби")
@@ -458,7 +631,7 @@ def send_message_to_thread_sync(bot_token: str, chat_id: str, thread_id: int, te
         else:
             logger.error(f"❌ HTTP помилка при відправці в thread: {response.status_code}")
             try:
-                error_response = response.json()
+                error_response = json_codec.loads(response.content)
                 logger.error(f"❌ Деталі помилки: {error_response}")
             except:
                 logger.error(f"❌ Текст відповіді: {response.text}")
@@ -489,11 +662,11 @@ def send_photo_to_thread_sync(bot_token: str, chat_id: str, thread_id: int, phot
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         }
         
-        response = requests.get(photo_url, headers=headers, timeout=15)
+        response = http_client.get(photo_url, headers=headers, timeout=15)
         response.raise_for_status()
         
         # Відправляємо через Telegram API
-        url = f"https://api.telegram.org/bot{bot_token}/sendPhoto"
+        url = f"{TELEGRAM_API_BASE}/bot{bot_token}/sendPhoto"
         
         files = {'photo': ('image.jpg', response.content, 'image/jpeg')}
         data = {
@@ -503,12 +676,12 @@ def send_photo_to_thread_sync(bot_token: str, chat_id: str, thread_id: int, phot
             'parse_mode': 'HTML'
         }
         
-        response = requests.post(url, files=files, data=data, timeout=30)
+        response = telegram_post(url, files=files, data=data, timeout=30)
         
         if response.status_code == 200:
-            result = response.json()
+            result = json_codec.loads(response.content)
             if result.get('ok'):
-                logger.info(f"✅ Фото відправлено в thread {thread_id} з тегом {project_tag}")
+                delivery_log.info("✅ Фото відправлено в thread %s з тегом %s", thread_id, project_tag)
                 # Додаємо затримку після успішної відправки для уникнення rate limit
                 import time
                 time.sleep(1)  # Зменшено для швидшої роботи
@@ -518,17 +691,17 @@ def send_photo_to_thread_sync(bot_token: str, chat_id: str, thread_id: int, phot
         elif response.status_code == 429:
             # Обробка rate limit
             try:
-                error_response = response.json()
+                error_response = json_codec.loads(response.content)
                 retry_after = error_response.get('parameters', {}).get('retry_after', 15)
-                logger.warning(f"⚠️ Rate limit при відправці фото в thread, чекаємо {retry_after} секунд...")
+                delivery_log.warning("⚠️ Rate limit при відправці фото в thread, чекаємо %s секунд...", retry_after)
                 import time
                 time.sleep(retry_after + 2)
                 # Повторна спроба
-                response2 = requests.post(url, files=files, data=data, timeout=30)
+                response2 = telegram_post(url, files=files, data=data, timeout=30)
                 if response2.status_code == 200:
-                    result2 = response2.json()
+                    result2 = json_codec.loads(response2.content)
                     if result2.get('ok'):
-                        logger.info(f"✅ Фото відправлено в thread {thread_id} після повторної спроби")
+                        delivery_log.info("✅ Фото відправлено в thread %s після повторної спроби", thread_id)
                         time.sleep(1.5)
                         return True
                 logger.error(f"❌ Не вдалося відправити фото після повторної спроби")
@@ -568,11 +741,11 @@ def send_message_with_photos_to_thread_sync(bot_token: str, chat_id: str, thread
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                 }
                 
-                response = requests.get(photo_urls[0], headers=headers, timeout=15)
+                response = http_client.get(photo_urls[0], headers=headers, timeout=15)
                 response.raise_for_status()
                 
                 # Відправляємо через sendPhoto з текстом як caption
-                url = f"https://api.telegram.org/bot{bot_token}/sendPhoto"
+                url = f"{TELEGRAM_API_BASE}/bot{bot_token}/sendPhoto"
                 
                 files = {'photo': ('image.jpg', response.content, 'image/jpeg')}
                 data = {
@@ -582,28 +755,28 @@ def send_message_with_photos_to_thread_sync(bot_token: str, chat_id: str, thread
                     'parse_mode': 'HTML'
                 }
                 
-                response = requests.post(url, files=files, data=data, timeout=30)
+                response = telegram_post(url, files=files, data=data, timeout=30)
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = json_codec.loads(response.content)
                     if result.get('ok'):
-                        logger.info(f"✅ Повідомлення з фото відправлено в thread {thread_id}")
+                        delivery_log.info("✅ Повідомлення з фото відправлено в thread %s", thread_id)
                         import time
                         time.sleep(1.5)
                         return True
                 elif response.status_code == 429:
                     # Обробка rate limit
-                    error_response = response.json()
+                    error_response = json_codec.loads(response.content)
                     retry_after = error_response.get('parameters', {}).get('retry_after', 15)
-                    logger.warning(f"⚠️ Rate limit, чекаємо {retry_after} секунд...")
+                    delivery_log.warning("⚠️ Rate limit, чекаємо %s секунд...", retry_after)
                     import time
                     time.sleep(retry_after + 2)
                     # Повторна спроба
-                    response2 = requests.post(url, files=files, data=data, timeout=30)
+                    response2 = telegram_post(url, files=files, data=data, timeout=30)
                     if response2.status_code == 200:
-                        result2 = response2.json()
+                        result2 = json_codec.loads(response2.content)
                         if result2.get('ok'):
-                            logger.info(f"✅ Повідомлення з фото відправлено після повторної спроби")
+                            delivery_log.info("✅ Повідомлення з фото відправлено після повторної спроби")
                             time.sleep(1.5)
                             return True
                 
@@ -629,7 +802,7 @@ def send_message_with_photos_to_thread_sync(bot_token: str, chat_id: str, thread
                         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                     }
                     
-                    response = requests.get(photo_url, headers=headers, timeout=15)
+                    response = http_client.get(photo_url, headers=headers, timeout=15)
                     response.raise_for_status()
                     
                     media.append({
@@ -638,12 +811,12 @@ def send_message_with_photos_to_thread_sync(bot_token: str, chat_id: str, thread
                         'caption': f'📷 {i+1}/{len(photo_urls)}' if i == 0 else ''  # Caption тільки на першому фото
                     })
                 
-                url = f"https://api.telegram.org/bot{bot_token}/sendMediaGroup"
+                url = f"{TELEGRAM_API_BASE}/bot{bot_token}/sendMediaGroup"
                 
                 # Підготовка файлів для відправки
                 files = {}
                 for i, photo_url in enumerate(photo_urls[:10]):
-                    response = requests.get(photo_url, headers=headers, timeout=15)
+                    response = http_client.get(photo_url, headers=headers, timeout=15)
                     files[f'photo{i}'] = ('image.jpg', response.content, 'image/jpeg')
                 
                 data = {
@@ -652,20 +825,20 @@ def send_message_with_photos_to_thread_sync(bot_token: str, chat_id: str, thread
                     'media': json.dumps(media)
                 }
                 
-                response = requests.post(url, files=files, data=data, timeout=30)
+                response = telegram_post(url, files=files, data=data, timeout=30)
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = json_codec.loads(response.content)
                     if result.get('ok'):
-                        logger.info(f"✅ Медіа-група з {len(photo_urls)} фото відправлена в thread {thread_id}")
+                        delivery_log.info("✅ Медіа-група з %s фото відправлена в thread %s", len(photo_urls), thread_id)
                         import time
                         time.sleep(2)
                         return True
                 elif response.status_code == 429:
                     # Обробка rate limit
-                    error_response = response.json()
+                    error_response = json_codec.loads(response.content)
                     retry_after = error_response.get('parameters', {}).get('retry_after', 15)
-                    logger.warning(f"⚠️ Rate limit для медіа-групи, чекаємо {retry_after} секунд...")
+                    delivery_log.warning("⚠️ Rate limit для медіа-групи, чекаємо %s секунд...", retry_after)
                     import time
                     time.sleep(retry_after + 2)
                 
@@ -729,17 +902,15 @@ def get_discord_server_name(channel_id: str, guild_id: str) -> str:
 def load_threads_mapping() -> Dict:
     """Завантажити mapping проектів до thread_id"""
     try:
-        with open('threads_mapping.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        return json_codec.load_file('threads_mapping.json')
+    except (FileNotFoundError, *json_codec.JSONDecodeError):
         return {}
 
 def save_threads_mapping(mapping: Dict) -> None:
     """Зберегти mapping проектів до thread_id"""
     try:
-        with open('threads_mapping.json', 'w', encoding='utf-8') as f:
-            json.dump(mapping, f, ensure_ascii=False, indent=2)
-        logger.info(f"💾 Збережено mapping гілок: {len(mapping)} записів")
+        json_codec.dump_file('threads_mapping.json', mapping)  # Файл лише для програми - компактно
+        delivery_logger.debug("💾 Збережено mapping гілок: %s записів", len(mapping))
     except Exception as e:
         logger.error(f"❌ Помилка збереження mapping'у гілок: {e}")
 
@@ -749,9 +920,9 @@ def get_project_thread_id(user_id: str, project_name: str, chat_id: str) -> Opti
     key = f"{user_id}_{project_name}_{chat_id}"
     thread_id = mapping.get(key)
     if thread_id:
-        logger.debug(f"🔍 Знайдено thread_id для {project_name}: {thread_id}")
+        delivery_logger.debug("🔍 Знайдено thread_id для %s: %s", project_name, thread_id)
     else:
-        logger.debug(f"🔍 Не знайдено thread_id для {project_name}")
+        delivery_logger.debug("🔍 Не знайдено thread_id для %s", project_name)
     return thread_id
 
 def save_project_thread_id(user_id: str, project_name: str, chat_id: str, thread_id: int) -> None:
@@ -760,7 +931,7 @@ def save_project_thread_id(user_id: str, project_name: str, chat_id: str, thread
     key = f"{user_id}_{project_name}_{chat_id}"
     mapping[key] = thread_id
     save_threads_mapping(mapping)
-    logger.info(f"💾 Збережено thread_id {thread_id} для проекту {project_name}")
+    delivery_logger.debug("💾 Збережено thread_id %s для проекту %s", thread_id, project_name)
 
 # ===================== Визначення отримувачів за проектами =====================
 def get_users_tracking_twitter(username: str) -> List[Dict]:
@@ -770,7 +941,7 @@ def get_users_tracking_twitter(username: str) -> List[Dict]:
         target = (username or '').replace('@', '').strip().lower()
         
         # Додаткове логування для діагностики
-        logger.info(f"🔍 Шукаємо користувачів для Twitter акаунта: '{target}'")
+        delivery_logger.debug("🔍 Шукаємо користувачів для Twitter акаунта: '%s'", target)
         
         for user_id_str, projects in project_manager.data.get('projects', {}).items():
             for p in projects:
@@ -778,17 +949,17 @@ def get_users_tracking_twitter(username: str) -> List[Dict]:
                     u = extract_twitter_username(p.get('url', '') or '')
                     if u:
                         project_username = u.replace('@', '').strip().lower()
-                        logger.debug(f"   Порівнюємо '{project_username}' з '{target}' для користувача {user_id_str}")
+                        delivery_logger.debug("   Порівнюємо '%s' з '%s' для користувача %s", project_username, target, user_id_str)
                         if project_username == target:
                             tracked_data.append({
                                 'user_id': int(user_id_str),
                                 'project': p
                             })
-                            logger.info(f"✅ Знайдено користувача {user_id_str} для Twitter акаунта {target}")
+                            delivery_logger.debug("✅ Знайдено користувача %s для Twitter акаунта %s", user_id_str, target)
                             break
         
         if not tracked_data:
-            logger.warning(f"⚠️ Не знайдено користувачів для Twitter акаунта '{target}' - твіт буде пропущено")
+            delivery_log.warning("⚠️ Не знайдено користувачів для Twitter акаунта '%s' - твіт буде пропущено", target)
         
         return tracked_data
     except Exception as e:
@@ -951,9 +1122,9 @@ async def forward_test_command(update: Update, context: ContextTypes.DEFAULT_TYP
                 "✅ Тестове повідомлення пересилання\n\n"
                 "Це перевірка ваших персональних налаштувань в режимі тегів."
             )
-            url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
+            url = f"{TELEGRAM_API_BASE}/bot{BOT_TOKEN}/sendMessage"
             data = {'chat_id': normalize_chat_id(channel_id), 'text': text}
-            r = requests.post(url, data=data, timeout=5)
+            r = telegram_post(url, data=data, timeout=5)
             if r.status_code == 200:
                 await update.message.reply_text("✅ Тест відправлено у ваш канал пересилання з тегом.")
             else:
@@ -1196,7 +1367,7 @@ def download_and_send_image(image_url: str, chat_id: str, caption: str = "") ->
         }
         
         logger.info(f"📥 Завантажуємо зображення: {image_url}")
-        response = requests.get(image_url, headers=headers, timeout=15)
+        response = http_client.get(image_url, headers=headers, timeout=15)
         response.raise_for_status()
         logger.info(f"✅ Зображення завантажено успішно, розмір: {len(response.content)} байт")
         
@@ -1223,7 +1394,7 @@ def download_and_send_image(image_url: str, chat_id: str, caption: str = "") ->
         
         try:
             # Відправляємо фото через Telegram API
-            url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendPhoto"
+            url = f"{TELEGRAM_API_BASE}/bot{BOT_TOKEN}/sendPhoto"
             
             with open(temp_file_path, 'rb') as photo_file:
                 files = {'photo': photo_file}
@@ -1232,7 +1403,7 @@ def download_and_send_image(image_url: str, chat_id: str, caption: str = "") ->
                     'caption': caption[:1024] if caption else '',  # Telegram обмежує caption до 1024 символів
                 }
                 
-                response = requests.post(url, files=files, data=data, timeout=30)
+                response = telegram_post(url, files=files, data=data, timeout=30)
                 
                 if response.status_code == 200:
                     logger.info(f"✅ Зображення відправлено в канал {chat_id}")
@@ -1542,6 +1713,8 @@ def get_admin_system_keyboard() -> InlineKeyboardMarkup:
     keyboard = [
         [InlineKeyboardButton("📊 Статистика системи", callback_data="admin_system_stats")],
         [InlineKeyboardButton("📋 Логи системи", callback_data="admin_system_logs")],
+        [InlineKeyboardButton("📈 Метрики", callback_data="admin_metrics")],
+        [InlineKeyboardButton("🔬 Профілювання", callback_data="admin_profile")],
         [InlineKeyboardButton("💾 Бекап та відновлення", callback_data="admin_backup_restore")],
         [InlineKeyboardButton("🔄 Очистити сесії", callback_data="admin_cleanup_sessions")],
         [InlineKeyboardButton("🧹 Очистити кеш", callback_data="admin_clear_cache")],
@@ -1600,6 +1773,7 @@ def get_admin_stats_keyboard() -> InlineKeyboardMarkup:
         [InlineKeyboardButton("📈 Графіки та діаграми", callback_data="admin_charts")],
         [InlineKeyboardButton("📅 Статистика за період", callback_data="admin_period_stats")],
         [InlineKeyboardButton("🔍 Детальна аналітика", callback_data="admin_detailed_analytics")],
+        [InlineKeyboardButton("⏱️ Швидкість доставки", callback_data="admin_freshness_stats")],
         [InlineKeyboardButton("📤 Експорт даних", callback_data="admin_export_data")],
         [InlineKeyboardButton("⬅️ Назад до адмін панелі", callback_data="admin_panel")]
     ]
@@ -2125,211 +2299,239 @@ async def handle_callback_query(update: Update, context: ContextTypes.DEFAULT_TY
         )
         return
     
-    if callback_data == "main_menu":
-        # Оновлюємо ID головного меню
-        main_menu_messages[user_id] = query.message.message_id
-        
-        welcome_text = format_success_message(
-            "Головне меню",
-            "Оберіть дію з меню нижче:",
-            "Всі функції бота доступні через це меню."
-        )
-        await query.edit_message_text(
-            welcome_text,
-            reply_markup=get_main_menu_keyboard(user_id),
-        )
-    elif callback_data == "add_project":
-        await query.edit_message_text(
-            "➕ Додавання нового проекту\n\nОберіть платформу для моніторингу:",
-            reply_markup=get_platform_keyboard()
-        )
-    elif callback_data == "my_projects":
-        projects_text = format_info_message(
-            "Мої проекти",
-            "Управління вашими проектами моніторингу",
-            "Тут ви можете переглядати, додавати та видаляти свої проекти для моніторингу Twitter та Discord."
-        )
-        await query.edit_message_text(
-            projects_text,
-            reply_markup=get_projects_menu_keyboard(user_id),
-        )
-    elif callback_data == "projects_menu":
-        await query.edit_message_text(
-            "📋 Управління проектами\n\nОберіть категорію:",
-            reply_markup=get_projects_menu_keyboard(user_id)
-        )
-    elif callback_data == "twitter_projects":
-        await query.edit_message_text(
-            "🐦 Twitter проекти\n\nОберіть проект для управління:",
-            reply_markup=get_twitter_projects_keyboard(user_id)
-        )
-    elif callback_data == "discord_projects":
-        await query.edit_message_text(
-            "💬 Discord проекти\n\nОберіть проект для управління:",
-            reply_markup=get_discord_projects_keyboard(user_id)
-        )
-    elif callback_data == "twitter_adapter_accounts":
+    if not await callback_router.dispatch(callback_data, update, context, query, user_id, callback_data):
+        logger.warning(f"Невідомий callback: {callback_data}")
+
+# ===================== Маршрути callback запитів =====================
+# Реєструються один раз при імпорті модуля; точні збіги - через dict, параметризовані - через префіксне дерево
+
+@callback_router.exact("main_menu")
+async def _cb_main_menu(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки main_menu"""
+    # Оновлюємо ID головного меню
+    main_menu_messages[user_id] = query.message.message_id
+
+    welcome_text = format_success_message(
+        "Головне меню",
+        "Оберіть дію з меню нижче:",
+        "Всі функції бота доступні через це меню."
+    )
+    await query.edit_message_text(
+        welcome_text,
+        reply_markup=get_main_menu_keyboard(user_id),
+    )
+
+@callback_router.exact("add_project")
+async def _cb_add_project(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки add_project"""
+    await query.edit_message_text(
+        "➕ Додавання нового проекту\n\nОберіть платформу для моніторингу:",
+        reply_markup=get_platform_keyboard()
+    )
+
+@callback_router.exact("my_projects")
+async def _cb_my_projects(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки my_projects"""
+    projects_text = format_info_message(
+        "Мої проекти",
+        "Управління вашими проектами моніторингу",
+        "Тут ви можете переглядати, додавати та видаляти свої проекти для моніторингу Twitter та Discord."
+    )
+    await query.edit_message_text(
+        projects_text,
+        reply_markup=get_projects_menu_keyboard(user_id),
+    )
+
+@callback_router.exact("projects_menu")
+async def _cb_projects_menu(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки projects_menu"""
+    await query.edit_message_text(
+        "📋 Управління проектами\n\nОберіть категорію:",
+        reply_markup=get_projects_menu_keyboard(user_id)
+    )
+
+@callback_router.exact("twitter_projects")
+async def _cb_twitter_projects(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки twitter_projects"""
+    await query.edit_message_text(
+        "🐦 Twitter проекти\n\nОберіть проект для управління:",
+        reply_markup=get_twitter_projects_keyboard(user_id)
+    )
+
+@callback_router.exact("discord_projects")
+async def _cb_discord_projects(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки discord_projects"""
+    await query.edit_message_text(
+        "💬 Discord проекти\n\nОберіть проект для управління:",
+        reply_markup=get_discord_projects_keyboard(user_id)
+    )
+
+@callback_router.exact("twitter_adapter_accounts")
+async def _cb_twitter_adapter_accounts(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки twitter_adapter_accounts"""
+    await query.edit_message_text(
+        "🚀 Twitter Monitor Adapter акаунти\n\nОберіть акаунт для управління:",
+        reply_markup=get_twitter_adapter_accounts_keyboard()
+    )
+
+@callback_router.exact("add_twitter")
+async def _cb_add_twitter(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки add_twitter"""
+    user_states[user_id] = {
+        'state': 'adding_twitter',
+        'data': {}
+    }
+    await query.edit_message_text(
+        "🐦 Додавання Twitter акаунта\n\nВведіть username акаунта (без @):"
+    )
+
+@callback_router.exact("add_discord")
+async def _cb_add_discord(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки add_discord"""
+    user_states[user_id] = {
+        'state': 'adding_discord',
+        'data': {}
+    }
+    await query.edit_message_text(
+        "💬 Додавання Discord каналу\n\nВведіть ID каналу:"
+    )
+
+@callback_router.exact("add_twitter_adapter")
+async def _cb_add_twitter_adapter(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки add_twitter_adapter"""
+    user_states[user_id] = {
+        'state': 'adding_twitter_adapter',
+        'data': {}
+    }
+    await query.edit_message_text(
+        "🚀 Додавання Twitter Monitor Adapter акаунта\n\nВведіть username акаунта (без @):"
+    )
+
+@callback_router.exact("platform_twitter")
+async def _cb_platform_twitter(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки platform_twitter"""
+    user_states[user_id] = {
+        'state': 'adding_project',
+        'data': {'platform': 'twitter'}
+    }
+    await query.edit_message_text(
+        "🐦 Додавання проекту Twitter/X\n\nВведіть назву проекту:"
+    )
+
+@callback_router.exact("platform_discord")
+async def _cb_platform_discord(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки platform_discord"""
+    user_states[user_id] = {
+        'state': 'adding_project',
+        'data': {'platform': 'discord'}
+    }
+    await query.edit_message_text(
+        "💬 Додавання проекту Discord\n\nВведіть назву проекту:"
+    )
+
+@callback_router.exact("help")
+async def _cb_help(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки help"""
+    await query.edit_message_text(
+        "❓ **Система допомоги**\n\n"
+        "Оберіть розділ для отримання детальної інформації:",
+        reply_markup=get_help_keyboard()
+    )
+
+@callback_router.exact("twitter_adapter")
+async def _cb_twitter_adapter(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки twitter_adapter"""
+    # Перевіряємо статус Twitter Monitor Adapter моніторингу
+    twitter_adapter_status = "🚀 Активний" if twitter_monitor_adapter and twitter_monitor_adapter.monitoring_active else "⏸️ Неактивний"
+    twitter_adapter_count = len(twitter_monitor_adapter.monitoring_accounts) if twitter_monitor_adapter else 0
+
+    twitter_adapter_text = (
+        "🐦 **Twitter Monitor Adapter Моніторинг**\n\n"
+        f"📊 **Статус:** {twitter_adapter_status}\n"
+        f"👥 **Акаунтів:** {twitter_adapter_count}\n"
+        f"🔄 **Автозапуск:** ✅ Увімкнено\n\n"
+        "🔧 **Доступні команди:**\n"
+        "• `/twitter_add username` - Додати акаунт\n"
+        "• `/twitter_test username` - Тестувати моніторинг\n"
+        "• `/twitter_start` - Запустити моніторинг\n"
+        "• `/twitter_stop` - Зупинити моніторинг\n"
+        "• `/twitter_remove username` - Видалити акаунт\n\n"
+        "📝 **Приклад використання:**\n"
+        "1. `/twitter_add pilk_xz` - додайте акаунт\n"
+        "2. `/twitter_test pilk_xz` - протестуйте\n"
+        "3. `/twitter_start` - запустіть моніторинг\n"
+        "4. Моніторинг запуститься автоматично!\n\n"
+        "💡 **Переваги Twitter Monitor Adapter:**\n"
+        "• Швидкий API доступ\n"
+        "• Надійний парсинг\n"
+        "• Автоматичне оновлення\n"
+        "• Обхід обмежень API\n"
+        "• Автоматичний запуск з ботом"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="main_menu")]]
+    await query.edit_message_text(
+        twitter_adapter_text,
+        reply_markup=InlineKeyboardMarkup(keyboard),
+    )
+
+@callback_router.prefix("delete_twitter_adapter_")
+async def _cb_delete_twitter_adapter(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок delete_twitter_adapter_..."""
+    username = callback_data.replace("delete_twitter_adapter_", "")
+    try:
+        project_manager.remove_selenium_account(username)
+        if twitter_monitor_adapter:
+            twitter_monitor_adapter.remove_account(username)
         await query.edit_message_text(
-            "🚀 Twitter Monitor Adapter акаунти\n\nОберіть акаунт для управління:",
+            f"✅ Twitter Monitor Adapter акаунт @{username} успішно видалено!",
             reply_markup=get_twitter_adapter_accounts_keyboard()
         )
-    elif callback_data == "add_twitter":
-        user_states[user_id] = {
-            'state': 'adding_twitter',
-            'data': {}
-        }
-        await query.edit_message_text(
-            "🐦 Додавання Twitter акаунта\n\nВведіть username акаунта (без @):"
-        )
-    elif callback_data == "add_discord":
-        user_states[user_id] = {
-            'state': 'adding_discord',
-            'data': {}
-        }
-        await query.edit_message_text(
-            "💬 Додавання Discord каналу\n\nВведіть ID каналу:"
-        )
-    elif callback_data == "add_twitter_adapter":
-        user_states[user_id] = {
-            'state': 'adding_twitter_adapter',
-            'data': {}
-        }
-        await query.edit_message_text(
-            "🚀 Додавання Twitter Monitor Adapter акаунта\n\nВведіть username акаунта (без @):"
-        )
-    elif callback_data == "platform_twitter":
-        user_states[user_id] = {
-            'state': 'adding_project',
-            'data': {'platform': 'twitter'}
-        }
-        await query.edit_message_text(
-            "🐦 Додавання проекту Twitter/X\n\nВведіть назву проекту:"
-        )
-    elif callback_data == "platform_discord":
-        user_states[user_id] = {
-            'state': 'adding_project',
-            'data': {'platform': 'discord'}
-        }
+    except Exception as e:
         await query.edit_message_text(
-            "💬 Додавання проекту Discord\n\nВведіть назву проекту:"
+            f"❌ Помилка видалення акаунта: {e}",
+            reply_markup=get_twitter_adapter_accounts_keyboard()
         )
-    elif callback_data == "help":
+
+@callback_router.prefix("view_discord_")
+async def _cb_view_discord(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок view_discord_..."""
+    project_id = int(callback_data.replace("view_discord_", ""))
+    project = project_manager.get_project_by_id(user_id, project_id)
+    if project:
+        text = f"💬 <b>Discord проект: {project['name']}</b>\n\n"
+        text += f"📝 <b>Опис:</b> {project.get('description', 'Немає опису')}\n"
+        text += f"🔗 <b>URL:</b> {project.get('url', 'Немає URL')}\n"
+        text += f"📅 <b>Створено:</b> {project.get('created_at', 'Невідомо')}\n"
+        text += f"🔄 <b>Статус:</b> {'Активний' if project.get('is_active', True) else 'Неактивний'}"
+        keyboard = [
+            [InlineKeyboardButton("👤 Кого пінгувати", callback_data=f"ping_menu_discord_{project_id}")],
+            [InlineKeyboardButton("❌ Видалити", callback_data=f"delete_discord_{project_id}")],
+            [InlineKeyboardButton("⬅️ Назад", callback_data="discord_projects")]
+        ]
         await query.edit_message_text(
-            "❓ **Система допомоги**\n\n"
-            "Оберіть розділ для отримання детальної інформації:",
-            reply_markup=get_help_keyboard()
-        )
-    elif callback_data == "twitter_adapter":
-        # Перевіряємо статус Twitter Monitor Adapter моніторингу
-        twitter_adapter_status = "🚀 Активний" if twitter_monitor_adapter and twitter_monitor_adapter.monitoring_active else "⏸️ Неактивний"
-        twitter_adapter_count = len(twitter_monitor_adapter.monitoring_accounts) if twitter_monitor_adapter else 0
-        
-        twitter_adapter_text = (
-            "🐦 **Twitter Monitor Adapter Моніторинг**\n\n"
-            f"📊 **Статус:** {twitter_adapter_status}\n"
-            f"👥 **Акаунтів:** {twitter_adapter_count}\n"
-            f"🔄 **Автозапуск:** ✅ Увімкнено\n\n"
-            "🔧 **Доступні команди:**\n"
-            "• `/twitter_add username` - Додати акаунт\n"
-            "• `/twitter_test username` - Тестувати моніторинг\n"
-            "• `/twitter_start` - Запустити моніторинг\n"
-            "• `/twitter_stop` - Зупинити моніторинг\n"
-            "• `/twitter_remove username` - Видалити акаунт\n\n"
-            "📝 **Приклад використання:**\n"
-            "1. `/twitter_add pilk_xz` - додайте акаунт\n"
-            "2. `/twitter_test pilk_xz` - протестуйте\n"
-            "3. `/twitter_start` - запустіть моніторинг\n"
-            "4. Моніторинг запуститься автоматично!\n\n"
-            "💡 **Переваги Twitter Monitor Adapter:**\n"
-            "• Швидкий API доступ\n"
-            "• Надійний парсинг\n"
-            "• Автоматичне оновлення\n"
-            "• Обхід обмежень API\n"
-            "• Автоматичний запуск з ботом"
-        )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="main_menu")]]
-        await query.edit_message_text(
-            twitter_adapter_text,
+            text,
             reply_markup=InlineKeyboardMarkup(keyboard),
+            parse_mode="HTML"
         )
-    elif callback_data.startswith("delete_twitter_adapter_"):
-        username = callback_data.replace("delete_twitter_adapter_", "")
-        try:
-            project_manager.remove_selenium_account(username)
-            if twitter_monitor_adapter:
-                twitter_monitor_adapter.remove_account(username)
-            # Синхронізація після змін
-            sync_monitors_with_projects()
-            await query.edit_message_text(
-                f"✅ Twitter Monitor Adapter акаунт @{username} успішно видалено!",
-                reply_markup=get_twitter_adapter_accounts_keyboard()
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ Помилка видалення акаунта: {e}",
-                reply_markup=get_twitter_adapter_accounts_keyboard()
-            )
-    elif callback_data.startswith("view_discord_"):
-        project_id = int(callback_data.replace("view_discord_", ""))
-        project = project_manager.get_project_by_id(user_id, project_id)
-        if project:
-            text = f"💬 <b>Discord проект: {project['name']}</b>\n\n"
-            text += f"📝 <b>Опис:</b> {project.get('description', 'Немає опису')}\n"
-            text += f"🔗 <b>URL:</b> {project.get('url', 'Немає URL')}\n"
-            text += f"📅 <b>Створено:</b> {project.get('created_at', 'Невідомо')}\n"
-            text += f"🔄 <b>Статус:</b> {'Активний' if project.get('is_active', True) else 'Неактивний'}"
-            keyboard = [
-                [InlineKeyboardButton("👤 Кого пінгувати", callback_data=f"ping_menu_discord_{project_id}")],
-                [InlineKeyboardButton("❌ Видалити", callback_data=f"delete_discord_{project_id}")],
-                [InlineKeyboardButton("⬅️ Назад", callback_data="discord_projects")]
-            ]
-            await query.edit_message_text(
-                text,
-                reply_markup=InlineKeyboardMarkup(keyboard),
-                parse_mode="HTML"
-            )
-    elif callback_data.startswith("ping_menu_discord_"):
-        project_id = int(callback_data.replace("ping_menu_discord_", ""))
-        project = project_manager.get_project_by_id(user_id, project_id)
-        if project:
-            ping_users = project_manager.get_project_ping_users(user_id, project_id)
-            text = f"👤 <b>Кого пінгувати для Discord-проекту:</b> <b>{project['name']}</b>\n\n"
-            if ping_users:
-                text += "Поточний список user_id для пінгу:\n"
-                for uid in ping_users:
-                    text += f"• <code>{uid}</code>\n"
-            else:
-                text += "Наразі список порожній.\n"
-            text += "\nВи можете додати або видалити user_id для пінгу.\nВведіть user_id для додавання або натисніть кнопку для видалення."
-            keyboard = []
-            for uid in ping_users:
-                keyboard.append([InlineKeyboardButton(f"❌ {uid}", callback_data=f"remove_ping_discord_{project_id}_{uid}")])
-            keyboard.append([InlineKeyboardButton("➕ Додати user_id", callback_data=f"add_ping_discord_{project_id}")])
-            keyboard.append([InlineKeyboardButton("⬅️ Назад", callback_data=f"view_discord_{project_id}")])
-            await query.edit_message_text(
-                text,
-                reply_markup=InlineKeyboardMarkup(keyboard),
-                parse_mode="HTML"
-            )
-    elif callback_data.startswith("remove_ping_discord_"):
-        # remove_ping_discord_{project_id}_{uid}
-        parts = callback_data.split("_")
-        project_id = int(parts[3])
-        uid = parts[4]
-        project_manager.remove_project_ping_user(user_id, project_id, uid)
-        project = project_manager.get_project_by_id(user_id, project_id)
+
+@callback_router.prefix("ping_menu_discord_")
+async def _cb_ping_menu_discord(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок ping_menu_discord_..."""
+    project_id = int(callback_data.replace("ping_menu_discord_", ""))
+    project = project_manager.get_project_by_id(user_id, project_id)
+    if project:
         ping_users = project_manager.get_project_ping_users(user_id, project_id)
         text = f"👤 <b>Кого пінгувати для Discord-проекту:</b> <b>{project['name']}</b>\n\n"
         if ping_users:
             text += "Поточний список user_id для пінгу:\n"
-            for uid2 in ping_users:
-                text += f"• <code>{uid2}</code>\n"
+            for uid in ping_users:
+                text += f"• <code>{uid}</code>\n"
         else:
             text += "Наразі список порожній.\n"
         text += "\nВи можете додати або видалити user_id для пінгу.\nВведіть user_id для додавання або натисніть кнопку для видалення."
         keyboard = []
-        for uid2 in ping_users:
-            keyboard.append([InlineKeyboardButton(f"❌ {uid2}", callback_data=f"remove_ping_discord_{project_id}_{uid2}")])
+        for uid in ping_users:
+            keyboard.append([InlineKeyboardButton(f"❌ {uid}", callback_data=f"remove_ping_discord_{project_id}_{uid}")])
         keyboard.append([InlineKeyboardButton("➕ Додати user_id", callback_data=f"add_ping_discord_{project_id}")])
         keyboard.append([InlineKeyboardButton("⬅️ Назад", callback_data=f"view_discord_{project_id}")])
         await query.edit_message_text(
@@ -2337,2406 +2539,2748 @@ async def handle_callback_query(update: Update, context: ContextTypes.DEFAULT_TY
             reply_markup=InlineKeyboardMarkup(keyboard),
             parse_mode="HTML"
         )
-    elif callback_data.startswith("add_ping_discord_"):
-        project_id = int(callback_data.replace("add_ping_discord_", ""))
+
+@callback_router.prefix("remove_ping_discord_")
+async def _cb_remove_ping_discord(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок remove_ping_discord_..."""
+    # remove_ping_discord_{project_id}_{uid}
+    parts = callback_data.split("_")
+    project_id = int(parts[3])
+    uid = parts[4]
+    project_manager.remove_project_ping_user(user_id, project_id, uid)
+    project = project_manager.get_project_by_id(user_id, project_id)
+    ping_users = project_manager.get_project_ping_users(user_id, project_id)
+    text = f"👤 <b>Кого пінгувати для Discord-проекту:</b> <b>{project['name']}</b>\n\n"
+    if ping_users:
+        text += "Поточний список user_id для пінгу:\n"
+        for uid2 in ping_users:
+            text += f"• <code>{uid2}</code>\n"
+    else:
+        text += "Наразі список порожній.\n"
+    text += "\nВи можете додати або видалити user_id для пінгу.\nВведіть user_id для додавання або натисніть кнопку для видалення."
+    keyboard = []
+    for uid2 in ping_users:
+        keyboard.append([InlineKeyboardButton(f"❌ {uid2}", callback_data=f"remove_ping_discord_{project_id}_{uid2}")])
+    keyboard.append([InlineKeyboardButton("➕ Додати user_id", callback_data=f"add_ping_discord_{project_id}")])
+    keyboard.append([InlineKeyboardButton("⬅️ Назад", callback_data=f"view_discord_{project_id}")])
+    await query.edit_message_text(
+        text,
+        reply_markup=InlineKeyboardMarkup(keyboard),
+        parse_mode="HTML"
+    )
+
+@callback_router.prefix("add_ping_discord_")
+async def _cb_add_ping_discord(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок add_ping_discord_..."""
+    project_id = int(callback_data.replace("add_ping_discord_", ""))
+    await query.edit_message_text(
+        f"Введіть user_id, якого потрібно додати до списку пінгованих для цього Discord-проекту.\n\nПісля введення, просто надішліть його у чат.\n\n<code>/cancel</code> — скасувати.",
+        parse_mode="HTML"
+    )
+    context.user_data['awaiting_ping_user_discord'] = {'project_id': project_id}
+
+@callback_router.prefix("add_ping_")
+async def _cb_add_ping(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок add_ping_..."""
+    # Для Twitter-проектів (аналогічно Discord)
+    project_id = int(callback_data.replace("add_ping_", ""))
+    await query.edit_message_text(
+        f"Введіть user_id, якого потрібно додати до списку пінгованих для цього Twitter-проекту.\n\nПісля введення, просто надішліть його у чат.\n\n<code>/cancel</code> — скасувати.",
+        parse_mode="HTML"
+    )
+    context.user_data['awaiting_ping_user'] = {'project_id': project_id}
+
+@callback_router.prefix("view_twitter_")
+async def _cb_view_twitter(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок view_twitter_..."""
+    project_id = int(callback_data.replace("view_twitter_", ""))
+    project = project_manager.get_project_by_id(user_id, project_id)
+    if project:
+        text = f"🐦 <b>Twitter проект: {project['name']}</b>\n\n"
+        text += f"📝 <b>Опис:</b> {project.get('description', 'Немає опису')}\n"
+        text += f"🔗 <b>URL:</b> {project.get('url', 'Немає URL')}\n"
+        text += f"📅 <b>Створено:</b> {project.get('created_at', 'Невідомо')}\n"
+        text += f"🔄 <b>Статус:</b> {'Активний' if project.get('is_active', True) else 'Неактивний'}"
+        keyboard = [
+            [InlineKeyboardButton("👤 Кого пінгувати", callback_data=f"ping_menu_{project_id}")],
+            [InlineKeyboardButton("❌ Видалити", callback_data=f"delete_twitter_{project_id}")],
+            [InlineKeyboardButton("⬅️ Назад", callback_data="twitter_projects")]
+        ]
         await query.edit_message_text(
-            f"Введіть user_id, якого потрібно додати до списку пінгованих для цього Discord-проекту.\n\nПісля введення, просто надішліть його у чат.\n\n<code>/cancel</code> — скасувати.",
+            text,
+            reply_markup=InlineKeyboardMarkup(keyboard),
             parse_mode="HTML"
         )
-        context.user_data['awaiting_ping_user_discord'] = {'project_id': project_id}
-    elif callback_data.startswith("add_ping_"):
-        # Для Twitter-проектів (аналогічно Discord)
-        project_id = int(callback_data.replace("add_ping_", ""))
+
+@callback_router.prefix("ping_menu_")
+async def _cb_ping_menu(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок ping_menu_..."""
+    project_id = int(callback_data.replace("ping_menu_", ""))
+    project = project_manager.get_project_by_id(user_id, project_id)
+    if project:
+        ping_users = project_manager.get_project_ping_users(user_id, project_id)
+        text = f"👤 <b>Кого пінгувати для проекту:</b> <b>{project['name']}</b>\n\n"
+        if ping_users:
+            text += "Поточний список user_id для пінгу:\n"
+            for uid in ping_users:
+                text += f"• <code>{uid}</code>\n"
+        else:
+            text += "Наразі список порожній.\n"
+        text += "\nВи можете додати або видалити user_id для пінгу.\nВведіть user_id для додавання або натисніть кнопку для видалення."
+        keyboard = []
+        for uid in ping_users:
+            keyboard.append([InlineKeyboardButton(f"❌ {uid}", callback_data=f"remove_ping_{project_id}_{uid}")])
+        keyboard.append([InlineKeyboardButton("➕ Додати user_id", callback_data=f"add_ping_{project_id}")])
+        keyboard.append([InlineKeyboardButton("⬅️ Назад", callback_data=f"view_twitter_{project_id}")])
         await query.edit_message_text(
-            f"Введіть user_id, якого потрібно додати до списку пінгованих для цього Twitter-проекту.\n\nПісля введення, просто надішліть його у чат.\n\n<code>/cancel</code> — скасувати.",
+            text,
+            reply_markup=InlineKeyboardMarkup(keyboard),
             parse_mode="HTML"
         )
-        context.user_data['awaiting_ping_user'] = {'project_id': project_id}
-    elif callback_data.startswith("view_twitter_"):
-        project_id = int(callback_data.replace("view_twitter_", ""))
-        project = project_manager.get_project_by_id(user_id, project_id)
-        if project:
-            text = f"🐦 <b>Twitter проект: {project['name']}</b>\n\n"
-            text += f"📝 <b>Опис:</b> {project.get('description', 'Немає опису')}\n"
-            text += f"🔗 <b>URL:</b> {project.get('url', 'Немає URL')}\n"
-            text += f"📅 <b>Створено:</b> {project.get('created_at', 'Невідомо')}\n"
-            text += f"🔄 <b>Статус:</b> {'Активний' if project.get('is_active', True) else 'Неактивний'}"
-            keyboard = [
-                [InlineKeyboardButton("👤 Кого пінгувати", callback_data=f"ping_menu_{project_id}")],
-                [InlineKeyboardButton("❌ Видалити", callback_data=f"delete_twitter_{project_id}")],
-                [InlineKeyboardButton("⬅️ Назад", callback_data="twitter_projects")]
-            ]
-            await query.edit_message_text(
-                text,
-                reply_markup=InlineKeyboardMarkup(keyboard),
-                parse_mode="HTML"
-            )
-    elif callback_data.startswith("ping_menu_"):
-        project_id = int(callback_data.replace("ping_menu_", ""))
-        project = project_manager.get_project_by_id(user_id, project_id)
-        if project:
-            ping_users = project_manager.get_project_ping_users(user_id, project_id)
-            text = f"👤 <b>Кого пінгувати для проекту:</b> <b>{project['name']}</b>\n\n"
-            if ping_users:
-                text += "Поточний список user_id для пінгу:\n"
-                for uid in ping_users:
-                    text += f"• <code>{uid}</code>\n"
-            else:
-                text += "Наразі список порожній.\n"
-            text += "\nВи можете додати або видалити user_id для пінгу.\nВведіть user_id для додавання або натисніть кнопку для видалення."
-            keyboard = []
-            for uid in ping_users:
-                keyboard.append([InlineKeyboardButton(f"❌ {uid}", callback_data=f"remove_ping_{project_id}_{uid}")])
-            keyboard.append([InlineKeyboardButton("➕ Додати user_id", callback_data=f"add_ping_{project_id}")])
-            keyboard.append([InlineKeyboardButton("⬅️ Назад", callback_data=f"view_twitter_{project_id}")])
-            await query.edit_message_text(
-                text,
-                reply_markup=InlineKeyboardMarkup(keyboard),
-                parse_mode="HTML"
-            )
-    elif callback_data.startswith("view_discord_"):
-        project_id = int(callback_data.replace("view_discord_", ""))
-        project = project_manager.get_project_by_id(user_id, project_id)
-        if project:
-            text = f"💬 **Discord проект: {project['name']}**\n\n"
-            text += f"📝 **Опис:** {project.get('description', 'Немає опису')}\n"
-            text += f"🔗 **URL:** {project.get('url', 'Немає URL')}\n"
-            text += f"📅 **Створено:** {project.get('created_at', 'Невідомо')}\n"
-            text += f"🔄 **Статус:** {'Активний' if project.get('is_active', True) else 'Неактивний'}"
-            
-            keyboard = [
-                [InlineKeyboardButton("❌ Видалити", callback_data=f"delete_discord_{project_id}")],
-                [InlineKeyboardButton("⬅️ Назад", callback_data="discord_projects")]
-            ]
-            await query.edit_message_text(
-                text,
-                reply_markup=InlineKeyboardMarkup(keyboard),
-            )
-    elif callback_data.startswith("view_twitter_adapter_"):
-        username = callback_data.replace("view_twitter_adapter_", "")
-        twitter_adapter_accounts = project_manager.get_selenium_accounts()
-        if username in twitter_adapter_accounts:
-            account_data = project_manager.data['selenium_accounts'][username]
-            text = f"🚀 **Twitter Monitor Adapter: @{username}**\n\n"
-            text += f"📅 **Додано:** {account_data.get('added_at', 'Невідомо')}\n"
-            text += f"👤 **Додав:** {account_data.get('added_by', 'Невідомо')}\n"
-            text += f"🔄 **Статус:** {'Активний' if account_data.get('is_active', True) else 'Неактивний'}\n"
-            text += f"⏰ **Остання перевірка:** {account_data.get('last_checked', 'Ніколи')}"
-            
-            keyboard = [
-                [InlineKeyboardButton("❌ Видалити", callback_data=f"delete_twitter_adapter_{username}")],
-                [InlineKeyboardButton("⬅️ Назад", callback_data="twitter_adapter_accounts")]
-            ]
-            await query.edit_message_text(
-                text,
-                reply_markup=InlineKeyboardMarkup(keyboard),
-            )
-    elif callback_data == "account_manager":
-        # Показуємо менеджер акаунтів
-        projects = project_manager.get_user_projects(user_id)
-        
-        if not projects:
-            await query.edit_message_text(
-                "🔧 **Менеджер акаунтів**\n\n❌ У вас немає проектів для моніторингу.\n\nДодайте проекти через меню бота.",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        # Групуємо по платформах
-        twitter_projects = [p for p in projects if p['platform'] == 'twitter']
-        discord_projects = [p for p in projects if p['platform'] == 'discord']
-        
-        # Форматуємо список
-        text = "🔧 **Менеджер акаунтів**\n\n"
-        
-        if twitter_projects:
-            text += "🐦 **Twitter/X акаунти:**\n"
-            for i, project in enumerate(twitter_projects, 1):
-                project_username: Optional[str] = extract_twitter_username(project['url'])
-                if project_username:
-                    text += f"{i}. @{project_username} ({project['name']})\n"
-            text += "\n"
-        
-        if discord_projects:
-            text += "💬 **Discord канали:**\n"
-            for i, project in enumerate(discord_projects, 1):
-                channel_id = extract_discord_channel_id(project['url'])
-                text += f"{i}. Канал {channel_id} ({project['name']})\n"
-            text += "\n"
-        
-        # Додаємо команди для видалення
-        text += "🔧 **Команди для управління:**\n"
-        text += "• /remove_twitter username - видалити Twitter акаунт\n"
-        text += "• /remove_discord channel_id - видалити Discord канал\n"
-        text += "• /accounts - показати список акаунтів"
-        
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="main_menu")]]
+
+@callback_router.prefix("view_twitter_adapter_")
+async def _cb_view_twitter_adapter(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок view_twitter_adapter_..."""
+    username = callback_data.replace("view_twitter_adapter_", "")
+    twitter_adapter_accounts = project_manager.get_selenium_accounts()
+    if username in twitter_adapter_accounts:
+        account_data = project_manager.data['selenium_accounts'][username]
+        text = f"🚀 **Twitter Monitor Adapter: @{username}**\n\n"
+        text += f"📅 **Додано:** {account_data.get('added_at', 'Невідомо')}\n"
+        text += f"👤 **Додав:** {account_data.get('added_by', 'Невідомо')}\n"
+        text += f"🔄 **Статус:** {'Активний' if account_data.get('is_active', True) else 'Неактивний'}\n"
+        text += f"⏰ **Остання перевірка:** {account_data.get('last_checked', 'Ніколи')}"
+
+        keyboard = [
+            [InlineKeyboardButton("❌ Видалити", callback_data=f"delete_twitter_adapter_{username}")],
+            [InlineKeyboardButton("⬅️ Назад", callback_data="twitter_adapter_accounts")]
+        ]
         await query.edit_message_text(
             text,
             reply_markup=InlineKeyboardMarkup(keyboard),
         )
-    elif callback_data == "discord_history":
-        # Перевіряємо чи є Discord проекти
-        projects = project_manager.get_user_projects(user_id)
-        discord_projects = [p for p in projects if p['platform'] == 'discord']
-        
-        if not discord_projects:
-            await query.edit_message_text(
-                "📜 Історія Discord\n\n❌ У вас немає Discord проектів для перегляду історії.\n\nДодайте Discord проект спочатку.",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-        else:
-            await query.edit_message_text(
-                "📜 Історія Discord\n\nОберіть канал для перегляду історії повідомлень:",
-                reply_markup=get_discord_channels_keyboard(user_id)
-            )
-    elif callback_data.startswith("channel_"):
-        # Зберігаємо вибраний канал для історії
-        project_id = int(callback_data.split("_")[1])
-        project = project_manager.get_project_by_id(user_id, project_id)
-        
-        if project:
-            user_states[user_id] = {
-                'state': 'viewing_history',
-                'data': {'project': project}
-            }
-            await query.edit_message_text(
-                f"📜 Історія каналу: {project['name']}\n\nОберіть кількість повідомлень для перегляду:",
-                reply_markup=get_history_count_keyboard()
-            )
-    elif callback_data.startswith("history_"):
-        # Отримуємо історію повідомлень
-        count = int(callback_data.split("_")[1])
-        await handle_discord_history(update, context, count)
-    elif callback_data == "settings":
+
+@callback_router.exact("account_manager")
+async def _cb_account_manager(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки account_manager"""
+    # Показуємо менеджер акаунтів
+    projects = project_manager.get_user_projects(user_id)
+
+    if not projects:
         await query.edit_message_text(
-            "⚙️ **Налаштування**\n\n"
-            "Налаштуйте бота під свої потреби:",
-            reply_markup=get_settings_keyboard(user_id)
+            "🔧 **Менеджер акаунтів**\n\n❌ У вас немає проектів для моніторингу.\n\nДодайте проекти через меню бота.",
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    elif callback_data == "forward_settings":
-        forward_status = project_manager.get_forward_status(user_id)
-        
-        if forward_status['enabled']:
-            status_text = f"📢 Налаштування пересилання\n\n✅ Пересилання увімкнено\n📺 Канал: {forward_status['channel_id']}\n🕒 Налаштовано: {forward_status['created_at'][:19] if forward_status['created_at'] else 'Невідомо'}\n\n💡 Сповіщення відправляються тільки в налаштований канал, не в особисті повідомлення."
-        else:
-            status_text = "📢 Налаштування пересилання\n\n❌ Пересилання вимкнено\n\nНалаштуйте канал для автоматичного пересилання сповіщень з ваших проектів.\n\n💡 Сповіщення будуть відправлятися тільки в налаштований канал."
-        
+        return
+
+    # Групуємо по платформах
+    twitter_projects = [p for p in projects if p['platform'] == 'twitter']
+    discord_projects = [p for p in projects if p['platform'] == 'discord']
+
+    # Форматуємо список
+    text = "🔧 **Менеджер акаунтів**\n\n"
+
+    if twitter_projects:
+        text += "🐦 **Twitter/X акаунти:**\n"
+        for i, project in enumerate(twitter_projects, 1):
+            project_username: Optional[str] = extract_twitter_username(project['url'])
+            if project_username:
+                text += f"{i}. @{project_username} ({project['name']})\n"
+        text += "\n"
+
+    if discord_projects:
+        text += "💬 **Discord канали:**\n"
+        for i, project in enumerate(discord_projects, 1):
+            channel_id = extract_discord_channel_id(project['url'])
+            text += f"{i}. Канал {channel_id} ({project['name']})\n"
+        text += "\n"
+
+    # Додаємо команди для видалення
+    text += "🔧 **Команди для управління:**\n"
+    text += "• /remove_twitter username - видалити Twitter акаунт\n"
+    text += "• /remove_discord channel_id - видалити Discord канал\n"
+    text += "• /accounts - показати список акаунтів"
+
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="main_menu")]]
+    await query.edit_message_text(
+        text,
+        reply_markup=InlineKeyboardMarkup(keyboard),
+    )
+
+@callback_router.exact("discord_history")
+async def _cb_discord_history(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки discord_history"""
+    # Перевіряємо чи є Discord проекти
+    projects = project_manager.get_user_projects(user_id)
+    discord_projects = [p for p in projects if p['platform'] == 'discord']
+
+    if not discord_projects:
         await query.edit_message_text(
-            status_text,
-            reply_markup=get_forward_settings_keyboard(user_id)
+            "📜 Історія Discord\n\n❌ У вас немає Discord проектів для перегляду історії.\n\nДодайте Discord проект спочатку.",
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    elif callback_data == "enable_forward":
-        if project_manager.enable_forward(user_id):
-            await query.edit_message_text(
-                "✅ Пересилання увімкнено!\n\nТепер потрібно встановити канал для пересилання.",
-                reply_markup=get_forward_settings_keyboard(user_id)
-            )
-        else:
-            await query.edit_message_text(
-                "❌ Помилка увімкнення пересилання",
-                reply_markup=get_forward_settings_keyboard(user_id)
-            )
-    elif callback_data == "disable_forward":
-        if project_manager.disable_forward(user_id):
-            await query.edit_message_text(
-                "🔴 Пересилання вимкнено",
-                reply_markup=get_forward_settings_keyboard(user_id)
-            )
-        else:
-            await query.edit_message_text(
-                "❌ Помилка вимкнення пересилання",
-                reply_markup=get_forward_settings_keyboard(user_id)
-            )
-    elif callback_data in ["set_channel", "change_channel"]:
+    else:
+        await query.edit_message_text(
+            "📜 Історія Discord\n\nОберіть канал для перегляду історії повідомлень:",
+            reply_markup=get_discord_channels_keyboard(user_id)
+        )
+
+@callback_router.prefix("channel_")
+async def _cb_channel(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок channel_..."""
+    # Зберігаємо вибраний канал для історії
+    project_id = int(callback_data.split("_")[1])
+    project = project_manager.get_project_by_id(user_id, project_id)
+
+    if project:
         user_states[user_id] = {
-            'state': 'setting_forward_channel',
-            'data': {}
+            'state': 'viewing_history',
+            'data': {'project': project}
         }
         await query.edit_message_text(
-            "📝 Встановлення каналу для пересилання\n\n"
-            "**Спосіб 1 - Автоматичне налаштування:**\n"
-            "1. Додайте бота в канал як адміністратора\n"
-            "2. Пінгніть бота в каналі: @parseryamatobot\n"
-            "3. Бот автоматично налаштує канал\n\n"
-            "**Спосіб 2 - Ручне налаштування:**\n"
-            "Введіть ID каналу або username каналу:\n\n"
-            "Приклади:\n"
-            "• @channel_username\n"
-            "• -1001234567890 (ID каналу)\n"
-            "• channel_username (без @)\n\n"
-            "💡 Рекомендуємо використовувати автоматичне налаштування!"
-        )
-    elif callback_data == "auto_setup":
-        bot_username = context.bot.username
-        await query.edit_message_text(
-            f"🤖 **Автоматичне налаштування каналу**\n\n"
-            f"Для автоматичного налаштування каналу:\n\n"
-            f"1️⃣ **Додайте бота в канал**\n"
-            f"   • Додайте @{bot_username} в канал як адміністратора\n"
-            f"   • Надайте права на відправку повідомлень\n\n"
-            f"2️⃣ **Пінгніть бота в каналі**\n"
-            f"   • Напишіть в каналі: @{bot_username}\n"
-            f"   • Бот автоматично налаштує канал\n\n"
-            f"3️⃣ **Готово!**\n"
-            f"   • Канал буде налаштовано для пересилання\n"
-            f"   • Ви отримаєте підтвердження\n\n"
-            f"💡 **Переваги:**\n"
-            f"• Не потрібно знати ID каналу\n"
-            f"• Автоматичне налаштування\n"
-            f"• Миттєве підтвердження",
-            reply_markup=get_forward_settings_keyboard(user_id)
+            f"📜 Історія каналу: {project['name']}\n\nОберіть кількість повідомлень для перегляду:",
+            reply_markup=get_history_count_keyboard()
         )
-    elif callback_data == "forward_status":
-        forward_status = project_manager.get_forward_status(user_id)
-        user_projects = project_manager.get_user_projects(user_id)
-        discord_projects = [p for p in user_projects if p['platform'] == 'discord']
-        twitter_projects = [p for p in user_projects if p['platform'] == 'twitter']
-        use_threads = forward_status.get('use_threads', True)
-        
-        status_text = (
-            f"📊 Статус пересилання\n\n"
-            f"🔄 Статус: {'✅ Увімкнено' if forward_status['enabled'] else '❌ Вимкнено'}\n"
-            f"📺 Канал: {forward_status['channel_id'] or 'Не встановлено'}\n"
-            f"🧵 Режим: {'Гілки (threads)' if use_threads else 'Теги в каналі'}\n"
-            f"📋 Проектів: Discord {len(discord_projects)}, Twitter {len(twitter_projects)}\n"
-            f"🕒 Налаштовано: {forward_status['created_at'][:19] if forward_status['created_at'] else 'Невідомо'}\n\n"
+
+@callback_router.prefix("history_")
+async def _cb_history(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок history_..."""
+    # Отримуємо історію повідомлень
+    count = int(callback_data.split("_")[1])
+    await handle_discord_history(update, context, count)
+
+@callback_router.exact("settings")
+async def _cb_settings(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки settings"""
+    await query.edit_message_text(
+        "⚙️ **Налаштування**\n\n"
+        "Налаштуйте бота під свої потреби:",
+        reply_markup=get_settings_keyboard(user_id)
+    )
+
+@callback_router.exact("forward_settings")
+async def _cb_forward_settings(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки forward_settings"""
+    forward_status = project_manager.get_forward_status(user_id)
+
+    if forward_status['enabled']:
+        status_text = f"📢 Налаштування пересилання\n\n✅ Пересилання увімкнено\n📺 Канал: {forward_status['channel_id']}\n🕒 Налаштовано: {forward_status['created_at'][:19] if forward_status['created_at'] else 'Невідомо'}\n\n💡 Сповіщення відправляються тільки в налаштований канал, не в особисті повідомлення."
+    else:
+        status_text = "📢 Налаштування пересилання\n\n❌ Пересилання вимкнено\n\nНалаштуйте канал для автоматичного пересилання сповіщень з ваших проектів.\n\n💡 Сповіщення будуть відправлятися тільки в налаштований канал."
+
+    await query.edit_message_text(
+        status_text,
+        reply_markup=get_forward_settings_keyboard(user_id)
+    )
+
+@callback_router.exact("enable_forward")
+async def _cb_enable_forward(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки enable_forward"""
+    if project_manager.enable_forward(user_id):
+        await query.edit_message_text(
+            "✅ Пересилання увімкнено!\n\nТепер потрібно встановити канал для пересилання.",
+            reply_markup=get_forward_settings_keyboard(user_id)
         )
-        
-        if use_threads:
-            status_text += "🧵 **Режим гілок**: Кожен проект має свою окрему гілку в групі\n"
-            project_threads = forward_status.get('project_threads', {})
-            if project_threads:
-                status_text += f"🔧 Активних гілок: {len(project_threads)}\n"
-        else:
-            status_text += "🏷️ **Режим тегів**: Всі повідомлення в одному каналі з тегами проектів\n"
-        
-        status_text += "\n💡 Сповіщення відправляються тільки в налаштований канал.\n\n"
-        
-        if forward_status['enabled'] and (discord_projects or twitter_projects):
-            status_text += "📢 Сповіщення будуть пересилатися з проектів:\n"
-            for project in discord_projects + twitter_projects:
-                platform_emoji = "💬" if project['platform'] == 'discord' else "🐦"
-                project_tag = project.get('tag', f"#{project['platform']}_project_{project['id']}")
-                status_text += f"• {platform_emoji} {project['name']} ({project_tag})\n"
-        elif not discord_projects and not twitter_projects:
-            status_text += "⚠️ У вас немає проектів для моніторингу."
-        
+    else:
         await query.edit_message_text(
-            status_text,
+            "❌ Помилка увімкнення пересилання",
             reply_markup=get_forward_settings_keyboard(user_id)
         )
-    elif callback_data == "enable_threads":
-        # Увімкнути використання thread'ів
-        forward_status = project_manager.get_forward_status(user_id)
-        if forward_status['enabled']:
-            project_manager.data['settings']['forward_settings'][str(user_id)]['use_threads'] = True
-            project_manager.save_data()
-            await query.edit_message_text(
-                "🧵 **Режим гілок увімкнено!**\n\n"
-                "Тепер кожен проект буде мати свою окрему гілку в групі.\n"
-                "Це дозволяє краще організувати повідомлення та легше їх знаходити.\n\n"
-                "💡 **Переваги гілок:**\n"
-                "• Кожен проект в окремій гілці\n"
-                "• Зручна навігація\n"
-                "• Автоматичне створення гілок\n"
-                "• Теги в назві гілки",
-                reply_markup=get_forward_settings_keyboard(user_id)
-            )
-        else:
-            await query.edit_message_text(
-                "❌ Спочатку увімкніть пересилання та встановіть канал.",
-                reply_markup=get_forward_settings_keyboard(user_id)
-            )
-    elif callback_data == "disable_threads":
-        # Вимкнути використання thread'ів (використовувати теги)
-        forward_status = project_manager.get_forward_status(user_id)
-        if forward_status['enabled']:
-            project_manager.data['settings']['forward_settings'][str(user_id)]['use_threads'] = False
-            project_manager.save_data()
-            await query.edit_message_text(
-                "🏷️ **Режим тегів увімкнено!**\n\n"
-                "Тепер всі повідомлення будуть відправлятися в основний канал з тегами проектів.\n"
-                "Кожне повідомлення буде містити тег проекту на початку.\n\n"
-                "💡 **Переваги тегів:**\n"
-                "• Всі повідомлення в одному каналі\n"
-                "• Легкий пошук за тегами\n"
-                "• Простий інтерфейс\n"
-                "• Сумісність зі старими каналами",
-                reply_markup=get_forward_settings_keyboard(user_id)
-            )
-        else:
-            await query.edit_message_text(
-                "❌ Спочатку увімкніть пересилання та встановіть канал.",
-                reply_markup=get_forward_settings_keyboard(user_id)
-            )
-    elif callback_data == "test_threads":
-        # Тестування thread'ів
-        forward_status = project_manager.get_forward_status(user_id)
-        if not forward_status['enabled']:
-            await query.edit_message_text(
-                "❌ Пересилання не налаштовано",
-                reply_markup=get_forward_settings_keyboard(user_id)
-            )
-            return
-        
-        user_projects = project_manager.get_user_projects(user_id)
-        if not user_projects:
-            await query.edit_message_text(
-                "❌ У вас немає проектів для тестування",
-                reply_markup=get_forward_settings_keyboard(user_id)
-            )
-            return
-        
-        forward_channel = forward_status['channel_id']
-        test_results = []
-        
-        for project in user_projects[:3]:  # Тестуємо перші 3 проекти
-            project_id = project.get('id')
-            project_name = project.get('name', 'Test Project')
-            project_tag = project.get('tag', f"#test_{project_id}")
-            
-            try:
-                # Спробуємо створити або знайти thread
-                thread_id = project_manager.get_project_thread(user_id, project_id)
-                
-                if not thread_id:
-                    thread_id = create_project_thread_sync(BOT_TOKEN, forward_channel, project_name, project_tag, str(user_id))
-                    
-                    if thread_id:
-                        project_manager.set_project_thread(user_id, project_id, thread_id)
-                
-                if thread_id:
-                    # Відправляємо тестове повідомлення в thread
-                    test_text = (
-                        f"🧪 **Тестове повідомлення**\n\n"
-                        f"• Проект: {project_name}\n"
-                        f"• Тег: {project_tag}\n"
-                        f"• Thread ID: {thread_id}\n"
-                        f"• Час: {datetime.now().strftime('%H:%M:%S')}\n\n"
-                        f"✅ Якщо ви бачите це повідомлення, гілка працює правильно!"
-                    )
-                    
-                    success = send_message_to_thread_sync(BOT_TOKEN, forward_channel, thread_id, test_text, project_tag)
-                    
-                    if success:
-                        test_results.append(f"✅ {project_name} (thread {thread_id})")
-                    else:
-                        test_results.append(f"❌ {project_name} - помилка відправки")
-                else:
-                    test_results.append(f"❌ {project_name} - не вдалося створити thread")
-                    
-            except Exception as e:
-                test_results.append(f"❌ {project_name} - помилка: {str(e)[:50]}")
-        
-        result_text = (
-            f"🧪 **Результати тестування гілок**\n\n"
-            f"📊 Протестовано проектів: {len(test_results)}\n\n"
-            + "\n".join(test_results) +
-            f"\n\n💡 Перевірте канал {forward_channel} для тестових повідомлень."
+
+@callback_router.exact("disable_forward")
+async def _cb_disable_forward(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки disable_forward"""
+    if project_manager.disable_forward(user_id):
+        await query.edit_message_text(
+            "🔴 Пересилання вимкнено",
+            reply_markup=get_forward_settings_keyboard(user_id)
         )
-        
+    else:
         await query.edit_message_text(
-            result_text,
+            "❌ Помилка вимкнення пересилання",
             reply_markup=get_forward_settings_keyboard(user_id)
         )
-    elif callback_data == "manage_threads":
-        # Управління thread'ами
-        forward_status = project_manager.get_forward_status(user_id)
-        user_projects = project_manager.get_user_projects(user_id)
+
+@callback_router.exact("set_channel")
+@callback_router.exact("change_channel")
+async def _cb_set_channel(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки set_channel / change_channel"""
+    user_states[user_id] = {
+        'state': 'setting_forward_channel',
+        'data': {}
+    }
+    await query.edit_message_text(
+        "📝 Встановлення каналу для пересилання\n\n"
+        "**Спосіб 1 - Автоматичне налаштування:**\n"
+        "1. Додайте бота в канал як адміністратора\n"
+        "2. Пінгніть бота в каналі: @parseryamatobot\n"
+        "3. Бот автоматично налаштує канал\n\n"
+        "**Спосіб 2 - Ручне налаштування:**\n"
+        "Введіть ID каналу або username каналу:\n\n"
+        "Приклади:\n"
+        "• @channel_username\n"
+        "• -1001234567890 (ID каналу)\n"
+        "• channel_username (без @)\n\n"
+        "💡 Рекомендуємо використовувати автоматичне налаштування!"
+    )
+
+@callback_router.exact("auto_setup")
+async def _cb_auto_setup(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки auto_setup"""
+    bot_username = context.bot.username
+    await query.edit_message_text(
+        f"🤖 **Автоматичне налаштування каналу**\n\n"
+        f"Для автоматичного налаштування каналу:\n\n"
+        f"1️⃣ **Додайте бота в канал**\n"
+        f"   • Додайте @{bot_username} в канал як адміністратора\n"
+        f"   • Надайте права на відправку повідомлень\n\n"
+        f"2️⃣ **Пінгніть бота в каналі**\n"
+        f"   • Напишіть в каналі: @{bot_username}\n"
+        f"   • Бот автоматично налаштує канал\n\n"
+        f"3️⃣ **Готово!**\n"
+        f"   • Канал буде налаштовано для пересилання\n"
+        f"   • Ви отримаєте підтвердження\n\n"
+        f"💡 **Переваги:**\n"
+        f"• Не потрібно знати ID каналу\n"
+        f"• Автоматичне налаштування\n"
+        f"• Миттєве підтвердження",
+        reply_markup=get_forward_settings_keyboard(user_id)
+    )
+
+@callback_router.exact("forward_status")
+async def _cb_forward_status(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки forward_status"""
+    forward_status = project_manager.get_forward_status(user_id)
+    user_projects = project_manager.get_user_projects(user_id)
+    discord_projects = [p for p in user_projects if p['platform'] == 'discord']
+    twitter_projects = [p for p in user_projects if p['platform'] == 'twitter']
+    use_threads = forward_status.get('use_threads', True)
+
+    status_text = (
+        f"📊 Статус пересилання\n\n"
+        f"🔄 Статус: {'✅ Увімкнено' if forward_status['enabled'] else '❌ Вимкнено'}\n"
+        f"📺 Канал: {forward_status['channel_id'] or 'Не встановлено'}\n"
+        f"🧵 Режим: {'Гілки (threads)' if use_threads else 'Теги в каналі'}\n"
+        f"📋 Проектів: Discord {len(discord_projects)}, Twitter {len(twitter_projects)}\n"
+        f"🕒 Налаштовано: {forward_status['created_at'][:19] if forward_status['created_at'] else 'Невідомо'}\n\n"
+    )
+
+    if use_threads:
+        status_text += "🧵 **Режим гілок**: Кожен проект має свою окрему гілку в групі\n"
         project_threads = forward_status.get('project_threads', {})
-        
-        threads_info = []
-        for project in user_projects:
-            project_id = str(project.get('id'))
-            project_name = project.get('name', 'Unknown')
-            project_tag = project.get('tag', f"#project_{project_id}")
-            thread_id = project_threads.get(project_id)
-            
-            if thread_id:
-                threads_info.append(f"🧵 {project_name} ({project_tag}) - Thread {thread_id}")
-            else:
-                threads_info.append(f"❌ {project_name} ({project_tag}) - Немає thread'а")
-        
-        if threads_info:
-            threads_text = "\n".join(threads_info[:10])  # Показуємо перші 10
-            if len(threads_info) > 10:
-                threads_text += f"\n... та ще {len(threads_info) - 10} проектів"
-        else:
-            threads_text = "❌ Немає активних гілок"
-        
-        manage_text = (
-            f"🔧 **Управління гілками**\n\n"
-            f"📊 Всього проектів: {len(user_projects)}\n"
-            f"🧵 Активних гілок: {len(project_threads)}\n\n"
-            f"**Список гілок:**\n{threads_text}\n\n"
-            f"💡 Гілки створюються автоматично при появі нових повідомлень."
-        )
-        
-        keyboard = [
-            [InlineKeyboardButton("🔄 Пересоздать все гілки", callback_data="recreate_all_threads")],
-            [InlineKeyboardButton("🧹 Очистити неактивні", callback_data="cleanup_threads")],
-            [InlineKeyboardButton("⬅️ Назад", callback_data="forward_settings")]
-        ]
-        
+        if project_threads:
+            status_text += f"🔧 Активних гілок: {len(project_threads)}\n"
+    else:
+        status_text += "🏷️ **Режим тегів**: Всі повідомлення в одному каналі з тегами проектів\n"
+
+    status_text += "\n💡 Сповіщення відправляються тільки в налаштований канал.\n\n"
+
+    if forward_status['enabled'] and (discord_projects or twitter_projects):
+        status_text += "📢 Сповіщення будуть пересилатися з проектів:\n"
+        for project in discord_projects + twitter_projects:
+            platform_emoji = "💬" if project['platform'] == 'discord' else "🐦"
+            project_tag = project.get('tag', f"#{project['platform']}_project_{project['id']}")
+            status_text += f"• {platform_emoji} {project['name']} ({project_tag})\n"
+    elif not discord_projects and not twitter_projects:
+        status_text += "⚠️ У вас немає проектів для моніторингу."
+
+    await query.edit_message_text(
+        status_text,
+        reply_markup=get_forward_settings_keyboard(user_id)
+    )
+
+@callback_router.exact("enable_threads")
+async def _cb_enable_threads(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки enable_threads"""
+    # Увімкнути використання thread'ів
+    forward_status = project_manager.get_forward_status(user_id)
+    if forward_status['enabled']:
+        project_manager.data['settings']['forward_settings'][str(user_id)]['use_threads'] = True
+        project_manager.save_data()
         await query.edit_message_text(
-            manage_text,
-            reply_markup=InlineKeyboardMarkup(keyboard)
-        )
-    elif callback_data == "recreate_all_threads":
-        # Пересоздать все thread'и
-        forward_status = project_manager.get_forward_status(user_id)
-        if not forward_status['enabled']:
-            await query.edit_message_text(
-                "❌ Пересилання не налаштовано",
-                reply_markup=get_forward_settings_keyboard(user_id)
-            )
-            return
-        
-        user_projects = project_manager.get_user_projects(user_id)
-        forward_channel = forward_status['channel_id']
-        
-        # Очищаємо старі thread'и
-        project_manager.data['settings']['forward_settings'][str(user_id)]['project_threads'] = {}
-        
-        created_threads = []
-        errors = []
-        
-        for project in user_projects:
-            project_id = project.get('id')
-            project_name = project.get('name', 'Project')
-            project_tag = project.get('tag', f"#project_{project_id}")
-            
-            try:
-                thread_id = create_project_thread_sync(BOT_TOKEN, forward_channel, project_name, project_tag, str(user_id))
-                
-                if thread_id:
-                    project_manager.set_project_thread(user_id, project_id, thread_id)
-                    created_threads.append(f"✅ {project_name} - Thread {thread_id}")
-                else:
-                    errors.append(f"❌ {project_name} - не вдалося створити")
-                    
-            except Exception as e:
-                errors.append(f"❌ {project_name} - помилка: {str(e)[:30]}")
-        
-        result_text = (
-            f"🔄 **Результати пересоздання гілок**\n\n"
-            f"✅ Створено: {len(created_threads)}\n"
-            f"❌ Помилок: {len(errors)}\n\n"
+            "🧵 **Режим гілок увімкнено!**\n\n"
+            "Тепер кожен проект буде мати свою окрему гілку в групі.\n"
+            "Це дозволяє краще організувати повідомлення та легше їх знаходити.\n\n"
+            "💡 **Переваги гілок:**\n"
+            "• Кожен проект в окремій гілці\n"
+            "• Зручна навігація\n"
+            "• Автоматичне створення гілок\n"
+            "• Теги в назві гілки",
+            reply_markup=get_forward_settings_keyboard(user_id)
         )
-        
-        if created_threads:
-            result_text += "**Створені гілки:**\n" + "\n".join(created_threads[:5])
-            if len(created_threads) > 5:
-                result_text += f"\n... та ще {len(created_threads) - 5}"
-        
-        if errors:
-            result_text += "\n\n**Помилки:**\n" + "\n".join(errors[:3])
-            
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="manage_threads")]]
+    else:
         await query.edit_message_text(
-            result_text,
-            reply_markup=InlineKeyboardMarkup(keyboard)
+            "❌ Спочатку увімкніть пересилання та встановіть канал.",
+            reply_markup=get_forward_settings_keyboard(user_id)
         )
-    elif callback_data == "cleanup_threads":
-        # Очистити неактивні thread'и
-        forward_status = project_manager.get_forward_status(user_id)
-        user_projects = project_manager.get_user_projects(user_id)
-        project_threads = forward_status.get('project_threads', {}).copy()
-        
-        # Визначаємо які thread'и треба залишити
-        active_project_ids = {str(p.get('id')) for p in user_projects}
-        threads_to_remove = []
-        
-        for project_id, thread_id in project_threads.items():
-            if project_id not in active_project_ids:
-                threads_to_remove.append(project_id)
-                project_manager.remove_project_thread(user_id, int(project_id))
-        
-        cleanup_text = (
-            f"🧹 **Очищення гілок завершено**\n\n"
-            f"📊 Всього було thread'ів: {len(project_threads)}\n"
-            f"🗑️ Видалено неактивних: {len(threads_to_remove)}\n"
-            f"✅ Залишилося активних: {len(project_threads) - len(threads_to_remove)}\n\n"
-            f"💡 Видалені thread'и належали проектам, які більше не існують."
+
+@callback_router.exact("disable_threads")
+async def _cb_disable_threads(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки disable_threads"""
+    # Вимкнути використання thread'ів (використовувати теги)
+    forward_status = project_manager.get_forward_status(user_id)
+    if forward_status['enabled']:
+        project_manager.data['settings']['forward_settings'][str(user_id)]['use_threads'] = False
+        project_manager.save_data()
+        await query.edit_message_text(
+            "🏷️ **Режим тегів увімкнено!**\n\n"
+            "Тепер всі повідомлення будуть відправлятися в основний канал з тегами проектів.\n"
+            "Кожне повідомлення буде містити тег проекту на початку.\n\n"
+            "💡 **Переваги тегів:**\n"
+            "• Всі повідомлення в одному каналі\n"
+            "• Легкий пошук за тегами\n"
+            "• Простий інтерфейс\n"
+            "• Сумісність зі старими каналами",
+            reply_markup=get_forward_settings_keyboard(user_id)
         )
-        
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="manage_threads")]]
+    else:
         await query.edit_message_text(
-            cleanup_text,
-            reply_markup=InlineKeyboardMarkup(keyboard)
+            "❌ Спочатку увімкніть пересилання та встановіть канал.",
+            reply_markup=get_forward_settings_keyboard(user_id)
         )
-    elif callback_data == "diagnostics":
-        diagnostics_text = (
-            "🔧 **Діагностика системи**\n\n"
-            "Оберіть тип перевірки:\n\n"
-            "🔍 **Перевірити бота** - статус бота та підключення\n"
-            "📺 **Тест каналів** - перевірка доступу до каналів\n"
-            "🔗 **Discord API** - тест підключення до Discord\n"
-            "📊 **Статистика** - детальна статистика системи\n"
-            "🔄 **Перезавантажити** - оновити дані"
+
+@callback_router.exact("test_threads")
+async def _cb_test_threads(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки test_threads"""
+    # Тестування thread'ів
+    forward_status = project_manager.get_forward_status(user_id)
+    if not forward_status['enabled']:
+        await query.edit_message_text(
+            "❌ Пересилання не налаштовано",
+            reply_markup=get_forward_settings_keyboard(user_id)
         )
+        return
+
+    user_projects = project_manager.get_user_projects(user_id)
+    if not user_projects:
         await query.edit_message_text(
-            diagnostics_text,
-            reply_markup=get_diagnostics_keyboard()
+            "❌ У вас немає проектів для тестування",
+            reply_markup=get_forward_settings_keyboard(user_id)
         )
-    elif callback_data == "check_bot_status":
+        return
+
+    forward_channel = forward_status['channel_id']
+    test_results = []
+
+    for project in user_projects[:3]:  # Тестуємо перші 3 проекти
+        project_id = project.get('id')
+        project_name = project.get('name', 'Test Project')
+        project_tag = project.get('tag', f"#test_{project_id}")
+
         try:
-            # Перевіряємо статус бота
-            bot_info = await context.bot.get_me()
-            bot_status = "✅ Активний"
-            
-            # Перевіряємо кількість авторизованих користувачів
-            auth_users = len(security_manager.authorized_users)
-            
-            # Перевіряємо Discord моніторинг
-            discord_status = "✅ Активний" if discord_monitor else "❌ Вимкнено"
-            
-            status_text = (
-                f"🔍 **Статус бота**\n\n"
-                f"🤖 Бот: {bot_status}\n"
-                f"📛 Ім'я: {bot_info.first_name}\n"
-                f"🆔 ID: {bot_info.id}\n"
-                f"👤 Username: @{bot_info.username}\n\n"
-                f"👥 Авторизованих користувачів: {auth_users}\n"
-                f"🔗 Discord моніторинг: {discord_status}\n"
-                f"📊 Проектів: {len(project_manager.get_user_projects(user_id))}\n"
-                f"🕒 Час: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            )
-            
-            await query.edit_message_text(
-                status_text,
-                reply_markup=get_diagnostics_keyboard()
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка перевірки бота**\n\n{str(e)}",
-                reply_markup=get_diagnostics_keyboard()
-            )
-    elif callback_data == "test_channels":
-        try:
-            forward_channel = project_manager.get_forward_channel(user_id)
-            
-            if forward_channel:
-                # Спробуємо відправити тестове повідомлення
-                test_message = (
+            # Спробуємо створити або знайти thread
+            thread_id = project_manager.get_project_thread(user_id, project_id)
+
+            if not thread_id:
+                thread_id = create_project_thread_sync(BOT_TOKEN, forward_channel, project_name, project_tag, str(user_id))
+
+                if thread_id:
+                    project_manager.set_project_thread(user_id, project_id, thread_id)
+
+            if thread_id:
+                # Відправляємо тестове повідомлення в thread
+                test_text = (
                     f"🧪 **Тестове повідомлення**\n\n"
-                    f"📺 Канал: {forward_channel}\n"
-                    f"👤 Від: {update.effective_user.first_name}\n"
-                    f"🕒 Час: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                    f"✅ Якщо ви бачите це повідомлення, канал працює!"
-                )
-                
-                await context.bot.send_message(
-                    chat_id=forward_channel,
-                    text=test_message,
+                    f"• Проект: {project_name}\n"
+                    f"• Тег: {project_tag}\n"
+                    f"• Thread ID: {thread_id}\n"
+                    f"• Час: {datetime.now().strftime('%H:%M:%S')}\n\n"
+                    f"✅ Якщо ви бачите це повідомлення, гілка працює правильно!"
                 )
-                
-                result_text = f"✅ **Тест каналу пройшов успішно!**\n\n📺 Канал: `{forward_channel}`\n📤 Тестове повідомлення відправлено"
+
+                success = send_message_to_thread_sync(BOT_TOKEN, forward_channel, thread_id, test_text, project_tag)
+
+                if success:
+                    test_results.append(f"✅ {project_name} (thread {thread_id})")
+                else:
+                    test_results.append(f"❌ {project_name} - помилка відправки")
             else:
-                result_text = "❌ **Канал не налаштовано**\n\nСпочатку встановіть канал для пересилання в налаштуваннях."
-            
-            await query.edit_message_text(
-                result_text,
-                reply_markup=get_diagnostics_keyboard()
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка тесту каналу**\n\n{str(e)}\n\n💡 Перевірте:\n• Чи додано бота в канал\n• Чи є у бота права адміністратора\n• Чи правильний ID каналу",
-                reply_markup=get_diagnostics_keyboard()
-            )
-    elif callback_data == "test_discord_api":
-        try:
-            if not DISCORD_AUTHORIZATION:
-                await query.edit_message_text(
-                    "❌ **Discord API не налаштовано**\n\nВстановіть AUTHORIZATION токен в .env файлі",
-                    reply_markup=get_diagnostics_keyboard()
-                )
-                return
-            
-            # Тестуємо Discord API
-            import aiohttp
-            headers = {
-                'Authorization': DISCORD_AUTHORIZATION,
-                'User-Agent': 'DiscordBot (https://github.com/discord/discord-api-docs, 1.0)'
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get('https://discord.com/api/v10/users/@me', headers=headers) as response:
-                    if response.status == 200:
-                        user_data = await response.json()
-                        result_text = (
-                            f"✅ **Discord API працює**\n\n"
-                            f"👤 Користувач: {user_data.get('username', 'Невідомо')}\n"
-                            f"🆔 ID: {user_data.get('id', 'Невідомо')}\n"
-                            f"📧 Email: {user_data.get('email', 'Приховано')}\n"
-                            f"🔐 Верифікований: {'✅' if user_data.get('verified', False) else '❌'}\n"
-                            f"📊 Статус: {response.status}"
-                        )
-                    else:
-                        result_text = f"❌ **Discord API помилка**\n\nСтатус: {response.status}\nВідповідь: {await response.text()}"
-            
-            await query.edit_message_text(
-                result_text,
-                reply_markup=get_diagnostics_keyboard()
-            )
+                test_results.append(f"❌ {project_name} - не вдалося створити thread")
+
         except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка Discord API**\n\n{str(e)}",
-                reply_markup=get_diagnostics_keyboard()
-            )
-    elif callback_data == "show_stats":
+            test_results.append(f"❌ {project_name} - помилка: {str(e)[:50]}")
+
+    result_text = (
+        f"🧪 **Результати тестування гілок**\n\n"
+        f"📊 Протестовано проектів: {len(test_results)}\n\n"
+        + "\n".join(test_results) +
+        f"\n\n💡 Перевірте канал {forward_channel} для тестових повідомлень."
+    )
+
+    await query.edit_message_text(
+        result_text,
+        reply_markup=get_forward_settings_keyboard(user_id)
+    )
+
+@callback_router.exact("manage_threads")
+async def _cb_manage_threads(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки manage_threads"""
+    # Управління thread'ами
+    forward_status = project_manager.get_forward_status(user_id)
+    user_projects = project_manager.get_user_projects(user_id)
+    project_threads = forward_status.get('project_threads', {})
+
+    threads_info = []
+    for project in user_projects:
+        project_id = str(project.get('id'))
+        project_name = project.get('name', 'Unknown')
+        project_tag = project.get('tag', f"#project_{project_id}")
+        thread_id = project_threads.get(project_id)
+
+        if thread_id:
+            threads_info.append(f"🧵 {project_name} ({project_tag}) - Thread {thread_id}")
+        else:
+            threads_info.append(f"❌ {project_name} ({project_tag}) - Немає thread'а")
+
+    if threads_info:
+        threads_text = "\n".join(threads_info[:10])  # Показуємо перші 10
+        if len(threads_info) > 10:
+            threads_text += f"\n... та ще {len(threads_info) - 10} проектів"
+    else:
+        threads_text = "❌ Немає активних гілок"
+
+    manage_text = (
+        f"🔧 **Управління гілками**\n\n"
+        f"📊 Всього проектів: {len(user_projects)}\n"
+        f"🧵 Активних гілок: {len(project_threads)}\n\n"
+        f"**Список гілок:**\n{threads_text}\n\n"
+        f"💡 Гілки створюються автоматично при появі нових повідомлень."
+    )
+
+    keyboard = [
+        [InlineKeyboardButton("🔄 Пересоздать все гілки", callback_data="recreate_all_threads")],
+        [InlineKeyboardButton("🧹 Очистити неактивні", callback_data="cleanup_threads")],
+        [InlineKeyboardButton("⬅️ Назад", callback_data="forward_settings")]
+    ]
+
+    await query.edit_message_text(
+        manage_text,
+        reply_markup=InlineKeyboardMarkup(keyboard)
+    )
+
+@callback_router.exact("recreate_all_threads")
+async def _cb_recreate_all_threads(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки recreate_all_threads"""
+    # Пересоздать все thread'и
+    forward_status = project_manager.get_forward_status(user_id)
+    if not forward_status['enabled']:
+        await query.edit_message_text(
+            "❌ Пересилання не налаштовано",
+            reply_markup=get_forward_settings_keyboard(user_id)
+        )
+        return
+
+    user_projects = project_manager.get_user_projects(user_id)
+    forward_channel = forward_status['channel_id']
+
+    # Очищаємо старі thread'и
+    project_manager.data['settings']['forward_settings'][str(user_id)]['project_threads'] = {}
+
+    created_threads = []
+    errors = []
+
+    for project in user_projects:
+        project_id = project.get('id')
+        project_name = project.get('name', 'Project')
+        project_tag = project.get('tag', f"#project_{project_id}")
+
         try:
-            stats = project_manager.get_statistics()
-            user_projects = project_manager.get_user_projects(user_id)
-            discord_projects = [p for p in user_projects if p['platform'] == 'discord']
-            forward_status = project_manager.get_forward_status(user_id)
-            
-            # Підраховуємо відстежені повідомлення
-            sent_messages = project_manager.data['settings'].get('sent_messages', {})
-            total_tracked = sum(
-                len(channel_messages) 
-                for user_messages in sent_messages.values() 
-                for channel_messages in user_messages.values()
-            )
-            
-            stats_text = (
-                f"📊 **Статистика системи**\n\n"
-                f"👥 Всього користувачів: {stats['total_users']}\n"
-                f"📋 Всього проектів: {stats['total_projects']}\n"
-                f"🔗 Discord проектів: {len(discord_projects)}\n"
-                f"🐦 Twitter проектів: {len([p for p in user_projects if p['platform'] == 'twitter'])}\n\n"
-                f"📢 **Пересилання:**\n"
-                f"🔄 Статус: {'✅ Увімкнено' if forward_status['enabled'] else '❌ Вимкнено'}\n"
-                f"📺 Канал: {forward_status['channel_id'] or 'Не встановлено'}\n\n"
-                f"💾 **Дані:**\n"
-                f"📁 Розмір файлу: {stats.get('data_size', 'Невідомо')}\n"
-                f"📨 Відстежених повідомлень: {total_tracked}\n"
-                f"🕒 Останнє оновлення: {stats.get('last_update', 'Невідомо')}"
-            )
-            
-            await query.edit_message_text(
-                stats_text,
-                reply_markup=get_diagnostics_keyboard()
-            )
+            thread_id = create_project_thread_sync(BOT_TOKEN, forward_channel, project_name, project_tag, str(user_id))
+
+            if thread_id:
+                project_manager.set_project_thread(user_id, project_id, thread_id)
+                created_threads.append(f"✅ {project_name} - Thread {thread_id}")
+            else:
+                errors.append(f"❌ {project_name} - не вдалося створити")
+
         except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка отримання статистики**\n\n{str(e)}",
-                reply_markup=get_diagnostics_keyboard()
+            errors.append(f"❌ {project_name} - помилка: {str(e)[:30]}")
+
+    result_text = (
+        f"🔄 **Результати пересоздання гілок**\n\n"
+        f"✅ Створено: {len(created_threads)}\n"
+        f"❌ Помилок: {len(errors)}\n\n"
+    )
+
+    if created_threads:
+        result_text += "**Створені гілки:**\n" + "\n".join(created_threads[:5])
+        if len(created_threads) > 5:
+            result_text += f"\n... та ще {len(created_threads) - 5}"
+
+    if errors:
+        result_text += "\n\n**Помилки:**\n" + "\n".join(errors[:3])
+
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="manage_threads")]]
+    await query.edit_message_text(
+        result_text,
+        reply_markup=InlineKeyboardMarkup(keyboard)
+    )
+
+@callback_router.exact("cleanup_threads")
+async def _cb_cleanup_threads(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки cleanup_threads"""
+    # Очистити неактивні thread'и
+    forward_status = project_manager.get_forward_status(user_id)
+    user_projects = project_manager.get_user_projects(user_id)
+    project_threads = forward_status.get('project_threads', {}).copy()
+
+    # Визначаємо які thread'и треба залишити
+    active_project_ids = {str(p.get('id')) for p in user_projects}
+    threads_to_remove = []
+
+    for project_id, thread_id in project_threads.items():
+        if project_id not in active_project_ids:
+            threads_to_remove.append(project_id)
+            project_manager.remove_project_thread(user_id, int(project_id))
+
+    cleanup_text = (
+        f"🧹 **Очищення гілок завершено**\n\n"
+        f"📊 Всього було thread'ів: {len(project_threads)}\n"
+        f"🗑️ Видалено неактивних: {len(threads_to_remove)}\n"
+        f"✅ Залишилося активних: {len(project_threads) - len(threads_to_remove)}\n\n"
+        f"💡 Видалені thread'и належали проектам, які більше не існують."
+    )
+
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="manage_threads")]]
+    await query.edit_message_text(
+        cleanup_text,
+        reply_markup=InlineKeyboardMarkup(keyboard)
+    )
+
+@callback_router.exact("diagnostics")
+async def _cb_diagnostics(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки diagnostics"""
+    diagnostics_text = (
+        "🔧 **Діагностика системи**\n\n"
+        "Оберіть тип перевірки:\n\n"
+        "🔍 **Перевірити бота** - статус бота та підключення\n"
+        "📺 **Тест каналів** - перевірка доступу до каналів\n"
+        "🔗 **Discord API** - тест підключення до Discord\n"
+        "📊 **Статистика** - детальна статистика системи\n"
+        "🔄 **Перезавантажити** - оновити дані"
+    )
+    await query.edit_message_text(
+        diagnostics_text,
+        reply_markup=get_diagnostics_keyboard()
+    )
+
+@callback_router.exact("check_bot_status")
+async def _cb_check_bot_status(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки check_bot_status"""
+    try:
+        # Перевіряємо статус бота
+        bot_info = await context.bot.get_me()
+        bot_status = "✅ Активний"
+
+        # Перевіряємо кількість авторизованих користувачів
+        auth_users = len(security_manager.authorized_users)
+
+        # Перевіряємо Discord моніторинг
+        discord_status = "✅ Активний" if discord_monitor else "❌ Вимкнено"
+
+        status_text = (
+            f"🔍 **Статус бота**\n\n"
+            f"🤖 Бот: {bot_status}\n"
+            f"📛 Ім'я: {bot_info.first_name}\n"
+            f"🆔 ID: {bot_info.id}\n"
+            f"👤 Username: @{bot_info.username}\n\n"
+            f"👥 Авторизованих користувачів: {auth_users}\n"
+            f"🔗 Discord моніторинг: {discord_status}\n"
+            f"📊 Проектів: {len(project_manager.get_user_projects(user_id))}\n"
+            f"🕒 Час: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        )
+
+        await query.edit_message_text(
+            status_text,
+            reply_markup=get_diagnostics_keyboard()
+        )
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка перевірки бота**\n\n{str(e)}",
+            reply_markup=get_diagnostics_keyboard()
+        )
+
+@callback_router.exact("test_channels")
+async def _cb_test_channels(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки test_channels"""
+    try:
+        forward_channel = project_manager.get_forward_channel(user_id)
+
+        if forward_channel:
+            # Спробуємо відправити тестове повідомлення
+            test_message = (
+                f"🧪 **Тестове повідомлення**\n\n"
+                f"📺 Канал: {forward_channel}\n"
+                f"👤 Від: {update.effective_user.first_name}\n"
+                f"🕒 Час: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                f"✅ Якщо ви бачите це повідомлення, канал працює!"
             )
-    elif callback_data == "reload_data":
-        try:
-            # Перезавантажуємо дані
-            project_manager.load_data()
-            # Проводимо синхронізацію моніторів
-            sync_monitors_with_projects()
-            
-            # Перезапускаємо Discord моніторинг
-            if discord_monitor:
-                discord_monitor.monitoring_channels.clear()
-                for user_id_str, projects in project_manager.data['projects'].items():
-                    for project in projects:
-                        if project['platform'] == 'discord':
-                            channel_id = project['link'].split('/')[-1]
-                            discord_monitor.add_channel(channel_id)
-            
-            await query.edit_message_text(
-                "🔄 **Дані перезавантажено**\n\n✅ Проекти оновлено\n✅ Discord канали оновлено\n✅ Налаштування оновлено",
-                reply_markup=get_diagnostics_keyboard()
+
+            await context.bot.send_message(
+                chat_id=forward_channel,
+                text=test_message,
             )
-        except Exception as e:
+
+            result_text = f"✅ **Тест каналу пройшов успішно!**\n\n📺 Канал: `{forward_channel}`\n📤 Тестове повідомлення відправлено"
+        else:
+            result_text = "❌ **Канал не налаштовано**\n\nСпочатку встановіть канал для пересилання в налаштуваннях."
+
+        await query.edit_message_text(
+            result_text,
+            reply_markup=get_diagnostics_keyboard()
+        )
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка тесту каналу**\n\n{str(e)}\n\n💡 Перевірте:\n• Чи додано бота в канал\n• Чи є у бота права адміністратора\n• Чи правильний ID каналу",
+            reply_markup=get_diagnostics_keyboard()
+        )
+
+@callback_router.exact("test_discord_api")
+async def _cb_test_discord_api(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки test_discord_api"""
+    try:
+        if not DISCORD_AUTHORIZATION:
             await query.edit_message_text(
-                f"❌ **Помилка перезавантаження**\n\n{str(e)}",
+                "❌ **Discord API не налаштовано**\n\nВстановіть AUTHORIZATION токен в .env файлі",
                 reply_markup=get_diagnostics_keyboard()
             )
-    # Видалення проектів з меню: Twitter
-    elif callback_data.startswith("delete_twitter_"):
-        project_id = int(callback_data.split('_')[-1])
-        project = project_manager.get_project_by_id(user_id, project_id)
-        if not project:
-            await query.edit_message_text("❌ Проект не знайдено.", reply_markup=get_twitter_projects_keyboard(user_id))
             return
-        removed_username: Optional[str] = extract_twitter_username(project.get('url', ''))
-        if project_manager.remove_project(user_id, project_id):
-            # Синхронізуємо монітори після видалення
-            sync_monitors_with_projects()
-            
-            # Зупиняємо моніторинг цього акаунта відразу
-            try:
-                if twitter_monitor and removed_username:
-                    twitter_monitor.remove_account(removed_username)
-            except Exception:
-                pass
-            if twitter_monitor_adapter and removed_username and removed_username in getattr(twitter_monitor_adapter, 'monitoring_accounts', set()):
-                twitter_monitor_adapter.monitoring_accounts.discard(removed_username)
-                if removed_username in twitter_monitor_adapter.seen_tweets:
-                    del twitter_monitor_adapter.seen_tweets[removed_username]
-            # Також приберемо із збережених Selenium акаунтів, якщо це був він
-            try:
-                if removed_username:
-                    project_manager.remove_selenium_account(removed_username)
-            except Exception:
-                pass
-            # Синхронізація після змін
-            sync_monitors_with_projects()
-            await query.edit_message_text(
-                f"✅ Twitter акаунт @{removed_username or 'Unknown'} видалено та зупинено моніторинг.",
-                reply_markup=get_twitter_projects_keyboard(user_id)
-            )
-        else:
+
+        # Тестуємо Discord API
+        headers = {
+            'Authorization': DISCORD_AUTHORIZATION,
+            'User-Agent': 'DiscordBot (https://github.com/discord/discord-api-docs, 1.0)'
+        }
+
+        session = http_client.async_session()
+        async with session.get('https://discord.com/api/v10/users/@me', headers=headers) as response:
+            if response.status == 200:
+                user_data = json_codec.loads(await response.read())
+                result_text = (
+                    f"✅ **Discord API працює**\n\n"
+                    f"👤 Користувач: {user_data.get('username', 'Невідомо')}\n"
+                    f"🆔 ID: {user_data.get('id', 'Невідомо')}\n"
+                    f"📧 Email: {user_data.get('email', 'Приховано')}\n"
+                    f"🔐 Верифікований: {'✅' if user_data.get('verified', False) else '❌'}\n"
+                    f"📊 Статус: {response.status}"
+                )
+            else:
+                result_text = f"❌ **Discord API помилка**\n\nСтатус: {response.status}\nВідповідь: {await response.text()}"
+
+        await query.edit_message_text(
+            result_text,
+            reply_markup=get_diagnostics_keyboard()
+        )
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка Discord API**\n\n{str(e)}",
+            reply_markup=get_diagnostics_keyboard()
+        )
+
+@callback_router.exact("show_stats")
+async def _cb_show_stats(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки show_stats"""
+    try:
+        stats = project_manager.get_statistics()
+        user_projects = project_manager.get_user_projects(user_id)
+        discord_projects = [p for p in user_projects if p['platform'] == 'discord']
+        forward_status = project_manager.get_forward_status(user_id)
+
+        # Підраховуємо відстежені повідомлення
+        sent_messages = project_manager.data['settings'].get('sent_messages', {})
+        total_tracked = sum(
+            len(channel_messages) 
+            for user_messages in sent_messages.values() 
+            for channel_messages in user_messages.values()
+        )
+
+        stats_text = (
+            f"📊 **Статистика системи**\n\n"
+            f"👥 Всього користувачів: {stats['total_users']}\n"
+            f"📋 Всього проектів: {stats['total_projects']}\n"
+            f"🔗 Discord проектів: {len(discord_projects)}\n"
+            f"🐦 Twitter проектів: {len([p for p in user_projects if p['platform'] == 'twitter'])}\n\n"
+            f"📢 **Пересилання:**\n"
+            f"🔄 Статус: {'✅ Увімкнено' if forward_status['enabled'] else '❌ Вимкнено'}\n"
+            f"📺 Канал: {forward_status['channel_id'] or 'Не встановлено'}\n\n"
+            f"💾 **Дані:**\n"
+            f"📁 Розмір файлу: {stats.get('data_size', 'Невідомо')}\n"
+            f"📨 Відстежених повідомлень: {total_tracked}\n"
+            f"🕒 Останнє оновлення: {stats.get('last_update', 'Невідомо')}"
+        )
+
+        await query.edit_message_text(
+            stats_text,
+            reply_markup=get_diagnostics_keyboard()
+        )
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка отримання статистики**\n\n{str(e)}",
+            reply_markup=get_diagnostics_keyboard()
+        )
+
+@callback_router.exact("reload_data")
+async def _cb_reload_data(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки reload_data"""
+    try:
+        # Перезавантажуємо дані
+        project_manager.load_data()
+        # Перезапускаємо Discord моніторинг
+        if discord_monitor:
+            discord_monitor.monitoring_channels.clear()
+            for user_id_str, projects in project_manager.data['projects'].items():
+                for project in projects:
+                    if project['platform'] == 'discord':
+                        channel_id = project['link'].split('/')[-1]
+                        discord_monitor.add_channel(channel_id)
+
+        await query.edit_message_text(
+            "🔄 **Дані перезавантажено**\n\n✅ Проекти оновлено\n✅ Discord канали оновлено\n✅ Налаштування оновлено",
+            reply_markup=get_diagnostics_keyboard()
+        )
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка перезавантаження**\n\n{str(e)}",
+            reply_markup=get_diagnostics_keyboard()
+        )
+
+# Видалення проектів з меню: Twitter
+@callback_router.prefix("delete_twitter_")
+async def _cb_delete_twitter(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок delete_twitter_..."""
+    project_id = int(callback_data.split('_')[-1])
+    project = project_manager.get_project_by_id(user_id, project_id)
+    if not project:
+        await query.edit_message_text("❌ Проект не знайдено.", reply_markup=get_twitter_projects_keyboard(user_id))
+        return
+    removed_username: Optional[str] = extract_twitter_username(project.get('url', ''))
+    if project_manager.remove_project(user_id, project_id):
+        # Зупиняємо моніторинг цього акаунта відразу
+        try:
+            if twitter_monitor and removed_username:
+                twitter_monitor.remove_account(removed_username)
+        except Exception:
+            pass
+        if twitter_monitor_adapter and removed_username and removed_username in getattr(twitter_monitor_adapter, 'monitoring_accounts', set()):
+            twitter_monitor_adapter.monitoring_accounts.discard(removed_username)
+            if removed_username in twitter_monitor_adapter.seen_tweets:
+                del twitter_monitor_adapter.seen_tweets[removed_username]
+        # Також приберемо із збережених Selenium акаунтів, якщо це був він
+        try:
+            if removed_username:
+                project_manager.remove_selenium_account(removed_username)
+        except Exception:
+            pass
+        # Монітори змінено напряму - перевіряємо узгодженість з індексом підписок
+        check_monitor_consistency()
+        await query.edit_message_text(
+            f"✅ Twitter акаунт @{removed_username or 'Unknown'} видалено та зупинено моніторинг.",
+            reply_markup=get_twitter_projects_keyboard(user_id)
+        )
+    else:
+        await query.edit_message_text(
+            "❌ Помилка видалення Twitter проекту.",
+            reply_markup=get_twitter_projects_keyboard(user_id)
+        )
+
+# Видалення проектів з меню: Discord
+@callback_router.prefix("delete_discord_")
+async def _cb_delete_discord(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок delete_discord_..."""
+    project_id = int(callback_data.split('_')[-1])
+    project = project_manager.get_project_by_id(user_id, project_id)
+    if not project:
+        await query.edit_message_text("❌ Проект не знайдено.", reply_markup=get_discord_projects_keyboard(user_id))
+        return
+    channel_id = extract_discord_channel_id(project.get('url', ''))
+    if project_manager.remove_project(user_id, project_id):
+        # Зупиняємо моніторинг цього каналу відразу
+        if discord_monitor and channel_id in getattr(discord_monitor, 'monitoring_channels', set()):
+            discord_monitor.monitoring_channels.discard(channel_id)
+            if channel_id in discord_monitor.last_message_ids:
+                del discord_monitor.last_message_ids[channel_id]
+        # Монітори змінено напряму - перевіряємо узгодженість з індексом підписок
+        check_monitor_consistency()
+        await query.edit_message_text(
+            f"✅ Discord канал {channel_id} видалено та зупинено моніторинг.",
+            reply_markup=get_discord_projects_keyboard(user_id)
+        )
+    else:
+        await query.edit_message_text(
+            "❌ Помилка видалення Discord проекту.",
+            reply_markup=get_discord_projects_keyboard(user_id)
+        )
+
+# Обробники адміністративної панелі
+@callback_router.exact("admin_panel")
+async def _cb_admin_panel(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_panel"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ **Доступ заборонено!**\n\nТільки адміністратор має доступ до цієї панелі.",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    await query.edit_message_text(
+        "👑 **Адміністративна панель**\n\n"
+        "🎯 **Добро пожаловать в центр управления!**\n\n"
+        "📊 **Доступные разделы:**\n"
+        "• 👥 Управление пользователями\n"
+        "• 📊 Статистика и аналитика\n"
+        "• 🔧 Системное управление\n"
+        "• 📋 Просмотр всех проектов\n"
+        "• 🔍 Поиск и фильтры\n"
+        "• 📈 Мониторинг системы\n"
+        "• ⚙️ Настройки\n\n"
+        "Выберите нужный раздел для работы:",
+        reply_markup=get_admin_panel_keyboard(),
+    )
+
+@callback_router.exact("admin_users")
+async def _cb_admin_users(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_users"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    await query.edit_message_text(
+        "👥 **Управління користувачами**\n\n"
+        "🎯 **Центр управления пользователями**\n\n"
+        "📋 **Доступные действия:**\n"
+        "• 👥 Просмотр списка пользователей\n"
+        "• 📊 Статистика пользователей\n"
+        "• ➕ Добавление новых пользователей\n"
+        "• 👑 Создание администраторов\n"
+        "• 🔍 Поиск пользователей\n"
+        "• 🔄 Изменение ролей\n"
+        "• 🔐 Сброс паролей\n"
+        "• 🔁 Настройка пересылки\n"
+        "• 🗑️ Удаление пользователей\n"
+        "• 📈 Активность пользователей\n\n"
+        "Выберите нужное действие:",
+        reply_markup=get_admin_users_keyboard(),
+    )
+
+@callback_router.exact("admin_create_for_user")
+async def _cb_admin_create_for_user(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_create_for_user"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text("❌ Доступ заборонено!", reply_markup=get_main_menu_keyboard(user_id))
+        return
+    # Перший крок: ввести Telegram ID цільового користувача
+    user_states[user_id] = {
+        'state': 'admin_creating_project_for_user',
+        'data': {'step': 'telegram_id'}
+    }
+    await query.edit_message_text(
+        "➕ **Створення проекту для користувача**\n\nВведіть Telegram ID користувача:",
+        reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("❌ Скасувати", callback_data="admin_panel")]])
+    )
+
+@callback_router.exact("admin_forward")
+async def _cb_admin_forward(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_forward"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+    # Запитуємо target user id
+    user_states[user_id] = {
+        'state': 'admin_forward_select_user',
+        'data': {}
+    }
+    await query.edit_message_text(
+        "🔁 **Керування пересиланням (користувач)**\n\nВведіть Telegram ID користувача:",
+        reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")]])
+    )
+
+@callback_router.exact("admin_stats")
+async def _cb_admin_stats(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_stats"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    try:
+        stats = project_manager.get_project_statistics(user_id)
+        users_list = project_manager.get_all_users_with_projects(user_id)
+
+        stats_text = (
+            f"📊 **Статистика системи**\n\n"
+            f"👥 Всього користувачів: {stats['total_users']}\n"
+            f"✅ Активних користувачів: {stats['active_users']}\n"
+            f"📋 Всього проектів: {stats['total_projects']}\n"
+            f"🐦 Twitter проектів: {stats['twitter_projects']}\n"
+            f"💬 Discord проектів: {stats['discord_projects']}\n"
+            f"🚀 Twitter Monitor Adapter акаунтів: {stats['selenium_accounts']}\n\n"
+            f"👑 **Адміністраторів:** {len(access_manager.get_all_admins())}\n"
+            f"👤 **Звичайних користувачів:** {len(access_manager.get_all_users_by_role('user'))}"
+        )
+
+        await query.edit_message_text(
+            stats_text,
+            reply_markup=get_admin_panel_keyboard()
+        )
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка отримання статистики**\n\n{str(e)}",
+            reply_markup=get_admin_panel_keyboard()
+        )
+
+@callback_router.exact("admin_list_users")
+async def _cb_admin_list_users(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_list_users"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    try:
+        all_users = access_manager.get_all_users()
+
+        if not all_users:
             await query.edit_message_text(
-                "❌ Помилка видалення Twitter проекту.",
-                reply_markup=get_twitter_projects_keyboard(user_id)
+                "👥 **Список користувачів**\n\n"
+                "Користувачів не знайдено.",
+                reply_markup=get_admin_users_keyboard()
             )
-    # Видалення проектів з меню: Discord
-    elif callback_data.startswith("delete_discord_"):
-        project_id = int(callback_data.split('_')[-1])
-        project = project_manager.get_project_by_id(user_id, project_id)
-        if not project:
-            await query.edit_message_text("❌ Проект не знайдено.", reply_markup=get_discord_projects_keyboard(user_id))
             return
-        channel_id = extract_discord_channel_id(project.get('url', ''))
-        if project_manager.remove_project(user_id, project_id):
-            # Синхронізуємо монітори після видалення
-            sync_monitors_with_projects()
-            
-            # Зупиняємо моніторинг цього каналу відразу
-            if discord_monitor and channel_id in getattr(discord_monitor, 'monitoring_channels', set()):
-                discord_monitor.monitoring_channels.discard(channel_id)
-                if channel_id in discord_monitor.last_message_ids:
-                    del discord_monitor.last_message_ids[channel_id]
-            # Синхронізація після змін
-            sync_monitors_with_projects()
-            await query.edit_message_text(
-                f"✅ Discord канал {channel_id} видалено та зупинено моніторинг.",
-                reply_markup=get_discord_projects_keyboard(user_id)
-            )
-        else:
-            await query.edit_message_text(
-                "❌ Помилка видалення Discord проекту.",
-                reply_markup=get_discord_projects_keyboard(user_id)
-            )
-    
-    # Обробники адміністративної панелі
-    elif callback_data == "admin_panel":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ **Доступ заборонено!**\n\nТільки адміністратор має доступ до цієї панелі.",
-                reply_markup=get_main_menu_keyboard(user_id)
+
+        users_text = "👥 **Список користувачів**\n\n"
+
+        for i, user in enumerate(all_users[:10], 1):  # Показуємо перших 10
+            role_emoji = "👑" if user.get('role', 'user') == 'admin' else "👤"
+            status_emoji = "✅" if user.get('is_active', True) else "❌"
+
+            users_text += (
+                f"{i}. {role_emoji} {user.get('username', 'Без імені')}\n"
+                f"   ID: {user.get('telegram_id')}\n"
+                f"   Статус: {status_emoji}\n"
+                f"   Створено: {user.get('created_at', '')[:10]}\n\n"
             )
-            return
-        
+
+        if len(all_users) > 10:
+            users_text += f"... та ще {len(all_users) - 10} користувачів"
+
         await query.edit_message_text(
-            "👑 **Адміністративна панель**\n\n"
-            "🎯 **Добро пожаловать в центр управления!**\n\n"
-            "📊 **Доступные разделы:**\n"
-            "• 👥 Управление пользователями\n"
-            "• 📊 Статистика и аналитика\n"
-            "• 🔧 Системное управление\n"
-            "• 📋 Просмотр всех проектов\n"
-            "• 🔍 Поиск и фильтры\n"
-            "• 📈 Мониторинг системы\n"
-            "• ⚙️ Настройки\n\n"
-            "Выберите нужный раздел для работы:",
-            reply_markup=get_admin_panel_keyboard(),
-        )
-    elif callback_data == "admin_users":
-        if not access_manager.is_admin(user_id):
+            users_text,
+            reply_markup=get_admin_users_keyboard()
+        )
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка отримання списку користувачів**\n\n{str(e)}",
+            reply_markup=get_admin_users_keyboard()
+        )
+
+@callback_router.exact("admin_all_projects")
+async def _cb_admin_all_projects(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_all_projects"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    try:
+        all_projects = project_manager.get_all_projects(user_id)
+        total_projects = sum(len(projects) for projects in all_projects.values())
+
+        if total_projects == 0:
             await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
+                "📋 **Всі проекти**\n\n"
+                "Проектів не знайдено.",
+                reply_markup=get_admin_panel_keyboard()
             )
             return
-            
+
+        projects_text = f"📋 **Всі проекти** (Всього: {total_projects})\n\n"
+
+        shown_projects = 0
+        for user_id_str, projects in all_projects.items():
+            if shown_projects >= 5:  # Показуємо тільки перші 5 користувачів
+                break
+
+            user_data = access_manager.get_user_by_telegram_id(int(user_id_str))
+            username = user_data.get('username', 'Без імені') if user_data else 'Невідомий'
+
+            projects_text += f"👤 **{username}** ({len(projects)} проектів):\n"
+
+            for project in projects[:3]:  # По 3 проекти на користувача
+                platform_emoji = "🐦" if project.get('platform') == 'twitter' else "💬"
+                projects_text += f"   {platform_emoji} {project.get('name', 'Без назви')}\n"
+
+            if len(projects) > 3:
+                projects_text += f"   ... та ще {len(projects) - 3} проектів\n"
+
+            projects_text += "\n"
+            shown_projects += 1
+
+        if len(all_projects) > 5:
+            projects_text += f"... та ще {len(all_projects) - 5} користувачів з проектами"
+
         await query.edit_message_text(
-            "👥 **Управління користувачами**\n\n"
-            "🎯 **Центр управления пользователями**\n\n"
-            "📋 **Доступные действия:**\n"
-            "• 👥 Просмотр списка пользователей\n"
-            "• 📊 Статистика пользователей\n"
-            "• ➕ Добавление новых пользователей\n"
-            "• 👑 Создание администраторов\n"
-            "• 🔍 Поиск пользователей\n"
-            "• 🔄 Изменение ролей\n"
-            "• 🔐 Сброс паролей\n"
-            "• 🔁 Настройка пересылки\n"
-            "• 🗑️ Удаление пользователей\n"
-            "• 📈 Активность пользователей\n\n"
-            "Выберите нужное действие:",
-            reply_markup=get_admin_users_keyboard(),
+            projects_text,
+            reply_markup=get_admin_panel_keyboard()
+        )
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка отримання проектів**\n\n{str(e)}",
+            reply_markup=get_admin_panel_keyboard()
+        )
+
+@callback_router.exact("admin_add_user")
+async def _cb_admin_add_user(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_add_user"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    # Встановлюємо стан для створення користувача
+    user_states[user_id] = {
+        'state': 'admin_creating_user',
+        'data': {'step': 'telegram_id'}
+    }
+
+    await query.edit_message_text(
+        "👤 **Створення нового користувача**\n\n"
+        "Введіть Telegram ID користувача:\n\n"
+        "💡 **Приклад:** 123456789",
+        reply_markup=InlineKeyboardMarkup([[
+            InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")
+        ]])
+    )
+
+@callback_router.exact("admin_add_admin")
+async def _cb_admin_add_admin(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_add_admin"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    # Встановлюємо стан для створення адміністратора
+    user_states[user_id] = {
+        'state': 'admin_creating_admin',
+        'data': {'step': 'telegram_id'}
+    }
+
+    await query.edit_message_text(
+        "👑 **Створення нового адміністратора**\n\n"
+        "Введіть Telegram ID адміністратора:\n\n"
+        "💡 **Приклад:** 123456789",
+        reply_markup=InlineKeyboardMarkup([[
+            InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")
+        ]])
+    )
+
+@callback_router.exact("admin_search_user")
+async def _cb_admin_search_user(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_search_user"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    # Встановлюємо стан для пошуку
+    user_states[user_id] = {
+        'state': 'admin_searching_user',
+        'data': {}
+    }
+
+    await query.edit_message_text(
+        "🔍 **Пошук користувача**\n\n"
+        "Введіть username або Telegram ID для пошуку:\n\n"
+        "💡 **Приклади:**\n"
+        "• JohnDoe (пошук за username)\n"
+        "• 123456789 (пошук за Telegram ID)",
+        reply_markup=InlineKeyboardMarkup([[
+            InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")
+        ]])
+    )
+
+@callback_router.exact("admin_delete_user")
+async def _cb_admin_delete_user(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_delete_user"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    # Встановлюємо стан для видалення
+    user_states[user_id] = {
+        'state': 'admin_deleting_user',
+        'data': {}
+    }
+
+    await query.edit_message_text(
+        "🗑️ **Видалення користувача**\n\n"
+        "⚠️ **УВАГА!** Ця дія видалить користувача повністю!\n\n"
+        "Введіть Telegram ID користувача для видалення:\n\n"
+        "💡 **Приклад:** 123456789",
+        reply_markup=InlineKeyboardMarkup([[
+            InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")
+        ]])
+    )
+
+@callback_router.exact("admin_change_role")
+async def _cb_admin_change_role(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_change_role"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    # Встановлюємо стан для зміни ролі
+    user_states[user_id] = {
+        'state': 'admin_changing_role',
+        'data': {'step': 'telegram_id'}
+    }
+
+    await query.edit_message_text(
+        "🔄 **Зміна ролі користувача**\n\n"
+        "Введіть Telegram ID користувача:\n\n"
+        "💡 **Приклад:** 123456789",
+        reply_markup=InlineKeyboardMarkup([[
+            InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")
+        ]])
+    )
+
+@callback_router.exact("admin_reset_password")
+async def _cb_admin_reset_password(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_reset_password"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    # Встановлюємо стан для скидання паролю
+    user_states[user_id] = {
+        'state': 'admin_resetting_password',
+        'data': {'step': 'telegram_id'}
+    }
+
+    await query.edit_message_text(
+        "🔐 **Скидання паролю користувача**\n\n"
+        "Введіть Telegram ID користувача:\n\n"
+        "💡 **Приклад:** 123456789",
+        reply_markup=InlineKeyboardMarkup([[
+            InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")
+        ]])
+    )
+
+@callback_router.exact("admin_user_stats")
+async def _cb_admin_user_stats(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_user_stats"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    try:
+        stats = access_manager.get_user_statistics()
+
+        stats_text = (
+            f"📊 **Статистика користувачів**\n\n"
+            f"👥 **Загальна статистика:**\n"
+            f"• Всього користувачів: {stats['total_users']}\n"
+            f"• Активних: {stats['active_users']}\n"
+            f"• Неактивних: {stats['inactive_users']}\n\n"
+            f"👑 **За ролями:**\n"
+            f"• Адміністраторів: {stats['admin_users']}\n"
+            f"• Звичайних користувачів: {stats['regular_users']}\n\n"
+            f"🟢 **Активність:**\n"
+            f"• Онлайн зараз: {stats['online_users']}\n"
+            f"• Входили за останні 24 год: {stats['recent_logins']}"
+        )
+
+        await query.edit_message_text(
+            stats_text,
+            reply_markup=get_admin_users_keyboard()
+        )
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка отримання статистики**\n\n{str(e)}",
+            reply_markup=get_admin_users_keyboard()
+        )
+
+# Нові обробники для статистики
+@callback_router.exact("admin_general_stats")
+async def _cb_admin_general_stats(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_general_stats"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    try:
+        user_stats = access_manager.get_user_statistics()
+        system_stats = access_manager.get_system_statistics()
+
+        stats_text = (
+            f"📊 **Загальна статистика системи**\n\n"
+            f"👥 **Користувачі:**\n"
+            f"• Всього користувачів: {user_stats['total_users']}\n"
+            f"• Активних: {user_stats['active_users']}\n"
+            f"• Адміністраторів: {user_stats['admin_users']}\n"
+            f"• Звичайних: {user_stats['regular_users']}\n\n"
+            f"📋 **Проекти:**\n"
+            f"• Всього проектів: {system_stats.get('total_projects', 0)}\n"
+            f"• Активних: {system_stats.get('active_projects', 0)}\n\n"
+            f"🟢 **Активність:**\n"
+            f"• Онлайн зараз: {user_stats['online_users']}\n"
+            f"• Входили за 24 год: {user_stats['recent_logins']}\n"
+            f"• Активних сесій: {system_stats.get('active_sessions', 0)}\n\n"
+            f"💾 **Система:**\n"
+            f"• Время работы: {system_stats.get('uptime', 'N/A')}\n"
+            f"• Версия: 2.0 Enhanced"
+        )
+
+        await query.edit_message_text(
+            stats_text,
+            reply_markup=get_admin_stats_keyboard(),
+        )
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка отримання статистики**\n\n{str(e)}",
+            reply_markup=get_admin_stats_keyboard()
+        )
+
+@callback_router.exact("admin_freshness_stats")
+async def _cb_admin_freshness_stats(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_freshness_stats"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    try:
+        report = freshness_tracker.format_report() or "Поки що немає доставлених подій"
+        await query.edit_message_text(
+            next(split_telegram_text(f"⏱️ Швидкість доставки (від публікації до Telegram)\n\n{report}")),
+            reply_markup=get_admin_stats_keyboard(),
+        )
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка отримання статистики**\n\n{str(e)}",
+            reply_markup=get_admin_stats_keyboard()
+        )
+
+@callback_router.exact("admin_project_stats")
+async def _cb_admin_project_stats(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_project_stats"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    try:
+        all_projects = project_manager.get_all_projects(user_id)
+        twitter_projects = [p for projects in all_projects.values() for p in projects if p.get('platform') == 'twitter']
+        discord_projects = [p for projects in all_projects.values() for p in projects if p.get('platform') == 'discord']
+
+        stats_text = (
+            f"📋 **Статистика проектів**\n\n"
+            f"📊 **Загальна статистика:**\n"
+            f"• Всього проектів: {sum(len(projects) for projects in all_projects.values())}\n"
+            f"• Twitter проектів: {len(twitter_projects)}\n"
+            f"• Discord проектів: {len(discord_projects)}\n\n"
+            f"🐦 **Twitter проекти:**\n"
+            f"• Активних: {len([p for p in twitter_projects if p.get('active', False)])}\n"
+            f"• Неактивних: {len([p for p in twitter_projects if not p.get('active', False)])}\n\n"
+            f"💬 **Discord проекти:**\n"
+            f"• Активних: {len([p for p in discord_projects if p.get('active', False)])}\n"
+            f"• Неактивних: {len([p for p in discord_projects if not p.get('active', False)])}\n\n"
+            f"📈 **Популярні платформи:**\n"
+            f"• Twitter: {len(twitter_projects)} проектів\n"
+            f"• Discord: {len(discord_projects)} проектів"
+        )
+
+        await query.edit_message_text(
+            stats_text,
+            reply_markup=get_admin_stats_keyboard(),
+        )
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка отримання статистики проектів**\n\n{str(e)}",
+            reply_markup=get_admin_stats_keyboard()
         )
-    elif callback_data == "admin_create_for_user":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text("❌ Доступ заборонено!", reply_markup=get_main_menu_keyboard(user_id))
-            return
-        # Перший крок: ввести Telegram ID цільового користувача
-        user_states[user_id] = {
-            'state': 'admin_creating_project_for_user',
-            'data': {'step': 'telegram_id'}
-        }
+
+@callback_router.exact("admin_charts")
+async def _cb_admin_charts(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_charts"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            "➕ **Створення проекту для користувача**\n\nВведіть Telegram ID користувача:",
-            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("❌ Скасувати", callback_data="admin_panel")]])
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    elif callback_data == "admin_forward":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        # Запитуємо target user id
-        user_states[user_id] = {
-            'state': 'admin_forward_select_user',
-            'data': {}
-        }
+        return
+
+    await query.edit_message_text(
+        "📈 **Графіки та діаграми**\n\n"
+        "🎯 **Візуальна аналітика**\n\n"
+        "📊 **Доступні графіки:**\n"
+        "• 📈 Графік активності користувачів\n"
+        "• 📊 Діаграма розподілу проектів\n"
+        "• 📅 Графік створення проектів\n"
+        "• 🔄 Графік активності моніторингу\n"
+        "• 📱 Статистика платформ\n\n"
+        "⚠️ **Примітка:** Графіки будуть додані в наступних версіях\n"
+        "Поки що доступна текстова статистика.",
+        reply_markup=get_admin_stats_keyboard(),
+    )
+
+@callback_router.exact("admin_export_data")
+async def _cb_admin_export_data(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_export_data"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            "🔁 **Керування пересиланням (користувач)**\n\nВведіть Telegram ID користувача:",
-            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")]])
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    elif callback_data == "admin_stats":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-            
-        try:
-            stats = project_manager.get_project_statistics(user_id)
-            users_list = project_manager.get_all_users_with_projects(user_id)
-            
-            stats_text = (
-                f"📊 **Статистика системи**\n\n"
-                f"👥 Всього користувачів: {stats['total_users']}\n"
-                f"✅ Активних користувачів: {stats['active_users']}\n"
-                f"📋 Всього проектів: {stats['total_projects']}\n"
-                f"🐦 Twitter проектів: {stats['twitter_projects']}\n"
-                f"💬 Discord проектів: {stats['discord_projects']}\n"
-                f"🚀 Twitter Monitor Adapter акаунтів: {stats['selenium_accounts']}\n\n"
-                f"👑 **Адміністраторів:** {len(access_manager.get_all_admins())}\n"
-                f"👤 **Звичайних користувачів:** {len(access_manager.get_all_users_by_role('user'))}"
-            )
-            
-            await query.edit_message_text(
-                stats_text,
-                reply_markup=get_admin_panel_keyboard()
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка отримання статистики**\n\n{str(e)}",
-                reply_markup=get_admin_panel_keyboard()
-            )
-    elif callback_data == "admin_list_users":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-            
-        try:
-            all_users = access_manager.get_all_users()
-            
-            if not all_users:
-                await query.edit_message_text(
-                    "👥 **Список користувачів**\n\n"
-                    "Користувачів не знайдено.",
-                    reply_markup=get_admin_users_keyboard()
-                )
-                return
-            
-            users_text = "👥 **Список користувачів**\n\n"
-            
-            for i, user in enumerate(all_users[:10], 1):  # Показуємо перших 10
-                role_emoji = "👑" if user.get('role', 'user') == 'admin' else "👤"
-                status_emoji = "✅" if user.get('is_active', True) else "❌"
-                
-                users_text += (
-                    f"{i}. {role_emoji} {user.get('username', 'Без імені')}\n"
-                    f"   ID: {user.get('telegram_id')}\n"
-                    f"   Статус: {status_emoji}\n"
-                    f"   Створено: {user.get('created_at', '')[:10]}\n\n"
-                )
-            
-            if len(all_users) > 10:
-                users_text += f"... та ще {len(all_users) - 10} користувачів"
-            
-            await query.edit_message_text(
-                users_text,
-                reply_markup=get_admin_users_keyboard()
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка отримання списку користувачів**\n\n{str(e)}",
-                reply_markup=get_admin_users_keyboard()
-            )
-    elif callback_data == "admin_all_projects":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-            
-        try:
-            all_projects = project_manager.get_all_projects(user_id)
-            total_projects = sum(len(projects) for projects in all_projects.values())
-            
-            if total_projects == 0:
-                await query.edit_message_text(
-                    "📋 **Всі проекти**\n\n"
-                    "Проектів не знайдено.",
-                    reply_markup=get_admin_panel_keyboard()
-                )
-                return
-            
-            projects_text = f"📋 **Всі проекти** (Всього: {total_projects})\n\n"
-            
-            shown_projects = 0
-            for user_id_str, projects in all_projects.items():
-                if shown_projects >= 5:  # Показуємо тільки перші 5 користувачів
-                    break
-                    
-                user_data = access_manager.get_user_by_telegram_id(int(user_id_str))
-                username = user_data.get('username', 'Без імені') if user_data else 'Невідомий'
-                
-                projects_text += f"👤 **{username}** ({len(projects)} проектів):\n"
-                
-                for project in projects[:3]:  # По 3 проекти на користувача
-                    platform_emoji = "🐦" if project.get('platform') == 'twitter' else "💬"
-                    projects_text += f"   {platform_emoji} {project.get('name', 'Без назви')}\n"
-                
-                if len(projects) > 3:
-                    projects_text += f"   ... та ще {len(projects) - 3} проектів\n"
-                
-                projects_text += "\n"
-                shown_projects += 1
-            
-            if len(all_projects) > 5:
-                projects_text += f"... та ще {len(all_projects) - 5} користувачів з проектами"
-            
-            await query.edit_message_text(
-                projects_text,
-                reply_markup=get_admin_panel_keyboard()
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка отримання проектів**\n\n{str(e)}",
-                reply_markup=get_admin_panel_keyboard()
-            )
-    elif callback_data == "admin_add_user":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        # Встановлюємо стан для створення користувача
-        user_states[user_id] = {
-            'state': 'admin_creating_user',
-            'data': {'step': 'telegram_id'}
-        }
-        
+        return
+
+    await query.edit_message_text(
+        "📤 **Експорт даних**\n\n"
+        "🎯 **Експорт системних даних**\n\n"
+        "📋 **Доступні формати:**\n"
+        "• 📊 Excel файл (.xlsx)\n"
+        "• 📄 CSV файл (.csv)\n"
+        "• 📋 JSON файл (.json)\n"
+        "• 📝 Текстовий файл (.txt)\n\n"
+        "⚠️ **Примітка:** Функція експорту буде додана в наступних версіях\n"
+        "Поки що дані доступні через адмін панель.",
+        reply_markup=get_admin_stats_keyboard(),
+    )
+
+@callback_router.exact("admin_system_stats")
+async def _cb_admin_system_stats(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_system_stats"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            "👤 **Створення нового користувача**\n\n"
-            "Введіть Telegram ID користувача:\n\n"
-            "💡 **Приклад:** 123456789",
-            reply_markup=InlineKeyboardMarkup([[
-                InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")
-            ]])
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    elif callback_data == "admin_add_admin":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        # Встановлюємо стан для створення адміністратора
-        user_states[user_id] = {
-            'state': 'admin_creating_admin',
-            'data': {'step': 'telegram_id'}
-        }
-        
+        return
+
+    try:
+        stats = access_manager.get_system_statistics()
+
+        stats_text = (
+            f"📊 **Системна статистика**\n\n"
+            f"👥 **Користувачі:**\n"
+            f"• Всього користувачів: {stats['total_users']}\n"
+            f"• Активних сесій: {stats['active_sessions']}\n\n"
+            f"📋 **Проекти:**\n"
+            f"• Всього проектів: {stats['total_projects']}\n"
+            f"• Активних моніторів: {stats['active_monitors']}\n\n"
+            f"⚙️ **Система:**\n"
+            f"• Статус: {stats['system_uptime']}\n"
+            f"• Останній бекап: {stats['last_backup']}\n"
+            f"• Використання сховища: {stats['storage_usage']} символів"
+        )
+
         await query.edit_message_text(
-            "👑 **Створення нового адміністратора**\n\n"
-            "Введіть Telegram ID адміністратора:\n\n"
-            "💡 **Приклад:** 123456789",
-            reply_markup=InlineKeyboardMarkup([[
-                InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")
-            ]])
+            stats_text,
+            reply_markup=get_admin_system_keyboard()
         )
-    elif callback_data == "admin_search_user":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        # Встановлюємо стан для пошуку
-        user_states[user_id] = {
-            'state': 'admin_searching_user',
-            'data': {}
-        }
-        
+    except Exception as e:
         await query.edit_message_text(
-            "🔍 **Пошук користувача**\n\n"
-            "Введіть username або Telegram ID для пошуку:\n\n"
-            "💡 **Приклади:**\n"
-            "• JohnDoe (пошук за username)\n"
-            "• 123456789 (пошук за Telegram ID)",
-            reply_markup=InlineKeyboardMarkup([[
-                InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")
-            ]])
+            f"❌ **Помилка отримання статистики**\n\n{str(e)}",
+            reply_markup=get_admin_system_keyboard()
         )
-    elif callback_data == "admin_delete_user":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        # Встановлюємо стан для видалення
-        user_states[user_id] = {
-            'state': 'admin_deleting_user',
-            'data': {}
-        }
-        
+
+@callback_router.exact("admin_metrics")
+async def _cb_admin_metrics(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_metrics"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            "🗑️ **Видалення користувача**\n\n"
-            "⚠️ **УВАГА!** Ця дія видалить користувача повністю!\n\n"
-            "Введіть Telegram ID користувача для видалення:\n\n"
-            "💡 **Приклад:** 123456789",
-            reply_markup=InlineKeyboardMarkup([[
-                InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")
-            ]])
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    elif callback_data == "admin_change_role":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        # Встановлюємо стан для зміни ролі
-        user_states[user_id] = {
-            'state': 'admin_changing_role',
-            'data': {'step': 'telegram_id'}
-        }
-        
+        return
+
+    try:
+        summary = metrics_registry.format_summary() or "Поки що немає даних"
+        routes = callback_router.get_stats(top=5)
+        routes_text = "\n".join(
+            f"• {route['route']}: {route['calls']} викл., avg {route['avg_ms']:.0f}ms, max {route['max_ms']:.0f}ms"
+            for route in routes
+        ) or "Поки що немає даних"
+
+        metrics_text = (
+            f"📈 Метрики\n\n"
+            f"{summary}\n\n"
+            f"🔘 Найважчі callback маршрути:\n"
+            f"{routes_text}"
+        )
+        if METRICS_PORT:
+            metrics_text += f"\n\n🌐 Prometheus: http://127.0.0.1:{METRICS_PORT}/metrics"
+
         await query.edit_message_text(
-            "🔄 **Зміна ролі користувача**\n\n"
-            "Введіть Telegram ID користувача:\n\n"
-            "💡 **Приклад:** 123456789",
-            reply_markup=InlineKeyboardMarkup([[
-                InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")
-            ]])
+            next(split_telegram_text(metrics_text)),
+            reply_markup=get_admin_system_keyboard()
         )
-    elif callback_data == "admin_reset_password":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        # Встановлюємо стан для скидання паролю
-        user_states[user_id] = {
-            'state': 'admin_resetting_password',
-            'data': {'step': 'telegram_id'}
-        }
-        
+    except Exception as e:
         await query.edit_message_text(
-            "🔐 **Скидання паролю користувача**\n\n"
-            "Введіть Telegram ID користувача:\n\n"
-            "💡 **Приклад:** 123456789",
-            reply_markup=InlineKeyboardMarkup([[
-                InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")
-            ]])
+            f"❌ **Помилка отримання метрик**\n\n{str(e)}",
+            reply_markup=get_admin_system_keyboard()
         )
-    elif callback_data == "admin_user_stats":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        try:
-            stats = access_manager.get_user_statistics()
-            
-            stats_text = (
-                f"📊 **Статистика користувачів**\n\n"
-                f"👥 **Загальна статистика:**\n"
-                f"• Всього користувачів: {stats['total_users']}\n"
-                f"• Активних: {stats['active_users']}\n"
-                f"• Неактивних: {stats['inactive_users']}\n\n"
-                f"👑 **За ролями:**\n"
-                f"• Адміністраторів: {stats['admin_users']}\n"
-                f"• Звичайних користувачів: {stats['regular_users']}\n\n"
-                f"🟢 **Активність:**\n"
-                f"• Онлайн зараз: {stats['online_users']}\n"
-                f"• Входили за останні 24 год: {stats['recent_logins']}"
-            )
-            
-            await query.edit_message_text(
-                stats_text,
-                reply_markup=get_admin_users_keyboard()
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка отримання статистики**\n\n{str(e)}",
-                reply_markup=get_admin_users_keyboard()
-            )
-    
-    # Нові обробники для статистики
-    elif callback_data == "admin_general_stats":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        try:
-            user_stats = access_manager.get_user_statistics()
-            system_stats = access_manager.get_system_statistics()
-            
-            stats_text = (
-                f"📊 **Загальна статистика системи**\n\n"
-                f"👥 **Користувачі:**\n"
-                f"• Всього користувачів: {user_stats['total_users']}\n"
-                f"• Активних: {user_stats['active_users']}\n"
-                f"• Адміністраторів: {user_stats['admin_users']}\n"
-                f"• Звичайних: {user_stats['regular_users']}\n\n"
-                f"📋 **Проекти:**\n"
-                f"• Всього проектів: {system_stats.get('total_projects', 0)}\n"
-                f"• Активних: {system_stats.get('active_projects', 0)}\n\n"
-                f"🟢 **Активність:**\n"
-                f"• Онлайн зараз: {user_stats['online_users']}\n"
-                f"• Входили за 24 год: {user_stats['recent_logins']}\n"
-                f"• Активних сесій: {system_stats.get('active_sessions', 0)}\n\n"
-                f"💾 **Система:**\n"
-                f"• Время работы: {system_stats.get('uptime', 'N/A')}\n"
-                f"• Версия: 2.0 Enhanced"
-            )
-            
-            await query.edit_message_text(
-                stats_text,
-                reply_markup=get_admin_stats_keyboard(),
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка отримання статистики**\n\n{str(e)}",
-                reply_markup=get_admin_stats_keyboard()
-            )
-    
-    elif callback_data == "admin_project_stats":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        try:
-            all_projects = project_manager.get_all_projects(user_id)
-            twitter_projects = [p for projects in all_projects.values() for p in projects if p.get('platform') == 'twitter']
-            discord_projects = [p for projects in all_projects.values() for p in projects if p.get('platform') == 'discord']
-            
-            stats_text = (
-                f"📋 **Статистика проектів**\n\n"
-                f"📊 **Загальна статистика:**\n"
-                f"• Всього проектів: {sum(len(projects) for projects in all_projects.values())}\n"
-                f"• Twitter проектів: {len(twitter_projects)}\n"
-                f"• Discord проектів: {len(discord_projects)}\n\n"
-                f"🐦 **Twitter проекти:**\n"
-                f"• Активних: {len([p for p in twitter_projects if p.get('active', False)])}\n"
-                f"• Неактивних: {len([p for p in twitter_projects if not p.get('active', False)])}\n\n"
-                f"💬 **Discord проекти:**\n"
-                f"• Активних: {len([p for p in discord_projects if p.get('active', False)])}\n"
-                f"• Неактивних: {len([p for p in discord_projects if not p.get('active', False)])}\n\n"
-                f"📈 **Популярні платформи:**\n"
-                f"• Twitter: {len(twitter_projects)} проектів\n"
-                f"• Discord: {len(discord_projects)} проектів"
-            )
-            
-            await query.edit_message_text(
-                stats_text,
-                reply_markup=get_admin_stats_keyboard(),
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка отримання статистики проектів**\n\n{str(e)}",
-                reply_markup=get_admin_stats_keyboard()
-            )
-    
-    elif callback_data == "admin_charts":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+
+@callback_router.exact("admin_profile")
+async def _cb_admin_profile(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_profile: семплювання стеків усіх потоків"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            "📈 **Графіки та діаграми**\n\n"
-            "🎯 **Візуальна аналітика**\n\n"
-            "📊 **Доступні графіки:**\n"
-            "• 📈 Графік активності користувачів\n"
-            "• 📊 Діаграма розподілу проектів\n"
-            "• 📅 Графік створення проектів\n"
-            "• 🔄 Графік активності моніторингу\n"
-            "• 📱 Статистика платформ\n\n"
-            "⚠️ **Примітка:** Графіки будуть додані в наступних версіях\n"
-            "Поки що доступна текстова статистика.",
-            reply_markup=get_admin_stats_keyboard(),
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    
-    elif callback_data == "admin_export_data":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+        return
+
+    if sampling_profiler.running:
         await query.edit_message_text(
-            "📤 **Експорт даних**\n\n"
-            "🎯 **Експорт системних даних**\n\n"
-            "📋 **Доступні формати:**\n"
-            "• 📊 Excel файл (.xlsx)\n"
-            "• 📄 CSV файл (.csv)\n"
-            "• 📋 JSON файл (.json)\n"
-            "• 📝 Текстовий файл (.txt)\n\n"
-            "⚠️ **Примітка:** Функція експорту буде додана в наступних версіях\n"
-            "Поки що дані доступні через адмін панель.",
-            reply_markup=get_admin_stats_keyboard(),
+            "⏳ Профілювання вже виконується, зачекайте на результат",
+            reply_markup=get_admin_system_keyboard()
         )
-    
-    elif callback_data == "admin_system_stats":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        try:
-            stats = access_manager.get_system_statistics()
-            
-            stats_text = (
-                f"📊 **Системна статистика**\n\n"
-                f"👥 **Користувачі:**\n"
-                f"• Всього користувачів: {stats['total_users']}\n"
-                f"• Активних сесій: {stats['active_sessions']}\n\n"
-                f"📋 **Проекти:**\n"
-                f"• Всього проектів: {stats['total_projects']}\n"
-                f"• Активних моніторів: {stats['active_monitors']}\n\n"
-                f"⚙️ **Система:**\n"
-                f"• Статус: {stats['system_uptime']}\n"
-                f"• Останній бекап: {stats['last_backup']}\n"
-                f"• Використання сховища: {stats['storage_usage']} символів"
-            )
-            
-            await query.edit_message_text(
-                stats_text,
-                reply_markup=get_admin_system_keyboard()
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка отримання статистики**\n\n{str(e)}",
-                reply_markup=get_admin_system_keyboard()
-            )
-    elif callback_data == "admin_system_logs":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        try:
-            logs = access_manager.get_logs(20)  # Останні 20 записів
-            
-            if not logs:
-                logs_text = "📋 **Логи системи**\n\n❌ Логи відсутні"
-            else:
-                logs_text = "📋 **Логи системи** (останні 20 записів)\n\n"
-                for log in logs:
-                    logs_text += f"• {log}\n"
-            
-            await query.edit_message_text(
-                logs_text,
-                reply_markup=get_admin_system_keyboard()
-            )
-        except Exception as e:
+        return
+
+    await query.edit_message_text(f"🔬 Профілювання всіх потоків {PROFILE_SECONDS}с...")
+    # Окрема задача: обробник повертається одразу, і бот обробляє інші оновлення, поки йде замір
+    context.application.create_task(_run_admin_profile(context, query))
+
+async def _run_admin_profile(context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery) -> None:
+    """Зняти профіль і надіслати звіт адміну, що його запросив"""
+    try:
+        # Семплювання блокує потік, тому виконується поза event loop
+        result = await asyncio.to_thread(sampling_profiler.run, PROFILE_SECONDS)
+        if result is None:
             await query.edit_message_text(
-                f"❌ **Помилка отримання логів**\n\n{str(e)}",
+                "⏳ Профілювання вже виконується, зачекайте на результат",
                 reply_markup=get_admin_system_keyboard()
             )
-    elif callback_data == "admin_cleanup_sessions":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
             return
-        
-        try:
-            cleaned_count = access_manager.cleanup_inactive_sessions()
-            
-            if cleaned_count > 0:
-                await query.edit_message_text(
-                    f"🔄 **Очищення сесій завершено!**\n\n"
-                    f"✅ Очищено {cleaned_count} неактивних сесій\n\n"
-                    f"Неактивні користувачі були розлогінені.",
-                    reply_markup=get_admin_system_keyboard()
-                )
-            else:
-                await query.edit_message_text(
-                    f"🔄 **Очищення сесій завершено!**\n\n"
-                    f"ℹ️ Неактивних сесій не знайдено\n\n"
-                    f"Всі сесії активні.",
-                    reply_markup=get_admin_system_keyboard()
-                )
-        except Exception as e:
+
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        summary = result.summary(top=15)
+        await context.bot.send_document(
+            chat_id=query.message.chat_id,
+            document=result.collapsed().encode('utf-8'),
+            filename=f"profile_{stamp}.collapsed.txt",
+            caption="🔬 Collapsed stacks (flamegraph.pl / speedscope)"
+        )
+        await context.bot.send_document(
+            chat_id=query.message.chat_id,
+            document=summary.encode('utf-8'),
+            filename=f"profile_{stamp}_top.txt"
+        )
+        await query.edit_message_text(
+            next(split_telegram_text(f"🔬 Профіль готовий\n\n{summary}")),
+            reply_markup=get_admin_system_keyboard()
+        )
+    except Exception as e:
+        logger.error(f"Помилка профілювання: {e}")
+        await query.edit_message_text(
+            f"❌ Помилка профілювання\n\n{str(e)}",
+            reply_markup=get_admin_system_keyboard()
+        )
+
+@callback_router.exact("admin_system_logs")
+async def _cb_admin_system_logs(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_system_logs"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    try:
+        logs = access_manager.get_logs(20)  # Останні 20 записів
+
+        if not logs:
+            logs_text = "📋 **Логи системи**\n\n❌ Логи відсутні"
+        else:
+            logs_text = "📋 **Логи системи** (останні 20 записів)\n\n"
+            for log in logs:
+                logs_text += f"• {log}\n"
+
+        await query.edit_message_text(
+            logs_text,
+            reply_markup=get_admin_system_keyboard()
+        )
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка отримання логів**\n\n{str(e)}",
+            reply_markup=get_admin_system_keyboard()
+        )
+
+@callback_router.exact("admin_cleanup_sessions")
+async def _cb_admin_cleanup_sessions(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_cleanup_sessions"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    try:
+        cleaned_count = access_manager.cleanup_inactive_sessions()
+
+        if cleaned_count > 0:
             await query.edit_message_text(
-                f"❌ **Помилка очищення сесій**\n\n{str(e)}",
+                f"🔄 **Очищення сесій завершено!**\n\n"
+                f"✅ Очищено {cleaned_count} неактивних сесій\n\n"
+                f"Неактивні користувачі були розлогінені.",
                 reply_markup=get_admin_system_keyboard()
             )
-    elif callback_data == "admin_create_backup":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        try:
-            if access_manager.backup_data():
-                await query.edit_message_text(
-                    f"💾 **Резервна копія створена!**\n\n"
-                    f"✅ Дані успішно збережено\n\n"
-                    f"Резервна копія збережена в папці 'backups'.",
-                    reply_markup=get_admin_system_keyboard()
-                )
-            else:
-                await query.edit_message_text(
-                    f"❌ **Помилка створення резервної копії!**\n\n"
-                    f"Спробуйте ще раз.",
-                    reply_markup=get_admin_system_keyboard()
-                )
-        except Exception as e:
+        else:
             await query.edit_message_text(
-                f"❌ **Помилка створення резервної копії**\n\n{str(e)}",
+                f"🔄 **Очищення сесій завершено!**\n\n"
+                f"ℹ️ Неактивних сесій не знайдено\n\n"
+                f"Всі сесії активні.",
                 reply_markup=get_admin_system_keyboard()
             )
-    elif callback_data == "admin_reset_system":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        # Встановлюємо стан для підтвердження скидання
-        user_states[user_id] = {
-            'state': 'admin_resetting_system',
-            'data': {}
-        }
-        
+    except Exception as e:
         await query.edit_message_text(
-            "⚠️ **СКИДАННЯ СИСТЕМИ**\n\n"
-            "🚨 **УВАГА!** Ця дія видалить ВСІХ користувачів крім адміністраторів!\n\n"
-            "📋 **Що буде видалено:**\n"
-            "• Всіх звичайних користувачів\n"
-            "• Всі їхні проекти\n"
-            "• Всі активні сесії\n\n"
-            "✅ **Що буде збережено:**\n"
-            "• Всіх адміністраторів\n"
-            "• Резервна копія буде створена автоматично\n\n"
-            "🔐 **Для підтвердження введіть:** CONFIRM_RESET",
-            reply_markup=InlineKeyboardMarkup([[
-                InlineKeyboardButton("❌ Скасувати", callback_data="admin_system")
-            ]])
-        )
-    
-    # Обробники для моніторингу
-    elif callback_data == "admin_monitoring_status":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        try:
-            # Отримуємо статус моніторингу
-            discord_status = "🟢 Активний" if discord_monitor else "🔴 Неактивний"
-            twitter_status = "🟢 Активний" if twitter_monitor else "🔴 Неактивний"
-            twitter_adapter_status = "🟢 Активний" if twitter_monitor_adapter else "🔴 Неактивний"
-            
-            status_text = (
-                f"📈 **Статус моніторингу**\n\n"
-                f"🎯 **Поточний стан системи:**\n\n"
-                f"💬 **Discord моніторинг:**\n"
-                f"• Статус: {discord_status}\n"
-                f"• Авторизація: {'✅ Налаштована' if DISCORD_AUTHORIZATION else '❌ Не налаштована'}\n\n"
-                f"🐦 **Twitter моніторинг:**\n"
-                f"• Статус: {twitter_status}\n"
-                f"• Авторизація: {'✅ Налаштована' if TWITTER_AUTH_TOKEN else '❌ Не налаштована'}\n\n"
-                f"🔧 **Twitter Monitor Adapter:**\n"
-                f"• Статус: {twitter_adapter_status}\n"
-                f"• База даних: {'✅ Налаштована' if os.path.exists('./twitter_monitor/accounts.db') else '❌ Не налаштована'}\n\n"
-                f"⏰ **Остання перевірка:** {datetime.now().strftime('%H:%M:%S')}\n"
-                f"🔄 **Інтервал перевірки:** {MONITORING_INTERVAL} секунд"
-            )
-            
-            await query.edit_message_text(
-                status_text,
-                reply_markup=get_admin_monitoring_keyboard(),
-            )
-        except Exception as e:
+            f"❌ **Помилка очищення сесій**\n\n{str(e)}",
+            reply_markup=get_admin_system_keyboard()
+        )
+
+@callback_router.exact("admin_create_backup")
+async def _cb_admin_create_backup(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_create_backup"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    try:
+        if access_manager.backup_data():
             await query.edit_message_text(
-                f"❌ **Помилка отримання статусу**\n\n{str(e)}",
-                reply_markup=get_admin_monitoring_keyboard()
+                f"💾 **Резервна копія створена!**\n\n"
+                f"✅ Дані успішно збережено\n\n"
+                f"Резервна копія збережена в папці 'backups'.",
+                reply_markup=get_admin_system_keyboard()
             )
-    
-    elif callback_data == "admin_notifications":
-        if not access_manager.is_admin(user_id):
+        else:
             await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
+                f"❌ **Помилка створення резервної копії!**\n\n"
+                f"Спробуйте ще раз.",
+                reply_markup=get_admin_system_keyboard()
             )
-            return
-        
+    except Exception as e:
         await query.edit_message_text(
-            "🔔 **Налаштування сповіщень**\n\n"
-            "🎯 **Центр уведомлений**\n\n"
-            "📋 **Доступні налаштування:**\n"
-            "• 📧 Email сповіщення\n"
-            "• 📱 Telegram сповіщення\n"
-            "• 🔔 Discord сповіщення\n"
-            "• ⚠️ Сповіщення про помилки\n"
-            "• 📊 Звіти про активність\n"
-            "• 🚨 Критичні сповіщення\n\n"
-            "⚠️ **Примітка:** Налаштування сповіщень будуть додані в наступних версіях",
-            reply_markup=get_admin_monitoring_keyboard(),
+            f"❌ **Помилка створення резервної копії**\n\n{str(e)}",
+            reply_markup=get_admin_system_keyboard()
         )
-    
-    elif callback_data == "admin_restart_monitoring":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+
+@callback_router.exact("admin_reset_system")
+async def _cb_admin_reset_system(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_reset_system"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    # Встановлюємо стан для підтвердження скидання
+    user_states[user_id] = {
+        'state': 'admin_resetting_system',
+        'data': {}
+    }
+
+    await query.edit_message_text(
+        "⚠️ **СКИДАННЯ СИСТЕМИ**\n\n"
+        "🚨 **УВАГА!** Ця дія видалить ВСІХ користувачів крім адміністраторів!\n\n"
+        "📋 **Що буде видалено:**\n"
+        "• Всіх звичайних користувачів\n"
+        "• Всі їхні проекти\n"
+        "• Всі активні сесії\n\n"
+        "✅ **Що буде збережено:**\n"
+        "• Всіх адміністраторів\n"
+        "• Резервна копія буде створена автоматично\n\n"
+        "🔐 **Для підтвердження введіть:** CONFIRM_RESET",
+        reply_markup=InlineKeyboardMarkup([[
+            InlineKeyboardButton("❌ Скасувати", callback_data="admin_system")
+        ]])
+    )
+
+# Обробники для моніторингу
+@callback_router.exact("admin_monitoring_status")
+async def _cb_admin_monitoring_status(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_monitoring_status"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    try:
+        # Отримуємо статус моніторингу
+        discord_status = "🟢 Активний" if discord_monitor else "🔴 Неактивний"
+        twitter_status = "🟢 Активний" if twitter_monitor else "🔴 Неактивний"
+        twitter_adapter_status = "🟢 Активний" if twitter_monitor_adapter else "🔴 Неактивний"
+
+        status_text = (
+            f"📈 **Статус моніторингу**\n\n"
+            f"🎯 **Поточний стан системи:**\n\n"
+            f"💬 **Discord моніторинг:**\n"
+            f"• Статус: {discord_status}\n"
+            f"• Авторизація: {'✅ Налаштована' if DISCORD_AUTHORIZATION else '❌ Не налаштована'}\n\n"
+            f"🐦 **Twitter моніторинг:**\n"
+            f"• Статус: {twitter_status}\n"
+            f"• Авторизація: {'✅ Налаштована' if TWITTER_AUTH_TOKEN else '❌ Не налаштована'}\n\n"
+            f"🔧 **Twitter Monitor Adapter:**\n"
+            f"• Статус: {twitter_adapter_status}\n"
+            f"• База даних: {'✅ Налаштована' if os.path.exists('./twitter_monitor/accounts.db') else '❌ Не налаштована'}\n\n"
+            f"⏰ **Остання перевірка:** {datetime.now().strftime('%H:%M:%S')}\n"
+            f"🔄 **Інтервал перевірки:** {MONITORING_INTERVAL} секунд"
+        )
+
         await query.edit_message_text(
-            "🔄 **Перезапуск моніторингу**\n\n"
-            "🎯 **Перезапуск системи моніторингу**\n\n"
-            "📋 **Що буде перезапущено:**\n"
-            "• Discord моніторинг\n"
-            "• Twitter моніторинг\n"
-            "• Twitter Monitor Adapter\n"
-            "• Всі активні сесії\n\n"
-            "⚠️ **Примітка:** Функція перезапуску буде додана в наступних версіях\n"
-            "Поки що перезапустіть бот вручну.",
+            status_text,
             reply_markup=get_admin_monitoring_keyboard(),
         )
-    
-    # Додаткові адміністративні обробники
-    elif callback_data == "admin_backup_restore":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+    except Exception as e:
+        await query.edit_message_text(
+            f"❌ **Помилка отримання статусу**\n\n{str(e)}",
+            reply_markup=get_admin_monitoring_keyboard()
+        )
+
+@callback_router.exact("admin_notifications")
+async def _cb_admin_notifications(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_notifications"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    await query.edit_message_text(
+        "🔔 **Налаштування сповіщень**\n\n"
+        "🎯 **Центр уведомлений**\n\n"
+        "📋 **Доступні налаштування:**\n"
+        "• 📧 Email сповіщення\n"
+        "• 📱 Telegram сповіщення\n"
+        "• 🔔 Discord сповіщення\n"
+        "• ⚠️ Сповіщення про помилки\n"
+        "• 📊 Звіти про активність\n"
+        "• 🚨 Критичні сповіщення\n\n"
+        "⚠️ **Примітка:** Налаштування сповіщень будуть додані в наступних версіях",
+        reply_markup=get_admin_monitoring_keyboard(),
+    )
+
+@callback_router.exact("admin_restart_monitoring")
+async def _cb_admin_restart_monitoring(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_restart_monitoring"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    await query.edit_message_text(
+        "🔄 **Перезапуск моніторингу**\n\n"
+        "🎯 **Перезапуск системи моніторингу**\n\n"
+        "📋 **Що буде перезапущено:**\n"
+        "• Discord моніторинг\n"
+        "• Twitter моніторинг\n"
+        "• Twitter Monitor Adapter\n"
+        "• Всі активні сесії\n\n"
+        "⚠️ **Примітка:** Функція перезапуску буде додана в наступних версіях\n"
+        "Поки що перезапустіть бот вручну.",
+        reply_markup=get_admin_monitoring_keyboard(),
+    )
+
+# Додаткові адміністративні обробники
+@callback_router.exact("admin_backup_restore")
+async def _cb_admin_backup_restore(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_backup_restore"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    await query.edit_message_text(
+        format_info_message(
+            "Бекап та відновлення",
+            "Управління резервними копіями системи",
+            "⚠️ Функція бекапу буде додана в наступних версіях.\n"
+            "Поки що дані зберігаються в файлах data.json та projects.json"
+        ),
+        reply_markup=get_admin_system_keyboard()
+    )
+
+@callback_router.exact("admin_clear_cache")
+async def _cb_admin_clear_cache(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_clear_cache"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    try:
+        # Очищуємо кеш (глобальні змінні)
+        global global_sent_tweets
+        global_sent_tweets.clear()
+
         await query.edit_message_text(
-            format_info_message(
-                "Бекап та відновлення",
-                "Управління резервними копіями системи",
-                "⚠️ Функція бекапу буде додана в наступних версіях.\n"
-                "Поки що дані зберігаються в файлах data.json та projects.json"
+            format_success_message(
+                "Кеш очищено",
+                "Всі тимчасові дані успішно видалено",
+                "Кеш відправлених твітів очищено. Система працюватиме швидше."
             ),
             reply_markup=get_admin_system_keyboard()
         )
-    
-    elif callback_data == "admin_clear_cache":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        try:
-            # Очищуємо кеш (глобальні змінні)
-            global global_sent_tweets
-            global_sent_tweets.clear()
-            
+    except Exception as e:
+        await query.edit_message_text(
+            format_error_message("Помилка очищення кешу", str(e)),
+            reply_markup=get_admin_system_keyboard()
+        )
+
+@callback_router.exact("admin_clear_seen_tweets")
+async def _cb_admin_clear_seen_tweets(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_clear_seen_tweets"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    try:
+        # Викликаємо функцію очищення seen_tweets
+        success = reset_seen_tweets()
+
+        if success:
             await query.edit_message_text(
                 format_success_message(
-                    "Кеш очищено",
-                    "Всі тимчасові дані успішно видалено",
-                    "Кеш відправлених твітів очищено. Система працюватиме швидше."
+                    "Seen_tweets очищено",
+                    "Всі файли з відправленими твітами успішно видалено",
+                    "⚠️ УВАГА: Бот може повторно відправити старі твіти! Використовуйте обережно."
                 ),
                 reply_markup=get_admin_system_keyboard()
             )
-        except Exception as e:
-            await query.edit_message_text(
-                format_error_message("Помилка очищення кешу", str(e)),
-                reply_markup=get_admin_system_keyboard()
-            )
-    
-    elif callback_data == "admin_clear_seen_tweets":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        try:
-            # Викликаємо функцію очищення seen_tweets
-            success = reset_seen_tweets()
-            
-            if success:
-                await query.edit_message_text(
-                    format_success_message(
-                        "Seen_tweets очищено",
-                        "Всі файли з відправленими твітами успішно видалено",
-                        "⚠️ УВАГА: Бот може повторно відправити старі твіти! Використовуйте обережно."
-                    ),
-                    reply_markup=get_admin_system_keyboard()
-                )
-            else:
-                await query.edit_message_text(
-                    format_error_message(
-                        "Помилка очищення", 
-                        "Не всі файли вдалося очистити",
-                        "Перевірте логи для деталей"
-                    ),
-                    reply_markup=get_admin_system_keyboard()
-                )
-        except Exception as e:
+        else:
             await query.edit_message_text(
-                format_error_message("Помилка очищення", str(e)),
+                format_error_message(
+                    "Помилка очищення", 
+                    "Не всі файли вдалося очистити",
+                    "Перевірте логи для деталей"
+                ),
                 reply_markup=get_admin_system_keyboard()
             )
-    
-    elif callback_data == "admin_system_config":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        config_text = format_info_message(
-            "Налаштування системи",
-            "Поточні налаштування бота",
-            f"🔧 Конфігурація:\n"
-            f"• Тайм-аут сесії: {SECURITY_TIMEOUT} секунд\n"
-            f"• Інтервал Discord: {MONITORING_INTERVAL} секунд\n"
-            f"• Інтервал Twitter: {TWITTER_MONITORING_INTERVAL} секунд\n"
-            f"• Активних сесій: {len(access_manager.user_sessions)}\n\n"
-            f"⚠️ Зміна налаштувань буде додана в наступних версіях"
+    except Exception as e:
+        await query.edit_message_text(
+            format_error_message("Помилка очищення", str(e)),
+            reply_markup=get_admin_system_keyboard()
         )
-        
+
+@callback_router.exact("admin_system_config")
+async def _cb_admin_system_config(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_system_config"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    config_text = format_info_message(
+        "Налаштування системи",
+        "Поточні налаштування бота",
+        f"🔧 Конфігурація:\n"
+        f"• Тайм-аут сесії: {SECURITY_TIMEOUT} секунд\n"
+        f"• Інтервал Discord: {MONITORING_INTERVAL} секунд\n"
+        f"• Інтервал Twitter: {TWITTER_MONITORING_INTERVAL} секунд\n"
+        f"• Активних сесій: {len(access_manager.user_sessions)}\n\n"
+        f"⚠️ Зміна налаштувань буде додана в наступних версіях"
+    )
+
+    await query.edit_message_text(
+        config_text,
+        reply_markup=get_admin_system_keyboard()
+    )
+
+# Обробники пошуку
+@callback_router.exact("admin_search_users")
+async def _cb_admin_search_users(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_search_users"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    await query.edit_message_text(
+        format_info_message(
+            "Пошук користувачів",
+            "Функція пошуку користувачів",
+            "⚠️ Детальний пошук буде додано в наступних версіях.\n"
+            "Поки що використовуйте 'Список користувачів' для перегляду всіх користувачів."
+        ),
+        reply_markup=get_admin_search_keyboard()
+    )
+
+@callback_router.exact("admin_search_projects")
+async def _cb_admin_search_projects(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_search_projects"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            config_text,
-            reply_markup=get_admin_system_keyboard()
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    
-    # Обробники пошуку
-    elif callback_data == "admin_search_users":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+        return
+
+    await query.edit_message_text(
+        format_info_message(
+            "Пошук проектів",
+            "Функція пошуку проектів",
+            "⚠️ Детальний пошук буде додано в наступних версіях.\n"
+            "Поки що використовуйте 'Всі проекти' для перегляду всіх проектів."
+        ),
+        reply_markup=get_admin_search_keyboard()
+    )
+
+# Обробники для налаштувань
+@callback_router.exact("admin_security_settings")
+async def _cb_admin_security_settings(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_security_settings"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            format_info_message(
-                "Пошук користувачів",
-                "Функція пошуку користувачів",
-                "⚠️ Детальний пошук буде додано в наступних версіях.\n"
-                "Поки що використовуйте 'Список користувачів' для перегляду всіх користувачів."
-            ),
-            reply_markup=get_admin_search_keyboard()
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    
-    elif callback_data == "admin_search_projects":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+        return
+
+    await query.edit_message_text(
+        "🔐 **Налаштування безпеки**\n\n"
+        "🎯 **Центр безпеки**\n\n"
+        "📋 **Доступні налаштування:**\n"
+        "• 🔑 Налаштування паролів\n"
+        "• ⏰ Таймаути сесій\n"
+        "• 🚫 Блокування користувачів\n"
+        "• 📝 Логи безпеки\n"
+        "• 🔒 Шифрування даних\n"
+        "• 🛡️ Захист від атак\n\n"
+        "⚠️ **Примітка:** Розширені налаштування безпеки будуть додані в наступних версіях",
+        reply_markup=get_admin_settings_keyboard(),
+    )
+
+@callback_router.exact("admin_ui_settings")
+async def _cb_admin_ui_settings(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_ui_settings"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            format_info_message(
-                "Пошук проектів",
-                "Функція пошуку проектів",
-                "⚠️ Детальний пошук буде додано в наступних версіях.\n"
-                "Поки що використовуйте 'Всі проекти' для перегляду всіх проектів."
-            ),
-            reply_markup=get_admin_search_keyboard()
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    
-    # Обробники для налаштувань
-    elif callback_data == "admin_security_settings":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+        return
+
+    await query.edit_message_text(
+        "🎨 **Налаштування інтерфейсу**\n\n"
+        "🎯 **Центр налаштувань UI**\n\n"
+        "📋 **Доступні налаштування:**\n"
+        "• 🎨 Теми інтерфейсу\n"
+        "• 📱 Розмір кнопок\n"
+        "• 🌍 Мова інтерфейсу\n"
+        "• 📊 Стиль статистики\n"
+        "• 🔔 Стиль сповіщень\n"
+        "• 📋 Макет меню\n\n"
+        "⚠️ **Примітка:** Налаштування інтерфейсу будуть додані в наступних версіях",
+        reply_markup=get_admin_settings_keyboard(),
+    )
+
+# Обробники нових меню
+@callback_router.exact("quick_actions")
+async def _cb_quick_actions(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки quick_actions"""
+    await query.edit_message_text(
+        "⚡ **Швидкі дії**\n\n"
+        "Оберіть дію для швидкого виконання:",
+        reply_markup=get_quick_actions_keyboard(user_id)
+    )
+
+@callback_router.exact("about")
+async def _cb_about(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки about"""
+    about_text = (
+        "ℹ️ **Про бота**\n\n"
+        "🤖 **Telegram Monitor Bot**\n"
+        "Версія: 2.0\n\n"
+        "📋 **Функції:**\n"
+        "• Моніторинг Twitter/X акаунтів\n"
+        "• Моніторинг Discord каналів\n"
+        "• Автоматичне пересилання повідомлень\n"
+        "• Система безпеки з авторизацією\n"
+        "• Адміністративна панель\n"
+        "• Twitter Monitor Adapter для обходу обмежень\n\n"
+        "👨‍💻 **Розробник:** megymin\n"
+        "📅 **Останнє оновлення:** 2025"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="main_menu")]]
+    await query.edit_message_text(
+        about_text,
+        reply_markup=InlineKeyboardMarkup(keyboard)
+    )
+
+# Обробники швидких дій
+@callback_router.exact("start_all_monitors")
+async def _cb_start_all_monitors(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки start_all_monitors"""
+    try:
+        # Запускаємо всі монітори через автоматичну функцію
+        auto_start_monitoring()
+
         await query.edit_message_text(
-            "🔐 **Налаштування безпеки**\n\n"
-            "🎯 **Центр безпеки**\n\n"
-            "📋 **Доступні налаштування:**\n"
-            "• 🔑 Налаштування паролів\n"
-            "• ⏰ Таймаути сесій\n"
-            "• 🚫 Блокування користувачів\n"
-            "• 📝 Логи безпеки\n"
-            "• 🔒 Шифрування даних\n"
-            "• 🛡️ Захист від атак\n\n"
-            "⚠️ **Примітка:** Розширені налаштування безпеки будуть додані в наступних версіях",
-            reply_markup=get_admin_settings_keyboard(),
+            "🚀 **Всі монітори запущено!**\n\n"
+            "✅ Twitter API моніторинг активний\n"
+            "✅ Twitter Monitor Adapter моніторинг активний\n"
+            "✅ Discord моніторинг активний\n"
+            "✅ Автоматичні сповіщення увімкнено",
+            reply_markup=get_quick_actions_keyboard(user_id)
         )
-    
-    elif callback_data == "admin_ui_settings":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+    except Exception as e:
         await query.edit_message_text(
-            "🎨 **Налаштування інтерфейсу**\n\n"
-            "🎯 **Центр налаштувань UI**\n\n"
-            "📋 **Доступні налаштування:**\n"
-            "• 🎨 Теми інтерфейсу\n"
-            "• 📱 Розмір кнопок\n"
-            "• 🌍 Мова інтерфейсу\n"
-            "• 📊 Стиль статистики\n"
-            "• 🔔 Стиль сповіщень\n"
-            "• 📋 Макет меню\n\n"
-            "⚠️ **Примітка:** Налаштування інтерфейсу будуть додані в наступних версіях",
-            reply_markup=get_admin_settings_keyboard(),
+            f"❌ **Помилка запуску моніторів**\n\n{str(e)}",
+            reply_markup=get_quick_actions_keyboard(user_id)
         )
-    
-    # Обробники нових меню
-    elif callback_data == "quick_actions":
+
+@callback_router.exact("stop_all_monitors")
+async def _cb_stop_all_monitors(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки stop_all_monitors"""
+    try:
+        # Зупиняємо всі монітори
+        if twitter_monitor_adapter:
+            twitter_monitor_adapter.monitoring_active = False
+
+        # Зупиняємо Twitter API моніторинг
+        if twitter_monitor:
+            twitter_monitor.monitoring_active = False
+
+        # Зупиняємо Discord моніторинг
+        if discord_monitor:
+            discord_monitor.monitoring_active = False
+
         await query.edit_message_text(
-            "⚡ **Швидкі дії**\n\n"
-            "Оберіть дію для швидкого виконання:",
+            "⏹️ **Всі монітори зупинено!**\n\n"
+            "🔴 Twitter API моніторинг зупинено\n"
+            "🔴 Twitter Monitor Adapter моніторинг зупинено\n"
+            "🔴 Discord моніторинг зупинено\n"
+            "🔴 Автоматичні сповіщення вимкнено",
             reply_markup=get_quick_actions_keyboard(user_id)
         )
-    elif callback_data == "about":
-        about_text = (
-            "ℹ️ **Про бота**\n\n"
-            "🤖 **Telegram Monitor Bot**\n"
-            "Версія: 2.0\n\n"
-            "📋 **Функції:**\n"
-            "• Моніторинг Twitter/X акаунтів\n"
-            "• Моніторинг Discord каналів\n"
-            "• Автоматичне пересилання повідомлень\n"
-            "• Система безпеки з авторизацією\n"
-            "• Адміністративна панель\n"
-            "• Twitter Monitor Adapter для обходу обмежень\n\n"
-            "👨‍💻 **Розробник:** megymin\n"
-            "📅 **Останнє оновлення:** 2025"
-        )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="main_menu")]]
-        await query.edit_message_text(
-            about_text,
-            reply_markup=InlineKeyboardMarkup(keyboard)
-        )
-    
-    # Обробники швидких дій
-    elif callback_data == "start_all_monitors":
-        try:
-            # Запускаємо всі монітори через автоматичну функцію
-            auto_start_monitoring()
-            
-            await query.edit_message_text(
-                "🚀 **Всі монітори запущено!**\n\n"
-                "✅ Twitter API моніторинг активний\n"
-                "✅ Twitter Monitor Adapter моніторинг активний\n"
-                "✅ Discord моніторинг активний\n"
-                "✅ Автоматичні сповіщення увімкнено",
-                reply_markup=get_quick_actions_keyboard(user_id)
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка запуску моніторів**\n\n{str(e)}",
-                reply_markup=get_quick_actions_keyboard(user_id)
-            )
-    elif callback_data == "stop_all_monitors":
-        try:
-            # Зупиняємо всі монітори
-            if twitter_monitor_adapter:
-                twitter_monitor_adapter.monitoring_active = False
-            
-            # Зупиняємо Twitter API моніторинг
-            if twitter_monitor:
-                twitter_monitor.monitoring_active = False
-            
-            # Зупиняємо Discord моніторинг
-            if discord_monitor:
-                discord_monitor.monitoring_active = False
-            
-            await query.edit_message_text(
-                "⏹️ **Всі монітори зупинено!**\n\n"
-                "🔴 Twitter API моніторинг зупинено\n"
-                "🔴 Twitter Monitor Adapter моніторинг зупинено\n"
-                "🔴 Discord моніторинг зупинено\n"
-                "🔴 Автоматичні сповіщення вимкнено",
-                reply_markup=get_quick_actions_keyboard(user_id)
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка зупинки моніторів**\n\n{str(e)}",
-                reply_markup=get_quick_actions_keyboard(user_id)
-            )
-    elif callback_data == "quick_stats":
-        try:
-            stats = project_manager.get_statistics()
-            user_projects = project_manager.get_user_projects(user_id)
-            twitter_count = len([p for p in user_projects if p['platform'] == 'twitter'])
-            discord_count = len([p for p in user_projects if p['platform'] == 'discord'])
-            twitter_adapter_count = len(project_manager.get_selenium_accounts())
-            
-            quick_stats_text = (
-                "📊 **Швидка статистика**\n\n"
-                f"👤 **Ваші проекти:**\n"
-                f"• Twitter: {twitter_count}\n"
-                f"• Discord: {discord_count}\n"
-                f"• Twitter Monitor Adapter: {twitter_adapter_count}\n\n"
-                f"🌐 **Загальна статистика:**\n"
-                f"• Всього користувачів: {stats.get('total_users', 0)}\n"
-                f"• Всього проектів: {stats.get('total_projects', 0)}\n"
-                f"• Активних сесій: {len(access_manager.user_sessions)}"
-            )
-            
-            await query.edit_message_text(
-                quick_stats_text,
-                reply_markup=get_quick_actions_keyboard(user_id)
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка отримання статистики**\n\n{str(e)}",
-                reply_markup=get_quick_actions_keyboard(user_id)
-            )
-    elif callback_data == "recent_messages":
+    except Exception as e:
         await query.edit_message_text(
-            "📝 **Останні повідомлення**\n\nОберіть кількість повідомлень для перегляду:",
-            reply_markup=get_history_count_keyboard()
+            f"❌ **Помилка зупинки моніторів**\n\n{str(e)}",
+            reply_markup=get_quick_actions_keyboard(user_id)
         )
-    elif callback_data == "refresh_data":
-        try:
-            project_manager.load_data()
-            sync_monitors_with_projects()
-            
-            await query.edit_message_text(
-                "🔄 **Дані оновлено!**\n\n"
-                "✅ Проекти перезавантажено\n"
-                "✅ Монітори синхронізовано\n"
-                "✅ Налаштування оновлено",
-                reply_markup=get_quick_actions_keyboard(user_id)
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                f"❌ **Помилка оновлення даних**\n\n{str(e)}",
-                reply_markup=get_quick_actions_keyboard(user_id)
-            )
-    
-    # Обробники допомоги
-    elif callback_data == "help_getting_started":
-        help_text = (
-            "🚀 **Початок роботи**\n\n"
-            "**Крок 1:** Авторизуйтеся за допомогою /login\n"
-            "**Крок 2:** Створіть новий проект через меню\n"
-            "**Крок 3:** Додайте посилання на Twitter або Discord\n"
-            "**Крок 4:** Налаштуйте пересилання повідомлень\n"
-            "**Крок 5:** Запустіть моніторинг\n\n"
-            "💡 **Поради:**\n"
-            "• Використовуйте швидкі дії для зручності\n"
-            "• Перевіряйте діагностику при проблемах\n"
-            "• Налаштуйте автоматичне пересилання"
-        )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
-        await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
-    elif callback_data == "help_twitter":
-        help_text = (
-            "🐦 **Twitter налаштування**\n\n"
-            "**Формат посилань:**\n"
-            "• https://twitter.com/username\n"
-            "• https://x.com/username\n\n"
-            "**Twitter Monitor Adapter моніторинг:**\n"
-            "• Обходить обмеження API\n"
-            "• Автоматичний запуск\n"
-            "• Підтримка зображень\n\n"
-            "**Команди:**\n"
-            "• /twitter_start - запустити\n"
-            "• /twitter_stop - зупинити\n"
-            "• /twitter_add username - додати акаунт"
-        )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
-        await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
-    elif callback_data == "help_discord":
-        help_text = (
-            "💬 **Discord налаштування**\n\n"
-            "**Формат посилань:**\n"
-            "• https://discord.com/channels/server_id/channel_id\n\n"
-            "**Налаштування:**\n"
-            "• Потрібен AUTHORIZATION токен\n"
-            "• Встановіть в .env файлі\n"
-            "• Перевірте через діагностику\n\n"
-            "**Функції:**\n"
-            "• Моніторинг нових повідомлень\n"
-            "• Автоматичне пересилання\n"
-            "• Підтримка зображень та файлів"
-        )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
-        await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
-    elif callback_data == "help_forwarding":
-        help_text = (
-            "📢 **Налаштування пересилання**\n\n"
-            "**Автоналаштування:**\n"
-            "• Додайте бота в канал як адміністратора\n"
-            "• Напишіть в каналі: @botusername ping\n"
-            "• Бот автоматично налаштує пересилання\n\n"
-            "**Ручне налаштування:**\n"
-            "• /forward_set_channel CHANNEL_ID\n"
-            "• /forward_on - увімкнути\n"
-            "• /forward_off - вимкнути\n\n"
-            "**Тестування:**\n"
-            "• /forward_test - відправити тестове повідомлення"
-        )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
-        await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
-    elif callback_data == "help_faq":
-        help_text = (
-            "❓ **Часті питання**\n\n"
-            "**Q: Чому не працює Twitter моніторинг?**\n"
-            "A: Спробуйте Twitter Monitor Adapter моніторинг - він обходить обмеження API\n\n"
-            "**Q: Як налаштувати Discord?**\n"
-            "A: Потрібен AUTHORIZATION токен в .env файлі\n\n"
-            "**Q: Сесія постійно закінчується**\n"
-            "A: Сесія діє 5 хвилин. Використовуйте бота активно\n\n"
-            "**Q: Не отримую сповіщення**\n"
-            "A: Перевірте налаштування пересилання та права бота"
-        )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
-        await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
-    elif callback_data == "help_support":
-        help_text = format_info_message(
-            "Підтримка",
-            "Технічна підтримка та допомога",
-            "• Використовуйте діагностику системи для перевірки стану\n"
-            "• Перевіряйте логи через адміністративну панель\n"
-            "• Перезапускайте монітори при необхідності\n"
-            "• Зверніться до адміністратора при серйозних проблемах"
-        )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
-        await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
-    
-    # Обробники налаштувань
-    elif callback_data == "settings_notifications":
-        settings_text = (
-            "🔔 **Налаштування сповіщень**\n\n"
-            "**Поточні налаштування:**\n"
-            "• Сповіщення про нові повідомлення: ✅ Увімкнено\n"
-            "• Сповіщення про помилки: ✅ Увімкнено\n"
-            "• Звукові сповіщення: ❌ Вимкнено\n\n"
-            "⚠️ **Примітка:** Детальні налаштування сповіщень будуть додані в наступних версіях"
-        )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="settings")]]
-        await query.edit_message_text(settings_text, reply_markup=InlineKeyboardMarkup(keyboard))
-    elif callback_data == "settings_intervals":
-        settings_text = (
-            "⏰ **Інтервали моніторингу**\n\n"
-            f"**Поточні налаштування:**\n"
-            f"• Discord: {MONITORING_INTERVAL} секунд\n"
-            f"• Twitter: {TWITTER_MONITORING_INTERVAL} секунд\n"
-            f"• Twitter Monitor Adapter: 30 секунд\n\n"
-            "⚠️ **Примітка:** Зміна інтервалів буде додана в наступних версіях.\n"
-            "Поки що інтервали налаштовуються в config.py"
-        )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="settings")]]
-        await query.edit_message_text(settings_text, reply_markup=InlineKeyboardMarkup(keyboard))
-    elif callback_data == "settings_theme":
-        settings_text = (
-            "🎨 **Тема інтерфейсу**\n\n"
-            "**Поточна тема:** Стандартна\n\n"
-            "**Доступні теми:**\n"
-            "• 🌟 Стандартна (поточна)\n"
-            "• 🌙 Темна (планується)\n"
-            "• 🌈 Кольорова (планується)\n\n"
-            "⚠️ **Примітка:** Вибір теми буде додано в наступних версіях"
-        )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="settings")]]
-        await query.edit_message_text(settings_text, reply_markup=InlineKeyboardMarkup(keyboard))
-    elif callback_data == "settings_language":
-        settings_text = (
-            "🌐 **Налаштування мови**\n\n"
-            "**Поточна мова:** 🇺🇦 Українська\n\n"
-            "**Доступні мови:**\n"
-            "• 🇺🇦 Українська (поточна)\n"
-            "• 🇬🇧 English (планується)\n"
-            "• 🇷🇺 Русский (планується)\n\n"
-            "⚠️ **Примітка:** Багатомовність буде додана в наступних версіях"
-        )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="settings")]]
-        await query.edit_message_text(settings_text, reply_markup=InlineKeyboardMarkup(keyboard))
-    elif callback_data == "settings_security":
-        session_time_left = security_manager.get_session_time_left(user_id) if security_manager else 0
-        settings_text = (
-            "🔒 **Налаштування безпеки**\n\n"
-            "**Поточні налаштування:**\n"
-            f"• Тайм-аут сесії: {SECURITY_TIMEOUT} секунд\n"
-            f"• Час до закінчення сесії: {session_time_left} секунд\n"
-            f"• Активних сесій: {len(access_manager.user_sessions)}\n\n"
-            "**Функції безпеки:**\n"
-            "• Автоматичне завершення сесії\n"
-            "• Авторизація за паролем\n"
-            "• Контроль доступу адміністраторів\n\n"
-            "⚠️ **Примітка:** Додаткові налаштування безпеки будуть додані пізніше"
-        )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="settings")]]
-        await query.edit_message_text(settings_text, reply_markup=InlineKeyboardMarkup(keyboard))
-    elif callback_data == "settings_export":
-        try:
-            stats = project_manager.get_statistics()
-            user_projects = project_manager.get_user_projects(user_id)
-            
-            export_text = (
-                "📊 **Експорт даних**\n\n"
-                "**Ваші дані:**\n"
-                f"• Проекти: {len(user_projects)}\n"
-                f"• Twitter проекти: {len([p for p in user_projects if p['platform'] == 'twitter'])}\n"
-                f"• Discord проекти: {len([p for p in user_projects if p['platform'] == 'discord'])}\n\n"
-                "**Загальна статистика:**\n"
-                f"• Всього користувачів: {stats.get('total_users', 0)}\n"
-                f"• Всього проектів: {stats.get('total_projects', 0)}\n"
-                f"• Розмір файлу даних: {stats.get('data_file_size', 0)} байт\n\n"
-                "⚠️ **Примітка:** Функція експорту в файл буде додана пізніше"
-            )
-        except Exception as e:
-            export_text = f"❌ **Помилка отримання даних для експорту**\n\n{str(e)}"
-        
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="settings")]]
-        await query.edit_message_text(export_text, reply_markup=InlineKeyboardMarkup(keyboard))
-    
-    # Додаткові обробники для моніторингу
-    elif callback_data == "admin_monitoring_schedule":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+
+@callback_router.exact("quick_stats")
+async def _cb_quick_stats(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки quick_stats"""
+    try:
+        stats = project_manager.get_statistics()
+        user_projects = project_manager.get_user_projects(user_id)
+        twitter_count = len([p for p in user_projects if p['platform'] == 'twitter'])
+        discord_count = len([p for p in user_projects if p['platform'] == 'discord'])
+        twitter_adapter_count = len(project_manager.get_selenium_accounts())
+
+        quick_stats_text = (
+            "📊 **Швидка статистика**\n\n"
+            f"👤 **Ваші проекти:**\n"
+            f"• Twitter: {twitter_count}\n"
+            f"• Discord: {discord_count}\n"
+            f"• Twitter Monitor Adapter: {twitter_adapter_count}\n\n"
+            f"🌐 **Загальна статистика:**\n"
+            f"• Всього користувачів: {stats.get('total_users', 0)}\n"
+            f"• Всього проектів: {stats.get('total_projects', 0)}\n"
+            f"• Активних сесій: {len(access_manager.user_sessions)}"
+        )
+
         await query.edit_message_text(
-            format_info_message(
-                "Розклад моніторингу",
-                "Налаштування розкладу моніторингу",
-                "⚠️ Функція розкладу буде додана в наступних версіях.\n"
-                "Поки що моніторинг працює постійно з фіксованими інтервалами."
-            ),
-            reply_markup=get_admin_monitoring_keyboard()
+            quick_stats_text,
+            reply_markup=get_quick_actions_keyboard(user_id)
         )
-    
-    elif callback_data == "admin_monitoring_logs":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+    except Exception as e:
         await query.edit_message_text(
-            format_info_message(
-                "Логи моніторингу",
-                "Журнал подій моніторингу",
-                "⚠️ Детальні логи моніторингу будуть додані в наступних версіях.\n"
-                "Поки що перевіряйте консоль для логів системи."
-            ),
-            reply_markup=get_admin_monitoring_keyboard()
+            f"❌ **Помилка отримання статистики**\n\n{str(e)}",
+            reply_markup=get_quick_actions_keyboard(user_id)
         )
-    
-    # Обробники фільтрів та аналітики
-    elif callback_data == "admin_stats_filters":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+
+@callback_router.exact("recent_messages")
+async def _cb_recent_messages(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки recent_messages"""
+    await query.edit_message_text(
+        "📝 **Останні повідомлення**\n\nОберіть кількість повідомлень для перегляду:",
+        reply_markup=get_history_count_keyboard()
+    )
+
+@callback_router.exact("refresh_data")
+async def _cb_refresh_data(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки refresh_data"""
+    try:
+        project_manager.load_data()
+
         await query.edit_message_text(
-            format_info_message(
-                "Фільтри статистики",
-                "Розширені фільтри для статистики",
-                "⚠️ Функція фільтрів буде додана в наступних версіях.\n"
-                "Поки що доступна базова статистика."
-            ),
-            reply_markup=get_admin_search_keyboard()
+            "🔄 **Дані оновлено!**\n\n"
+            "✅ Проекти перезавантажено\n"
+            "✅ Монітори синхронізовано\n"
+            "✅ Налаштування оновлено",
+            reply_markup=get_quick_actions_keyboard(user_id)
         )
-    
-    elif callback_data == "admin_date_filter":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+    except Exception as e:
         await query.edit_message_text(
-            format_info_message(
-                "Фільтр за датою",
-                "Фільтрація даних за часовим періодом",
-                "⚠️ Функція фільтрації за датою буде додана в наступних версіях.\n"
-                "Поки що доступні всі дані без фільтрації."
-            ),
-            reply_markup=get_admin_search_keyboard()
+            f"❌ **Помилка оновлення даних**\n\n{str(e)}",
+            reply_markup=get_quick_actions_keyboard(user_id)
         )
-    
-    elif callback_data == "admin_tag_filter":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+
+# Обробники допомоги
+@callback_router.exact("help_getting_started")
+async def _cb_help_getting_started(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки help_getting_started"""
+    help_text = (
+        "🚀 **Початок роботи**\n\n"
+        "**Крок 1:** Авторизуйтеся за допомогою /login\n"
+        "**Крок 2:** Створіть новий проект через меню\n"
+        "**Крок 3:** Додайте посилання на Twitter або Discord\n"
+        "**Крок 4:** Налаштуйте пересилання повідомлень\n"
+        "**Крок 5:** Запустіть моніторинг\n\n"
+        "💡 **Поради:**\n"
+        "• Використовуйте швидкі дії для зручності\n"
+        "• Перевіряйте діагностику при проблемах\n"
+        "• Налаштуйте автоматичне пересилання"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
+    await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+@callback_router.exact("help_twitter")
+async def _cb_help_twitter(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки help_twitter"""
+    help_text = (
+        "🐦 **Twitter налаштування**\n\n"
+        "**Формат посилань:**\n"
+        "• https://twitter.com/username\n"
+        "• https://x.com/username\n\n"
+        "**Twitter Monitor Adapter моніторинг:**\n"
+        "• Обходить обмеження API\n"
+        "• Автоматичний запуск\n"
+        "• Підтримка зображень\n\n"
+        "**Команди:**\n"
+        "• /twitter_start - запустити\n"
+        "• /twitter_stop - зупинити\n"
+        "• /twitter_add username - додати акаунт"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
+    await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+@callback_router.exact("help_discord")
+async def _cb_help_discord(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки help_discord"""
+    help_text = (
+        "💬 **Discord налаштування**\n\n"
+        "**Формат посилань:**\n"
+        "• https://discord.com/channels/server_id/channel_id\n\n"
+        "**Налаштування:**\n"
+        "• Потрібен AUTHORIZATION токен\n"
+        "• Встановіть в .env файлі\n"
+        "• Перевірте через діагностику\n\n"
+        "**Функції:**\n"
+        "• Моніторинг нових повідомлень\n"
+        "• Автоматичне пересилання\n"
+        "• Підтримка зображень та файлів"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
+    await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+@callback_router.exact("help_forwarding")
+async def _cb_help_forwarding(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки help_forwarding"""
+    help_text = (
+        "📢 **Налаштування пересилання**\n\n"
+        "**Автоналаштування:**\n"
+        "• Додайте бота в канал як адміністратора\n"
+        "• Напишіть в каналі: @botusername ping\n"
+        "• Бот автоматично налаштує пересилання\n\n"
+        "**Ручне налаштування:**\n"
+        "• /forward_set_channel CHANNEL_ID\n"
+        "• /forward_on - увімкнути\n"
+        "• /forward_off - вимкнути\n\n"
+        "**Тестування:**\n"
+        "• /forward_test - відправити тестове повідомлення"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
+    await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+@callback_router.exact("help_faq")
+async def _cb_help_faq(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки help_faq"""
+    help_text = (
+        "❓ **Часті питання**\n\n"
+        "**Q: Чому не працює Twitter моніторинг?**\n"
+        "A: Спробуйте Twitter Monitor Adapter моніторинг - він обходить обмеження API\n\n"
+        "**Q: Як налаштувати Discord?**\n"
+        "A: Потрібен AUTHORIZATION токен в .env файлі\n\n"
+        "**Q: Сесія постійно закінчується**\n"
+        "A: Сесія діє 5 хвилин. Використовуйте бота активно\n\n"
+        "**Q: Не отримую сповіщення**\n"
+        "A: Перевірте налаштування пересилання та права бота"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
+    await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+@callback_router.exact("help_support")
+async def _cb_help_support(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки help_support"""
+    help_text = format_info_message(
+        "Підтримка",
+        "Технічна підтримка та допомога",
+        "• Використовуйте діагностику системи для перевірки стану\n"
+        "• Перевіряйте логи через адміністративну панель\n"
+        "• Перезапускайте монітори при необхідності\n"
+        "• Зверніться до адміністратора при серйозних проблемах"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
+    await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+# Обробники налаштувань
+@callback_router.exact("settings_notifications")
+async def _cb_settings_notifications(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки settings_notifications"""
+    settings_text = (
+        "🔔 **Налаштування сповіщень**\n\n"
+        "**Поточні налаштування:**\n"
+        "• Сповіщення про нові повідомлення: ✅ Увімкнено\n"
+        "• Сповіщення про помилки: ✅ Увімкнено\n"
+        "• Звукові сповіщення: ❌ Вимкнено\n\n"
+        "⚠️ **Примітка:** Детальні налаштування сповіщень будуть додані в наступних версіях"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="settings")]]
+    await query.edit_message_text(settings_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+@callback_router.exact("settings_intervals")
+async def _cb_settings_intervals(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки settings_intervals"""
+    settings_text = (
+        "⏰ **Інтервали моніторингу**\n\n"
+        f"**Поточні налаштування:**\n"
+        f"• Discord: {MONITORING_INTERVAL} секунд\n"
+        f"• Twitter: {TWITTER_MONITORING_INTERVAL} секунд\n"
+        f"• Twitter Monitor Adapter: 30 секунд\n\n"
+        "⚠️ **Примітка:** Зміна інтервалів буде додана в наступних версіях.\n"
+        "Поки що інтервали налаштовуються в config.py"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="settings")]]
+    await query.edit_message_text(settings_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+@callback_router.exact("settings_theme")
+async def _cb_settings_theme(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки settings_theme"""
+    settings_text = (
+        "🎨 **Тема інтерфейсу**\n\n"
+        "**Поточна тема:** Стандартна\n\n"
+        "**Доступні теми:**\n"
+        "• 🌟 Стандартна (поточна)\n"
+        "• 🌙 Темна (планується)\n"
+        "• 🌈 Кольорова (планується)\n\n"
+        "⚠️ **Примітка:** Вибір теми буде додано в наступних версіях"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="settings")]]
+    await query.edit_message_text(settings_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+@callback_router.exact("settings_language")
+async def _cb_settings_language(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки settings_language"""
+    settings_text = (
+        "🌐 **Налаштування мови**\n\n"
+        "**Поточна мова:** 🇺🇦 Українська\n\n"
+        "**Доступні мови:**\n"
+        "• 🇺🇦 Українська (поточна)\n"
+        "• 🇬🇧 English (планується)\n"
+        "• 🇷🇺 Русский (планується)\n\n"
+        "⚠️ **Примітка:** Багатомовність буде додана в наступних версіях"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="settings")]]
+    await query.edit_message_text(settings_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+@callback_router.exact("settings_security")
+async def _cb_settings_security(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки settings_security"""
+    session_time_left = security_manager.get_session_time_left(user_id) if security_manager else 0
+    settings_text = (
+        "🔒 **Налаштування безпеки**\n\n"
+        "**Поточні налаштування:**\n"
+        f"• Тайм-аут сесії: {SECURITY_TIMEOUT} секунд\n"
+        f"• Час до закінчення сесії: {session_time_left} секунд\n"
+        f"• Активних сесій: {len(access_manager.user_sessions)}\n\n"
+        "**Функції безпеки:**\n"
+        "• Автоматичне завершення сесії\n"
+        "• Авторизація за паролем\n"
+        "• Контроль доступу адміністраторів\n\n"
+        "⚠️ **Примітка:** Додаткові налаштування безпеки будуть додані пізніше"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="settings")]]
+    await query.edit_message_text(settings_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+@callback_router.exact("settings_export")
+async def _cb_settings_export(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки settings_export"""
+    try:
+        stats = project_manager.get_statistics()
+        user_projects = project_manager.get_user_projects(user_id)
+
+        export_text = (
+            "📊 **Експорт даних**\n\n"
+            "**Ваші дані:**\n"
+            f"• Проекти: {len(user_projects)}\n"
+            f"• Twitter проекти: {len([p for p in user_projects if p['platform'] == 'twitter'])}\n"
+            f"• Discord проекти: {len([p for p in user_projects if p['platform'] == 'discord'])}\n\n"
+            "**Загальна статистика:**\n"
+            f"• Всього користувачів: {stats.get('total_users', 0)}\n"
+            f"• Всього проектів: {stats.get('total_projects', 0)}\n"
+            f"• Розмір файлу даних: {stats.get('data_file_size', 0)} байт\n\n"
+            "⚠️ **Примітка:** Функція експорту в файл буде додана пізніше"
+        )
+    except Exception as e:
+        export_text = f"❌ **Помилка отримання даних для експорту**\n\n{str(e)}"
+
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="settings")]]
+    await query.edit_message_text(export_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+# Додаткові обробники для моніторингу
+@callback_router.exact("admin_monitoring_schedule")
+async def _cb_admin_monitoring_schedule(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_monitoring_schedule"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            format_info_message(
-                "Фільтр за тегами",
-                "Фільтрація даних за тегами",
-                "⚠️ Система тегів буде додана в наступних версіях.\n"
-                "Поки що використовуйте пошук за назвою проектів."
-            ),
-            reply_markup=get_admin_search_keyboard()
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    
-    elif callback_data == "admin_advanced_analytics":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+        return
+
+    await query.edit_message_text(
+        format_info_message(
+            "Розклад моніторингу",
+            "Налаштування розкладу моніторингу",
+            "⚠️ Функція розкладу буде додана в наступних версіях.\n"
+            "Поки що моніторинг працює постійно з фіксованими інтервалами."
+        ),
+        reply_markup=get_admin_monitoring_keyboard()
+    )
+
+@callback_router.exact("admin_monitoring_logs")
+async def _cb_admin_monitoring_logs(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_monitoring_logs"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            format_info_message(
-                "Розширена аналітика",
-                "Детальний аналіз даних системи",
-                "⚠️ Розширена аналітика буде додана в наступних версіях.\n"
-                "Поки що доступна базова статистика в розділі 'Статистика та аналітика'."
-            ),
-            reply_markup=get_admin_search_keyboard()
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    
-    # Обробники відсутніх callback'ів
-    elif callback_data == "user_stats":
-        try:
-            stats = project_manager.get_statistics()
-            user_projects = project_manager.get_user_projects(user_id)
-            twitter_count = len([p for p in user_projects if p['platform'] == 'twitter'])
-            discord_count = len([p for p in user_projects if p['platform'] == 'discord'])
-            twitter_adapter_count = len(project_manager.get_selenium_accounts())
-            
-            stats_text = format_info_message(
-                "Ваша статистика",
-                f"📊 Ваші проекти:\n"
-                f"• Twitter: {twitter_count}\n"
-                f"• Discord: {discord_count}\n"
-                f"• Twitter Monitor Adapter: {twitter_adapter_count}\n\n"
-                f"🌐 Загальна статистика:\n"
-                f"• Всього користувачів: {stats.get('total_users', 0)}\n"
-                f"• Всього проектів: {stats.get('total_projects', 0)}\n"
-                f"• Активних сесій: {len(access_manager.user_sessions)}",
-                f"Час до закінчення сесії: {security_manager.get_session_time_left(user_id)} секунд"
-            )
-            
-            await query.edit_message_text(
-                stats_text,
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Назад", callback_data="main_menu")]])
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                format_error_message("Помилка статистики", str(e)),
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Назад", callback_data="main_menu")]])
-            )
-    
-    elif callback_data == "change_channel":
-        user_states[user_id] = {'state': 'setting_forward_channel'}
+        return
+
+    await query.edit_message_text(
+        format_info_message(
+            "Логи моніторингу",
+            "Журнал подій моніторингу",
+            "⚠️ Детальні логи моніторингу будуть додані в наступних версіях.\n"
+            "Поки що перевіряйте консоль для логів системи."
+        ),
+        reply_markup=get_admin_monitoring_keyboard()
+    )
+
+# Обробники фільтрів та аналітики
+@callback_router.exact("admin_stats_filters")
+async def _cb_admin_stats_filters(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_stats_filters"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            "✏️ Зміна каналу пересилання\n\n"
-            "Надішліть ID каналу або перешліть повідомлення з каналу:",
-            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("❌ Скасувати", callback_data="forward_settings")]])
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    
-    elif callback_data == "set_channel":
-        user_states[user_id] = {'state': 'setting_forward_channel'}
+        return
+
+    await query.edit_message_text(
+        format_info_message(
+            "Фільтри статистики",
+            "Розширені фільтри для статистики",
+            "⚠️ Функція фільтрів буде додана в наступних версіях.\n"
+            "Поки що доступна базова статистика."
+        ),
+        reply_markup=get_admin_search_keyboard()
+    )
+
+@callback_router.exact("admin_date_filter")
+async def _cb_admin_date_filter(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_date_filter"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            "📝 Встановлення каналу пересилання\n\n"
-            "Надішліть ID каналу або перешліть повідомлення з каналу:",
-            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("❌ Скасувати", callback_data="forward_settings")]])
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    
-    elif callback_data.startswith("history_"):
-        # Отримуємо історію повідомлень
-        count = int(callback_data.split("_")[1])
-        await handle_discord_history(update, context, count)
-    
-    elif callback_data == "help_settings":
-        help_text = format_info_message(
-            "Налаштування допомоги",
-            "Як налаштувати бота під свої потреби",
-            "• Використовуйте розділ 'Налаштування' в головному меню\n"
-            "• Налаштуйте інтервали моніторингу\n"
-            "• Оберіть тему інтерфейсу\n"
-            "• Налаштуйте сповіщення\n"
-            "• Експортуйте свої дані при потребі"
+        return
+
+    await query.edit_message_text(
+        format_info_message(
+            "Фільтр за датою",
+            "Фільтрація даних за часовим періодом",
+            "⚠️ Функція фільтрації за датою буде додана в наступних версіях.\n"
+            "Поки що доступні всі дані без фільтрації."
+        ),
+        reply_markup=get_admin_search_keyboard()
+    )
+
+@callback_router.exact("admin_tag_filter")
+async def _cb_admin_tag_filter(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_tag_filter"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
-        await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
-    
-    # Обробники адміністративних функцій
-    elif callback_data == "admin_system":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї панелі."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+        return
+
+    await query.edit_message_text(
+        format_info_message(
+            "Фільтр за тегами",
+            "Фільтрація даних за тегами",
+            "⚠️ Система тегів буде додана в наступних версіях.\n"
+            "Поки що використовуйте пошук за назвою проектів."
+        ),
+        reply_markup=get_admin_search_keyboard()
+    )
+
+@callback_router.exact("admin_advanced_analytics")
+async def _cb_admin_advanced_analytics(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_advanced_analytics"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            format_info_message(
-                "Системне управління",
-                "Управління системними функціями бота",
-                "Тут ви можете керувати системними налаштуваннями, переглядати логи, створювати бекапи та виконувати інші адміністративні завдання."
-            ),
-            reply_markup=get_admin_system_keyboard()
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
+            reply_markup=get_main_menu_keyboard(user_id)
+        )
+        return
+
+    await query.edit_message_text(
+        format_info_message(
+            "Розширена аналітика",
+            "Детальний аналіз даних системи",
+            "⚠️ Розширена аналітика буде додана в наступних версіях.\n"
+            "Поки що доступна базова статистика в розділі 'Статистика та аналітика'."
+        ),
+        reply_markup=get_admin_search_keyboard()
+    )
+
+# Обробники відсутніх callback'ів
+@callback_router.exact("user_stats")
+async def _cb_user_stats(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки user_stats"""
+    try:
+        stats = project_manager.get_statistics()
+        user_projects = project_manager.get_user_projects(user_id)
+        twitter_count = len([p for p in user_projects if p['platform'] == 'twitter'])
+        discord_count = len([p for p in user_projects if p['platform'] == 'discord'])
+        twitter_adapter_count = len(project_manager.get_selenium_accounts())
+
+        stats_text = format_info_message(
+            "Ваша статистика",
+            f"📊 Ваші проекти:\n"
+            f"• Twitter: {twitter_count}\n"
+            f"• Discord: {discord_count}\n"
+            f"• Twitter Monitor Adapter: {twitter_adapter_count}\n\n"
+            f"🌐 Загальна статистика:\n"
+            f"• Всього користувачів: {stats.get('total_users', 0)}\n"
+            f"• Всього проектів: {stats.get('total_projects', 0)}\n"
+            f"• Активних сесій: {len(access_manager.user_sessions)}",
+            f"Час до закінчення сесії: {security_manager.get_session_time_left(user_id)} секунд"
         )
-    
-    elif callback_data == "admin_user_activity":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
-        try:
-            # Отримуємо активність користувачів
-            active_sessions = len(access_manager.user_sessions)
-            total_users = len(project_manager.data.get('users', {}))
-            
-            activity_text = format_info_message(
-                "Активність користувачів",
-                f"📊 Загальна інформація:\n"
-                f"• Всього користувачів: {total_users}\n"
-                f"• Активних сесій: {active_sessions}\n"
-                f"• Користувачів онлайн: {active_sessions}",
-                "Детальна статистика активності користувачів"
-            )
-            
-            await query.edit_message_text(
-                activity_text,
-                reply_markup=get_admin_users_keyboard()
-            )
-        except Exception as e:
-            await query.edit_message_text(
-                format_error_message("Помилка отримання активності", str(e)),
-                reply_markup=get_admin_users_keyboard()
+
+        await query.edit_message_text(
+            stats_text,
+            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Назад", callback_data="main_menu")]])
         )
-    
-    # Нові обробники для покращеної адмін панелі
-    elif callback_data == "admin_search":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+    except Exception as e:
+        await query.edit_message_text(
+            format_error_message("Помилка статистики", str(e)),
+            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Назад", callback_data="main_menu")]])
+        )
+
+@callback_router.exact("help_settings")
+async def _cb_help_settings(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки help_settings"""
+    help_text = format_info_message(
+        "Налаштування допомоги",
+        "Як налаштувати бота під свої потреби",
+        "• Використовуйте розділ 'Налаштування' в головному меню\n"
+        "• Налаштуйте інтервали моніторингу\n"
+        "• Оберіть тему інтерфейсу\n"
+        "• Налаштуйте сповіщення\n"
+        "• Експортуйте свої дані при потребі"
+    )
+    keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data="help")]]
+    await query.edit_message_text(help_text, reply_markup=InlineKeyboardMarkup(keyboard))
+
+# Обробники адміністративних функцій
+@callback_router.exact("admin_system")
+async def _cb_admin_system(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_system"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            "🔍 **Пошук та фільтри**\n\n"
-            "🎯 **Центр поиска и фильтрации**\n\n"
-            "📋 **Доступные функции:**\n"
-            "• 🔍 Поиск пользователей\n"
-            "• 📋 Поиск проектов\n"
-            "• 📊 Фильтры статистики\n"
-            "• 📅 Фильтр по дате\n"
-            "• 🏷️ Фильтр по тегам\n"
-            "• 📈 Расширенная аналитика\n\n"
-            "Выберите нужную функцию:",
-            reply_markup=get_admin_search_keyboard(),
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї панелі."),
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    
-    elif callback_data == "admin_monitoring":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+        return
+
+    await query.edit_message_text(
+        format_info_message(
+            "Системне управління",
+            "Управління системними функціями бота",
+            "Тут ви можете керувати системними налаштуваннями, переглядати логи, створювати бекапи та виконувати інші адміністративні завдання."
+        ),
+        reply_markup=get_admin_system_keyboard()
+    )
+
+@callback_router.exact("admin_user_activity")
+async def _cb_admin_user_activity(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_user_activity"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            "📈 **Моніторинг системи**\n\n"
-            "🎯 **Центр мониторинга**\n\n"
-            "📋 **Доступные функции:**\n"
-            "• 📈 Статус мониторинга\n"
-            "• 🔔 Настройки уведомлений\n"
-            "• ⏰ Расписание мониторинга\n"
-            "• 📊 Логи мониторинга\n"
-            "• 🔄 Перезапуск мониторинга\n"
-            "• ⚡ Скорость отклика\n\n"
-            "Выберите нужную функцию:",
-            reply_markup=get_admin_monitoring_keyboard(),
+            format_error_message("Доступ заборонено!", "Тільки адміністратор має доступ до цієї функції."),
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    
-    elif callback_data == "admin_settings":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+        return
+
+    try:
+        # Отримуємо активність користувачів
+        active_sessions = len(access_manager.user_sessions)
+        total_users = len(project_manager.data.get('users', {}))
+
+        activity_text = format_info_message(
+            "Активність користувачів",
+            f"📊 Загальна інформація:\n"
+            f"• Всього користувачів: {total_users}\n"
+            f"• Активних сесій: {active_sessions}\n"
+            f"• Користувачів онлайн: {active_sessions}",
+            "Детальна статистика активності користувачів"
+        )
+
         await query.edit_message_text(
-            "⚙️ **Налаштування системи**\n\n"
-            "🎯 **Центр настроек**\n\n"
-            "📋 **Доступные настройки:**\n"
-            "• 🔐 Настройки безопасности\n"
-            "• 🎨 Настройки интерфейса\n"
-            "• 📱 Настройки бота\n"
-            "• 🌐 Настройки сети\n"
-            "• 💾 Настройки хранения\n"
-            "• 🔧 Расширенные настройки\n\n"
-            "Выберите нужный раздел:",
-            reply_markup=get_admin_settings_keyboard(),
+            activity_text,
+            reply_markup=get_admin_users_keyboard()
         )
-    
-    elif callback_data == "admin_stats":
-        if not access_manager.is_admin(user_id):
-            await query.edit_message_text(
-                "❌ Доступ заборонено!",
-                reply_markup=get_main_menu_keyboard(user_id)
-            )
-            return
-        
+    except Exception as e:
         await query.edit_message_text(
-            "📊 **Статистика та аналітика**\n\n"
-            "🎯 **Центр статистики**\n\n"
-            "📋 **Доступные отчеты:**\n"
-            "• 📊 Общая статистика\n"
-            "• 👥 Статистика пользователей\n"
-            "• 📋 Статистика проектов\n"
-            "• 📈 Графики и диаграммы\n"
-            "• 📅 Статистика за период\n"
-            "• 🔍 Детальная аналитика\n"
-            "• 📤 Экспорт данных\n\n"
-            "Выберите нужный отчет:",
-            reply_markup=get_admin_stats_keyboard(),
+            format_error_message("Помилка отримання активності", str(e)),
+            reply_markup=get_admin_users_keyboard()
+    )
+
+# Нові обробники для покращеної адмін панелі
+@callback_router.exact("admin_search")
+async def _cb_admin_search(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_search"""
+    if not access_manager.is_admin(user_id):
+        await query.edit_message_text(
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    
-    # Адмін керування пересиланням: дії з кнопок
-    elif callback_data.startswith("admin_forward_enable_"):
-        if not access_manager.is_admin(user_id):
-            return
-        target_id = int(callback_data.split('_')[-1])
-        project_manager.enable_forward(target_id)
+        return
+
+    await query.edit_message_text(
+        "🔍 **Пошук та фільтри**\n\n"
+        "🎯 **Центр поиска и фильтрации**\n\n"
+        "📋 **Доступные функции:**\n"
+        "• 🔍 Поиск пользователей\n"
+        "• 📋 Поиск проектов\n"
+        "• 📊 Фильтры статистики\n"
+        "• 📅 Фильтр по дате\n"
+        "• 🏷️ Фильтр по тегам\n"
+        "• 📈 Расширенная аналитика\n\n"
+        "Выберите нужную функцию:",
+        reply_markup=get_admin_search_keyboard(),
+    )
+
+@callback_router.exact("admin_monitoring")
+async def _cb_admin_monitoring(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_monitoring"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            f"🟢 Пересилання увімкнено для `{target_id}`",
-            reply_markup=get_admin_forward_keyboard(target_id),
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    elif callback_data.startswith("admin_forward_disable_"):
-        if not access_manager.is_admin(user_id):
-            return
-        target_id = int(callback_data.split('_')[-1])
-        project_manager.disable_forward(target_id)
+        return
+
+    await query.edit_message_text(
+        "📈 **Моніторинг системи**\n\n"
+        "🎯 **Центр мониторинга**\n\n"
+        "📋 **Доступные функции:**\n"
+        "• 📈 Статус мониторинга\n"
+        "• 🔔 Настройки уведомлений\n"
+        "• ⏰ Расписание мониторинга\n"
+        "• 📊 Логи мониторинга\n"
+        "• 🔄 Перезапуск мониторинга\n"
+        "• ⚡ Скорость отклика\n\n"
+        "Выберите нужную функцию:",
+        reply_markup=get_admin_monitoring_keyboard(),
+    )
+
+@callback_router.exact("admin_settings")
+async def _cb_admin_settings(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопки admin_settings"""
+    if not access_manager.is_admin(user_id):
         await query.edit_message_text(
-            f"🔴 Пересилання вимкнено для `{target_id}`",
-            reply_markup=get_admin_forward_keyboard(target_id),
+            "❌ Доступ заборонено!",
+            reply_markup=get_main_menu_keyboard(user_id)
         )
-    elif callback_data.startswith("admin_forward_status_"):
-        if not access_manager.is_admin(user_id):
-            return
-        target_id = int(callback_data.split('_')[-1])
-        status = project_manager.get_forward_status(target_id)
-        enabled = status.get('enabled', False)
-        channel = status.get('channel_id') or '—'
+        return
+
+    await query.edit_message_text(
+        "⚙️ **Налаштування системи**\n\n"
+        "🎯 **Центр настроек**\n\n"
+        "📋 **Доступные настройки:**\n"
+        "• 🔐 Настройки безопасности\n"
+        "• 🎨 Настройки интерфейса\n"
+        "• 📱 Настройки бота\n"
+        "• 🌐 Настройки сети\n"
+        "• 💾 Настройки хранения\n"
+        "• 🔧 Расширенные настройки\n\n"
+        "Выберите нужный раздел:",
+        reply_markup=get_admin_settings_keyboard(),
+    )
+
+# Адмін керування пересиланням: дії з кнопок
+@callback_router.prefix("admin_forward_enable_")
+async def _cb_admin_forward_enable(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок admin_forward_enable_..."""
+    if not access_manager.is_admin(user_id):
+        return
+    target_id = int(callback_data.split('_')[-1])
+    project_manager.enable_forward(target_id)
+    await query.edit_message_text(
+        f"🟢 Пересилання увімкнено для `{target_id}`",
+        reply_markup=get_admin_forward_keyboard(target_id),
+    )
+
+@callback_router.prefix("admin_forward_disable_")
+async def _cb_admin_forward_disable(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок admin_forward_disable_..."""
+    if not access_manager.is_admin(user_id):
+        return
+    target_id = int(callback_data.split('_')[-1])
+    project_manager.disable_forward(target_id)
+    await query.edit_message_text(
+        f"🔴 Пересилання вимкнено для `{target_id}`",
+        reply_markup=get_admin_forward_keyboard(target_id),
+    )
+
+@callback_router.prefix("admin_forward_status_")
+async def _cb_admin_forward_status(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок admin_forward_status_..."""
+    if not access_manager.is_admin(user_id):
+        return
+    target_id = int(callback_data.split('_')[-1])
+    status = project_manager.get_forward_status(target_id)
+    enabled = status.get('enabled', False)
+    channel = status.get('channel_id') or '—'
+    await query.edit_message_text(
+        f"📊 Статус пересилання для `{target_id}`\n\nСтатус: {'🟢 увімкнено' if enabled else '🔴 вимкнено'}\nКанал: `{channel}`",
+        reply_markup=get_admin_forward_keyboard(target_id),
+    )
+
+@callback_router.prefix("admin_forward_test_")
+async def _cb_admin_forward_test(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок admin_forward_test_..."""
+    if not access_manager.is_admin(user_id):
+        return
+    target_id = int(callback_data.split('_')[-1])
+    forward_channel = project_manager.get_forward_channel(target_id)
+    if not forward_channel:
         await query.edit_message_text(
-            f"📊 Статус пересилання для `{target_id}`\n\nСтатус: {'🟢 увімкнено' if enabled else '🔴 вимкнено'}\nКанал: `{channel}`",
+            f"❌ У користувача `{target_id}` не налаштований канал.",
             reply_markup=get_admin_forward_keyboard(target_id),
         )
-    elif callback_data.startswith("admin_forward_test_"):
-        if not access_manager.is_admin(user_id):
-            return
-        target_id = int(callback_data.split('_')[-1])
-        forward_channel = project_manager.get_forward_channel(target_id)
-        if not forward_channel:
-            await query.edit_message_text(
-                f"❌ У користувача `{target_id}` не налаштований канал.",
-                reply_markup=get_admin_forward_keyboard(target_id),
+    else:
+        try:
+            test_text = (
+                f"🧪 Тест пересилання\n\n"
+                f"Це тестове повідомлення від адміністратора для користувача `{target_id}`."
             )
-        else:
-            try:
-                test_text = (
-                    f"🧪 Тест пересилання\n\n"
-                    f"Це тестове повідомлення від адміністратора для користувача `{target_id}`."
+            url = f"{TELEGRAM_API_BASE}/bot{BOT_TOKEN}/sendMessage"
+            data = {
+                'chat_id': normalize_chat_id(forward_channel),
+                'text': test_text,
+            }
+            r = telegram_post(url, data=data, timeout=5)
+            if r.status_code == 200:
+                await query.edit_message_text(
+                    f"✅ Тестове повідомлення надіслано у `{normalize_chat_id(forward_channel)}`",
+                    reply_markup=get_admin_forward_keyboard(target_id),
                 )
-                url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
-                data = {
-                    'chat_id': normalize_chat_id(forward_channel),
-                    'text': test_text,
-                }
-                r = requests.post(url, data=data, timeout=5)
-                if r.status_code == 200:
-                    await query.edit_message_text(
-                        f"✅ Тестове повідомлення надіслано у `{normalize_chat_id(forward_channel)}`",
-                        reply_markup=get_admin_forward_keyboard(target_id),
-                    )
-                else:
-                    await query.edit_message_text(
-                        f"❌ Помилка надсилання ({r.status_code}). Перевірте права бота у каналі.",
-                        reply_markup=get_admin_forward_keyboard(target_id)
-                    )
-            except Exception as e:
+            else:
                 await query.edit_message_text(
-                    f"❌ Виняток при надсиланні: {e}",
+                    f"❌ Помилка надсилання ({r.status_code}). Перевірте права бота у каналі.",
                     reply_markup=get_admin_forward_keyboard(target_id)
                 )
-    elif callback_data.startswith("admin_forward_set_"):
-        if not access_manager.is_admin(user_id):
-            return
-        target_id = int(callback_data.split('_')[-1])
-        # Переводимо у стан очікування ID каналу
-        user_states[user_id] = {'state': 'admin_forward_set_channel', 'data': {'target_id': target_id}}
-        await query.edit_message_text(
-            f"📝 Перешліть повідомлення з потрібного каналу АБО введіть його ID для користувача `{target_id}`:",
-            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")]]),
-        )
+        except Exception as e:
+            await query.edit_message_text(
+                f"❌ Виняток при надсиланні: {e}",
+                reply_markup=get_admin_forward_keyboard(target_id)
+            )
+
+@callback_router.prefix("admin_forward_set_")
+async def _cb_admin_forward_set(update: Update, context: ContextTypes.DEFAULT_TYPE, query: CallbackQuery, user_id: int, callback_data: str) -> None:
+    """Обробник кнопок admin_forward_set_..."""
+    if not access_manager.is_admin(user_id):
+        return
+    target_id = int(callback_data.split('_')[-1])
+    # Переводимо у стан очікування ID каналу
+    user_states[user_id] = {'state': 'admin_forward_set_channel', 'data': {'target_id': target_id}}
+    await query.edit_message_text(
+        f"📝 Перешліть повідомлення з потрібного каналу АБО введіть його ID для користувача `{target_id}`:",
+        reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("❌ Скасувати", callback_data="admin_users")]]),
+    )
+
 
 async def handle_project_creation(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Обробник створення проекту"""
@@ -4770,9 +5314,6 @@ async def handle_project_creation(update: Update, context: ContextTypes.DEFAULT_
         
         # Додаємо проект
         if project_manager.add_project(user_id, state_data):
-            # Синхронізуємо монітори з новими проектами
-            sync_monitors_with_projects()
-            
             # Додаємо до відповідного моніторингу
             if state_data['platform'] == 'discord' and discord_monitor:
                 try:
@@ -4911,9 +5452,6 @@ async def handle_admin_create_project_for_user(update: Update, context: ContextT
         # Створюємо проект від імені target_id
         ok = project_manager.add_project(admin_id, project_data, target_user_id=state['target_id'])
         if ok:
-            # Синхронізуємо монітори з новими проектами
-            sync_monitors_with_projects()
-            
             # Додаємо у відповідний монітор одразу
             if state['platform'] == 'twitter':
                 username = extract_twitter_username(state['url'])
@@ -4922,7 +5460,7 @@ async def handle_admin_create_project_for_user(update: Update, context: ContextT
             else:
                 if discord_monitor:
                     discord_monitor.add_channel(state['url'])
-            sync_monitors_with_projects()
+            check_monitor_consistency()
             await update.message.reply_text("✅ Проект створено і додано до моніторингу.")
         else:
             await update.message.reply_text("❌ Не вдалося створити проект.")
@@ -4952,9 +5490,6 @@ async def handle_twitter_addition(update: Update, context: ContextTypes.DEFAULT_
         }
         
         if project_manager.add_project(user_id, project_data):
-            # Синхронізуємо монітори з новими проектами
-            sync_monitors_with_projects()
-            
             await update.message.reply_text(
                 f"✅ **Twitter акаунт успішно додано!**\n\n"
                 f"🐦 **Username:** @{username}\n"
@@ -4998,9 +5533,6 @@ async def handle_discord_addition(update: Update, context: ContextTypes.DEFAULT_
         }
         
         if project_manager.add_project(user_id, project_data):
-            # Синхронізуємо монітори з новими проектами
-            sync_monitors_with_projects()
-            
             await update.message.reply_text(
                 f"✅ **Discord канал успішно додано!**\n\n"
                 f"💬 **Channel ID:** {channel_id}\n"
@@ -5652,9 +6184,6 @@ async def handle_twitter_adapter_addition(update: Update, context: ContextTypes.
         # Додаємо до проектного менеджера
         project_manager.add_selenium_account(username, user_id)
         
-        # Синхронізуємо монітори після додавання
-        sync_monitors_with_projects()
-        
         await update.message.reply_text(
             f"✅ **Twitter Monitor Adapter акаунт успішно додано!**\n\n"
             f"🚀 **Username:** @{username}\n"
@@ -5780,20 +6309,22 @@ async def handle_discord_history(update: Update, context: ContextTypes.DEFAULT_T
                 reply_markup=get_main_menu_keyboard(user_id)
             )
         else:
-            # Форматуємо повідомлення
-            history_text = format_discord_history(messages, project['name'], count)
-            
-            # Розбиваємо на частини якщо текст занадто довгий
-            if len(history_text) > 4000:
-                # Telegram має ліміт на довжину повідомлення
-                parts = [history_text[i:i+4000] for i in range(0, len(history_text), 4000)]
-                for i, part in enumerate(parts):
-                    if i == 0:
-                        await query.edit_message_text(part)
-                    else:
-                        await context.bot.send_message(chat_id=user_id, text=part)
+            # Відправляємо історію частинами одразу по мірі форматування
+            chunks = iter_discord_history_chunks(messages, project['name'], count)
+            first_chunk = next(chunks)
+            next_chunk = next(chunks, None)
+            if next_chunk is None:
+                await query.edit_message_text(first_chunk, reply_markup=get_main_menu_keyboard(user_id), parse_mode="HTML")
             else:
-                await query.edit_message_text(history_text, reply_markup=get_main_menu_keyboard(user_id))
+                await query.edit_message_text(first_chunk, parse_mode="HTML")
+                while next_chunk is not None:
+                    chunk, next_chunk = next_chunk, next(chunks, None)
+                    await context.bot.send_message(
+                        chat_id=user_id,
+                        text=chunk,
+                        parse_mode="HTML",
+                        reply_markup=get_main_menu_keyboard(user_id) if next_chunk is None else None
+                    )
                 
     except Exception as e:
         logger.error(f"Помилка отримання історії Discord: {e}")
@@ -5820,66 +6351,124 @@ async def get_discord_messages_history(channel_url: str, limit: int) -> List[Dic
         
         channel_id = match.group(2)
         
-        # Створюємо новий session для цього запиту
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://discord.com/api/v9/channels/{channel_id}/messages?limit={limit}",
-                headers={
-                    'Authorization': DISCORD_AUTHORIZATION,
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    logger.error(f"Помилка отримання повідомлень: {response.status}")
-                    return []
+        # Спільна сесія event loop - з'єднання з discord.com перевикористовуються
+        session = http_client.async_session()
+        async with session.get(
+            f"https://discord.com/api/v9/channels/{channel_id}/messages?limit={limit}",
+            headers={
+                'Authorization': DISCORD_AUTHORIZATION,
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            }
+        ) as response:
+            if response.status == 200:
+                return json_codec.loads(await response.read())
+            else:
+                logger.error(f"Помилка отримання повідомлень: {response.status}")
+                return []
                 
     except Exception as e:
         logger.error(f"Помилка в get_discord_messages_history: {e}")
         return []
 
-def format_discord_history(messages: List[Dict], channel_name: str, count: int) -> str:
-    """Форматувати історію повідомлень Discord"""
-    from datetime import datetime
+# Ліміт Telegram 4096 символів, залишаємо запас під службові символи
+TELEGRAM_MESSAGE_LIMIT = 4000
+
+def _find_safe_split(text: str, limit: int) -> int:
+    """Знайти позицію розрізу до limit: по рядку, потім по пробілу, не всередині HTML сутності чи тега"""
+    cut = text.rfind('\n', 0, limit + 1)
+    if cut <= 0:
+        cut = text.rfind(' ', 0, limit + 1)
+    if cut <= 0:
+        cut = limit
+    # Не розрізаємо &amp; / &#123; та <b> посередині
+    amp = text.rfind('&', 0, cut)
+    if amp != -1 and text.find(';', amp, cut) == -1 and cut - amp <= 10:
+        cut = amp
+    lt = text.rfind('<', 0, cut)
+    if lt != -1 and text.find('>', lt, cut) == -1:
+        cut = lt
+    return cut if cut > 0 else limit
+
+def split_telegram_text(text: str, limit: int = TELEGRAM_MESSAGE_LIMIT) -> Iterator[str]:
+    """Розбити текст на частини для Telegram по межах рядків та HTML сутностей"""
+    while len(text) > limit:
+        cut = _find_safe_split(text, limit)
+        part = text[:cut].rstrip()
+        if part:
+            yield part
+        text = text[cut:].lstrip('\n ')
+    if text:
+        yield text
+
+def iter_telegram_chunks(blocks: Iterable[str], limit: int = TELEGRAM_MESSAGE_LIMIT) -> Iterator[str]:
+    """Пакувати блоки тексту в повідомлення Telegram, віддаючи кожне як тільки воно заповнене"""
+    buffer = ""
+    for block in blocks:
+        if not buffer:
+            block = block.lstrip('\n')
+        if len(buffer) + len(block) <= limit:
+            buffer += block
+            continue
+        if buffer:
+            yield buffer.rstrip()
+            block = block.lstrip('\n')
+        if len(block) <= limit:
+            buffer = block
+            continue
+        # Блок сам по собі задовгий - ріжемо його, хвіст залишаємо в буфері
+        parts = list(split_telegram_text(block, limit))
+        for part in parts[:-1]:
+            yield part
+        buffer = parts[-1] if parts else ""
+    if buffer.strip():
+        yield buffer.rstrip()
+
+def _format_discord_history_message(index: int, message: Dict) -> str:
+    """Форматувати одне повідомлення історії Discord (HTML)"""
+    author = message.get('author', {}).get('username', 'Unknown')
+    content = message.get('content', '')
+    timestamp = message.get('timestamp', '')
+    
+    # Форматуємо час
+    try:
+        if timestamp:
+            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            time_str = dt.strftime('%d.%m.%Y %H:%M')
+        else:
+            time_str = 'Unknown time'
+    except:
+        time_str = 'Unknown time'
     
-    header = f"📜 **Історія каналу: {channel_name}**\n"
-    header += f"📊 Останні {count} повідомлень:\n\n"
+    # Обмежуємо довжину повідомлення
+    if len(content) > 200:
+        content = content[:200] + "..."
     
-    if not messages:
-        return header + "❌ Повідомлення не знайдено."
+    formatted_msg = f"<b>{index}.</b> 👤 {escape_html(author)} | 🕒 {time_str}\n"
+    if content:
+        formatted_msg += f"💬 {escape_html(content)}\n"
+    formatted_msg += "─" * 30 + "\n"
+    return formatted_msg
+
+def _iter_discord_history_blocks(messages: Iterable[Dict], channel_name: str, count: int) -> Iterator[str]:
+    """Послідовно віддавати заголовок та відформатовані повідомлення історії"""
+    yield f"📜 <b>Історія каналу: {escape_html(channel_name)}</b>\n📊 Останні {count} повідомлень:\n\n"
     
-    formatted_messages = []
+    empty = True
     for i, message in enumerate(messages, 1):
-        author = message.get('author', {}).get('username', 'Unknown')
-        content = message.get('content', '')
-        timestamp = message.get('timestamp', '')
-        
-        # Форматуємо час
-        try:
-            if timestamp:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                time_str = dt.strftime('%d.%m.%Y %H:%M')
-            else:
-                time_str = 'Unknown time'
-        except:
-            time_str = 'Unknown time'
-        
-        # Обмежуємо довжину повідомлення
-        if len(content) > 200:
-            content = content[:200] + "..."
-        
-        formatted_msg = f"**{i}.** 👤 {author} | 🕒 {time_str}\n"
-        if content:
-            formatted_msg += f"💬 {content}\n"
-        formatted_msg += "─" * 30 + "\n"
-        
-        formatted_messages.append(formatted_msg)
+        block = _format_discord_history_message(i, message)
+        yield block if empty else "\n" + block
+        empty = False
     
-    return header + "\n".join(formatted_messages)
+    if empty:
+        yield "❌ Повідомлення не знайдено."
+
+def iter_discord_history_chunks(messages: Iterable[Dict], channel_name: str, count: int,
+                                limit: int = TELEGRAM_MESSAGE_LIMIT) -> Iterator[str]:
+    """Потоково форматувати історію Discord частинами, готовими до відправки в Telegram"""
+    return iter_telegram_chunks(_iter_discord_history_blocks(messages, channel_name, count), limit)
 
-def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
+@NOTIFICATION_HANDLER_SECONDS.time(platform='discord')
+def handle_discord_notifications_sync(new_messages: List[Union[DiscordEvent, Dict]]) -> None:
     """Обробник нових повідомлень Discord з підтримкою thread'ів та тегів"""
     global bot_instance
     
@@ -5887,7 +6476,8 @@ def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
         return
         
     try:
-        logger.info(f"📨 handle_discord_notifications_sync: отримано {len(new_messages)} Discord повідомлень для обробки")
+        NOTIFICATIONS_RECEIVED.inc(len(new_messages), platform='discord')
+        delivery_log.info("📨 handle_discord_notifications_sync: отримано %s Discord повідомлень для обробки", len(new_messages))
         
         # Кеші для оптимізації
         channel_to_tracked_data: Dict[str, List[Dict]] = {}
@@ -5896,19 +6486,21 @@ def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
         # Обробляємо кожне повідомлення МИТТЄВО
         for message in new_messages:
             try:
-                message_id = message.get('message_id', '')
-                channel_id = message.get('channel_id', '')
+                message = as_discord_event(message)
+                message_id = message.message_id
+                channel_id = message.channel_id
+                timing = freshness_tracker.start('discord', channel_id, message)
             
                 # Красиве форматування
-                author = escape_html(message['author'])
-                content = escape_html(message['content'])
+                author = escape_html(message.author)
+                content = escape_html(message.content)
                 
                 # Обрізаємо текст якщо він занадто довгий
                 if len(content) > 200:
                     content = content[:200] + "..."
                 
                 # Форматуємо дату
-                timestamp = message.get('timestamp', '')
+                timestamp = message.timestamp
                 formatted_date = "Не відомо"
                 time_ago = ""
                 
@@ -5926,18 +6518,18 @@ def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
                 guild_id = ""
                 try:
                     # Спробуємо витягти guild_id з URL
-                    url_parts = message['url'].split('/')
+                    url_parts = message.url.split('/')
                     if len(url_parts) >= 5:
                         guild_id = url_parts[4]
                         # Отримуємо назву сервера з проекту користувача
                         server_name = get_discord_server_name(channel_id, guild_id)
-                        logger.info(f"🏷️ Discord сервер для каналу {channel_id}: {server_name}")
+                        delivery_log.info("🏷️ Discord сервер для каналу %s: %s", channel_id, server_name)
                 except Exception as e:
                     logger.error(f"Помилка отримання назви сервера: {e}")
                     pass
                 
                 # Отримуємо зображення з повідомлення
-                images = message.get('images', [])
+                images = message.images
                 
                 # Отримуємо всіх користувачів та проекти, які відстежують цей Discord канал
                 if channel_id in channel_to_tracked_data:
@@ -5947,15 +6539,16 @@ def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
                     channel_to_tracked_data[channel_id] = tracked_data
 
                 # Додаємо детальне логування для діагностики
-                logger.info(f"🔍 Discord канал {channel_id}: знайдено {len(tracked_data)} проектів")
-                for item in tracked_data:
-                    logger.info(f"   📋 Проект: {item['project']['name']} (користувач: {item['user_id']})")
+                delivery_log.info("🔍 Discord канал %s: знайдено %s проектів", channel_id, len(tracked_data))
+                if delivery_logger.isEnabledFor(logging.DEBUG):
+                    for item in tracked_data:
+                        delivery_logger.debug("   📋 Проект: %s (користувач: %s)", item['project']['name'], item['user_id'])
 
                 if not tracked_data:
-                    logger.warning(f"🚫 Discord канал {channel_id}: немає проектів, що відстежують цей канал")
+                    delivery_log.warning("🚫 Discord канал %s: немає проектів, що відстежують цей канал", channel_id)
                     continue
                 
-                logger.info(f"✅ Обробляємо Discord повідомлення {message_id} для {len(tracked_data)} проектів")
+                delivery_log.info("✅ Обробляємо Discord повідомлення %s для %s проектів", message_id, len(tracked_data))
 
                 # Не дублювати відправку в одну гілку
                 sent_targets: Set[str] = set()
@@ -5974,10 +6567,10 @@ def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
                             forward_channel = project_manager.get_forward_channel(user_id)
                             user_to_forward_channel[user_id] = forward_channel
                         if not forward_channel:
-                            logger.warning(f"🚫 Користувач {user_id} не має налаштованого каналу для пересилання")
-                            logger.warning(f"💡 Підказка: налаштуйте канал пересилання командою /forward_set_channel")
+                            delivery_log.warning("🚫 Користувач %s не має налаштованого каналу для пересилання", user_id)
+                            delivery_log.warning("💡 Підказка: налаштуйте канал пересилання командою /forward_set_channel")
                             continue
-                        logger.info(f"✅ Користувач {user_id} має канал пересилання: {forward_channel}")
+                        delivery_log.info("✅ Користувач %s має канал пересилання: %s", user_id, forward_channel)
                         # Очищаємо канал від зайвих символів
                         clean_channel = forward_channel.split('/')[0] if '/' in forward_channel else forward_channel
                         # Перевіряємо чи використовуються thread'и
@@ -5988,21 +6581,21 @@ def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
                         if use_threads:
                             # Робота з thread'ами
                             thread_id = project_manager.get_project_thread(user_id, project_id)
-                            logger.info(f"🔍 Перевіряємо Discord thread для проекту {project_name}: thread_id = {thread_id}")
+                            delivery_logger.debug("🔍 Перевіряємо Discord thread для проекту %s: thread_id = %s", project_name, thread_id)
                             if not thread_id:
                                 # Створюємо новий thread
-                                logger.info(f"🔧 Створюємо новий Discord thread для проекту {project_name} в каналі {clean_channel}")
+                                delivery_log.info("🔧 Створюємо новий Discord thread для проекту %s в каналі %s", project_name, clean_channel)
                                 thread_id = create_project_thread_sync(BOT_TOKEN, clean_channel, project_name, project_tag, str(user_id))
                                 if thread_id:
                                     project_manager.set_project_thread(user_id, project_id, thread_id)
-                                    logger.info(f"✅ Створено Discord thread {thread_id} для проекту {project_name}")
+                                    delivery_log.info("✅ Створено Discord thread %s для проекту %s", thread_id, project_name)
                                 else:
-                                    logger.warning(f"⚠️ Не вдалося створити Discord thread для проекту {project_name}")
-                                    logger.info(f"🔄 Перемикаємося на режим відправки з тегами замість threads")
+                                    delivery_log.warning("⚠️ Не вдалося створити Discord thread для проекту %s", project_name)
+                                    delivery_log.info("🔄 Перемикаємося на режим відправки з тегами замість threads")
                                     # Перемикаємося на режим з тегами
                                     use_threads = False
                             else:
-                                logger.info(f"✅ Використовується існуючий Discord thread {thread_id} для проекту {project_name}")
+                                delivery_logger.debug("✅ Використовується існуючий Discord thread %s для проекту %s", thread_id, project_name)
                             # Унікальний ключ для thread'а
                             thread_key = f"{clean_channel}_{thread_id}"
                             if thread_key in sent_targets:
@@ -6017,7 +6610,7 @@ def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
                             # Формуємо гіперпосилання на власника проекту
                             user_mention = f'<a href="tg://user?id={user_id}">Користувач</a>'
                             # Формуємо правильний Discord url
-                            discord_url = message.get('url')
+                            discord_url = message.url
                             # Якщо url не містить server_id, будуємо вручну
                             if discord_url and '/channels/' in discord_url:
                                 url_parts = discord_url.split('/')
@@ -6028,11 +6621,11 @@ def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
                                 else:
                                     server_id = guild_id or ''
                                     channel_id = channel_id
-                                    message_id = message.get('message_id', '')
+                                    message_id = message.message_id
                                 discord_url = f"https://discord.com/channels/{server_id}/{channel_id}/{message_id}"
                             else:
                                 # fallback: будуємо з guild_id, channel_id, message_id
-                                discord_url = f"https://discord.com/channels/{guild_id}/{channel_id}/{message.get('message_id','')}"
+                                discord_url = f"https://discord.com/channels/{guild_id}/{channel_id}/{message.message_id}"
                             # Формуємо повідомлення у стилі Twitter + пінги
                             forward_text = (
                                 f"💬 <b>Нове повідомлення з Discord</b>\n"
@@ -6049,11 +6642,13 @@ def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
                             )
                             if images:
                                 forward_text += f"\n📷 Зображень: {len(images)}"
-                            logger.info(f"📤 Відправляємо Discord повідомлення в thread {thread_id} для проекту {project_name} в канал {clean_channel}")
+                            timing.mark_rendered()
+                            delivery_log.info("📤 Відправляємо Discord повідомлення в thread %s для проекту %s в канал %s", thread_id, project_name, clean_channel)
                             # Відправляємо повідомлення в thread
                             success = send_message_to_thread_sync(BOT_TOKEN, clean_channel, thread_id, forward_text, project_tag)
-                            logger.info(f"📊 Результат відправки Discord повідомлення в thread {thread_id}: success = {success}")
+                            delivery_log.info("📊 Результат відправки Discord повідомлення в thread %s: success = %s", thread_id, success)
                             if success:
+                                timing.mark_delivered()
                                 # Відправляємо зображення в thread якщо є
                                 if images:
                                     for i, image_url in enumerate(images[:5]):  # Максимум 5 зображень
@@ -6066,7 +6661,7 @@ def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
                                             logger.error(f"Помилка відправки Discord зображення в thread: {e}")
                                 project_manager.add_sent_message(forward_key, clean_channel, user_id)
                                 sent_targets.add(thread_key)
-                                logger.info(f"✅ Переслано в thread {thread_id} проекту {project_name}")
+                                delivery_log.info("✅ Переслано в thread %s проекту %s", thread_id, project_name)
                             else:
                                 logger.error(f"❌ Помилка відправки в thread {thread_id}")
                         else:
@@ -6086,19 +6681,21 @@ def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
                                 f"• Автор: {author} | {user_mention}\n"
                                 f"• Дата: {formatted_date} ({time_ago})\n"
                                 f"• Текст: {content}\n"
-                                f'🔗 {message["url"]}'
+                                f'🔗 {message.url}'
                             )
                             if images:
                                 forward_text += f"\n📷 Зображень: {len(images)}"
-                            logger.info(f"📤 Відправляємо Discord повідомлення з тегом {project_tag} в канал {clean_channel}")
-                            url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
+                            timing.mark_rendered()
+                            delivery_log.info("📤 Відправляємо Discord повідомлення з тегом %s в канал %s", project_tag, clean_channel)
+                            url = f"{TELEGRAM_API_BASE}/bot{BOT_TOKEN}/sendMessage"
                             data = {
                                 'chat_id': normalize_chat_id(clean_channel),
                                 'text': forward_text,
                                 'parse_mode': 'HTML',
                             }
-                            response = requests.post(url, data=data, timeout=3)
+                            response = telegram_post(url, data=data, timeout=3)
                             if response.status_code == 200:
+                                timing.mark_delivered()
                                 # Відправляємо зображення з тегом якщо є
                                 if images:
                                     for i, image_url in enumerate(images[:5]):
@@ -6111,7 +6708,7 @@ def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
                                             logger.error(f"Помилка відправки Discord зображення: {e}")
                                 project_manager.add_sent_message(forward_key, clean_channel, user_id)
                                 sent_targets.add(target_key)
-                                logger.info(f"✅ Переслано в канал {clean_channel} з тегом {project_tag}")
+                                delivery_log.info("✅ Переслано в канал %s з тегом %s", clean_channel, project_tag)
                             else:
                                 logger.error(f"❌ Помилка відправки в канал {clean_channel}: {response.status_code}")
                     except Exception as e:
@@ -6123,7 +6720,8 @@ def handle_discord_notifications_sync(new_messages: List[Dict]) -> None:
     except Exception as e:
         logger.error(f"Помилка обробки Discord сповіщень: {e}")
 
-def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
+@NOTIFICATION_HANDLER_SECONDS.time(platform='twitter')
+def handle_twitter_notifications_sync(new_tweets: List[Union[TweetEvent, Dict]]) -> None:
     """Обробник нових твітів Twitter (оптимізована версія)"""
     global bot_instance, global_sent_tweets
     
@@ -6132,40 +6730,43 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
         
     try:
         # Швидка обробка твітів
-        logger.info(f"📨 handle_twitter_notifications_sync: отримано {len(new_tweets)} твітів для обробки")
+        NOTIFICATIONS_RECEIVED.inc(len(new_tweets), platform='twitter')
+        delivery_log.info("📨 handle_twitter_notifications_sync: отримано %s твітів для обробки", len(new_tweets))
         for tweet in new_tweets:
-            tweet_id = tweet.get('tweet_id', '')
-            account = tweet.get('account', '')
-            logger.info(f"🔍 Обробляємо твіт {tweet_id} від {account}")
+            tweet = as_tweet_event(tweet)
+            tweet_id = tweet.tweet_id
+            account = tweet.account
+            timing = freshness_tracker.start('twitter', account, tweet)
+            delivery_log.info("🔍 Обробляємо твіт %s від %s", tweet_id, account)
             
             # Отримуємо всіх користувачів та проекти, які відстежують цей Twitter акаунт
             tracked_data = get_users_tracking_twitter(account)
             
             # ВАЖЛИВО: Якщо немає проектів які відстежують цей акаунт - пропускаємо твіт
             if not tracked_data:
-                logger.warning(f"🚫 Твіт від {account} пропущено - акаунт не додано до жодного проекту")
+                delivery_log.warning("🚫 Твіт від %s пропущено - акаунт не додано до жодного проекту", account)
                 continue
             
-            logger.info(f"✅ Знайдено {len(tracked_data)} проектів для акаунта {account}")
+            delivery_log.info("✅ Знайдено %s проектів для акаунта %s", len(tracked_data), account)
             
             # Фільтруємо тільки користувачів з налаштованим пересиланням
             users_with_forwarding: List[Dict] = []
             for tracked_item in tracked_data:
                 user_id = tracked_item['user_id']
                 forward_channel = project_manager.get_forward_channel(user_id)
-                logger.info(f"🔍 Перевіряємо користувача {user_id}: forward_channel = {forward_channel}")
+                delivery_logger.debug("🔍 Перевіряємо користувача %s: forward_channel = %s", user_id, forward_channel)
                 if forward_channel:
                     users_with_forwarding.append(tracked_item)
-                    logger.info(f"✅ Користувач {user_id} має налаштоване пересилання в канал {forward_channel}")
+                    delivery_logger.debug("✅ Користувач %s має налаштоване пересилання в канал %s", user_id, forward_channel)
                 else:
-                    logger.warning(f"⚠️ Користувач {user_id} не має налаштованого каналу пересилання")
+                    delivery_log.warning("⚠️ Користувач %s не має налаштованого каналу пересилання", user_id)
             
             if not users_with_forwarding:
-                logger.warning(f"🚫 Твіт від {account} пропущено - немає користувачів з налаштованим пересиланням")
-                logger.warning(f"💡 Підказка: налаштуйте канал пересилання командою /forward_set_channel або через меню бота")
+                delivery_log.warning("🚫 Твіт від %s пропущено - немає користувачів з налаштованим пересиланням", account)
+                delivery_log.warning("💡 Підказка: налаштуйте канал пересилання командою /forward_set_channel або через меню бота")
                 continue
             
-            logger.info(f"✅ Знайдено {len(users_with_forwarding)} користувачів з налаштованим пересиланням для акаунта {account}")
+            delivery_log.info("✅ Знайдено %s користувачів з налаштованим пересиланням для акаунта %s", len(users_with_forwarding), account)
 
             # Глобальна перевірка дублікатів
             if account not in global_sent_tweets:
@@ -6173,13 +6774,13 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
             
             # Перевіряємо чи цей твіт вже був відправлений глобально
             if tweet_id in global_sent_tweets[account]:
-                logger.info(f"Твіт {tweet_id} для {account} вже був відправлений, пропускаємо")
+                delivery_log.info("Твіт %s для %s вже був відправлений, пропускаємо", tweet_id, account)
                 continue
             
             # Додаткова перевірка за контентом (для випадків коли ID може змінюватися)
-            tweet_text = tweet.get('text', '').strip()
-            # Спочатку перевіряємо чи є готовий content_key з Twitter Monitor Adapter
-            content_key = tweet.get('content_key')
+            tweet_text = tweet.text.strip()
+            # Спочатку перевіряємо чи є готовий content_key від монітора
+            content_key = tweet.content_key
             if not content_key and tweet_text:
                 # Створюємо хеш контенту для додаткової перевірки
                 import hashlib
@@ -6187,7 +6788,7 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
                 content_key = f"content_{content_hash}"
                 
             if content_key and content_key in global_sent_tweets[account]:
-                logger.info(f"Контент твіта для {account} вже був відправлений, пропускаємо")
+                delivery_log.info("Контент твіта для %s вже був відправлений, пропускаємо", account)
                 continue
             
             # ВАЖЛИВО: НЕ додаємо твіт до відправлених ТУТ - тільки після успішної відправки!
@@ -6197,15 +6798,15 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
             time.sleep(10)  # Збільшено для уникнення rate limit
             
             # Красиве форматування
-            author = escape_html(tweet.get('author', 'Unknown'))
-            text = escape_html(tweet.get('text', ''))
+            author = escape_html(tweet.author or 'Unknown')
+            text = escape_html(tweet.text)
             
             # Обрізаємо текст якщо він занадто довгий
             if len(text) > 200:
                 text = text[:200] + "..."
             
             # Форматуємо дату
-            timestamp = tweet.get('timestamp', '')
+            timestamp = tweet.timestamp
             formatted_date = "Не відомо"
             time_ago = ""
             
@@ -6219,7 +6820,7 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
                     formatted_date = timestamp[:19] if len(timestamp) > 19 else timestamp
             
             # Отримуємо зображення з твіта
-            images = tweet.get('images', [])
+            images = tweet.images
             
             # --- Додаємо пінги ---
             ping_users = project_manager.get_project_ping_users(user_id, project_id) if 'project_id' in locals() else []
@@ -6234,11 +6835,12 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
             forward_text += (
                 f"• Дата: {formatted_date} ({time_ago})\n"
                 f"• Текст: {text}\n"
-                f'🔗 {tweet.get("url", "")}'
+                f'🔗 {tweet.url}'
             )
             # Додаємо інформацію про зображення якщо є
             if images:
                 forward_text += f"\n📷 Зображень: {len(images)}"
+            timing.mark_rendered()
             
             # Не дублювати відправку в одну гілку
             sent_targets: Set[str] = set()
@@ -6278,23 +6880,23 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
                         if use_threads:
                             # Робота з thread'ами
                             thread_id = project_manager.get_project_thread(user_id, project_id)
-                            logger.info(f"🔍 Перевіряємо thread для проекту {project_name}: thread_id = {thread_id}")
+                            delivery_logger.debug("🔍 Перевіряємо thread для проекту %s: thread_id = %s", project_name, thread_id)
                             
                             if not thread_id:
                                 # Створюємо новий thread
-                                logger.info(f"🔧 Створюємо новий thread для проекту {project_name} в каналі {clean_channel}")
+                                delivery_log.info("🔧 Створюємо новий thread для проекту %s в каналі %s", project_name, clean_channel)
                                 thread_id = create_project_thread_sync(BOT_TOKEN, clean_channel, project_name, project_tag, str(user_id))
                                 
                                 if thread_id:
                                     project_manager.set_project_thread(user_id, project_id, thread_id)
-                                    logger.info(f"✅ Створено thread {thread_id} для проекту {project_name}")
+                                    delivery_log.info("✅ Створено thread %s для проекту %s", thread_id, project_name)
                                 else:
-                                    logger.warning(f"⚠️ Не вдалося створити thread для проекту {project_name} в каналі {clean_channel}")
-                                    logger.info(f"🔄 Перемикаємося на режим відправки з тегами замість threads")
+                                    delivery_log.warning("⚠️ Не вдалося створити thread для проекту %s в каналі %s", project_name, clean_channel)
+                                    delivery_log.info("🔄 Перемикаємося на режим відправки з тегами замість threads")
                                     # Перемикаємося на режим з тегами
                                     use_threads = False
                             else:
-                                logger.info(f"✅ Використовується існуючий thread {thread_id} для проекту {project_name}")
+                                delivery_logger.debug("✅ Використовується існуючий thread %s для проекту %s", thread_id, project_name)
                             
                             # Унікальний ключ для thread'а
                             thread_key = f"{clean_channel}_{thread_id}"
@@ -6319,29 +6921,30 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
                             thread_forward_text += (
                                 f"• Дата: {formatted_date} ({time_ago})\n"
                                 f"• Текст: {text}\n"
-                                f'🔗 {tweet.get("url", "")}'
+                                f'🔗 {tweet.url}'
                             )
                             if images:
                                 thread_forward_text += f"\n📷 Зображень: {len(images)}"
                             
-                            logger.info(f"📤 Відправляємо Twitter твіт в thread {thread_id} для проекту {project_name} в канал {clean_channel}")
+                            delivery_log.info("📤 Відправляємо Twitter твіт в thread %s для проекту %s в канал %s", thread_id, project_name, clean_channel)
                             
                             # Відправляємо повідомлення з фотографіями в одному повідомленні
                             if images:
-                                logger.info(f"📷 Знайдено {len(images)} зображень, відправляємо в одному повідомленні")
+                                delivery_log.info("📷 Знайдено %s зображень, відправляємо в одному повідомленні", len(images))
                                 success = send_message_with_photos_to_thread_sync(BOT_TOKEN, clean_channel, thread_id, thread_forward_text, images, project_tag)
                             else:
                                 # Якщо немає зображень, відправляємо звичайне повідомлення
-                                logger.info(f"📝 Відправляємо текстове повідомлення в thread {thread_id}")
+                                delivery_log.info("📝 Відправляємо текстове повідомлення в thread %s", thread_id)
                                 success = send_message_to_thread_sync(BOT_TOKEN, clean_channel, thread_id, thread_forward_text, project_tag)
                             
-                            logger.info(f"📊 Результат відправки в thread {thread_id}: success = {success}")
+                            delivery_log.info("📊 Результат відправки в thread %s: success = %s", thread_id, success)
                             
                             if success:
+                                timing.mark_delivered()
                                 project_manager.add_sent_message(forward_key, clean_channel, user_id)
                                 sent_targets.add(thread_key)
                                 tweet_successfully_sent = True
-                                logger.info(f"✅ Переслано Twitter твіт in thread {thread_id} проекту {project_name}")
+                                delivery_log.info("✅ Переслано Twitter твіт in thread %s проекту %s", thread_id, project_name)
                             else:
                                 logger.error(f"❌ Помилка відправки Twitter твіта в thread {thread_id}")
                         else:
@@ -6368,32 +6971,33 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
                             tagged_forward_text += (
                                 f"• Дата: {formatted_date} ({time_ago})\n"
                                 f"• Текст: {text}\n"
-                                f"🔗 {tweet.get('url', '')}"
+                                f"🔗 {tweet.url}"
                             )
                             if images:
                                 tagged_forward_text += f"\n📷 Зображень: {len(images)}"
                             
-                            logger.info(f"📤 Відправляємо Twitter твіт з тегом {project_tag} в канал {clean_channel}")
+                            delivery_log.info("📤 Відправляємо Twitter твіт з тегом %s в канал %s", project_tag, clean_channel)
                             
-                            url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
+                            url = f"{TELEGRAM_API_BASE}/bot{BOT_TOKEN}/sendMessage"
                             data = {
                                 'chat_id': normalize_chat_id(clean_channel),
                                 'text': tagged_forward_text,
                             }
-                            response = requests.post(url, data=data, timeout=3)
+                            response = telegram_post(url, data=data, timeout=3)
                             
                             if response.status_code == 200:
+                                timing.mark_delivered()
                                 # Відправляємо зображення з тегом якщо є
                                 if images:
-                                    logger.info(f"📷 Знайдено {len(images)} зображень для відправки в канал {clean_channel}")
+                                    delivery_log.info("📷 Знайдено %s зображень для відправки в канал %s", len(images), clean_channel)
                                     for i, image_url in enumerate(images[:5]):
                                         try:
                                             image_caption = f"{project_tag} 📷 Twitter зображення {i+1}/{len(images)}" if len(images) > 1 else f"{project_tag} 📷 Twitter зображення"
                                             success = download_and_send_image(image_url, clean_channel, image_caption)
                                             if success:
-                                                logger.info(f"✅ Зображення {i+1} успішно відправлено з тегом {project_tag}")
+                                                delivery_log.info("✅ Зображення %s успішно відправлено з тегом %s", i+1, project_tag)
                                             else:
-                                                logger.warning(f"⚠️ Не вдалося відправити зображення {i+1}")
+                                                delivery_log.warning("⚠️ Не вдалося відправити зображення %s", i+1)
                                             import time
                                             time.sleep(0.5)  # Зменшено затримку
                                         except Exception as e:
@@ -6402,7 +7006,7 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
                                 project_manager.add_sent_message(forward_key, clean_channel, user_id)
                                 sent_targets.add(target_key)
                                 tweet_successfully_sent = True
-                                logger.info(f"✅ Переслано Twitter твіт в канал {clean_channel} з тегом {project_tag}")
+                                delivery_log.info("✅ Переслано Twitter твіт в канал %s з тегом %s", clean_channel, project_tag)
                             else:
                                 logger.error(f"❌ Помилка відправки Twitter твіта в канал {clean_channel}: {response.status_code}")
                     
@@ -6419,14 +7023,14 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
                 global_sent_tweets[account].add(tweet_id)
                 if content_key:
                     global_sent_tweets[account].add(content_key)
-                logger.info(f"📝 Твіт {tweet_id} додано до списку відправлених для акаунта {account}")
+                delivery_log.info("📝 Твіт %s додано до списку відправлених для акаунта %s", tweet_id, account)
                 
                 # Також додаємо до Twitter Monitor Adapter якщо він використовується
                 global twitter_monitor_adapter, twitter_monitor
                 if twitter_monitor_adapter:
                     try:
                         twitter_monitor_adapter.mark_tweet_as_sent(account, tweet_id, content_key)
-                        logger.debug(f"Твіт {tweet_id} відмічено як відправлений в Twitter Monitor Adapter")
+                        delivery_logger.debug("Твіт %s відмічено як відправлений в Twitter Monitor Adapter", tweet_id)
                     except Exception as e:
                         logger.error(f"Помилка відмітки твіта в Twitter Monitor Adapter: {e}")
                 
@@ -6435,7 +7039,7 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
                     try:
                         twitter_monitor.mark_tweet_as_sent(account, tweet_id, content_key)
                         twitter_monitor.save_seen_tweets()  # Зберігаємо зміни
-                        logger.debug(f"Твіт {tweet_id} відмічено як відправлений в Twitter Monitor")
+                        delivery_logger.debug("Твіт %s відмічено як відправлений в Twitter Monitor", tweet_id)
                     except Exception as e:
                         logger.error(f"Помилка відмітки твіта в Twitter Monitor: {e}")
                 
@@ -6443,7 +7047,7 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
                 if twitter_monitor_adapter:
                     try:
                         twitter_monitor_adapter.save_seen_tweets()
-                        logger.debug(f"Збережено зміни в Twitter Monitor Adapter")
+                        delivery_logger.debug("Збережено зміни в Twitter Monitor Adapter")
                     except Exception as e:
                         logger.error(f"Помилка збереження в Twitter Monitor Adapter: {e}")
                 
@@ -6451,7 +7055,7 @@ def handle_twitter_notifications_sync(new_tweets: List[Dict]) -> None:
                 if len(global_sent_tweets[account]) % 50 == 0:  # Кожні 50 твітів
                     cleanup_old_tweets()
             else:
-                logger.warning(f"⚠️ Твіт {tweet_id} НЕ додано до списку відправлених - жодна відправка не була успішною")
+                delivery_log.warning("⚠️ Твіт %s НЕ додано до списку відправлених - жодна відправка не була успішною", tweet_id)
                     
     except Exception as e:
         logger.error(f"Помилка обробки Twitter сповіщень: {e}")
@@ -6488,7 +7092,7 @@ async def start_twitter_monitoring():
     """Запустити моніторинг Twitter з покращеним HTML парсингом"""
     global twitter_monitor
     
-    if not twitter_monitor or not TWITTER_AUTH_TOKEN:
+    if not twitter_monitor or not twitter_monitor.auth_token:
         logger.warning("Twitter auth_token не налаштовано")
         return
         
@@ -6516,24 +7120,14 @@ async def start_twitter_monitoring():
                         # Обробляємо кожен твіт ОДРАЗУ після знаходження
                         for tweet in new_tweets:
                             try:
-                                # Конвертуємо формат для сумісності з існуючим кодом
-                                formatted_tweet = {
-                                    'tweet_id': tweet.get('id', ''),
-                                    'account': tweet.get('user', {}).get('screen_name', ''),
-                                    'author': tweet.get('user', {}).get('name', ''),
-                                    'text': tweet.get('text', ''),
-                                    'url': tweet.get('url', ''),
-                                    'timestamp': tweet.get('created_at', '')
-                                }
-                                
                                 # МИТТЄВО відправляємо кожен твіт (масив з 1 елементом)
-                                handle_twitter_notifications_sync([formatted_tweet])
+                                handle_twitter_notifications_sync([tweet])
                                 
                                 # Невелика затримка між твітами для уникнення rate limit
                                 await asyncio.sleep(0.5)
                                 
                             except Exception as e:
-                                logger.error(f"Помилка обробки твіта {tweet.get('id', 'unknown')}: {e}")
+                                logger.error(f"Помилка обробки твіта {tweet.tweet_id}: {e}")
                         
                         logger.info(f"Twitter API: миттєво оброблено {len(new_tweets)} нових твітів")
                     
@@ -6575,26 +7169,14 @@ async def start_twitter_monitor_adapter():
                     # Обробляємо кожен твіт ОДРАЗУ після знаходження
                     for tweet in new_tweets:
                         try:
-                            # Конвертуємо формат для сумісності з існуючим кодом
-                            formatted_tweet = {
-                                'tweet_id': tweet.get('id', ''),
-                                'account': tweet.get('user', {}).get('screen_name', ''),
-                                'author': tweet.get('user', {}).get('name', ''),
-                                'text': tweet.get('text', ''),
-                                'url': tweet.get('url', ''),
-                                'timestamp': tweet.get('created_at', ''),
-                                'images': tweet.get('images', []),  # Додаємо зображення!
-                                'content_key': tweet.get('content_key')  # Додаємо content_key якщо є
-                            }
-                            
                             # МИТТЄВО відправляємо кожен твіт (масив з 1 елементом)
-                            handle_twitter_notifications_sync([formatted_tweet])
+                            handle_twitter_notifications_sync([tweet])
                             
                             # Невелика затримка між твітами для уникнення rate limit
                             await asyncio.sleep(0.5)
                             
                         except Exception as e:
-                            logger.error(f"Помилка обробки твіта {tweet.get('id', 'unknown')}: {e}")
+                            logger.error(f"Помилка обробки твіта {tweet.tweet_id}: {e}")
                     
                     logger.info(f"Twitter Monitor Adapter: миттєво оброблено {len(new_tweets)} нових твітів")
                 
@@ -6618,7 +7200,7 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> N
 async def check_sessions(context: ContextTypes.DEFAULT_TYPE) -> None:
     """Перевірити закінчені сесії"""
     try:
-        security_manager.check_expired_sessions(context.bot)
+        await security_manager.check_expired_sessions(context.bot)
     except Exception as e:
         logger.error(f"Помилка перевірки сесій: {e}")
 
@@ -6636,6 +7218,13 @@ async def cleanup_access_sessions(context: ContextTypes.DEFAULT_TYPE) -> None:
     except Exception as e:
         logger.error(f"Помилка очищення сесій доступу: {e}")
 
+async def flush_access_data(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Записати відкладені зміни даних доступу на диск"""
+    try:
+        access_manager.flush()
+    except Exception as e:
+        logger.error(f"Помилка збереження даних доступу: {e}")
+
 def _get_time_ago(dt: datetime) -> str:
     """Отримати час тому"""
     try:
@@ -6764,9 +7353,6 @@ async def remove_twitter_command(update: Update, context: ContextTypes.DEFAULT_T
     
     # Видаляємо проект
     if project_manager.remove_project(user_id, project_to_remove['id']):
-        # Синхронізуємо монітори після видалення
-        sync_monitors_with_projects()
-        
         await update.message.reply_text(f"✅ Twitter акаунт @{username} видалено з моніторингу.")
         
         # Також видаляємо з активних моніторів
@@ -6782,8 +7368,8 @@ async def remove_twitter_command(update: Update, context: ContextTypes.DEFAULT_T
                 twitter_monitor.remove_account(username)
         except Exception:
             pass
-        # Після змін — синхронізуємо стан усіх моніторів
-        sync_monitors_with_projects()
+        # Монітори змінено напряму - перевіряємо узгодженість з індексом підписок
+        check_monitor_consistency()
     else:
         await update.message.reply_text(f"❌ Помилка видалення Twitter акаунта @{username}.")
 
@@ -6803,21 +7389,18 @@ async def twitter_add_command(update: Update, context: ContextTypes.DEFAULT_TYPE
     username = context.args[0].replace('@', '').strip()
     
     # Перевіряємо чи акаунт не заборонений
-    if username.lower() in ['twitter', 'x', 'elonmusk']:
+    if is_forbidden_twitter_account(username):
         await update.message.reply_text("❌ Заборонено моніторинг офіційного Twitter акаунта!")
         return
     
     global twitter_monitor_adapter
     
     if not twitter_monitor_adapter:
-        twitter_monitor_adapter = TwitterMonitorAdapter()
+        twitter_monitor_adapter = create_twitter_monitor_adapter()
     
     # Додаємо в базу даних (використовуємо ту ж функцію що і для Selenium)
     project_manager.add_selenium_account(username)
     
-    # Синхронізуємо монітори після додавання
-    sync_monitors_with_projects()
-    
     # Додаємо акаунт в поточний монітор
     if twitter_monitor_adapter.add_account(username):
         await update.message.reply_text(
@@ -6845,7 +7428,7 @@ async def twitter_test_command(update: Update, context: ContextTypes.DEFAULT_TYP
     global twitter_monitor_adapter
     
     if not twitter_monitor_adapter:
-        twitter_monitor_adapter = TwitterMonitorAdapter()
+        twitter_monitor_adapter = create_twitter_monitor_adapter()
     
     await update.message.reply_text(f"🔍 Тестування Twitter Monitor Adapter моніторингу для @{username}...")
     
@@ -6879,7 +7462,7 @@ async def twitter_start_command(update: Update, context: ContextTypes.DEFAULT_TY
     global twitter_monitor_adapter
     
     if not twitter_monitor_adapter:
-        twitter_monitor_adapter = TwitterMonitorAdapter()
+        twitter_monitor_adapter = create_twitter_monitor_adapter()
     
     if not twitter_monitor_adapter.monitoring_accounts:
         await update.message.reply_text("❌ Немає акаунтів для моніторингу! Додайте Twitter акаунти спочатку.")
@@ -6932,9 +7515,6 @@ async def twitter_remove_command(update: Update, context: ContextTypes.DEFAULT_T
     
     # Видаляємо з бази даних
     if project_manager.remove_selenium_account(username):
-        # Синхронізуємо монітори після видалення
-        sync_monitors_with_projects()
-        
         # Видаляємо з поточного монітора
         if twitter_monitor_adapter and username in twitter_monitor_adapter.monitoring_accounts:
             twitter_monitor_adapter.monitoring_accounts.discard(username)
@@ -6959,15 +7539,14 @@ async def test_tweet_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     user_id = update.effective_user.id
     
     # Створюємо тестовий твіт
-    test_tweet = {
-        'tweet_id': 'test_' + str(int(time.time())),
-        'account': 'irys_xyz',
-        'author': 'Irys',
-        'text': 'Це тестовий твіт для перевірки системи пересилання',
-        'url': 'https://x.com/irys_xyz/status/test',
-        'timestamp': datetime.now().isoformat(),
-        'images': []
-    }
+    test_tweet = TweetEvent(
+        tweet_id='test_' + str(int(time.time())),
+        account='irys_xyz',
+        author='Irys',
+        text='Це тестовий твіт для перевірки системи пересилання',
+        url='https://x.com/irys_xyz/status/test',
+        timestamp=datetime.now().isoformat()
+    )
     
     try:
         # Відправляємо тестовий твіт
@@ -6986,15 +7565,14 @@ async def test_discord_command(update: Update, context: ContextTypes.DEFAULT_TYP
     user_id = update.effective_user.id
     
     # Створюємо тестове Discord повідомлення
-    test_message = {
-        'message_id': 'test_' + str(int(time.time())),
-        'channel_id': '1413243132467871839',  # Канал з проекту
-        'author': 'Test User',
-        'content': 'Це тестове повідомлення для перевірки системи Discord пересилання',
-        'url': 'https://discord.com/channels/1408570777275469866/1413243132467871839/test',
-        'timestamp': datetime.now().isoformat(),
-        'images': []
-    }
+    test_message = DiscordEvent(
+        message_id='test_' + str(int(time.time())),
+        channel_id='1413243132467871839',  # Канал з проекту
+        author='Test User',
+        content='Це тестове повідомлення для перевірки системи Discord пересилання',
+        url='https://discord.com/channels/1408570777275469866/1413243132467871839/test',
+        timestamp=datetime.now().isoformat()
+    )
     
     try:
         # Відправляємо тестове Discord повідомлення
@@ -7068,9 +7646,6 @@ async def remove_discord_command(update: Update, context: ContextTypes.DEFAULT_T
     
     # Видаляємо проект
     if project_manager.remove_project(user_id, project_to_remove['id']):
-        # Синхронізуємо монітори після видалення
-        sync_monitors_with_projects()
-        
         await update.message.reply_text(f"✅ Discord канал {channel_id} видалено з моніторингу.")
         
         # Також видаляємо з Discord монітора якщо він активний
@@ -7080,8 +7655,8 @@ async def remove_discord_command(update: Update, context: ContextTypes.DEFAULT_T
             if channel_id in discord_monitor.last_message_ids:
                 del discord_monitor.last_message_ids[channel_id]
             await update.message.reply_text(f"✅ Канал {channel_id} також видалено з Discord моніторингу.")
-        # Після змін — синхронізуємо стан
-        sync_monitors_with_projects()
+        # Монітори змінено напряму - перевіряємо узгодженість з індексом підписок
+        check_monitor_consistency()
     else:
         await update.message.reply_text(f"❌ Помилка видалення Discord каналу {channel_id}.")
 
@@ -7308,6 +7883,60 @@ async def reset_seen_tweets_command(update: Update, context: ContextTypes.DEFAUL
             f"❌ **Помилка очищення seen_tweets**\n\n{str(e)}",
         )
 
+def log_monitoring_state() -> None:
+    """Показати поточний стан моніторингу"""
+    try:
+        twitter_accounts = len(getattr(twitter_monitor, 'monitoring_accounts', set())) if twitter_monitor else 0
+        twitter_adapter_accounts = len(getattr(twitter_monitor_adapter, 'monitoring_accounts', set())) if twitter_monitor_adapter else 0
+        discord_channels = len(getattr(discord_monitor, 'channels', [])) if discord_monitor else 0
+        
+        logger.info("📈 Поточний стан моніторингу:")
+        logger.info(f"   🐦 Twitter API: {twitter_accounts} акаунтів")
+        logger.info(f"   🚀 Twitter Monitor Adapter: {twitter_adapter_accounts} акаунтів") 
+        logger.info(f"   💬 Discord: {discord_channels} каналів")
+        
+        total_monitoring = twitter_accounts + twitter_adapter_accounts + discord_channels
+        if total_monitoring > 0:
+            logger.info(f"✅ Всього активних моніторів: {total_monitoring}")
+            logger.info("🎯 Бот готовий до роботи та автоматично моніторить всі налаштовані проекти!")
+        else:
+            logger.info("ℹ️ Монітори готові, очікуємо додавання проектів")
+    except Exception as e:
+        logger.error(f"Помилка отримання стану моніторингу: {e}")
+
+_monitors_startup_task: Optional[asyncio.Task] = None
+
+async def start_monitors_in_background() -> None:
+    """Фоновий етап запуску: імпорт бекендів, створення моніторів та синхронізація з проектами"""
+    started = time.perf_counter()
+    try:
+        # Імпорт twscrape/aiohttp та читання seen_tweets - поза event loop
+        await asyncio.to_thread(init_platform_backends)
+        
+        # Зміни проектів надходять подіями; підписуємось до повної синхронізації,
+        # щоб не пропустити зміни, зроблені поки монітори піднімались
+        project_manager.add_listener(on_project_event)
+        logger.info("🔄 Синхронізуємо монітори з існуючими проектами...")
+        sync_monitors_with_projects()
+        log_monitoring_state()
+    except Exception as e:
+        logger.error(f"Помилка фонового запуску моніторів: {e}")
+    finally:
+        now = time.perf_counter()
+        STARTUP_SECONDS.set(now - started, stage='monitors')
+        STARTUP_SECONDS.set(now - _startup_started, stage='total')
+        logger.info(
+            f"⏱️ Запуск: polling через {STARTUP_SECONDS.get(stage='polling'):.2f}с, "
+            f"монітори через {now - _startup_started:.2f}с від старту процесу"
+        )
+
+async def _on_startup(application: Application) -> None:
+    """post_init: бот одразу починає приймати оновлення, монітори стартують у фоні"""
+    global _monitors_startup_task
+    STARTUP_SECONDS.set(time.perf_counter() - _startup_started, stage='polling')
+    # Посилання на задачу тримаємо, щоб її не зібрав GC до завершення
+    _monitors_startup_task = asyncio.get_running_loop().create_task(start_monitors_in_background())
+
 def main() -> None:
     """Головна функція"""
     global bot_instance
@@ -7320,7 +7949,7 @@ def main() -> None:
         logger.warning("AUTHORIZATION токен не встановлено! Discord моніторинг буде відключено")
     
     # Створюємо додаток
-    application = Application.builder().token(BOT_TOKEN).build()
+    application = Application.builder().token(BOT_TOKEN).post_init(_on_startup).build()
     bot_instance = application.bot
     
     # Додаємо обробники
@@ -7371,16 +8000,26 @@ def main() -> None:
     # Додаємо періодичну перевірку сесій (кожну хвилину)
     job_queue = application.job_queue
     if job_queue:
-        job_queue.run_repeating(check_sessions, interval=300, first=300)  # Кожні 5 хвилин
+        job_queue.run_repeating(check_sessions, interval=60, first=60)  # Щохвилини (черга закінчення - O(expired))
         
         # Додаємо періодичне очищення старих повідомлень (кожні 2 години)
         job_queue.run_repeating(cleanup_old_messages, interval=7200, first=7200)
         
         # Додаємо періодичне очищення сесій доступу (кожні 30 хвилин)
         job_queue.run_repeating(cleanup_access_sessions, interval=1800, first=1800)  # Кожні 30 хвилин
+        
+        # Додаємо періодичне збереження даних доступу (зміни накопичуються в пам'яті)
+        job_queue.run_repeating(flush_access_data, interval=10, first=10)
     
-        # Додаємо періодичну синхронізацію моніторів (кожні 5 хвилин)
-        job_queue.run_repeating(lambda context: sync_monitors_with_projects(), interval=300, first=300)  # Кожні 5 хвилин
+        # Періодична перевірка узгодженості моніторів за контрольними сумами
+        job_queue.run_repeating(lambda context: check_monitor_consistency(), interval=300, first=300)  # Кожні 5 хвилин
+    
+    # Локальний endpoint метрик (опціонально)
+    if METRICS_PORT:
+        try:
+            start_metrics_server(METRICS_PORT)
+        except Exception as e:
+            logger.error(f"Не вдалося запустити endpoint метрик на порту {METRICS_PORT}: {e}")
     
     logger.info("🚀 Бот запускається...")
     
@@ -7418,49 +8057,8 @@ def main() -> None:
     except Exception as e:
         logger.error(f"Помилка отримання статистики проектів: {e}")
     
-    # Ініціалізуємо Twitter Monitor Adapter (основний підхід)
-    global twitter_monitor_adapter
-    try:
-        twitter_monitor_adapter = TwitterMonitorAdapter()
-        logger.info("✅ Twitter Monitor Adapter ініціалізовано")
-        
-        # Завантажуємо збережені акаунти в адаптер
-        saved_accounts = project_manager.get_selenium_accounts()
-        if saved_accounts:
-            logger.info(f"Завантажено {len(saved_accounts)} збережених акаунтів в Twitter Monitor Adapter: {saved_accounts}")
-            for username in saved_accounts:
-                twitter_monitor_adapter.add_account(username)
-    except Exception as e:
-        logger.error(f"Помилка ініціалізації Twitter Monitor Adapter: {e}")
-        twitter_monitor_adapter = None
-    
-    
-    # На старті проводимо синхронізацію моніторів з проектами/базою
-    # Це автоматично запустить всі монітори для існуючих проектів
-    logger.info("🔄 Синхронізуємо монітори з існуючими проектами...")
-    sync_monitors_with_projects()
-
-    # Показуємо поточний стан моніторингу
-    try:
-        twitter_accounts = len(getattr(twitter_monitor, 'monitoring_accounts', set())) if twitter_monitor else 0
-        twitter_adapter_accounts = len(getattr(twitter_monitor_adapter, 'monitoring_accounts', set())) if twitter_monitor_adapter else 0
-        discord_channels = len(getattr(discord_monitor, 'channels', [])) if discord_monitor else 0
-        
-        logger.info("📈 Поточний стан моніторингу:")
-        logger.info(f"   🐦 Twitter API: {twitter_accounts} акаунтів")
-        logger.info(f"   🚀 Twitter Monitor Adapter: {twitter_adapter_accounts} акаунтів") 
-        logger.info(f"   💬 Discord: {discord_channels} каналів")
-        
-        total_monitoring = twitter_accounts + twitter_adapter_accounts + discord_channels
-        if total_monitoring > 0:
-            logger.info(f"✅ Всього активних моніторів: {total_monitoring}")
-            logger.info("🎯 Бот готовий до роботи та автоматично моніторить всі налаштовані проекти!")
-        else:
-            logger.info("ℹ️ Монітори готові, очікуємо додавання проектів")
-    except Exception as e:
-        logger.error(f"Помилка отримання стану моніторингу: {e}")
-    
-    logger.info("✅ Синхронізація завершена, всі монітори запущені автоматично")
+    # Монітори піднімаються у фоні після старту polling (_on_startup)
+    logger.info(f"⏱️ Імпорт та налаштування: {time.perf_counter() - _startup_started:.2f}с")
     
     # Запускаємо бота
     try:
@@ -7469,6 +8067,11 @@ def main() -> None:
         # Примусово зберігаємо дані при завершенні
         project_manager.save_data(force=True)
         logger.info("Бот зупинено, дані збережено")
+    finally:
+        access_manager.flush()
+
+# Час імпорту модуля (без запуску моніторів)
+STARTUP_SECONDS.set(time.perf_counter() - _startup_started, stage='import')
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
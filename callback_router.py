@@ -0,0 +1,129 @@
+"""
+Маршрутизатор callback запитів Telegram
+
+Точні callback_data ("main_menu", "admin_panel") обробляються через dict,
+параметризовані ("view_discord_{id}", "remove_ping_discord_{pid}_{uid}") -
+через префіксне дерево з пошуком найдовшого префікса.
+"""
+
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CallbackHandler = Callable[..., Awaitable[Any]]
+
+
+class RouteStats:
+    """Лічильники часу виконання для одного маршруту"""
+
+    __slots__ = ('calls', 'errors', 'total_time', 'max_time')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def record(self, elapsed: float, failed: bool) -> None:
+        self.calls += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        if failed:
+            self.errors += 1
+
+
+class _TrieNode:
+    __slots__ = ('children', 'route', 'handler')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.route: Optional[str] = None
+        self.handler: Optional[CallbackHandler] = None
+
+
+class CallbackRouter:
+    """Таблиця маршрутизації callback_data: dict для точних збігів + префіксне дерево"""
+
+    def __init__(self):
+        self._exact: Dict[str, CallbackHandler] = {}
+        self._root = _TrieNode()
+        self.stats: Dict[str, RouteStats] = {}
+
+    def exact(self, callback_data: str) -> Callable[[CallbackHandler], CallbackHandler]:
+        """Декоратор: зареєструвати обробник для точного значення callback_data"""
+        def decorator(handler: CallbackHandler) -> CallbackHandler:
+            if callback_data in self._exact:
+                raise ValueError(f"Маршрут '{callback_data}' вже зареєстровано")
+            self._exact[callback_data] = handler
+            self.stats[callback_data] = RouteStats()
+            return handler
+        return decorator
+
+    def prefix(self, prefix: str) -> Callable[[CallbackHandler], CallbackHandler]:
+        """Декоратор: зареєструвати обробник для callback_data з параметрами після префікса"""
+        def decorator(handler: CallbackHandler) -> CallbackHandler:
+            node = self._root
+            for char in prefix:
+                node = node.children.setdefault(char, _TrieNode())
+            if node.handler is not None:
+                raise ValueError(f"Префікс '{prefix}' вже зареєстровано")
+            route = prefix + '*'
+            node.route = route
+            node.handler = handler
+            self.stats[route] = RouteStats()
+            return handler
+        return decorator
+
+    def resolve(self, callback_data: str) -> Tuple[Optional[str], Optional[CallbackHandler]]:
+        """Знайти маршрут: спочатку точний збіг, потім найдовший зареєстрований префікс"""
+        handler = self._exact.get(callback_data)
+        if handler is not None:
+            return callback_data, handler
+
+        route, handler = None, None
+        node = self._root
+        for char in callback_data:
+            node = node.children.get(char)
+            if node is None:
+                break
+            if node.handler is not None:
+                route, handler = node.route, node.handler
+        return route, handler
+
+    async def dispatch(self, callback_data: str, *args, **kwargs) -> bool:
+        """Викликати обробник для callback_data. Повертає False якщо маршрут не знайдено"""
+        route, handler = self.resolve(callback_data)
+        if handler is None:
+            return False
+
+        started = time.perf_counter()
+        failed = True
+        try:
+            await handler(*args, **kwargs)
+            failed = False
+        finally:
+            self.stats[route].record(time.perf_counter() - started, failed)
+        return True
+
+    def get_stats(self, top: Optional[int] = None) -> List[Dict]:
+        """Статистика маршрутів, відсортована за сумарним часом"""
+        result = []
+        for route, stats in self.stats.items():
+            if not stats.calls:
+                continue
+            result.append({
+                'route': route,
+                'calls': stats.calls,
+                'errors': stats.errors,
+                'total_ms': stats.total_time * 1000,
+                'avg_ms': stats.total_time * 1000 / stats.calls,
+                'max_ms': stats.max_time * 1000
+            })
+        result.sort(key=lambda item: item['total_ms'], reverse=True)
+        return result[:top] if top else result
+
+    def __len__(self) -> int:
+        return len(self.stats)
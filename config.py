@@ -15,7 +15,27 @@ MONITORING_INTERVAL = 15  # Інтервал перевірки нових по
 # Twitter/X моніторинг
 TWITTER_AUTH_TOKEN = os.getenv('TWITTER_AUTH_TOKEN')  # Twitter auth_token
 TWITTER_CSRF_TOKEN = os.getenv('TWITTER_CSRF_TOKEN')  # Twitter csrf_token (ct0)
+# Додаткові пари облікових даних: "auth_token:ct0,auth_token2:ct0_2" (кожна - окрема сесія)
+TWITTER_CREDENTIALS = os.getenv('TWITTER_CREDENTIALS', '')
+# Розподіл запитів між парами: round_robin, health або budget (x-rate-limit-remaining)
+TWITTER_CREDENTIAL_STRATEGY = os.getenv('TWITTER_CREDENTIAL_STRATEGY', 'round_robin')
 TWITTER_MONITORING_INTERVAL = 30  # Інтервал перевірки нових твітів (секунди)
+# Пакетне опитування: групи акаунтів одним пошуковим запитом "from:a OR from:b" (1 - увімкнено)
+TWITTER_BATCH_POLLING = os.getenv('TWITTER_BATCH_POLLING', '0') == '1'
+
+# Telegram Bot API (можна вказати локальний Bot API сервер або заглушку для бенчмарків)
+TELEGRAM_API_BASE = os.getenv('TELEGRAM_API_BASE', 'https://api.telegram.org').rstrip('/')
+
+# Тривалість профілювання з адмін-панелі (секунди)
+PROFILE_SECONDS = int(os.getenv('PROFILE_SECONDS', '30'))
+
+# Логування: рівень за замовчуванням, рівні підсистем (ім'я=рівень через кому) та формат text/json
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'ERROR')
+LOG_LEVELS = os.getenv('LOG_LEVELS', 'twitter_monitor=WARNING,twitter_monitor_adapter=WARNING,httpx=WARNING')
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')
+
+# Метрики: локальний endpoint у форматі Prometheus (0 - вимкнено)
+METRICS_PORT = int(os.getenv('METRICS_PORT', '0'))
 
 # Повідомлення
 MESSAGES = {
@@ -0,0 +1,112 @@
+"""
+Записи подій моніторів
+
+TweetEvent та DiscordEvent створюються один раз монітором і без змін
+передаються обробникам доставки (handle_twitter_notifications_sync,
+handle_discord_notifications_sync). Поля фіксовані (__slots__ на Python 3.10+),
+тому подія не перекладається в нові dict на кожному рівні і не губить поля
+(зображення, content_key, detected_at).
+
+Тестові команди, бенчмарки та зовнішні монітори можуть і далі передавати
+dict - обробники перетворюють їх через as_tweet_event / as_discord_event.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+# slots=True у dataclass - з Python 3.10; на старіших версіях звичайні атрибути
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class MediaRef:
+    """Вкладення події; для відео та GIF url - прев'ю"""
+
+    url: str
+    kind: str = 'photo'  # photo, video, gif
+
+
+def media_refs(items: Iterable[Union[str, Dict, MediaRef]]) -> Tuple[MediaRef, ...]:
+    """Кортеж MediaRef з URL, dict {'url', 'kind'/'type'} або готових MediaRef"""
+    refs = []
+    for item in items or ():
+        if isinstance(item, MediaRef):
+            refs.append(item)
+        elif isinstance(item, str):
+            refs.append(MediaRef(item))
+        elif isinstance(item, dict) and item.get('url'):
+            refs.append(MediaRef(item['url'], item.get('kind') or item.get('type') or 'photo'))
+    return tuple(refs)
+
+
+@dataclass(**_SLOTS)
+class TweetEvent:
+    """Новий твіт акаунта, знайдений монітором"""
+
+    tweet_id: str
+    account: str
+    text: str = ''
+    url: str = ''
+    author: str = ''
+    timestamp: str = ''  # час публікації з джерела (ISO або формат Twitter)
+    media: Tuple[MediaRef, ...] = ()
+    content_key: Optional[str] = None
+    detected_at: Optional[float] = None
+
+    @property
+    def images(self) -> List[str]:
+        return [item.url for item in self.media]
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'TweetEvent':
+        return cls(
+            tweet_id=str(data.get('tweet_id') or data.get('id') or ''),
+            account=data.get('account') or data.get('username') or '',
+            text=data.get('text', ''),
+            url=data.get('url', ''),
+            author=data.get('author', ''),
+            timestamp=data.get('timestamp') or data.get('created_at') or '',
+            media=media_refs(data.get('media') or data.get('images')),
+            content_key=data.get('content_key'),
+            detected_at=data.get('detected_at')
+        )
+
+
+@dataclass(**_SLOTS)
+class DiscordEvent:
+    """Нове повідомлення Discord каналу"""
+
+    message_id: str
+    channel_id: str
+    author: str = ''
+    content: str = ''
+    url: str = ''
+    timestamp: str = ''
+    media: Tuple[MediaRef, ...] = ()
+    detected_at: Optional[float] = None
+
+    @property
+    def images(self) -> List[str]:
+        return [item.url for item in self.media]
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'DiscordEvent':
+        return cls(
+            message_id=str(data.get('message_id') or data.get('id') or ''),
+            channel_id=str(data.get('channel_id', '')),
+            author=data.get('author', ''),
+            content=data.get('content', ''),
+            url=data.get('url', ''),
+            timestamp=data.get('timestamp', ''),
+            media=media_refs(data.get('media') or data.get('images')),
+            detected_at=data.get('detected_at')
+        )
+
+
+def as_tweet_event(item: Union[TweetEvent, Dict]) -> TweetEvent:
+    return item if isinstance(item, TweetEvent) else TweetEvent.from_dict(item)
+
+
+def as_discord_event(item: Union[DiscordEvent, Dict]) -> DiscordEvent:
+    return item if isinstance(item, DiscordEvent) else DiscordEvent.from_dict(item)
@@ -0,0 +1,146 @@
+"""
+Облік свіжості доставки: від публікації в джерелі до підтвердження Telegram
+
+Для кожної події фіксуються моменти:
+    published - created_at твіта / timestamp Discord повідомлення
+    detected  - коли монітор знайшов подію (detected_at)
+    rendered  - коли текст сповіщення сформовано
+    delivered - перше успішне підтвердження відправки Telegram
+
+Тривалості етапів потрапляють у гістограми реєстру метрик (платформа + етап)
+і наскрізна затримка - окремо по кожному акаунту/каналу.
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, Optional, Union
+
+from events import DiscordEvent, TweetEvent
+from metrics import REGISTRY, MetricsRegistry, format_seconds
+
+# Кошики під затримки доставки (секунди): від пів секунди до години
+FRESHNESS_BUCKETS = (0.5, 1, 2, 3, 5, 7.5, 10, 15, 20, 30, 45, 60, 90, 120, 180, 300, 600, 1800, 3600)
+
+STAGES = ('detect', 'render', 'send', 'end_to_end')
+
+STAGE_TITLES = {
+    'detect': 'публікація → виявлення',
+    'render': 'виявлення → формування',
+    'send': 'формування → відправка',
+    'end_to_end': 'наскрізна'
+}
+
+_TWITTER_DATE_FORMAT = '%a %b %d %H:%M:%S %z %Y'  # Wed Oct 10 20:19:24 +0000 2018
+
+
+def parse_source_time(value) -> Optional[float]:
+    """Час публікації в джерелі як unix timestamp (ISO 8601, формат Twitter legacy або число)"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        # Мілісекунди приводимо до секунд
+        return value / 1000.0 if value > 1e11 else float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    text = str(value).strip()
+    try:
+        return datetime.fromisoformat(text.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(text, _TWITTER_DATE_FORMAT).timestamp()
+    except ValueError:
+        return None
+
+
+class EventTiming:
+    """Відмітки часу однієї події на шляху до Telegram"""
+
+    __slots__ = ('tracker', 'platform', 'account', 'published', 'detected', 'rendered', 'delivered')
+
+    def __init__(self, tracker: 'FreshnessTracker', platform: str, account: str,
+                 published: Optional[float], detected: float):
+        self.tracker = tracker
+        self.platform = platform
+        self.account = account
+        self.published = published
+        self.detected = detected
+        self.rendered: Optional[float] = None
+        self.delivered: Optional[float] = None
+
+    def mark_rendered(self) -> None:
+        if self.rendered is None:
+            self.rendered = time.time()
+
+    def mark_delivered(self) -> None:
+        """Зафіксувати перше успішне підтвердження відправки (повторні виклики ігноруються)"""
+        if self.delivered is not None:
+            return
+        self.delivered = time.time()
+        if self.rendered is None:
+            self.rendered = self.delivered
+        self.tracker.record(self)
+
+
+class FreshnessTracker:
+    """Гістограми затримок доставки по платформах, етапах та акаунтах"""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY):
+        self.stage_seconds = registry.histogram(
+            'freshness_stage_seconds', 'Затримка етапів доставки подій', ('platform', 'stage'),
+            buckets=FRESHNESS_BUCKETS)
+        self.account_seconds = registry.histogram(
+            'freshness_account_seconds', 'Наскрізна затримка доставки по акаунтах/каналах', ('platform', 'account'),
+            buckets=FRESHNESS_BUCKETS)
+
+    def start(self, platform: str, account: str, event: Union[TweetEvent, DiscordEvent, Dict],
+              published_field: str = 'timestamp') -> EventTiming:
+        """Почати облік події (TweetEvent/DiscordEvent або dict); detected_at з події або поточний час"""
+        if isinstance(event, dict):
+            detected, published = event.get('detected_at'), event.get(published_field)
+        else:
+            detected, published = getattr(event, 'detected_at', None), getattr(event, published_field, None)
+        return EventTiming(self, platform, account, parse_source_time(published), detected or time.time())
+
+    def record(self, timing: EventTiming) -> None:
+        platform = timing.platform
+        # Розбіжність годинників джерела може дати від'ємні значення - обрізаємо до 0
+        if timing.published is not None:
+            self.stage_seconds.observe(max(0.0, timing.detected - timing.published), platform=platform, stage='detect')
+        self.stage_seconds.observe(max(0.0, timing.rendered - timing.detected), platform=platform, stage='render')
+        self.stage_seconds.observe(max(0.0, timing.delivered - timing.rendered), platform=platform, stage='send')
+        if timing.published is not None:
+            end_to_end = max(0.0, timing.delivered - timing.published)
+            self.stage_seconds.observe(end_to_end, platform=platform, stage='end_to_end')
+            self.account_seconds.observe(end_to_end, platform=platform, account=timing.account)
+
+    def format_report(self, top_accounts: int = 5) -> str:
+        """Текстовий звіт для адмін-панелі: p50/p95/p99 по етапах та найповільніші акаунти"""
+        lines = []
+        platforms = sorted({platform for platform, _ in self.stage_seconds.label_keys()})
+        for platform in platforms:
+            lines.append(f"{'🐦 Twitter' if platform == 'twitter' else '💬 Discord' if platform == 'discord' else platform}:")
+            for stage in STAGES:
+                key = (platform, stage)
+                count = self.stage_seconds.count_for_key(key)
+                if not count:
+                    continue
+                p50, p95, p99 = (self.stage_seconds.percentile_for_key(key, q) for q in (50, 95, 99))
+                lines.append(
+                    f"• {STAGE_TITLES[stage]}: p50 {format_seconds(p50)}, p95 {format_seconds(p95)}, "
+                    f"p99 {format_seconds(p99)} (n={count})"
+                )
+
+            accounts = [key for key in self.account_seconds.label_keys() if key[0] == platform]
+            accounts.sort(key=lambda key: self.account_seconds.percentile_for_key(key, 95) or 0, reverse=True)
+            if accounts:
+                lines.append("  Найповільніші (p95):")
+                for key in accounts[:top_accounts]:
+                    p95 = self.account_seconds.percentile_for_key(key, 95)
+                    lines.append(f"  – {key[1]}: {format_seconds(p95)} (n={self.account_seconds.count_for_key(key)})")
+            lines.append("")
+        return "\n".join(lines).strip()
+
+
+# Глобальний трекер процесу
+freshness_tracker = FreshnessTracker()
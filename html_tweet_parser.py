@@ -0,0 +1,114 @@
+"""
+Однопрохідний розбір твітів з HTML сторінки профілю
+
+Замість п'яти re.DOTALL проходів по всій сторінці та окремих regex для тексту
+кожного знайденого блоку - один прохід вперед прекомпільованими regex:
+пошук початку контейнера твіта, його кінець за глибиною однойменних тегів і
+розбір лише цього фрагмента. Контейнер: article/div з data-testid="tweet",
+елемент з data-tweet-id або з класом tweet (js-stream-tweet, tweet-card тощо).
+У межах контейнера збираються ID (data-tweet-id, посилання /username/status/ID
+або tweet_id=ID), текст та зображення.
+
+iter_html_tweets - генератор: наступний контейнер шукається лише тоді, коли
+споживачу потрібен ще один твіт, тож після limit решта сторінки не читається.
+"""
+
+import html as html_lib
+import re
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
+
+CONTAINER_START = re.compile(
+    r'<(article|div|li)\b([^>]*?(?:data-testid="tweet"|data-tweet-id="|class="[^"]*tweet)[^>]*)>', re.IGNORECASE)
+TWEET_CLASS = re.compile(r'class="(?:[^"]*\s)?(?:[\w-]+-)?tweet(?:-(?!text)[\w-]+)?(?:\s[^"]*)?"')  # tweet, js-stream-tweet, tweet-card
+TWEET_ID_ATTR = re.compile(r'data-tweet-id="(\d+)"')
+STATUS_HREF = re.compile(r'href="[^"]*?/([A-Za-z0-9_]{1,15})/status/(\d+)')
+TWEET_ID_PARAM = re.compile(r'tweet_id=(\d+)')
+MEDIA_SOURCE = re.compile(r'<(?:img|video)\b[^>]*?\b(?:src|poster)="([^"]*(?:/media/|video_thumb)[^"]*)"', re.IGNORECASE)
+NON_TEXT_BLOCK = re.compile(r'<(script|style|svg)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+LINE_BREAK = re.compile(r'<br\s*/?>', re.IGNORECASE)
+TAG = re.compile(r'<[^>]+>')
+WHITESPACE = re.compile(r'\s+')
+
+# Початки елементів з текстом твіта за пріоритетом
+TEXT_STARTS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'<(div|span)\b[^>]*\bdata-testid="tweetText"[^>]*>',
+    r'<(div|span|p)\b[^>]*\bclass="(?:[^"]*\s)?tweet-text(?:\s[^"]*)?"[^>]*>',
+    r'<(div)\b[^>]*\bdir="auto"[^>]*>',
+    r'<(p)\b[^>]*>'
+)]
+
+_TAG_BOUNDS: Dict[str, Pattern] = {}
+
+
+def _element_end(html: str, tag: str, pos: int, end: int) -> Tuple[int, int]:
+    """(початок, кінець) закриваючого тега для елемента tag, відкритого до pos"""
+    bounds = _TAG_BOUNDS.get(tag)
+    if bounds is None:
+        bounds = _TAG_BOUNDS[tag] = re.compile(rf'<(/?){tag}\b[^>]*?(/?)>', re.IGNORECASE)
+    depth = 1
+    for match in bounds.finditer(html, pos, end):
+        if match.group(1):
+            depth -= 1
+            if not depth:
+                return match.start(), match.end()
+        elif not match.group(2):
+            depth += 1
+    return end, end  # Незакритий елемент - до кінця доступного фрагмента
+
+
+def _clean_text(fragment: str) -> str:
+    if '<' in fragment:
+        if '<s' in fragment or '<S' in fragment:
+            fragment = NON_TEXT_BLOCK.sub('', fragment)
+        fragment = TAG.sub('', LINE_BREAK.sub(' ', fragment))
+    if '&' in fragment:
+        fragment = html_lib.unescape(fragment)
+    return WHITESPACE.sub(' ', fragment).strip()
+
+
+def _tweet_text(html: str, start: int, end: int) -> str:
+    for text_start in TEXT_STARTS:
+        match = text_start.search(html, start, end)
+        if match:
+            text_end, _ = _element_end(html, match.group(1).lower(), match.end(), end)
+            text = _clean_text(html[match.end():text_end])
+            if text:
+                return text
+    return _clean_text(html[start:end])
+
+
+def _tweet_id(html: str, attrs: str, start: int, end: int, username: str) -> Optional[str]:
+    match = TWEET_ID_ATTR.search(attrs)
+    if match:
+        return match.group(1)
+    for link in STATUS_HREF.finditer(html, start, end):
+        if link.group(1).lower() == username:
+            return link.group(2)
+    match = TWEET_ID_PARAM.search(html, start, end)
+    return match.group(1) if match else None
+
+
+def iter_html_tweets(html: str, username: str) -> Iterator[Dict]:
+    """Твіти сторінки в порядку документа: {'id' (або None), 'text', 'images'}
+
+    ID береться лише з посилань на статуси самого username, тому ретвіти інших
+    авторів отримують id None (як і блоки без посилань).
+    """
+    username = username.lower()
+    pos = 0
+    while True:
+        match = CONTAINER_START.search(html, pos)
+        if not match:
+            return
+        tag, attrs = match.group(1).lower(), match.group(2)
+        if 'data-testid="tweet"' not in attrs and 'data-tweet-id="' not in attrs and not TWEET_CLASS.search(attrs):
+            pos = match.end()  # Клас лише містить "tweet" (tweet-text тощо) - не контейнер
+            continue
+        start = match.end()
+        end, pos = _element_end(html, tag, start, len(html))
+        images: List[str] = [html_lib.unescape(source) for source in MEDIA_SOURCE.findall(html, start, end)]
+        yield {
+            'id': _tweet_id(html, attrs, start, end, username),
+            'text': _tweet_text(html, start, end),
+            'images': images
+        }
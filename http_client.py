@@ -0,0 +1,192 @@
+"""
+Спільні HTTP клієнти для вихідних запитів
+
+Відправка в Telegram, завантаження зображень і HTML fallback раніше робили
+кожен запит окремим requests.get/post - нове TCP+TLS з'єднання щоразу. Тут
+клієнти живуть весь процес і тримають keep-alive з'єднання по хостах:
+
+    get(url, **kwargs) / post(url, **kwargs)  - синхронні запити (аргументи як у requests)
+    create_connector(**kwargs)                - aiohttp.TCPConnector з лімітами та кешем DNS
+    trace_config()                            - облік з'єднань aiohttp сесії
+    async_session()                           - спільна aiohttp сесія поточного event loop
+    connection_stats()                        - запити, нові з'єднання та частка повторного використання
+
+Синхронний клієнт - httpx з HTTP/2, якщо встановлено httpx і h2 (pip install
+"httpx[http2]"), інакше requests.Session з пулом urllib3 (MAX_PER_HOST
+з'єднань на хост). Ліміт на хост у httpx лише загальний, але HTTP/2
+мультиплексує запити до хоста в одному з'єднанні. Кеш DNS (DNS_CACHE_TTL)
+діє для aiohttp; синхронні клієнти резолвлять хост лише для нових з'єднань.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from metrics import REGISTRY
+
+try:
+    import httpx
+    import h2  # noqa: F401  HTTP/2 для httpx
+except ImportError:
+    httpx = None
+
+BACKEND = 'httpx' if httpx is not None else 'requests'
+
+HTTP_REQUESTS = REGISTRY.counter('http_client_requests_total', 'Вихідні HTTP запити спільних клієнтів', ('client', 'host'))
+HTTP_CONNECTIONS = REGISTRY.counter('http_client_connections_total', 'Нові з\'єднання спільних клієнтів', ('client', 'host'))
+
+MAX_CONNECTIONS = 100
+MAX_PER_HOST = 10
+MAX_HOSTS = 20  # Пулів requests (по хосту) одночасно
+KEEPALIVE_SECONDS = 60.0
+DNS_CACHE_TTL = 300
+
+_lock = threading.Lock()
+_clients: Dict[bool, object] = {}  # verify -> синхронний клієнт
+_httpx_streams = weakref.WeakSet()  # Мережеві потоки httpx, які вже бачили (з'єднання)
+_async_sessions = weakref.WeakKeyDictionary()  # event loop -> aiohttp.ClientSession
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        HTTP_CONNECTIONS.inc(client='requests', host=self.host)
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        HTTP_CONNECTIONS.inc(client='requests', host=self.host)
+        return super()._new_conn()
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter, пули якого рахують нові з'єднання"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _CountingHTTPConnectionPool,
+                                                   'https': _CountingHTTPSConnectionPool}
+
+
+def _httpx_response(response) -> None:
+    stream = response.extensions.get('network_stream')
+    if stream is not None and stream not in _httpx_streams:
+        _httpx_streams.add(stream)
+        HTTP_CONNECTIONS.inc(client='httpx', host=response.request.url.host)
+
+
+def _create_client(verify: bool):
+    if BACKEND == 'httpx':
+        limits = httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS,
+                              keepalive_expiry=KEEPALIVE_SECONDS)
+        return httpx.Client(http2=True, verify=verify, limits=limits, follow_redirects=True,
+                            event_hooks={'response': [_httpx_response]})
+    session = requests.Session()
+    session.verify = verify
+    adapter = _CountingAdapter(pool_connections=MAX_HOSTS, pool_maxsize=MAX_PER_HOST)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _client(verify: bool):
+    client = _clients.get(verify)
+    if client is None:
+        with _lock:
+            client = _clients.get(verify)
+            if client is None:
+                client = _clients[verify] = _create_client(verify)
+    return client
+
+
+def request(method: str, url: str, verify: bool = True, **kwargs):
+    """Синхронний запит через спільний клієнт; відповідь має status_code, content, text, json(), raise_for_status()"""
+    HTTP_REQUESTS.inc(client=BACKEND, host=urlsplit(url).hostname or '')
+    client = _client(verify)
+    if BACKEND == 'httpx':
+        data = kwargs.get('data')
+        if isinstance(data, dict):
+            # requests пропускає поля зі значенням None (напр. message_thread_id поза гілкою)
+            kwargs['data'] = {key: value for key, value in data.items() if value is not None}
+        if 'allow_redirects' in kwargs:
+            kwargs['follow_redirects'] = kwargs.pop('allow_redirects')
+    return client.request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs):
+    return request('GET', url, **kwargs)
+
+
+def post(url: str, **kwargs):
+    return request('POST', url, **kwargs)
+
+
+def close() -> None:
+    """Закрити синхронні клієнти (наступний запит створить нові)"""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+def create_connector(**kwargs):
+    """TCPConnector з keep-alive, лімітами з'єднань і кешем DNS; kwargs перекривають значення за замовчуванням"""
+    import aiohttp
+    options = {
+        'limit': MAX_CONNECTIONS,
+        'limit_per_host': MAX_PER_HOST,
+        'use_dns_cache': True,
+        'ttl_dns_cache': DNS_CACHE_TTL,
+        'keepalive_timeout': KEEPALIVE_SECONDS
+    }
+    options.update(kwargs)
+    return aiohttp.TCPConnector(**options)
+
+
+async def _on_request_start(session, context, params) -> None:
+    context.host = params.url.host or ''
+    HTTP_REQUESTS.inc(client='aiohttp', host=context.host)
+
+
+async def _on_connection_create_end(session, context, params) -> None:
+    HTTP_CONNECTIONS.inc(client='aiohttp', host=getattr(context, 'host', ''))
+
+
+def trace_config():
+    """TraceConfig для aiohttp.ClientSession(trace_configs=[...]): запити та нові з'єднання в метриках"""
+    import aiohttp
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(_on_request_start)
+    config.on_connection_create_end.append(_on_connection_create_end)
+    return config
+
+
+def async_session():
+    """Спільна aiohttp сесія поточного event loop (для разових запитів з обробників бота)"""
+    import aiohttp
+    loop = asyncio.get_running_loop()
+    session = _async_sessions.get(loop)
+    if session is None or session.closed:
+        session = _async_sessions[loop] = aiohttp.ClientSession(connector=create_connector(),
+                                                                trace_configs=[trace_config()])
+    return session
+
+
+def connection_stats() -> Dict[Tuple[str, str], Dict[str, float]]:
+    """(клієнт, хост) -> {'requests', 'connections', 'reuse_rate'}; reuse_rate - частка запитів без нового з'єднання"""
+    stats = {}
+    for key, value in HTTP_REQUESTS.items():
+        connections = HTTP_CONNECTIONS.get(client=key[0], host=key[1])
+        stats[key] = {
+            'requests': value,
+            'connections': connections,
+            'reuse_rate': max(0.0, 1 - connections / value) if value else 0.0
+        }
+    return stats
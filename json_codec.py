@@ -0,0 +1,87 @@
+"""
+Серіалізація JSON з необов'язковим швидким бекендом
+
+Якщо встановлено orjson (або msgspec), відповіді API та файли стану
+розбираються і записуються ним, інакше - стандартним json. Виводиться завжди
+UTF-8 без екранування не-ASCII (як ensure_ascii=False).
+
+    loads(data)                    - str або bytes -> об'єкт
+    dumps(obj, pretty=False)       - об'єкт -> bytes (pretty - відступ 2 пробіли)
+    load_file(path)                - прочитати JSON файл
+    dump_file(path, obj, pretty)   - записати JSON файл (атомарно: тимчасовий файл + os.replace)
+
+Файли, які читає лише програма (seen_tweets, mapping гілок, стан моніторів),
+пишуться компактно; data.json та access_data.json - з відступами, бо їх
+переглядають вручну.
+"""
+
+import json
+import os
+import tempfile
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if orjson is not None:
+    BACKEND = 'orjson'
+    JSONDecodeError = (json.JSONDecodeError,)  # orjson.JSONDecodeError - його підклас
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+elif msgspec is not None:
+    BACKEND = 'msgspec'
+    JSONDecodeError = (json.JSONDecodeError, msgspec.DecodeError)
+    _msgspec_encoder = msgspec.json.Encoder()
+    _msgspec_decoder = msgspec.json.Decoder()
+else:
+    BACKEND = 'json'
+    JSONDecodeError = (json.JSONDecodeError,)
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    if BACKEND == 'orjson':
+        return orjson.loads(data)
+    if BACKEND == 'msgspec':
+        return _msgspec_decoder.decode(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    if BACKEND == 'orjson':
+        return orjson.dumps(obj, option=(_ORJSON_OPTIONS | orjson.OPT_INDENT_2) if pretty else _ORJSON_OPTIONS)
+    if BACKEND == 'msgspec':
+        encoded = _msgspec_encoder.encode(obj)
+        return msgspec.json.format(encoded, indent=2) if pretty else encoded
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def load_file(path: str) -> Any:
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_file(path: str, obj: Any, pretty: bool = False) -> None:
+    """Записати файл атомарно; при помилці серіалізації старий файл не змінюється"""
+    payload = dumps(obj, pretty)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=f'.{os.path.basename(path)}.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
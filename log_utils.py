@@ -0,0 +1,159 @@
+"""
+Логування для гарячого шляху
+
+    configure_logging  - рівні по підсистемах (LOG_LEVEL / LOG_LEVELS) та формат text/json
+    LazyJson           - json.dumps лише тоді, коли запис справді виводиться
+    event()            - структурований запис "подія key=value" з полями для JSON формату
+    SampledLogger      - обмеження частоти для рядків, що пишуться на кожну подію
+
+Усі повідомлення форматуються %-стилем логера, тому відфільтрований рівнем
+запис коштує лише перевірки isEnabledFor.
+"""
+
+import json
+import logging
+import sys
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """'twitter_monitor=INFO,bot.delivery=DEBUG' -> {ім'я логера: рівень}"""
+    levels = {}
+    for item in (spec or '').split(','):
+        if '=' not in item:
+            continue
+        name, level = item.split('=', 1)
+        name, level = name.strip(), level.strip().upper()
+        if name and level in logging._nameToLevel:
+            levels[name] = logging._nameToLevel[level]
+    return levels
+
+
+class JsonFormatter(logging.Formatter):
+    """Один JSON об'єкт на рядок: час, рівень, логер, повідомлення та поля події"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage()
+        }
+        fields = getattr(record, 'fields', None)
+        if fields:
+            payload.update(fields)
+        if record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def configure_logging(level: str = 'ERROR', levels: str = '', fmt: str = 'text') -> None:
+    """Налаштувати кореневий логер та рівні підсистем
+
+    force=True - модулі, імпортовані раніше, могли викликати basicConfig і
+    встановити власний рівень кореневого логера.
+    """
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(JsonFormatter() if fmt == 'json' else logging.Formatter(TEXT_FORMAT))
+    logging.basicConfig(level=logging._nameToLevel.get(level.upper(), logging.ERROR),
+                        handlers=[handler], force=True)
+    for name, subsystem_level in parse_levels(levels).items():
+        logging.getLogger(name).setLevel(subsystem_level)
+
+
+class LazyJson:
+    """Відкладений json.dumps для аргументів логування (обрізається до limit символів)"""
+
+    __slots__ = ('data', 'limit')
+
+    def __init__(self, data, limit: int = 500):
+        self.data = data
+        self.limit = limit
+
+    def __str__(self) -> str:
+        try:
+            text = json.dumps(self.data, ensure_ascii=False, default=str)
+        except (TypeError, ValueError):
+            text = repr(self.data)
+        return text if len(text) <= self.limit else text[:self.limit] + '...'
+
+
+class _Event:
+    """Повідомлення 'подія key=value ...', що форматується лише при виводі"""
+
+    __slots__ = ('name', 'fields')
+
+    def __init__(self, name: str, fields: Dict):
+        self.name = name
+        self.fields = fields
+
+    def __str__(self) -> str:
+        if not self.fields:
+            return self.name
+        return self.name + ' ' + ' '.join(f'{key}={value}' for key, value in self.fields.items())
+
+
+def event(logger: logging.Logger, level: int, name: str, **fields) -> None:
+    """Структурований запис; поля доступні JsonFormatter як окремі ключі"""
+    if logger.isEnabledFor(level):
+        logger.log(level, _Event(name, fields), extra={'fields': {'event': name, **fields}})
+
+
+class SampledLogger:
+    """Обмеження частоти для записів на кожну подію
+
+    Для кожного ключа (за замовчуванням - шаблон повідомлення) пропускається не
+    більше burst записів за interval секунд; кількість пропущених додається до
+    наступного виведеного запису. every > 1 додатково залишає кожен N-й запис.
+    """
+
+    def __init__(self, logger: logging.Logger, interval: float = 10.0, burst: int = 5, every: int = 1):
+        self.logger = logger
+        self.interval = interval
+        self.burst = burst
+        self.every = max(1, every)
+        self._windows: Dict[str, Tuple[float, int, int]] = {}  # key -> (початок вікна, виведено, пропущено)
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _allow(self, key: str) -> Optional[int]:
+        """None якщо запис пропускається, інакше кількість раніше пропущених"""
+        with self._lock:
+            if self.every > 1:
+                count = self._counters.get(key, 0) + 1
+                self._counters[key] = count
+                if count % self.every:
+                    return None
+            now = time.monotonic()
+            started, emitted, suppressed = self._windows.get(key, (now, 0, 0))
+            if now - started >= self.interval:
+                started, emitted = now, 0
+            if emitted >= self.burst:
+                self._windows[key] = (started, emitted, suppressed + 1)
+                return None
+            self._windows[key] = (started, emitted + 1, 0)
+            return suppressed
+
+    def log(self, level: int, msg: str, *args, key: Optional[str] = None, **fields) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+        suppressed = self._allow(key or msg)
+        if suppressed is None:
+            return
+        if suppressed:
+            msg = f'{msg} (+{suppressed} пропущено)'
+        extra = {'fields': fields} if fields else None
+        self.logger.log(level, msg, *args, extra=extra)
+
+    def debug(self, msg: str, *args, **kwargs) -> None:
+        self.log(logging.DEBUG, msg, *args, **kwargs)
+
+    def info(self, msg: str, *args, **kwargs) -> None:
+        self.log(logging.INFO, msg, *args, **kwargs)
+
+    def warning(self, msg: str, *args, **kwargs) -> None:
+        self.log(logging.WARNING, msg, *args, **kwargs)
@@ -0,0 +1,337 @@
+"""
+Реєстр метрик в пам'яті процесу
+
+Лічильники, gauge-метрики та гістограми з мітками. Оновлення виконуються без
+блокувань (одна операція над dict під GIL), тому їх можна викликати з потоків
+моніторів і з event loop бота. При одночасному інкременті однієї мітки з різних
+потоків можлива втрата поодиноких значень - для метрик це прийнятно.
+
+Опціонально метрики віддаються у текстовому форматі Prometheus через
+локальний HTTP сервер (start_http_server).
+"""
+
+import abc
+import asyncio
+import bisect
+import functools
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Межі кошиків за замовчуванням (секунди): від 5 мс до 5 хвилин
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+LabelKey = Tuple[str, ...]
+
+
+class _Metric(abc.ABC):
+    """Базовий клас метрики з мітками"""
+
+    type_name = 'untyped'
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+
+    def _key(self, labels: Dict[str, str]) -> LabelKey:
+        if not self.label_names:
+            return ()
+        return tuple(str(labels.get(label, '')) for label in self.label_names)
+
+    def _format_labels(self, key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.label_names, key))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ''
+        escaped = (f'{name}="{_escape_label(value)}"' for name, value in pairs)
+        return '{' + ','.join(escaped) + '}'
+
+    @abc.abstractmethod
+    def render(self) -> List[str]:
+        """Рядки метрики у текстовому форматі Prometheus"""
+
+
+class Counter(_Metric):
+    """Монотонний лічильник"""
+
+    type_name = 'counter'
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        super().__init__(name, help_text, label_names)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def total(self) -> float:
+        return sum(self._values.values())
+
+    def items(self) -> List[Tuple[LabelKey, float]]:
+        return list(self._values.items())
+
+    def render(self) -> List[str]:
+        return [f'{self.name}{self._format_labels(key)} {_format_value(value)}'
+                for key, value in self.items()]
+
+
+class Gauge(Counter):
+    """Поточне значення, яке може зростати і спадати"""
+
+    type_name = 'gauge'
+
+    def set(self, value: float, **labels) -> None:
+        self._values[self._key(labels)] = value
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class _HistogramData:
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self, size: int):
+        self.counts = [0] * size  # Не кумулятивні лічильники кошиків (+Inf останній)
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    """Гістограма з фіксованими кошиками та оцінкою перцентилів"""
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._data: Dict[LabelKey, _HistogramData] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        data = self._data.get(key)
+        if data is None:
+            data = self._data.setdefault(key, _HistogramData(len(self.buckets) + 1))
+        data.counts[bisect.bisect_left(self.buckets, value)] += 1
+        data.sum += value
+        data.count += 1
+
+    def time(self, **labels) -> '_Timer':
+        """Контекстний менеджер / декоратор: записати тривалість виконання"""
+        return _Timer(self, labels)
+
+    def count(self, **labels) -> int:
+        data = self._data.get(self._key(labels))
+        return data.count if data else 0
+
+    def label_keys(self) -> List[LabelKey]:
+        return list(self._data)
+
+    def percentile(self, q: float, **labels) -> Optional[float]:
+        """Оцінка перцентиля (0..100) лінійною інтерполяцією всередині кошика"""
+        data = self._data.get(self._key(labels))
+        return self._percentile(data, q) if data else None
+
+    def percentile_for_key(self, key: LabelKey, q: float) -> Optional[float]:
+        data = self._data.get(key)
+        return self._percentile(data, q) if data else None
+
+    def count_for_key(self, key: LabelKey) -> int:
+        data = self._data.get(key)
+        return data.count if data else 0
+
+    def mean_for_key(self, key: LabelKey) -> Optional[float]:
+        data = self._data.get(key)
+        if not data or not data.count:
+            return None
+        return data.sum / data.count
+
+    def _percentile(self, data: _HistogramData, q: float) -> Optional[float]:
+        if not data.count:
+            return None
+        rank = data.count * q / 100.0
+        seen = 0
+        for index, bucket_count in enumerate(list(data.counts)):
+            if not bucket_count:
+                continue
+            if seen + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                if index >= len(self.buckets):
+                    # Кошик +Inf: точніше за нижню межу оцінити не можна
+                    return lower
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+    def render(self) -> List[str]:
+        lines = []
+        for key, data in list(self._data.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), list(data.counts)):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else _format_value(bound)
+                lines.append(f'{self.name}_bucket{self._format_labels(key, ("le", le))} {cumulative}')
+            lines.append(f'{self.name}_sum{self._format_labels(key)} {_format_value(data.sum)}')
+            lines.append(f'{self.name}_count{self._format_labels(key)} {data.count}')
+        return lines
+
+
+class _Timer:
+    __slots__ = ('histogram', 'labels', 'started')
+
+    def __init__(self, histogram: Histogram, labels: Dict[str, str]):
+        self.histogram = histogram
+        self.labels = labels
+        self.started = 0.0
+
+    def __enter__(self) -> '_Timer':
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+
+    def __call__(self, func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with _Timer(self.histogram, self.labels):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Timer(self.histogram, self.labels):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+class MetricsRegistry:
+    """Реєстр метрик: створення за ім'ям (повторний виклик повертає існуючу)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()  # Лише для реєстрації, не для оновлень
+
+    def _register(self, cls, name: str, help_text: str, label_names: Sequence[str], **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = cls(name, help_text, label_names, **kwargs)
+                    self._metrics[name] = metric
+        if type(metric) is not cls:
+            raise ValueError(f"Метрику '{name}' вже зареєстровано з іншим типом")
+        return metric
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, help_text, label_names)
+
+    def gauge(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, help_text, label_names)
+
+    def histogram(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, help_text, label_names, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render_prometheus(self) -> str:
+        """Усі метрики у текстовому форматі Prometheus"""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f'# HELP {metric.name} {metric.help}')
+            lines.append(f'# TYPE {metric.name} {metric.type_name}')
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def format_summary(self) -> str:
+        """Короткий текстовий звіт для адмін-панелі"""
+        lines = []
+        for metric in list(self._metrics.values()):
+            if isinstance(metric, Histogram):
+                for key in metric.label_keys():
+                    labels = ','.join(f'{n}={v}' for n, v in zip(metric.label_names, key))
+                    p50 = metric.percentile_for_key(key, 50)
+                    p95 = metric.percentile_for_key(key, 95)
+                    lines.append(
+                        f"• {metric.name}{'{' + labels + '}' if labels else ''}: "
+                        f"n={metric.count_for_key(key)}, p50={format_seconds(p50)}, p95={format_seconds(p95)}"
+                    )
+            else:
+                for key, value in metric.items():
+                    labels = ','.join(f'{n}={v}' for n, v in zip(metric.label_names, key))
+                    lines.append(f"• {metric.name}{'{' + labels + '}' if labels else ''}: {_format_value(value)}")
+        return '\n'.join(lines)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: 'MetricsRegistry' = None
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        body = self.registry.render_prometheus().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_http_server(port: int, host: str = '127.0.0.1', registry: Optional['MetricsRegistry'] = None) -> ThreadingHTTPServer:
+    """Запустити локальний HTTP endpoint /metrics у фоновому потоці"""
+    handler = type('MetricsHandler', (_MetricsHandler,), {'registry': registry or REGISTRY})
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True)
+    thread.start()
+    logger.info(f"Метрики доступні на http://{host}:{port}/metrics")
+    return server
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def format_seconds(value: Optional[float]) -> str:
+    """Тривалість для звітів адмін-панелі: мс, с або хв"""
+    if value is None:
+        return '-'
+    if value < 1:
+        return f'{value * 1000:.0f}мс'
+    if value < 60:
+        return f'{value:.1f}с'
+    return f'{value / 60:.1f}хв'
+
+
+# Глобальний реєстр процесу
+REGISTRY = MetricsRegistry()
+
+# Спільні метрики моніторів (мітка monitor розрізняє джерело)
+POLL_SECONDS = REGISTRY.histogram('monitor_poll_seconds', 'Тривалість опитування одного акаунта/каналу', ('monitor',))
+SOURCE_RESPONSES = REGISTRY.counter('monitor_source_responses_total', 'Відповіді джерела за статусом', ('monitor', 'status'))
+EVENTS_DETECTED = REGISTRY.counter('monitor_events_detected_total', 'Виявлені нові події', ('monitor',))
+MONITORED_ACCOUNTS = REGISTRY.gauge('monitor_accounts', 'Кількість акаунтів/каналів під моніторингом', ('monitor',))
+BATCH_GROUPS = REGISTRY.counter('monitor_batch_groups_total', 'Пошукові запити груп акаунтів за результатом', ('monitor', 'result'))
@@ -0,0 +1,70 @@
+"""
+Знімок стану монітора для теплого старту
+
+Монітор зберігає компактний стан (останні ID, знайдені user_id, курсори,
+статистику опитувань) в JSON файл періодично і при зупинці, а при запуску
+відновлює його, щоб продовжити з місця зупинки без повторного "базового"
+опитування кожного акаунта.
+
+Запис атомарний (тимчасовий файл + os.replace) і не частіший за save_interval.
+"""
+
+import logging
+import os
+import time
+from typing import Dict, Optional
+
+import json_codec
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 1
+
+
+class MonitorStateStore:
+    """Файл стану монітора з обмеженням частоти запису"""
+
+    def __init__(self, path: str, save_interval: float = 60.0):
+        self.path = path
+        self.save_interval = save_interval
+        self._last_save = 0.0
+
+    def load(self) -> Dict:
+        """Завантажити стан; порожній dict якщо файлу немає, він пошкоджений або іншої версії"""
+        try:
+            if not os.path.exists(self.path):
+                return {}
+            state = json_codec.load_file(self.path)
+            if state.get('version') != STATE_VERSION:
+                logger.warning(f"Стан {self.path} має іншу версію ({state.get('version')}), ігноруємо")
+                return {}
+            return state
+        except Exception as e:
+            logger.error(f"Помилка завантаження стану монітора {self.path}: {e}")
+            return {}
+
+    def due(self) -> bool:
+        return time.monotonic() - self._last_save >= self.save_interval
+
+    def save(self, state: Dict, force: bool = False) -> bool:
+        """Записати стан, якщо минуло save_interval (або force). Повертає True якщо записано"""
+        if not force and not self.due():
+            return False
+        payload = dict(state)
+        payload['version'] = STATE_VERSION
+        payload['saved_at'] = time.time()
+        try:
+            json_codec.dump_file(self.path, payload)
+            self._last_save = time.monotonic()
+            return True
+        except Exception as e:
+            logger.error(f"Помилка збереження стану монітора {self.path}: {e}")
+            return False
+
+
+def downtime_seconds(state: Dict) -> Optional[float]:
+    """Скільки секунд монітор не працював з моменту останнього збереження"""
+    saved_at = state.get('saved_at')
+    if not saved_at:
+        return None
+    return max(0.0, time.time() - saved_at)
@@ -0,0 +1,96 @@
+"""
+Індекс підписок моніторів
+
+Зберігає, скільки проектів посилається на кожен Twitter акаунт / Discord канал.
+Монітор потрібно змінювати лише коли лічильник переходить 0 -> 1 або 1 -> 0,
+тому події проектів обробляються за O(1). Для кожної платформи підтримується
+контрольна сума множини ключів (XOR хешів), яку періодична перевірка
+порівнює з фактичним станом моніторів замість повного перебору проектів.
+"""
+
+import hashlib
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+# Twitter акаунти, які не моніторяться - спільний список для індексу підписок і TwitterMonitor,
+# інакше індекс і множина акаунтів монітора розходяться і перевірка щоразу синхронізує повністю
+FORBIDDEN_TWITTER_ACCOUNTS = frozenset({'twitter', 'x', 'elonmusk'})
+
+
+def is_forbidden_twitter_account(username: str) -> bool:
+    return username.lower() in FORBIDDEN_TWITTER_ACCOUNTS
+
+
+def key_hash(key: str) -> int:
+    """64-бітний хеш ключа (стабільний між запусками, на відміну від hash())"""
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def set_checksum(keys: Iterable[str]) -> int:
+    """Контрольна сума множини ключів, незалежна від порядку"""
+    checksum = 0
+    for key in set(keys):
+        checksum ^= key_hash(key)
+    return checksum
+
+
+class SubscriptionIndex:
+    """Лічильники посилань на підписки: (platform, key) -> кількість проектів"""
+
+    def __init__(self):
+        self._refs: Dict[Tuple[str, str], int] = {}
+        self._targets: Dict[Tuple[str, str], str] = {}  # Оригінальне значення (напр. URL Discord каналу)
+        self._keys: Dict[str, Set[str]] = {}
+        self._checksums: Dict[str, int] = {}
+
+    def add(self, platform: str, key: str, target: Optional[str] = None) -> bool:
+        """Додати посилання. Повертає True якщо підписка щойно з'явилася"""
+        ref = (platform, key)
+        count = self._refs.get(ref, 0)
+        self._refs[ref] = count + 1
+        if count:
+            return False
+        self._targets[ref] = target if target is not None else key
+        self._keys.setdefault(platform, set()).add(key)
+        self._checksums[platform] = self._checksums.get(platform, 0) ^ key_hash(key)
+        return True
+
+    def remove(self, platform: str, key: str) -> bool:
+        """Зняти посилання. Повертає True якщо підписка більше нікому не потрібна"""
+        ref = (platform, key)
+        count = self._refs.get(ref, 0)
+        if count > 1:
+            self._refs[ref] = count - 1
+            return False
+        if not count:
+            return False
+        del self._refs[ref]
+        del self._targets[ref]
+        self._keys[platform].discard(key)
+        self._checksums[platform] ^= key_hash(key)
+        return True
+
+    def target(self, platform: str, key: str) -> Optional[str]:
+        return self._targets.get((platform, key))
+
+    def keys(self, platform: str) -> Set[str]:
+        return set(self._keys.get(platform, ()))
+
+    def targets(self, platform: str) -> Dict[str, str]:
+        """key -> оригінальне значення для платформи"""
+        return {key: self._targets[(platform, key)] for key in self._keys.get(platform, ())}
+
+    def checksum(self, platform: str) -> int:
+        return self._checksums.get(platform, 0)
+
+    def matches(self, platform: str, keys: Iterable[str]) -> bool:
+        """Чи збігається фактичний набір ключів монітора з індексом"""
+        return set_checksum(keys) == self.checksum(platform)
+
+    def clear(self) -> None:
+        self._refs.clear()
+        self._targets.clear()
+        self._keys.clear()
+        self._checksums.clear()
+
+    def __len__(self) -> int:
+        return len(self._refs)
@@ -1,9 +1,9 @@
-import json
 import os
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional
 from access_manager import access_manager
+import json_codec
 
 class ProjectManager:
     def __init__(self, data_file: str = "data.json"):
@@ -22,8 +22,27 @@ class ProjectManager:
         self.logger = logging.getLogger(__name__)
         self._last_save = datetime.now()
         self._save_interval = 30  # Зберігаємо кожні 30 секунд
+        self._listeners: List[Callable[[str, Dict], None]] = []
         self.load_data()
         
+    def add_listener(self, listener: Callable[[str, Dict], None]) -> None:
+        """Підписатися на зміни проектів.
+        
+        listener(event, payload) викликається для подій:
+        project_added / project_removed (payload - дані проекту),
+        account_added / account_removed (payload - {'username': ...}),
+        reset (дані перезавантажено, payload порожній).
+        """
+        self._listeners.append(listener)
+        
+    def _emit(self, event: str, payload: Dict) -> None:
+        """Повідомити слухачів про зміну"""
+        for listener in list(self._listeners):
+            try:
+                listener(event, payload)
+            except Exception as e:
+                self.logger.error(f"Помилка обробки події {event}: {e}")
+        
     def _generate_project_tag(self, project_data: Dict) -> str:
         """Генерувати тег для проекту"""
         try:
@@ -54,8 +73,7 @@ class ProjectManager:
         """Завантажити дані з файлу"""
         try:
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
+                loaded_data = json_codec.load_file(self.data_file)
                     
                 # Міграція зі старої структури (projects.json)
                 if 'projects' not in loaded_data and isinstance(loaded_data, dict):
@@ -67,6 +85,7 @@ class ProjectManager:
                     self.data.update(loaded_data)
                     
                 self.logger.info(f"Завантажено дані: {len(self.data['projects'])} користувачів з проектами")
+                self._emit('reset', {})
             else:
                 self.logger.info("Створено новий файл даних")
         except Exception as e:
@@ -82,8 +101,7 @@ class ProjectManager:
                 return
                 
             self.data['metadata']['last_updated'] = now.isoformat()
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            json_codec.dump_file(self.data_file, self.data, pretty=True)  # Файл переглядають вручну - з відступами
             self._last_save = now
         except Exception as e:
             self.logger.error(f"Помилка збереження даних: {e}")
@@ -113,6 +131,7 @@ class ProjectManager:
             if 'ping_users' not in project_data:
                 project_data['ping_users'] = []
             self.data['projects'][user_id_str].append(project_data)
+            self._emit('project_added', project_data)
             # Автоматично створюємо thread для проекту, якщо є налаштування пересилання
             forward_channel = self.get_forward_channel(user_id)
             if forward_channel:
@@ -220,6 +239,7 @@ class ProjectManager:
                 for i, project in enumerate(projects):
                     if project['id'] == project_id:
                         del projects[i]
+                        self._emit('project_removed', project)
                         self.save_data()
                         self.logger.info(f"Видалено проект {project_id} для користувача {user_id}")
                         return True
@@ -557,8 +577,7 @@ class ProjectManager:
             export_file = f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
-            with open(export_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            json_codec.dump_file(export_file, self.data, pretty=True)
             self.logger.info(f"Дані експортовано в {export_file}")
             return export_file
         except Exception as e:
@@ -568,8 +587,7 @@ class ProjectManager:
     def import_data(self, import_file: str) -> bool:
         """Імпортувати дані"""
         try:
-            with open(import_file, 'r', encoding='utf-8') as f:
-                imported_data = json.load(f)
+            imported_data = json_codec.load_file(import_file)
             
             # Створюємо резервну копію
             backup_file = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -577,6 +595,7 @@ class ProjectManager:
             
             # Імпортуємо дані
             self.data.update(imported_data)
+            self._emit('reset', {})
             self.save_data()
             
             self.logger.info(f"Дані імпортовано з {import_file}")
@@ -600,7 +619,10 @@ class ProjectManager:
                 'last_checked': None
             }
             
+            previous = self.data['selenium_accounts'].get(username)
             self.data['selenium_accounts'][username] = account_data
+            if not previous or not previous.get('is_active', True):
+                self._emit('account_added', {'username': username})
             self.save_data(force=True)
             
             self.logger.info(f"Додано Selenium Twitter акаунт: {username}")
@@ -617,7 +639,9 @@ class ProjectManager:
                 return False
             
             if username in self.data['selenium_accounts']:
-                del self.data['selenium_accounts'][username]
+                previous = self.data['selenium_accounts'].pop(username)
+                if previous.get('is_active', True):
+                    self._emit('account_removed', {'username': username})
                 self.save_data(force=True)
                 
                 self.logger.info(f"Видалено Selenium Twitter акаунт: {username}")
@@ -653,7 +677,10 @@ class ProjectManager:
                 return False
             
             if username in self.data['selenium_accounts']:
+                was_active = self.data['selenium_accounts'][username].get('is_active', True)
                 self.data['selenium_accounts'][username]['is_active'] = is_active
+                if was_active != is_active:
+                    self._emit('account_added' if is_active else 'account_removed', {'username': username})
                 self.data['selenium_accounts'][username]['last_checked'] = datetime.now().isoformat()
                 self.save_data(force=True)
                 
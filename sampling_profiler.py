@@ -0,0 +1,140 @@
+"""
+Семплюючий профайлер усіх потоків процесу
+
+Під час профілювання фоновий цикл кожні interval секунд знімає стеки всіх
+потоків (sys._current_frames) і рахує однакові стеки. Поза профілюванням
+нічого не працює, тож у простої накладних витрат немає.
+
+Результат:
+    collapsed() - формат "потік;функція;...;функція кількість" (flamegraph.pl / speedscope)
+    summary()   - топ функцій за власним та інклюзивним часом
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+Stack = Tuple[str, ...]
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class ProfileResult:
+    """Зібрані семпли одного запуску профайлера"""
+
+    def __init__(self, stacks: Counter, samples: int, duration: float, interval: float):
+        self.stacks = stacks  # (потік, кадр від кореня, ..., листовий кадр) -> кількість
+        self.samples = samples
+        self.duration = duration
+        self.interval = interval
+
+    def collapsed(self) -> str:
+        lines = [f"{';'.join(stack)} {count}" for stack, count in self.stacks.most_common()]
+        return '\n'.join(lines) + '\n'
+
+    def top_functions(self, top: int = 15) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+        """(власний час, інклюзивний час) - функції з кількістю семплів"""
+        own: Counter = Counter()
+        inclusive: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack[1:]
+            if not frames:
+                continue
+            own[frames[-1]] += count
+            for frame in set(frames):
+                inclusive[frame] += count
+        return own.most_common(top), inclusive.most_common(top)
+
+    def thread_totals(self) -> List[Tuple[str, int]]:
+        totals: Counter = Counter()
+        for stack, count in self.stacks.items():
+            totals[stack[0]] += count
+        return totals.most_common()
+
+    def summary(self, top: int = 15) -> str:
+        total = sum(self.stacks.values()) or 1
+        own, inclusive = self.top_functions(top)
+        lines = [
+            f"Тривалість: {self.duration:.1f}с, знімків: {self.samples}, інтервал: {self.interval * 1000:.0f}мс",
+            "",
+            "Потоки:"
+        ]
+        lines += [f"  {count / total:6.1%}  {name}" for name, count in self.thread_totals()]
+        lines += ["", "Власний час (листові кадри):"]
+        lines += [f"  {count / total:6.1%}  {frame}" for frame, count in own]
+        lines += ["", "Інклюзивний час:"]
+        lines += [f"  {count / total:6.1%}  {frame}" for frame, count in inclusive]
+        return '\n'.join(lines)
+
+
+class SamplingProfiler:
+    """Обмежене в часі профілювання; одночасно може працювати лише один запуск"""
+
+    def __init__(self, interval: float = 0.01, max_depth: int = 64):
+        self.interval = interval
+        self.max_depth = max_depth
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    def run(self, duration: float, idle_filter: bool = True) -> Optional[ProfileResult]:
+        """Блокуючий запуск на duration секунд (викликати з окремого потоку).
+
+        Повертає None, якщо профілювання вже триває. idle_filter прибирає стеки
+        потоків, що чекають на select/poll/Condition.wait - інакше вони
+        домінують у звіті.
+        """
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            return self._sample(duration, idle_filter)
+        finally:
+            self._lock.release()
+
+    def _sample(self, duration: float, idle_filter: bool) -> ProfileResult:
+        own_ident = threading.get_ident()
+        stacks: Counter = Counter()
+        samples = 0
+        started = time.perf_counter()
+        deadline = started + duration
+        names: Dict[int, str] = {}
+
+        while time.perf_counter() < deadline:
+            if len(names) != threading.active_count():
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                frames = []
+                depth = 0
+                while frame is not None and depth < self.max_depth:
+                    frames.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                    depth += 1
+                if idle_filter and frames and _is_idle(frames[0]):
+                    continue
+                frames.reverse()
+                stacks[(names.get(ident, f'thread-{ident}'),) + tuple(frames)] += 1
+            samples += 1
+            time.sleep(self.interval)
+
+        return ProfileResult(stacks, samples, time.perf_counter() - started, self.interval)
+
+
+_IDLE_FUNCTIONS = ('select ', 'poll ', 'wait ', '_worker ', 'serve_forever ', 'accept ')
+
+
+def _is_idle(leaf: str) -> bool:
+    """Листовий кадр потоку, що просто чекає (event loop без задач, пул потоків, Event.wait)"""
+    return leaf.startswith(_IDLE_FUNCTIONS)
+
+
+# Глобальний профайлер процесу
+profiler = SamplingProfiler()
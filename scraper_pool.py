@@ -0,0 +1,192 @@
+"""
+Стан пулу акаунтів twscrape для TwitterMonitorAdapter
+
+twscrape сам видає акаунти з accounts.db під кожен запит (черга = GraphQL
+операція, напр. UserTweets) і сам блокує їх на rate limit, але адаптер цього
+не бачить. ScraperPoolHealth підміняє на екземплярі AccountsPool методи, якими
+QueueClient бере та повертає акаунт:
+
+    get_for_queue_or_wait  - акаунт виданий під запит (початок заміру)
+    unlock                 - запит успішний
+    lock_until             - rate limit або помилка, акаунт заблоковано до часу
+    mark_inactive          - акаунт забанено / розлогінено
+
+і веде по кожному акаунту успіхи, серії невдач, затримку та блокування.
+Акаунт, що блокується кілька разів поспіль, отримує довше блокування
+(експоненційно до MAX_COOLDOWN), тож twscrape видає здорові акаунти.
+concurrency(queue) - скільки акаунтів монітора опитувати паралельно: не
+більше, ніж акаунтів пулу зараз можуть обслужити чергу.
+"""
+
+import logging
+import time
+from typing import Dict, Optional, Set
+
+from metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+POOL_ACCOUNTS = REGISTRY.gauge('scraper_pool_accounts', 'Акаунти пулу twscrape за станом', ('state',))
+POOL_AVAILABLE = REGISTRY.gauge('scraper_pool_available', 'Акаунти пулу, доступні для черги', ('queue',))
+POOL_IN_FLIGHT = REGISTRY.gauge('scraper_pool_in_flight', 'Акаунти пулу, видані під запит зараз', ('queue',))
+POOL_REQUESTS = REGISTRY.counter('scraper_pool_requests_total', 'Запити через акаунти пулу за результатом', ('account', 'result'))
+POOL_LATENCY = REGISTRY.histogram('scraper_pool_request_seconds', 'Час від видачі акаунта пулу до його повернення', ('queue',))
+
+FAILURES_BEFORE_BACKOFF = 2  # Блокувань поспіль, після яких блокування подовжується
+BACKOFF_BASE = 60.0
+MAX_COOLDOWN = 30 * 60.0
+MAX_CONCURRENCY = 8
+DEFAULT_CONCURRENCY = 3  # Поки стан пулу невідомий
+LATENCY_SMOOTHING = 0.2  # Вага нового заміру в ковзному середньому затримки
+
+
+class ScraperAccountHealth:
+    """Стан одного акаунта пулу"""
+
+    __slots__ = ('requests', 'failures', 'streak', 'latency', 'locked_until', 'inactive', 'last_error', 'started')
+
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.streak = 0  # Невдачі поспіль
+        self.latency: Optional[float] = None  # Ковзне середнє, с
+        self.locked_until: Dict[str, float] = {}  # Черга -> unix час
+        self.inactive = False
+        self.last_error: Optional[str] = None
+        self.started: Dict[str, float] = {}  # Черга -> час видачі під поточний запит
+
+
+class ScraperPoolHealth:
+    """Облік здоров'я акаунтів AccountsPool та ліміт паралельності монітора"""
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self.pool = None
+        self.accounts: Dict[str, ScraperAccountHealth] = {}
+        self.available: Dict[str, int] = {}  # Черга -> доступні акаунти (з останнього refresh)
+        self.active: Optional[int] = None  # Активні акаунти з останнього refresh (None - ще невідомо)
+        self._locked_since_refresh: Dict[str, Set[str]] = {}  # Черга -> акаунти, заблоковані після refresh
+
+    def attach(self, pool) -> None:
+        """Підключитись до AccountsPool (методи підміняються лише на цьому екземплярі)"""
+        self.pool = pool
+        get_for_queue_or_wait, unlock = pool.get_for_queue_or_wait, pool.unlock
+        lock_until, mark_inactive = pool.lock_until, pool.mark_inactive
+
+        async def tracked_get_for_queue_or_wait(queue: str, *args, **kwargs):
+            account = await get_for_queue_or_wait(queue, *args, **kwargs)
+            if account is not None:
+                self._acquired(account.username, queue)
+            return account
+
+        async def tracked_unlock(username: str, queue: str, *args, **kwargs):
+            self._released(username, queue, 'ok')
+            return await unlock(username, queue, *args, **kwargs)
+
+        async def tracked_lock_until(username: str, queue: str, unlock_at: int, *args, **kwargs):
+            unlock_at = self._released(username, queue, 'locked', unlock_at)
+            return await lock_until(username, queue, unlock_at, *args, **kwargs)
+
+        async def tracked_mark_inactive(username: str, error_msg: Optional[str], *args, **kwargs):
+            health = self._health(username)
+            health.inactive = True
+            health.last_error = error_msg
+            for queue in list(health.started):
+                self._released(username, queue, 'inactive')
+            logger.warning("Акаунт пулу twscrape %s неактивний: %s", username, error_msg)
+            return await mark_inactive(username, error_msg, *args, **kwargs)
+
+        pool.get_for_queue_or_wait = tracked_get_for_queue_or_wait
+        pool.unlock = tracked_unlock
+        pool.lock_until = tracked_lock_until
+        pool.mark_inactive = tracked_mark_inactive
+
+    async def refresh(self) -> None:
+        """Оновити кількість активних / заблокованих акаунтів з accounts.db (раз на цикл опитування)"""
+        if self.pool is None:
+            return
+        try:
+            stats = await self.pool.stats()
+        except Exception as e:
+            logger.error(f"Помилка отримання стану пулу twscrape: {e}")
+            return
+        self.active = int(stats.get('active', 0))
+        self._locked_since_refresh.clear()
+        POOL_ACCOUNTS.set(self.active, state='active')
+        POOL_ACCOUNTS.set(int(stats.get('inactive', 0)), state='inactive')
+        locked_total = 0
+        for key, value in stats.items():
+            if key.startswith('locked_'):
+                queue = key[len('locked_'):]
+                locked_total = max(locked_total, int(value))
+                self.available[queue] = max(0, self.active - int(value))
+                POOL_AVAILABLE.set(self.available[queue], queue=queue)
+        POOL_ACCOUNTS.set(locked_total, state='locked')
+
+    def concurrency(self, queue: str) -> int:
+        """Скільки акаунтів монітора опитувати паралельно для черги queue"""
+        if self.active is None:
+            return DEFAULT_CONCURRENCY
+        available = self.available.get(queue, self.active)
+        # Блокування, про які дізнались після refresh
+        available -= len(self._locked_since_refresh.get(queue, ()))
+        return max(1, min(self.max_concurrency, available))
+
+    def summary(self) -> Dict[str, Dict]:
+        """Стан акаунтів пулу для діагностики: username -> показники"""
+        now = time.time()
+        return {
+            username: {
+                'requests': health.requests,
+                'failures': health.failures,
+                'streak': health.streak,
+                'latency': health.latency,
+                'locked': sorted(queue for queue, until in health.locked_until.items() if until > now),
+                'inactive': health.inactive,
+                'last_error': health.last_error
+            }
+            for username, health in self.accounts.items()
+        }
+
+    def _health(self, username: str) -> ScraperAccountHealth:
+        health = self.accounts.get(username)
+        if health is None:
+            health = self.accounts[username] = ScraperAccountHealth()
+        return health
+
+    def _acquired(self, username: str, queue: str) -> None:
+        health = self._health(username)
+        health.inactive = False
+        health.started[queue] = time.time()
+        POOL_IN_FLIGHT.inc(queue=queue)
+
+    def _released(self, username: str, queue: str, result: str, unlock_at: Optional[int] = None) -> Optional[int]:
+        """Зафіксувати результат запиту (ok, locked, inactive); для блокування повертає (можливо подовжений) час розблокування"""
+        health = self._health(username)
+        started = health.started.pop(queue, None)
+        if started is not None:
+            POOL_IN_FLIGHT.dec(queue=queue)
+            elapsed = time.time() - started
+            POOL_LATENCY.observe(elapsed, queue=queue)
+            health.latency = elapsed if health.latency is None else (
+                health.latency + LATENCY_SMOOTHING * (elapsed - health.latency))
+        health.requests += 1
+        POOL_REQUESTS.inc(account=username, result=result)
+        if result == 'ok':
+            health.streak = 0
+            health.locked_until.pop(queue, None)
+            self._locked_since_refresh.get(queue, set()).discard(username)
+            return None
+
+        health.failures += 1
+        health.streak += 1
+        if unlock_at is not None and health.streak > FAILURES_BEFORE_BACKOFF:
+            # Акаунт блокується знову і знову - тримаємо його довше, щоб запити йшли на інші
+            cooldown = min(MAX_COOLDOWN, BACKOFF_BASE * 2 ** (health.streak - FAILURES_BEFORE_BACKOFF - 1))
+            unlock_at = max(unlock_at, int(time.time() + cooldown))
+            logger.info("Акаунт пулу %s заблоковано для %s ще на %.0fс (%s невдач поспіль)",
+                        username, queue, cooldown, health.streak)
+        if unlock_at is not None:
+            health.locked_until[queue] = float(unlock_at)
+            self._locked_since_refresh.setdefault(queue, set()).add(username)
+        return unlock_at
@@ -6,7 +6,6 @@ Selenium Twitter Monitor для інтеграції з ботом
 import asyncio
 import logging
 import time
-import json
 import os
 import urllib3
 from datetime import datetime
@@ -19,14 +18,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+import json_codec
+
 # Відключаємо попередження про SSL сертифікати
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-# Налаштування логування
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Логування налаштовує застосунок (bot.configure_logging); basicConfig - лише при запуску модуля напряму
 logger = logging.getLogger(__name__)
 
 class SeleniumTwitterMonitor:
@@ -843,8 +840,7 @@ class SeleniumTwitterMonitor:
                 else:
                     data_to_save[account] = tweet_ids
             
-            with open(self.seen_tweets_file, 'w', encoding='utf-8') as f:
-                json.dump(data_to_save, f, ensure_ascii=False, indent=2)
+            json_codec.dump_file(self.seen_tweets_file, data_to_save)  # Файл лише для програми - компактно
             logger.debug(f"Збережено seen_tweets для {len(data_to_save)} акаунтів")
             return True
         except Exception as e:
@@ -855,8 +851,7 @@ class SeleniumTwitterMonitor:
         """Завантажити список оброблених твітів"""
         try:
             if os.path.exists(self.seen_tweets_file):
-                with open(self.seen_tweets_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = json_codec.load_file(self.seen_tweets_file)
                 
                 # Конвертуємо list назад у set
                 for account, tweet_ids in data.items():
@@ -888,4 +883,8 @@ async def main():
         print(f"Знайдено {len(new_tweets)} нових твітів")
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     asyncio.run(main())
\ No newline at end of file
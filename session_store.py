@@ -0,0 +1,92 @@
+"""
+Сховище сесій в пам'яті з чергою закінчення на купі
+
+Замість перебору всіх сесій при кожній перевірці, час останньої активності
+кожної сесії потрапляє в мін-купу. Пошук закінчених сесій знімає з вершини
+лише ті записи, що вже прострочені, тому коштує O(expired · log n).
+Застарілі записи (після оновлення активності) відкидаються ліниво.
+"""
+
+import heapq
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+class SessionStore:
+    """Сесії користувачів: user_id -> час останньої активності"""
+
+    def __init__(self, timeout_seconds: float):
+        self.timeout_seconds = timeout_seconds
+        self._last_activity: Dict[Hashable, float] = {}  # user_id -> time.monotonic()
+        self._heap: List[Tuple[float, Hashable]] = []
+
+    def touch(self, user_id: Hashable) -> None:
+        """Почати сесію або оновити її активність"""
+        now = time.monotonic()
+        self._last_activity[user_id] = now
+        heapq.heappush(self._heap, (now, user_id))
+        # Купа росте з кожним оновленням - періодично прибираємо застарілі записи
+        if len(self._heap) > 4 * len(self._last_activity) + 64:
+            self._compact()
+
+    def remove(self, user_id: Hashable) -> bool:
+        """Завершити сесію (запис у купі буде відкинуто при наступній перевірці)"""
+        return self._last_activity.pop(user_id, None) is not None
+
+    def clear(self) -> None:
+        self._last_activity.clear()
+        self._heap.clear()
+
+    def idle_seconds(self, user_id: Hashable) -> Optional[float]:
+        """Скільки секунд сесія неактивна (None якщо сесії немає)"""
+        last = self._last_activity.get(user_id)
+        if last is None:
+            return None
+        return time.monotonic() - last
+
+    def is_expired(self, user_id: Hashable, timeout_seconds: Optional[float] = None) -> bool:
+        idle = self.idle_seconds(user_id)
+        timeout = self.timeout_seconds if timeout_seconds is None else timeout_seconds
+        return idle is None or idle > timeout
+
+    def time_left(self, user_id: Hashable) -> float:
+        """Секунд до закінчення сесії"""
+        idle = self.idle_seconds(user_id)
+        if idle is None:
+            return 0
+        return max(0.0, self.timeout_seconds - idle)
+
+    def last_activity(self, user_id: Hashable) -> Optional[datetime]:
+        """Час останньої активності як datetime (для відображення)"""
+        idle = self.idle_seconds(user_id)
+        if idle is None:
+            return None
+        return datetime.now() - timedelta(seconds=idle)
+
+    def pop_expired(self, timeout_seconds: Optional[float] = None) -> List[Hashable]:
+        """Видалити та повернути сесії, неактивні довше timeout_seconds"""
+        timeout = self.timeout_seconds if timeout_seconds is None else timeout_seconds
+        cutoff = time.monotonic() - timeout
+        expired = []
+        heap = self._heap
+        while heap and heap[0][0] < cutoff:
+            activity, user_id = heapq.heappop(heap)
+            # Запис актуальний лише якщо збігається з поточною активністю сесії
+            if self._last_activity.get(user_id) == activity:
+                del self._last_activity[user_id]
+                expired.append(user_id)
+        return expired
+
+    def _compact(self) -> None:
+        self._heap = [(activity, user_id) for user_id, activity in self._last_activity.items()]
+        heapq.heapify(self._heap)
+
+    def __contains__(self, user_id: Hashable) -> bool:
+        return user_id in self._last_activity
+
+    def __len__(self) -> int:
+        return len(self._last_activity)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._last_activity))
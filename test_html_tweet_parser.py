@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Тест однопрохідного HTML парсера твітів на збережених сторінках (fixtures/html)
+
+Перевіряє ID, текст і зображення для трьох варіантів розмітки (x.com, стара
+розмітка twitter.com, довільні блоки з data-tweet-id/tweet_id=), ранню зупинку
+генератора. Час однопрохідного парсера та попередньої реалізації на regex
+лише виводиться - на результат тестів він не впливає.
+
+Запуск: python -m pytest test_html_tweet_parser.py або python test_html_tweet_parser.py
+"""
+
+import itertools
+import os
+import re
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+
+from html_tweet_parser import iter_html_tweets  # noqa: E402
+
+FIXTURES_DIR = os.path.join(REPO_DIR, 'fixtures', 'html')
+
+EXPECTED = {
+    'x_profile.html': [
+        ('1890000000000000001', 'Testnet v2 is live & open for everyone Join now',
+         ['https://pbs.twimg.com/media/GjA1bCdXkAA1.jpg?format=jpg&name=small']),
+        (None, 'Partnership announcement with a friendly project', []),  # Репост іншого автора - без ID
+        ('1890000000000000003', 'gm', []),
+        ('1890000000000000004', 'Quoting our roadmap: Q1 mainnet',
+         ['https://pbs.twimg.com/ext_tw_video_thumb/1890000000000000005/pu/img/abc.jpg'])
+    ],
+    'legacy_profile.html': [
+        ('1100000000000000011', 'Legacy layout tweet with #AI hashtag', ['https://pbs.twimg.com/media/Dlegacy01.jpg']),
+        ('1100000000000000012', 'Check https://x.com/OtherProject/status/1100000000000000099 please', [])
+    ],
+    'generic_profile.html': [
+        ('1200000000000000021', 'Plain block without a text container inside', []),
+        ('1200000000000000023', 'Paragraph text of an embedded post, bold part', [])
+    ]
+}
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def regex_parse(html: str, limit: int = 10) -> list:
+    """Попередня реалізація _basic_html_parsing (лише пошук блоків і тексту) - еталон швидкості"""
+    tweet_patterns = [
+        r'<article[^>]*data-testid="tweet"[^>]*>(.*?)</article>',
+        r'<div[^>]*data-testid="tweet"[^>]*>(.*?)</div>',
+        r'<div[^>]*class="[^"]*tweet[^"]*"[^>]*>(.*?)</div>',
+        r'data-tweet-id="(\d+)"[^>]*>(.*?)</div>',
+        r'tweet_id=(\d+).*?>(.*?)<'
+    ]
+    text_patterns = [
+        r'<div[^>]*dir="auto"[^>]*>(.*?)</div>',
+        r'<div[^>]*class="[^"]*tweet-text[^"]*"[^>]*>(.*?)</div>',
+        r'<span[^>]*class="[^"]*tweet-text[^"]*"[^>]*>(.*?)</span>',
+        r'<p[^>]*>(.*?)</p>',
+        r'data-testid="tweetText"[^>]*>(.*?)</div>'
+    ]
+    tweets = []
+    for pattern in tweet_patterns:
+        for match in re.findall(pattern, html, re.DOTALL)[:limit]:
+            tweet_html = match if isinstance(match, str) else match[1]
+            text = ""
+            for text_pattern in text_patterns:
+                text_match = re.search(text_pattern, tweet_html, re.DOTALL)
+                if text_match:
+                    text = re.sub(r'<[^>]+>', '', text_match.group(1)).strip()
+                    break
+            if not text:
+                text = re.sub(r'<[^>]+>', '', tweet_html).strip()
+            text = re.sub(r'\s+', ' ', text).strip()
+            if len(text) > 10:
+                tweets.append(text)
+        if tweets:
+            break
+    return tweets
+
+
+def test_fixtures():
+    """Результат парсера збігається з очікуваним для кожної сторінки"""
+    for name, expected in EXPECTED.items():
+        found = [(tweet['id'], tweet['text'], tweet['images']) for tweet in iter_html_tweets(load_fixture(name), 'GoKiteAI')]
+        assert found == expected, f"{name}:\n   очікували {expected}\n   отримали  {found}"
+        print(f"✅ {name}: {len(found)} твітів")
+
+
+def test_early_stop():
+    """Генератор віддає твіти по одному: перші доступні без розбору решти великої сторінки"""
+    html = load_fixture('x_profile.html')
+    article = html[html.index('<article'):html.index('</article>') + len('</article>')]
+    big_page = '<html><body>' + article * 20000 + '</body></html>'
+
+    tweets = iter_html_tweets(big_page, 'GoKiteAI')
+    assert iter(tweets) is tweets, "iter_html_tweets має повертати ітератор, а не готовий список"
+
+    started = time.perf_counter()
+    first = [tweet['id'] for tweet in itertools.islice(tweets, 3)]
+    first_seconds = time.perf_counter() - started
+    assert first == ['1890000000000000001'] * 3, first
+
+    started = time.perf_counter()
+    total = sum(1 for _ in iter_html_tweets(big_page, 'GoKiteAI'))
+    full_seconds = time.perf_counter() - started
+    assert total == 20000, total
+
+    print(f"✅ Рання зупинка: перші 3 твіти {first_seconds * 1000:.2f}мс, "
+          f"уся сторінка ({total} твітів) {full_seconds * 1000:.1f}мс")
+
+
+def test_speed():
+    """Перші 10 твітів довгої сторінки профілю; час порівняно з regex реалізацією лише виводиться"""
+    html = load_fixture('x_profile.html')
+    body = html[html.index('<div data-testid="cellInnerDiv">'):html.index('</section>')]
+    page = html.replace(body, body * 100)  # ~400 твітів, як у довгій стрічці
+
+    def timed(func, runs: int = 20) -> float:
+        started = time.perf_counter()
+        for _ in range(runs):
+            func()
+        return (time.perf_counter() - started) / runs
+
+    def single_pass():
+        tweets = []
+        for tweet in iter_html_tweets(page, 'GoKiteAI'):
+            if len(tweet['text']) > 10:
+                tweets.append(tweet)
+                if len(tweets) >= 10:
+                    break
+        return tweets
+
+    # Стара реалізація залишала сутності (&amp;) та обрізала текст на першому </div>,
+    # тому тексти порівнюються з очікуваними, а не з її результатом
+    expected_texts = [text for _, text, _ in EXPECTED['x_profile.html'] if len(text) > 10]
+    expected_texts = (expected_texts * 10)[:10]
+    texts = [tweet['text'] for tweet in single_pass()]
+    assert texts == expected_texts, texts
+
+    old_seconds = timed(lambda: regex_parse(page))
+    new_seconds = timed(single_pass)
+    print(f"✅ Тексти правильні; час (10 твітів з {len(page) // 1024}KB): regex {old_seconds * 1000:.2f}мс, "
+          f"один прохід {new_seconds * 1000:.2f}мс")
+
+
+if __name__ == "__main__":
+    print("🧪 Тестування HTML парсера твітів...")
+    failed = 0
+    for test in (test_fixtures, test_early_stop, test_speed):
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    print("\n✅ Усі тести пройдено" if not failed else f"\n❌ Не пройдено тестів: {failed}")
+    sys.exit(1 if failed else 0)
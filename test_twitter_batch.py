@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Тест планувальника пакетного опитування (twitter_batch.BatchPlanner)
+
+Перевіряє розбиття акаунтів на групи в межах довжини запиту, окреме
+опитування одиночних і "solo" акаунтів, зменшення розміру груп при неповному
+покритті та перевірку акаунтів, яких пошук давно не повертав.
+
+Запуск: python -m pytest test_twitter_batch.py або python test_twitter_batch.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from twitter_batch import BatchPlanner, search_query  # noqa: E402
+
+ACCOUNTS = [f'account{index}' for index in range(7)]
+
+
+def test_grouping():
+    """Групи в межах довжини запиту, одиночний акаунт окремо"""
+    planner = BatchPlanner(max_query_length=len(search_query(ACCOUNTS[:3])))
+    groups, individual = planner.plan(ACCOUNTS)
+    assert groups == [ACCOUNTS[0:3], ACCOUNTS[3:6]], groups
+    assert individual == [ACCOUNTS[6]], individual
+    assert all(len(search_query(group)) <= planner.max_query_length for group in groups)
+
+
+def test_truncated_page_shrinks_groups():
+    """Неповне покриття зменшує розмір груп"""
+    planner = BatchPlanner()
+    groups, _ = planner.plan(ACCOUNTS)
+    planner.record_page(groups[0], ACCOUNTS[:2], truncated=True)
+    groups, individual = planner.plan(ACCOUNTS)
+    assert planner.group_size == 3, planner.group_size
+    assert [len(group) for group in groups] == [3, 3], groups
+    assert individual == [ACCOUNTS[6]], individual
+
+
+def test_probe_and_solo():
+    """Перевірка акаунтів, яких пошук давно не повертав, і перехід в окреме опитування"""
+    planner = BatchPlanner(probe_seconds=60)
+    planner.plan(ACCOUNTS)
+    planner.last_seen[ACCOUNTS[0]] -= 120  # Пошук давно не повертав account0
+    planner.last_seen[ACCOUNTS[1]] -= 120
+    groups, individual = planner.plan(ACCOUNTS)
+    assert individual == ACCOUNTS[:2], individual
+    assert ACCOUNTS[0] not in sum(groups, []), groups
+
+    planner.record_individual(ACCOUNTS[0], found_new=True)   # Окремо знайшлися нові твіти - пошук його не бачить
+    planner.record_individual(ACCOUNTS[1], found_new=False)  # Просто тихий акаунт
+    groups, individual = planner.plan(ACCOUNTS)
+    assert individual == [ACCOUNTS[0]], individual
+    assert ACCOUNTS[1] in groups[0], groups
+    assert planner.solo == {ACCOUNTS[0]}, planner.solo
+
+
+if __name__ == "__main__":
+    print("🧪 Тестування планувальника пакетного опитування...")
+    failed = 0
+    for test in (test_grouping, test_truncated_page_shrinks_groups, test_probe_and_solo):
+        try:
+            test()
+            print(f"✅ {test.__doc__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__doc__}: {e}")
+    print("\n✅ Усі тести пройдено" if not failed else f"\n❌ Не пройдено тестів: {failed}")
+    sys.exit(1 if failed else 0)
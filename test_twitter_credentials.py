@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Тест пулу облікових даних TwitterMonitor (twitter_credentials.CredentialPool)
+
+Перевіряє розбір TWITTER_CREDENTIALS, ротацію по черзі, карантин на 401/403
+і 429 та вибір пари за залишком ліміту запитів.
+
+Запуск: python -m pytest test_twitter_credentials.py або python test_twitter_credentials.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from twitter_credentials import CredentialPool, parse_credentials  # noqa: E402
+
+PAIRS = [('token_a', 'ct0_a'), ('token_b', 'ct0_b'), ('token_c', 'ct0_c')]
+
+
+def test_parse():
+    """Розбір TWITTER_CREDENTIALS"""
+    pairs = parse_credentials(' token_a:ct0_a, token_b:ct0_b;broken\ntoken_c:ct0_c ')
+    assert pairs == PAIRS, pairs
+
+
+def test_round_robin_and_quarantine():
+    """Ротація по черзі, карантин на 401"""
+    pool = CredentialPool(PAIRS + [PAIRS[0]])  # Дублікат пропускається
+    assert len(pool) == 3, len(pool)
+    order = [pool.acquire().auth_token for _ in range(3)]
+    assert order == ['token_a', 'token_b', 'token_c'], order
+    pool.release(pool.credentials[0], 401)
+    after = {pool.acquire().auth_token for _ in range(4)}
+    assert after == {'token_b', 'token_c'}, after
+
+
+def test_rate_limit_and_budget():
+    """Вибір за залишком ліміту, пауза до x-rate-limit-reset на 429"""
+    pool = CredentialPool(PAIRS, strategy='budget')
+    reset = str(int(time.time()) + 600)
+    pool.release(pool.credentials[0], 200, {'x-rate-limit-remaining': '3', 'x-rate-limit-reset': reset})
+    pool.release(pool.credentials[1], 200, {'x-rate-limit-remaining': '40', 'x-rate-limit-reset': reset})
+    pool.release(pool.credentials[2], 429, {'x-rate-limit-remaining': '0', 'x-rate-limit-reset': reset})
+    chosen = pool.acquire().auth_token
+    assert chosen == 'token_b', chosen
+    assert pool.credentials[2].quarantined_until >= int(reset), pool.credentials[2].quarantined_until
+
+
+def test_all_quarantined():
+    """Усі в карантині - запитів немає, доки карантин не закінчиться"""
+    pool = CredentialPool(PAIRS[:2])
+    pool.release(pool.credentials[0], 403)
+    pool.release(pool.credentials[1], 403)
+    assert not pool.available()
+    chosen = pool.acquire()
+    assert chosen is None, chosen.auth_token
+
+    pool.credentials[1].quarantined_until = time.time() - 1  # Карантин token_b закінчився
+    assert pool.available()
+    chosen = pool.acquire()
+    assert chosen is not None and chosen.auth_token == 'token_b', chosen
+
+
+if __name__ == "__main__":
+    print("🧪 Тестування пулу облікових даних Twitter...")
+    failed = 0
+    for test in (test_parse, test_round_robin_and_quarantine, test_rate_limit_and_budget, test_all_quarantined):
+        try:
+            test()
+            print(f"✅ {test.__doc__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__doc__}: {e}")
+    print("\n✅ Усі тести пройдено" if not failed else f"\n❌ Не пройдено тестів: {failed}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,125 @@
+"""
+Пакетне опитування Twitter акаунтів через пошук
+
+Замість окремого запиту UserTweets на кожен акаунт акаунти групуються в
+пошукові запити "(from:a OR from:b ...) -filter:replies" у межах довжини
+запиту; одна сторінка пошуку (Latest) покриває всю групу, а результати
+розкладаються по авторах.
+
+BatchPlanner підбирає розмір груп і вирішує, які акаунти опитувати окремо:
+    - на повній сторінці результатів нові твіти акаунта могли не поміститись,
+      якщо його останній відомий твіт старіший за найстаріший на сторінці -
+      такі акаунти в цьому циклі опитуються окремо, а розмір груп
+      зменшується вдвічі; серія сторінок без втрат збільшує розмір;
+    - помилка запиту групи також зменшує розмір, а акаунти групи опитуються
+      окремо;
+    - акаунт, якого пошук не повертав довше probe_seconds, перевіряється
+      окремим запитом; якщо так знайдено нові твіти - пошук його не бачить
+      (захищений акаунт, обмеження пошуку), і акаунт назавжди переходить в
+      окреме опитування.
+"""
+
+import logging
+import time
+from typing import Dict, Iterable, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEARCH_QUERY_MAX_LENGTH = 500  # Обмеження довжини rawQuery пошуку
+SEARCH_QUERY_SUFFIX = ' -filter:replies'  # Як у UserTweets: без відповідей
+BATCH_MIN_ACCOUNTS = 2
+BATCH_MAX_ACCOUNTS = 20
+BATCH_PROBE_SECONDS = 6 * 3600
+BATCH_GROW_AFTER = 5  # Неповних сторінок поспіль до збільшення розміру груп
+
+
+def search_query(usernames: Iterable[str]) -> str:
+    """Пошуковий запит для групи акаунтів"""
+    return '(' + ' OR '.join(f'from:{username}' for username in usernames) + ')' + SEARCH_QUERY_SUFFIX
+
+
+class BatchPlanner:
+    """Розбиття акаунтів на пошукові групи з автоматичним розміром і відкатом до окремого опитування"""
+
+    def __init__(self, page_size: int = 20, max_query_length: int = SEARCH_QUERY_MAX_LENGTH,
+                 max_accounts: int = BATCH_MAX_ACCOUNTS, probe_seconds: float = BATCH_PROBE_SECONDS):
+        self.page_size = page_size
+        self.max_query_length = max_query_length
+        self.max_accounts = max_accounts
+        self.probe_seconds = probe_seconds
+        self.group_size = max_accounts
+        self.solo: Set[str] = set()  # Акаунти, які пошук не покриває - лише окреме опитування
+        self.last_seen: Dict[str, float] = {}  # Акаунт -> коли пошук востаннє повертав його твіти (або перевірка)
+        self.probing: Set[str] = set()  # Акаунти поточного циклу, що опитуються окремо для перевірки
+        self._quiet_pages = 0
+
+    def plan(self, accounts: Iterable[str]) -> Tuple[List[List[str]], List[str]]:
+        """(групи для пошуку, акаунти для окремого опитування)"""
+        now = time.time()
+        self.probing = set()
+        individual: List[str] = []
+        groups: List[List[str]] = []
+        group: List[str] = []
+        for username in sorted(accounts, key=str.lower):
+            if username in self.solo:
+                individual.append(username)
+                continue
+            seen = self.last_seen.setdefault(username, now)
+            if now - seen >= self.probe_seconds:
+                individual.append(username)  # Перевірка, чи пошук досі бачить акаунт
+                self.probing.add(username)
+                continue
+            candidate = group + [username]
+            if group and (len(candidate) > self.group_size
+                          or len(search_query(candidate)) > self.max_query_length):
+                groups.append(group)
+                candidate = [username]
+            group = candidate
+        if group:
+            groups.append(group)
+        # Група з одного акаунта не економить запитів
+        for single in [group for group in groups if len(group) < BATCH_MIN_ACCOUNTS]:
+            groups.remove(single)
+            individual.extend(single)
+        return groups, individual
+
+    def record_page(self, group: List[str], authors: Iterable[str], truncated: bool) -> None:
+        """Врахувати сторінку пошуку групи; truncated - частина акаунтів не вмістилась і опитується окремо"""
+        now = time.time()
+        for username in authors:
+            self.last_seen[username] = now
+        if truncated:
+            self._quiet_pages = 0
+            self._shrink(group, "повна сторінка")
+            return
+        self._quiet_pages += 1
+        if self._quiet_pages >= BATCH_GROW_AFTER and self.group_size < self.max_accounts:
+            self._quiet_pages = 0
+            self.group_size += 1
+
+    def record_failure(self, group: List[str], status) -> None:
+        self._quiet_pages = 0
+        self._shrink(group, f"помилка пошуку {status}")
+
+    def record_individual(self, username: str, found_new: bool) -> None:
+        """Результат окремого опитування; для перевірки (probing) - рішення про окреме опитування надалі"""
+        if username not in self.probing:
+            return
+        self.probing.discard(username)
+        self.last_seen[username] = time.time()
+        if found_new:
+            self.solo.add(username)
+            logger.warning("Пошук не повертає твіти %s - акаунт переведено в окреме опитування", username)
+
+    def forget(self, username: str) -> None:
+        self.solo.discard(username)
+        self.probing.discard(username)
+        self.last_seen.pop(username, None)
+
+    def _shrink(self, group: List[str], reason: str) -> None:
+        """Половина фактичного розміру групи (він може бути меншим за group_size через довжину запиту)"""
+        size = max(BATCH_MIN_ACCOUNTS, min(self.group_size, len(group)) // 2)
+        if size < self.group_size:
+            logger.info("Розмір пошукових груп %s -> %s: %s для групи з %s акаунтів",
+                        self.group_size, size, reason, len(group))
+            self.group_size = size
@@ -0,0 +1,162 @@
+"""
+Пул облікових даних TwitterMonitor (пари auth_token / ct0)
+
+Кожна пара має власну aiohttp сесію з окремим cookie jar, а запити
+розподіляються між парами за стратегією:
+    round_robin - по черзі
+    health      - найменше невдач поспіль, потім найменша затримка
+    budget      - найбільший залишок x-rate-limit-remaining (після
+                  x-rate-limit-reset залишок вважається повним)
+
+401/403 відправляють пару в карантин (QUARANTINE_BASE, далі вдвічі довше
+до QUARANTINE_MAX), 429 - до x-rate-limit-reset. Пари в карантині не
+отримують запитів; якщо в карантині всі - acquire повертає None, і
+TwitterMonitor не звертається до API до кінця найближчого карантину.
+
+Формат TWITTER_CREDENTIALS: "auth_token:ct0,auth_token2:ct0_2" (роздільники
+пар - кома, крапка з комою або новий рядок).
+"""
+
+import logging
+import re
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+CREDENTIAL_REQUESTS = REGISTRY.counter('twitter_credential_requests_total', 'Запити TwitterMonitor за обліковими даними та статусом',
+                                       ('credential', 'status'))
+CREDENTIALS_AVAILABLE = REGISTRY.gauge('twitter_credentials_available', 'Облікові дані TwitterMonitor поза карантином')
+
+STRATEGIES = ('round_robin', 'health', 'budget')
+QUARANTINE_BASE = 5 * 60.0
+QUARANTINE_MAX = 6 * 3600.0
+RATE_LIMIT_PAUSE = 60.0  # Якщо 429 без x-rate-limit-reset
+LATENCY_SMOOTHING = 0.2
+
+
+class CredentialsUnavailable(Exception):
+    """Усі пари облікових даних у карантині - запит до API не відправляється"""
+
+
+def parse_credentials(value: Optional[str]) -> List[Tuple[str, str]]:
+    """Пари (auth_token, ct0) з рядка конфігурації; некоректні записи пропускаються"""
+    pairs = []
+    for item in re.split(r'[,;\n]+', value or ''):
+        auth_token, _, csrf_token = item.strip().partition(':')
+        if auth_token and csrf_token:
+            pairs.append((auth_token.strip(), csrf_token.strip()))
+        elif item.strip():
+            logger.warning("Пропущено запис TWITTER_CREDENTIALS без ct0 (очікується auth_token:ct0)")
+    return pairs
+
+
+class Credential:
+    """Одна пара облікових даних та її стан"""
+
+    __slots__ = ('auth_token', 'csrf_token', 'label', 'session', 'quarantined_until', 'strikes', 'streak',
+                 'latency', 'remaining', 'reset_at')
+
+    def __init__(self, auth_token: str, csrf_token: str):
+        self.auth_token = auth_token
+        self.csrf_token = csrf_token
+        self.label = f'…{auth_token[-4:]}'  # Для логів і метрик - без самого токена
+        self.session = None
+        self.quarantined_until = 0.0
+        self.strikes = 0  # Карантинів поспіль (401/403) - визначає тривалість наступного
+        self.streak = 0  # Невдалих запитів поспіль
+        self.latency: Optional[float] = None
+        self.remaining: Optional[int] = None  # x-rate-limit-remaining останньої відповіді
+        self.reset_at = 0.0  # x-rate-limit-reset
+
+    def budget(self, now: float) -> float:
+        if self.remaining is None or now >= self.reset_at:
+            return float('inf')
+        return self.remaining
+
+
+class CredentialPool:
+    """Ротація запитів між парами облікових даних з карантином"""
+
+    def __init__(self, pairs: Sequence[Tuple[str, str]], strategy: str = 'round_robin'):
+        if strategy not in STRATEGIES:
+            logger.warning(f"Невідома стратегія ротації {strategy}, використовуємо round_robin")
+            strategy = 'round_robin'
+        self.strategy = strategy
+        self.credentials: List[Credential] = []
+        seen = set()
+        for auth_token, csrf_token in pairs:
+            if auth_token and auth_token not in seen:
+                seen.add(auth_token)
+                self.credentials.append(Credential(auth_token, csrf_token))
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self.credentials)
+
+    def __iter__(self):
+        return iter(self.credentials)
+
+    def available(self) -> bool:
+        """Чи є пара поза карантином"""
+        now = time.time()
+        return any(credential.quarantined_until <= now for credential in self.credentials)
+
+    def acquire(self) -> Optional[Credential]:
+        """Пара для наступного запиту (None, якщо пул порожній або всі пари в карантині)"""
+        if not self.credentials:
+            return None
+        now = time.time()
+        available = [credential for credential in self.credentials if credential.quarantined_until <= now]
+        CREDENTIALS_AVAILABLE.set(len(available))
+        if not available:
+            return None
+        if self.strategy == 'health':
+            return min(available, key=lambda credential: (credential.streak, credential.latency or 0.0))
+        if self.strategy == 'budget':
+            return max(available, key=lambda credential: credential.budget(now))
+        credential = available[self._next % len(available)]
+        self._next += 1
+        return credential
+
+    def release(self, credential: Credential, status: int, headers: Optional[Dict] = None,
+                elapsed: Optional[float] = None) -> None:
+        """Врахувати відповідь (status 0 - помилка з'єднання): ліміти, затримку, карантин на 401/403/429"""
+        now = time.time()
+        CREDENTIAL_REQUESTS.inc(credential=credential.label, status=status)
+        headers = headers or {}
+        remaining, reset = headers.get('x-rate-limit-remaining'), headers.get('x-rate-limit-reset')
+        if remaining is not None:
+            try:
+                credential.remaining = int(remaining)
+                credential.reset_at = float(reset) if reset is not None else now + 15 * 60
+            except ValueError:
+                pass
+        if elapsed is not None:
+            credential.latency = elapsed if credential.latency is None else (
+                credential.latency + LATENCY_SMOOTHING * (elapsed - credential.latency))
+
+        if status in (401, 403):
+            credential.streak += 1
+            credential.strikes += 1
+            duration = min(QUARANTINE_MAX, QUARANTINE_BASE * 2 ** (credential.strikes - 1))
+            credential.quarantined_until = now + duration
+            logger.warning(f"Облікові дані {credential.label}: статус {status}, карантин на {duration / 60:.0f} хв")
+        elif status == 429:
+            credential.streak += 1
+            credential.remaining = 0
+            credential.quarantined_until = max(credential.reset_at, now + 1) if credential.reset_at > now else now + RATE_LIMIT_PAUSE
+            credential.reset_at = max(credential.reset_at, credential.quarantined_until)
+        elif status == 0 or status >= 500:
+            credential.streak += 1
+        else:
+            credential.streak = 0
+            credential.strikes = 0
+
+    async def close(self) -> None:
+        for credential in self.credentials:
+            if credential.session is not None:
+                await credential.session.close()
+                credential.session = None
@@ -8,7 +8,6 @@ Twitter Monitor Adapter для інтеграції з основним бото
 
 import asyncio
 import logging
-import json
 import os
 import time
 from datetime import datetime
@@ -22,22 +21,27 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'twitter_monitor'))
 from twscrape import API
 from twscrape.models import Tweet, User
 
-# Налаштування логування
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from metrics import POLL_SECONDS, SOURCE_RESPONSES, EVENTS_DETECTED, MONITORED_ACCOUNTS, BATCH_GROUPS
+from monitor_state import MonitorStateStore
+import json_codec
+from events import MediaRef, TweetEvent
+from twitter_batch import BatchPlanner, search_query
+from scraper_pool import ScraperPoolHealth
+
+# Логування налаштовує застосунок (bot.configure_logging); basicConfig - лише при запуску модуля напряму
 logger = logging.getLogger(__name__)
 
+
 class TwitterMonitorAdapter:
     """Адаптер для інтеграції twitter_monitor з основним ботом"""
     
-    def __init__(self, accounts_db_path: str = None):
+    def __init__(self, accounts_db_path: str = None, batch_polling: bool = False):
         """
         Ініціалізація адаптера
         
         Args:
             accounts_db_path: Шлях до бази даних акаунтів twitter_monitor
+            batch_polling: Опитувати групи акаунтів одним пошуковим запитом (twitter_batch)
         """
         self.accounts_db_path = accounts_db_path or "./twitter_monitor/accounts.db"
         self.api = None
@@ -46,13 +50,19 @@ class TwitterMonitorAdapter:
         self.sent_tweets = {}  # account -> set of sent tweet_ids
         self.monitoring_active = False
         self.seen_tweets_file = "twitter_monitor_seen_tweets.json"
+        self.user_ids = {}  # account -> user.id (кеш, щоб не викликати user_by_login щоразу)
+        self.state_store = MonitorStateStore("twitter_monitor_state.json")
+        self.batch_polling = batch_polling
+        self.batch_planner = BatchPlanner()
+        self.pool_health = ScraperPoolHealth()  # Стан акаунтів accounts.db та ліміт паралельності
         
         # Створюємо папку twitter_monitor якщо не існує
         twitter_monitor_dir = Path("twitter_monitor")
         twitter_monitor_dir.mkdir(exist_ok=True)
         
-        # Завантажуємо збережені seen_tweets
+        # Завантажуємо збережені seen_tweets та стан для теплого старту
         self.load_seen_tweets()
+        self.user_ids.update(self.state_store.load().get('user_ids', {}))
         
         # Словник для зберігання відповідності акаунтів до проектів
         self.account_projects = {}  # username -> project_name
@@ -66,12 +76,12 @@ class TwitterMonitorAdapter:
             if os.path.exists(self.accounts_db_path):
                 self.api = API(pool=self.accounts_db_path)
                 logger.info(f"Twitter Monitor API ініціалізовано з базою: {self.accounts_db_path}")
-                return True
             else:
                 logger.warning(f"База даних акаунтів не знайдена: {self.accounts_db_path}")
                 logger.info("Створюємо нову базу даних...")
                 self.api = API()
-                return True
+            self.pool_health.attach(self.api.pool)
+            return True
         except Exception as e:
             logger.error(f"Помилка ініціалізації API: {e}")
             return False
@@ -113,8 +123,9 @@ class TwitterMonitorAdapter:
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Закрити сесію"""
-        # Зберігаємо seen_tweets перед закриттям
+        # Зберігаємо seen_tweets та стан перед закриттям
         self.save_seen_tweets()
+        self.state_store.save({'user_ids': self.user_ids}, force=True)
         logger.info("Twitter Monitor адаптер закрито")
         
     def add_account(self, username: str) -> bool:
@@ -161,25 +172,31 @@ class TwitterMonitorAdapter:
         try:
             clean_username = username.replace('@', '').strip()
             
-            # Отримуємо інформацію про користувача
-            user = await self.api.user_by_login(clean_username)
-            if not user:
-                logger.error(f"Користувач @{clean_username} не знайдено")
-                return []
+            # Отримуємо ID користувача (з кешу, якщо вже відомий)
+            user_id = self.user_ids.get(clean_username)
+            if not user_id:
+                user = await self.api.user_by_login(clean_username)
+                if not user:
+                    logger.error(f"Користувач @{clean_username} не знайдено")
+                    return []
+                user_id = user.id
+                self.user_ids[clean_username] = user_id
             
-            logger.info(f"Отримуємо твіти для @{clean_username} (ID: {user.id})")
+            logger.info(f"Отримуємо твіти для @{clean_username} (ID: {user_id})")
             
             # Отримуємо твіти користувача
             tweets = []
-            async for tweet in self.api.user_tweets(user.id, limit=limit):
+            async for tweet in self.api.user_tweets(user_id, limit=limit):
                 tweet_data = self._convert_tweet_to_dict(tweet, clean_username)
                 if tweet_data:
                     tweets.append(tweet_data)
             
             logger.info(f"Знайдено {len(tweets)} твітів для {clean_username}")
+            SOURCE_RESPONSES.inc(monitor='twitter_adapter', status='ok')
             return tweets
             
         except Exception as e:
+            SOURCE_RESPONSES.inc(monitor='twitter_adapter', status='error')
             logger.error(f"Помилка отримання твітів для {username}: {e}")
             return []
     
@@ -193,18 +210,13 @@ class TwitterMonitorAdapter:
                     logger.debug(f"Twitter Monitor: Відфільтровано твіт з невалідними посиланнями для {username}: {tweet.rawContent[:50]}...")
                     return None
             
-            # Витягуємо зображення
-            images = []
+            # Витягуємо медіа (для відео та GIF - прев'ю)
+            media = []
             if tweet.media:
-                # Фото
-                for photo in tweet.media.photos:
-                    images.append(photo.url)
-                # Відео (thumbnail)
-                for video in tweet.media.videos:
-                    images.append(video.thumbnailUrl)
-                # GIF
-                for gif in tweet.media.animated:
-                    images.append(gif.thumbnailUrl)
+                media.extend(MediaRef(photo.url, 'photo') for photo in tweet.media.photos)
+                media.extend(MediaRef(video.thumbnailUrl, 'video') for video in tweet.media.videos)
+                media.extend(MediaRef(gif.thumbnailUrl, 'gif') for gif in tweet.media.animated)
+            images = [item.url for item in media]
             
             # Фільтруємо короткі або порожні тексти (але дозволяємо твіти тільки з фото)
             if len(tweet.rawContent) < 5 and not images:
@@ -215,6 +227,7 @@ class TwitterMonitorAdapter:
                 'text': tweet.rawContent,
                 'url': tweet.url,
                 'images': images,
+                'media': media,
                 'created_at': tweet.date.isoformat(),
                 'user': {
                     'screen_name': username,
@@ -226,17 +239,26 @@ class TwitterMonitorAdapter:
             logger.debug(f"Помилка конвертації твіта: {e}")
             return None
     
-    async def check_new_tweets(self) -> List[Dict]:
-        """Перевірити нові твіти для всіх акаунтів (паралельно по 3 акаунти)"""
+    async def check_new_tweets(self) -> List[TweetEvent]:
+        """Перевірити нові твіти для всіх акаунтів (паралельно - за кількістю доступних акаунтів пулу)"""
         if not self.api:
             logger.warning("Twitter Monitor API не ініціалізовано")
             return []
             
         new_tweets = []
         
-        # Розбиваємо акаунти на групи по 3 для паралельної обробки
+        # Розбиваємо акаунти на групи для паралельної обробки: не більше, ніж пул акаунтів може обслужити
         accounts_list = list(self.monitoring_accounts)
-        batch_size = 3
+        await self.pool_health.refresh()
+        batch_size = self.pool_health.concurrency('UserTweets')
+        MONITORED_ACCOUNTS.set(len(accounts_list), monitor='twitter_adapter')
+        
+        # Пакетний режим: спершу групи акаунтів пошуком, решта - окремими запитами
+        if self.batch_polling:
+            batched = await self._poll_batches()
+            for username, tweets in batched.items():
+                new_tweets.extend(await self._check_account_tweets(username, tweets))
+            accounts_list = [username for username in accounts_list if username not in batched]
         
         for i in range(0, len(accounts_list), batch_size):
             batch = accounts_list[i:i + batch_size]
@@ -253,11 +275,13 @@ class TwitterMonitorAdapter:
                 batch_results = await asyncio.gather(*tasks, return_exceptions=True)
                 
                 # Обробляємо результати
-                for result in batch_results:
+                for username, result in zip(batch, batch_results):
                     if isinstance(result, Exception):
                         logger.error(f"Помилка в паралельній обробці: {result}")
                     elif isinstance(result, list):
                         new_tweets.extend(result)
+                        if self.batch_polling:
+                            self.batch_planner.record_individual(username, bool(result))
                         
             except Exception as e:
                 logger.error(f"Помилка паралельної обробки групи {batch}: {e}")
@@ -270,11 +294,58 @@ class TwitterMonitorAdapter:
         if new_tweets:
             self.save_seen_tweets()
             logger.info(f"✅ Знайдено загалом {len(new_tweets)} нових твітів")
+        self.state_store.save({'user_ids': self.user_ids})
                 
         return new_tweets
     
-    async def _check_account_tweets(self, username: str) -> List[Dict]:
-        """Перевірити твіти для одного акаунта (допоміжна функція для паралельної обробки)"""
+    async def _poll_batches(self) -> Dict[str, List[Dict]]:
+        """Опитати групи акаунтів пошуком: {username: твіти з результатів}
+        
+        Акаунти без відомих твітів (ще не опитані окремо) в групи не
+        потрапляють. На повній сторінці акаунт вважається покритим, лише якщо
+        серед його твітів є вже відомий; решта акаунтів (та групи з помилкою)
+        в результат не потрапляють і опитуються окремо.
+        """
+        batched: Dict[str, List[Dict]] = {}
+        groups, _ = self.batch_planner.plan(username for username in self.monitoring_accounts
+                                            if self.seen_tweets.get(username) or self.sent_tweets.get(username))
+        page_size = self.batch_planner.page_size
+        for group in groups:
+            usernames = {username.lower(): username for username in group}
+            found: Dict[str, List[Dict]] = {username: [] for username in group}
+            results = 0
+            try:
+                with POLL_SECONDS.time(monitor='twitter_adapter'):
+                    async for tweet in self.api.search(search_query(group), limit=page_size, kv={'product': 'Latest'}):
+                        results += 1
+                        username = usernames.get(tweet.user.username.lower() if tweet.user else '')
+                        tweet_data = self._convert_tweet_to_dict(tweet, username) if username else None
+                        if tweet_data:
+                            found[username].append(tweet_data)
+                SOURCE_RESPONSES.inc(monitor='twitter_adapter', status='ok')
+            except Exception as e:
+                SOURCE_RESPONSES.inc(monitor='twitter_adapter', status='error')
+                BATCH_GROUPS.inc(monitor='twitter_adapter', result='error')
+                logger.error(f"Помилка пошуку для групи {group}: {e}")
+                self.batch_planner.record_failure(group, type(e).__name__)
+                continue
+            
+            if results >= page_size:
+                for username in group:
+                    known = self.seen_tweets.get(username, set()) | self.sent_tweets.get(username, set())
+                    if not any(tweet['id'] in known for tweet in found[username]):
+                        del found[username]
+            truncated = len(found) < len(group)
+            self.batch_planner.record_page(group, [name for name, tweets in found.items() if tweets], truncated)
+            BATCH_GROUPS.inc(monitor='twitter_adapter', result='truncated' if truncated else 'ok')
+            batched.update(found)
+        return batched
+    
+    async def _check_account_tweets(self, username: str, tweets: Optional[List[Dict]] = None) -> List[TweetEvent]:
+        """Перевірити твіти для одного акаунта (допоміжна функція для паралельної обробки)
+        
+        tweets - вже отримані твіти (пакетне опитування); інакше запитуються get_user_tweets.
+        """
         account_new_tweets = []
         
         try:
@@ -284,7 +355,9 @@ class TwitterMonitorAdapter:
             if username not in self.sent_tweets:
                 self.sent_tweets[username] = set()
             
-            tweets = await self.get_user_tweets(username, limit=5)
+            if tweets is None:
+                with POLL_SECONDS.time(monitor='twitter_adapter'):
+                    tweets = await self.get_user_tweets(username, limit=5)
             logger.info(f"📊 Знайдено {len(tweets)} твітів для {username}")
             
             for tweet in tweets:
@@ -302,6 +375,7 @@ class TwitterMonitorAdapter:
                         continue
                     
                     # Додаткова перевірка за контентом
+                    content_key = None
                     if tweet_text:
                         import hashlib
                         content_hash = hashlib.md5(f"{username}_{tweet_text}".encode('utf-8')).hexdigest()[:12]
@@ -313,16 +387,18 @@ class TwitterMonitorAdapter:
                     # Додаємо до нових твітів (БЕЗ відмітки як відправлений!)
                     if tweet_id not in self.seen_tweets[username]:
                         logger.info(f"🆕 Twitter Monitor: Знайдено новий твіт від {username}: {tweet_text[:50]}...")
-                        
-                        # Додаємо хеш контенту для перевірки дублікатів
-                        if tweet_text:
-                            import hashlib
-                            content_hash = hashlib.md5(f"{username}_{tweet_text}".encode('utf-8')).hexdigest()[:12]
-                            content_key = f"content_{content_hash}"
-                            # Зберігаємо content_key в твіті для подальшого використання
-                            tweet['content_key'] = content_key
-                        
-                        account_new_tweets.append(tweet)
+                        account_new_tweets.append(TweetEvent(
+                            tweet_id=tweet_id,
+                            account=username,
+                            text=tweet.get('text', ''),
+                            url=tweet.get('url', ''),
+                            author=tweet.get('user', {}).get('name', username),
+                            timestamp=tweet.get('created_at', ''),
+                            media=tuple(tweet.get('media', ())),
+                            content_key=content_key,
+                            detected_at=time.time()
+                        ))
+                        EVENTS_DETECTED.inc(monitor='twitter_adapter')
                         
                         # ВАЖЛИВО: НЕ додаємо до seen_tweets тут! Це буде зроблено після успішної відправки
                     
@@ -419,8 +495,7 @@ class TwitterMonitorAdapter:
                 else:
                     data_to_save[account] = tweet_ids
             
-            with open(self.seen_tweets_file, 'w', encoding='utf-8') as f:
-                json.dump(data_to_save, f, ensure_ascii=False, indent=2)
+            json_codec.dump_file(self.seen_tweets_file, data_to_save)  # Файл лише для програми - компактно
             logger.debug(f"Збережено seen_tweets для {len(data_to_save)} акаунтів")
             return True
         except Exception as e:
@@ -431,8 +506,7 @@ class TwitterMonitorAdapter:
         """Завантажити список оброблених твітів"""
         try:
             if os.path.exists(self.seen_tweets_file):
-                with open(self.seen_tweets_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = json_codec.load_file(self.seen_tweets_file)
                 
                 # Конвертуємо list назад у set
                 for account, tweet_ids in data.items():
@@ -487,4 +561,8 @@ async def main():
         print(f"Знайдено {len(new_tweets)} нових твітів")
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     asyncio.run(main())